@@ -73,7 +73,17 @@ class LetterBoxedStack(Stack):
         )
         test_table_resources.append(self.test_game_table)
         
-        # Add a GSI for language, sorting by board size and createdAt time
+        # DynamoDB creates or deletes at most one GSI per table per update, so the Games table's
+        # indexes are rolled out over deploys: on an existing stack, deploy with
+        # `-c gamesIndexStage=1` (adds InventoryPoolIndex), then without it (adds LanguageBrowseIndex).
+        # `-c gamesIndexStage=0` adds neither.
+        games_index_stage = int(self.node.try_get_context("gamesIndexStage") or 2)
+        # The production Games table isn't managed here, so its InventoryPoolIndex is added by hand.
+        # Deploy with `-c prodInventoryIndex=true` once it exists there and has finished backfilling.
+        prod_inventory_index = str(self.node.try_get_context("prodInventoryIndex")).lower() == "true"
+
+        # Add a GSI for language, sorting by board size and createdAt time. Browsing has moved to
+        # LanguageBrowseIndex; remove this one in a later deploy, once nothing queries it.
         self.test_game_table.add_global_secondary_index(
             index_name="LanguageCreatedAtIndex",
             partition_key=dynamodb.Attribute(
@@ -86,6 +96,54 @@ class LetterBoxedStack(Stack):
             ),
             projection_type=dynamodb.ProjectionType.ALL
         )
+        # The slim browse GSI, by language and createdAt. It only projects what browsing
+        # reads (BROWSE_GAME_ATTRIBUTES in db_utils, less the keys). A projection can't be
+        # changed in place, so this is a new index rather than a change to the one above.
+        language_browse_index = "LanguageCreatedAtIndex"
+        if games_index_stage >= 2:
+            language_browse_index = "LanguageBrowseIndex"
+            self.test_game_table.add_global_secondary_index(
+                index_name=language_browse_index,
+                partition_key=dynamodb.Attribute(
+                    name="language",
+                    type=dynamodb.AttributeType.STRING
+                ),
+                sort_key=dynamodb.Attribute(
+                    name="createdAt",
+                    type=dynamodb.AttributeType.STRING
+                ),
+                projection_type=dynamodb.ProjectionType.INCLUDE,
+                non_key_attributes=[
+                    "gameLayout",
+                    "gameType",
+                    "boardSize",
+                    "createdBy",
+                    "clue",
+                    "validWordCount",
+                    "oneWordSolutionCount",
+                    "twoWordSolutionCount",
+                    "totalRatings",
+                    "totalStars",
+                    "totalCompletions",
+                    "totalWordsUsed",
+                ]
+            )
+
+        # Add a sparse GSI for the random game inventory (only unclaimed games have inventoryPool).
+        # The production Games table is not managed here, so add this index to it in the console.
+        if games_index_stage >= 1:
+            self.test_game_table.add_global_secondary_index(
+                index_name="InventoryPoolIndex",
+                partition_key=dynamodb.Attribute(
+                    name="inventoryPool",
+                    type=dynamodb.AttributeType.STRING
+                ),
+                sort_key=dynamodb.Attribute(
+                    name="inventoryAddedAt",
+                    type=dynamodb.AttributeType.STRING
+                ),
+                projection_type=dynamodb.ProjectionType.KEYS_ONLY
+            )
 
         # Production DynamoDB ValidWords table
         self.prod_valid_words_table = dynamodb.Table.from_table_name(
@@ -427,6 +485,7 @@ class LetterBoxedStack(Stack):
             "RANDOM_GAMES_TABLE_RU": test_RANDOM_GAMES_TABLE_NAME_RU,
             "METADATA_TABLE": test_METADATA_TABLE_NAME,
             "ARCHIVE_TABLE": test_ARCHIVE_TABLE_NAME,
+            "LANGUAGE_BROWSE_INDEX": language_browse_index,
             "DICTIONARY_SOURCE": "s3",
             "S3_BUCKET_NAME": "test-dictionary-bucket",
             "DICTIONARY_BASE_S3_PATH": "Dictionaries/",
@@ -487,6 +546,10 @@ class LetterBoxedStack(Stack):
             "save_user_state": {
                 "handler": "lambdas.save_user_state.handler.handler",
                 "name": "SaveUserStateLambda"
+            },
+            "replenish_inventory": {
+                "handler": "lambdas.replenish_inventory.handler.handler",
+                "name": "ReplenishInventoryLambda"
             }
         }
 
@@ -498,9 +561,19 @@ class LetterBoxedStack(Stack):
             description="Lambda layer that includes dependency libraries."
         )
 
+        # Create Lambda layer with the compiled dictionaries (built by build_dictionary_layer.py)
+        dictionary_layer = _lambda.LayerVersion(
+            self, "LambdaLayerDictionaries",
+            code=_lambda.Code.from_asset("dictionary_layer"),
+            compatible_runtimes=[_lambda.Runtime.PYTHON_3_10],
+            description="Lambda layer that includes the compiled dictionaries for every language."
+        )
+        lambda_layers = [lambda_layer, dictionary_layer]
+
         # Create Lambda functions and store references to them,
         # so they can be used when creating API routing
         lambda_references = {}
+        test_lambda_references = {}
         for lambda_key, lambda_config in lambda_functions.items():
             # Create Production Lambda
             prod_lambda = self.create_lambda(
@@ -508,7 +581,7 @@ class LetterBoxedStack(Stack):
                 lambda_config, 
                 prod_common_environment, 
                 "", 
-                lambda_layer, 
+                lambda_layers, 
                 prod_table_resources
             )
             # Grant each Lambda S3 read/write access
@@ -522,11 +595,12 @@ class LetterBoxedStack(Stack):
                 lambda_config, 
                 test_common_environment, 
                 "Test", 
-                lambda_layer, 
+                lambda_layers, 
                 test_table_resources
             )
             # Grant each test Lambda S3 read/write access to the test bucket
             self.test_bucket.grant_read_write(test_lambda)
+            test_lambda_references[lambda_key] = test_lambda
 
 
         # ===========================================================================
@@ -686,7 +760,7 @@ class LetterBoxedStack(Stack):
                 exclude=[
                     "**/node_modules", "**/__pycache__", ".pytest_cache",
                     "**/.git", "**/.idea", "**/.vscode", "**/*.pyc",
-                    "cdk.out", "dictionaries", "venv", "lambda_layer",
+                    "cdk.out", "dictionaries", "venv", "lambda_layer", "dictionary_layer",
                     "*.iml", "*.log", "*.tmp", "*.zip", "*.tar.gz",
                     ".env", ".gitignore", "utility", "test",
                     "cdk.json", "*.bat", "*.md"
@@ -736,7 +810,45 @@ class LetterBoxedStack(Stack):
         )
 
 
-    def create_lambda(self, lambda_key, lambda_config, environment, function_suffix, layer, resources):
+        # ===========================================================================
+        # Random Game Inventory Schedule
+        # Keeps ready-made random games available so create_random can return instantly
+        # ===========================================================================
+
+        # Each schedule only exists once its table has InventoryPoolIndex, which every run queries
+        inventory_schedules = []
+        if games_index_stage >= 1 and prod_inventory_index:
+            inventory_schedules.append(("", lambda_references["replenish_inventory"]))
+        if games_index_stage >= 1:
+            inventory_schedules.append(("Test", test_lambda_references["replenish_inventory"]))
+
+        for suffix, replenish_inventory_lambda in inventory_schedules:
+            inventory_scheduler_role = iam.Role(
+                self, "ReplenishInventorySchedulerRole" + suffix,
+                assumed_by=iam.ServicePrincipal("scheduler.amazonaws.com"),
+            )
+            inventory_scheduler_role.add_to_policy(
+                iam.PolicyStatement(
+                    actions=["lambda:InvokeFunction"],
+                    resources=[replenish_inventory_lambda.function_arn],
+                )
+            )
+
+            scheduler.CfnSchedule(
+                self, "ReplenishInventorySchedule" + suffix,
+                schedule_expression="rate(15 minutes)",
+                flexible_time_window=scheduler.CfnSchedule.FlexibleTimeWindowProperty(
+                    mode="OFF"
+                ),
+                target=scheduler.CfnSchedule.TargetProperty(
+                    arn=replenish_inventory_lambda.function_arn,
+                    role_arn=inventory_scheduler_role.role_arn,
+                ),
+                description=f"Tops up the LetterBoxed{' test' if suffix else ''} random game inventory every 15 minutes"
+            )
+
+
+    def create_lambda(self, lambda_key, lambda_config, environment, function_suffix, layers, resources):
         lambda_function = _lambda.Function(
             self, lambda_config["name"] + function_suffix,
             runtime=_lambda.Runtime.PYTHON_3_10,
@@ -755,6 +867,7 @@ class LetterBoxedStack(Stack):
                     "dictionaries",
                     "venv",
                     "lambda_layer",
+                    "dictionary_layer",
                     "*.iml",
                     "*.log",
                     "*.tmp",
@@ -772,7 +885,7 @@ class LetterBoxedStack(Stack):
             timeout=Duration.seconds(120),
             memory_size=1024,
             ephemeral_storage_size=Size.gibibytes(2),
-            layers=[layer],
+            layers=layers,
             environment=environment,
             function_name=lambda_config["name"] + function_suffix
         )
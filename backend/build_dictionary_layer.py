@@ -0,0 +1,79 @@
+import os
+import shutil
+from lambdas.common.dictionary_index import DictionaryIndex
+from lambdas.common.pair_catalog import PairCatalog
+from lambdas.common.s3_publish_utils import calculate_s3_etag
+
+# Paths and directories
+script_dir = os.path.dirname(os.path.abspath(__file__))
+dictionaries_dir = os.path.join(script_dir, "dictionaries")
+# Lambda layers are mounted under /opt, so this becomes /opt/dictionaries/{language}/
+layer_output_dir = os.path.join(script_dir, "dictionary_layer", "dictionaries")
+
+# Source files compiled for each language (basic and nyt are optional)
+SOURCE_DICTIONARY_TYPES = ["dictionary", "basic", "nyt"]
+# Seed pair catalogs served by get_pairs, by dictionary type and board size
+PAIR_CATALOGS = [(dictionary_type, board_size) for dictionary_type in ["basic", "dictionary"] for board_size in ["3x3", "4x4"]]
+
+
+def read_word_list(file_path):
+    """Read a dictionary file the same way dictionary_utils does."""
+    with open(file_path, "r") as f:
+        return [line.strip().upper() for line in f if line.strip()]
+
+
+def compile_language(language, language_dir, output_dir):
+    """
+    Compile one language's dictionaries into the indexed binary artifacts.
+
+    Args:
+        language (str): The language code.
+        language_dir (str): Directory containing dictionary.txt (and optionally basic.txt
+            and nyt.txt, the words collected from NYT dictionaries, used for commonness ranks).
+        output_dir (str): Directory to write the compiled dictionary to.
+
+    Returns:
+        DictionaryIndex: The compiled dictionary.
+    """
+    word_lists = {}
+    sources = {}
+    for dictionary_type in SOURCE_DICTIONARY_TYPES:
+        source_path = os.path.join(language_dir, f"{dictionary_type}.txt")
+        if os.path.isfile(source_path):
+            word_lists[dictionary_type] = read_word_list(source_path)
+            # Recorded so Lambdas can tell when S3 has a newer dictionary than the layer
+            sources[dictionary_type] = calculate_s3_etag(source_path)
+
+    index = DictionaryIndex.build(
+        language,
+        word_lists["dictionary"],
+        word_lists.get("basic"),
+        sources=sources,
+        nyt_words=word_lists.get("nyt", []),
+    )
+    index.save(output_dir)
+
+    for dictionary_type, board_size in PAIR_CATALOGS:
+        catalog = PairCatalog.build(index, dictionary_type, board_size)
+        catalog.save(os.path.join(output_dir, "pairs", PairCatalog.directory_name(dictionary_type, board_size)))
+        print(f"  {dictionary_type} {board_size}: {catalog.total_pairs} seed pairs")
+    return index
+
+
+def main():
+    """
+    Compile every language under dictionaries/ into dictionary_layer/, ready to deploy as a Lambda layer.
+    """
+    if os.path.exists(layer_output_dir):
+        shutil.rmtree(layer_output_dir)
+
+    for language in sorted(os.listdir(dictionaries_dir)):
+        language_dir = os.path.join(dictionaries_dir, language)
+        if not os.path.isfile(os.path.join(language_dir, "dictionary.txt")):
+            continue
+        index = compile_language(language, language_dir, os.path.join(layer_output_dir, language))
+        print(f"Compiled '{language}': {len(index.words)} words, version {index.version}")
+
+
+if __name__ == "__main__":
+    main()
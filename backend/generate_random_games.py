@@ -0,0 +1,58 @@
+import os
+import argparse
+from lambdas.create_random.batch_generation_service import WRITE_CHUNK_SIZE, generate_random_games
+from lambdas.create_random.board_quality import DIFFICULTY_BANDS
+
+# Paths and directories
+script_dir = os.path.dirname(os.path.abspath(__file__))
+checkpoint_dir = os.path.join(script_dir, "utility")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Generate random games in bulk and add them to the random game pool.")
+    parser.add_argument("--language", default="en", help="Language code (default: en)")
+    parser.add_argument("--board-size", default="3x3", help="Board size (default: 3x3)")
+    parser.add_argument("--count", type=int, required=True, help="Number of games to add")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=WRITE_CHUNK_SIZE, help="Games written per batch")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for a reproducible run (default: random)")
+    parser.add_argument(
+        "--difficulty",
+        choices=list(DIFFICULTY_BANDS),
+        default=None,
+        help="Only keep boards in this difficulty band (default: any board)",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        default=None,
+        help="Checkpoint file used to resume an interrupted run "
+             "(default: utility/random_games_<language>_<board size>.checkpoint.json)",
+    )
+    return parser.parse_args()
+
+
+def main():
+    """
+    Generate random games in bulk. Tables and the dictionary source are taken from the
+    environment (or .env), the same as the Lambdas. Re-run with the same arguments to
+    resume an interrupted run.
+    """
+    args = parse_args()
+    run_name = f"{args.language}_{args.board_size}" + (f"_{args.difficulty}" if args.difficulty else "")
+    checkpoint_path = args.checkpoint or os.path.join(checkpoint_dir, f"random_games_{run_name}.checkpoint.json")
+    os.makedirs(os.path.dirname(os.path.abspath(checkpoint_path)), exist_ok=True)
+
+    generate_random_games(
+        args.language,
+        args.board_size,
+        args.count,
+        max_workers=args.workers,
+        checkpoint_path=checkpoint_path,
+        chunk_size=args.chunk_size,
+        seed=args.seed,
+        difficulty=args.difficulty,
+    )
+
+
+if __name__ == "__main__":
+    main()
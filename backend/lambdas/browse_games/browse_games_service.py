@@ -1,3 +1,5 @@
+import base64
+import json
 from datetime import datetime
 from typing import Optional, Dict, Any, List
 from lambdas.common.db_utils import fetch_games_by_language
@@ -20,7 +22,9 @@ def query_games_by_language(
         limit (int): Number of results to return (default 10).
 
     Returns:
-        dict: A dictionary containing the list of games and pagination metadata.
+        dict: A dictionary containing the list of games and pagination metadata: "nextToken",
+        which continues from the last game (None after the last page), and "lastEvaluatedKey",
+        the same key unencoded, for clients that don't send nextToken yet.
     """
     # Input validation
     if not isinstance(language, str) or not language:
@@ -48,6 +52,7 @@ def query_games_by_language(
             game_type=game_type
         )
         print(f"Query successful. Fetched {len(result['games'])} games.")
+        result["nextToken"] = encode_pagination_token(result["lastEvaluatedKey"])
         return result
     except ValueError as ve:
         print(f"Validation error while querying games: {str(ve)}")
@@ -55,3 +60,44 @@ def query_games_by_language(
     except Exception as e:
         print(f"Unexpected error while querying games: {str(e)}")
         raise
+
+
+def encode_pagination_token(last_key: Optional[Dict[str, str]]) -> Optional[str]:
+    """
+    Encode a pagination key as an opaque, URL-safe continuation token.
+
+    Args:
+        last_key (Optional[Dict[str, str]]): The pagination key.
+
+    Returns:
+        Optional[str]: The token, or None if there is no key.
+    """
+    if not last_key:
+        return None
+    encoded = json.dumps(last_key, separators=(",", ":"), sort_keys=True).encode("utf-8")
+    return base64.urlsafe_b64encode(encoded).decode("ascii").rstrip("=")
+
+
+def decode_pagination_token(token: str, game_type: Optional[str] = None) -> Dict[str, str]:
+    """
+    Decode a continuation token from encode_pagination_token.
+
+    Args:
+        token (str): The token.
+        game_type (Optional[str]): The game type being browsed, which decides the key's attributes.
+
+    Returns:
+        Dict[str, str]: The pagination key.
+
+    Raises:
+        ValueError: If the token is malformed or doesn't match the game type.
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        last_key = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError) as e:
+        raise ValueError("Invalid nextToken.") from e
+    if not isinstance(last_key, dict) or not all(isinstance(value, str) for value in last_key.values()):
+        raise ValueError("Invalid nextToken.")
+    validate_pagination_key(last_key, game_type)
+    return last_key
@@ -1,7 +1,7 @@
 import json
 from typing import Dict, Any
 from lambdas.common.response_utils import error_response, HEADERS
-from lambdas.browse_games.browse_games_service import query_games_by_language
+from lambdas.browse_games.browse_games_service import decode_pagination_token, query_games_by_language
 from lambdas.common.validation_utils import VALID_GAME_TYPES, validate_language, validate_pagination_key
 
 
@@ -33,9 +33,16 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         if game_type and game_type not in VALID_GAME_TYPES:
             return error_response(f"Invalid gameType. Must be one of: {', '.join(VALID_GAME_TYPES)}", 400)
 
-        # Parse and validate lastEvaluatedKey
+        # Parse and validate the continuation token, or the raw lastEvaluatedKey older clients send
+        next_token = query_params.get("nextToken")
         last_key = query_params.get("lastEvaluatedKey")
-        if last_key:
+        if next_token:
+            try:
+                last_key = decode_pagination_token(next_token, game_type)
+            except ValueError:
+                print(f"Invalid nextToken: {next_token}")
+                return error_response("Invalid nextToken.", 400)
+        elif last_key:
             try:
                 last_key = json.loads(last_key)  # Parse as JSON object
                 if not isinstance(last_key, dict):
@@ -0,0 +1,64 @@
+import os
+from functools import lru_cache
+from typing import Any, Dict, Literal
+import boto3
+from botocore.config import Config
+
+# Connections kept open per client. Threaded callers (batch writers, parallel S3 uploads)
+# otherwise queue on botocore's default pool of 10.
+MAX_POOL_CONNECTIONS = int(os.getenv("AWS_MAX_POOL_CONNECTIONS", "50"))
+
+_BASE_CONFIG = Config(
+    max_pool_connections=MAX_POOL_CONNECTIONS,
+    tcp_keepalive=True,
+    # Adaptive mode also rate-limits the client when DynamoDB starts throttling
+    retries={"mode": "adaptive", "max_attempts": 5},
+)
+
+# The services this backend talks to
+ServiceName = Literal["dynamodb", "s3", "sns"]
+
+# Timeouts by class of operation, in seconds:
+# - "read": item lookups on the request path, which should fail fast and retry (never writes)
+# - "default": writes, queries and everything else
+# - "transfer": S3 downloads/uploads of dictionaries and other large objects
+CLIENT_CONFIGS: Dict[str, Config] = {
+    "read": _BASE_CONFIG.merge(Config(
+        connect_timeout=1,
+        read_timeout=2,
+        retries={"mode": "adaptive", "max_attempts": 4},
+    )),
+    "default": _BASE_CONFIG.merge(Config(connect_timeout=2, read_timeout=10)),
+    "transfer": _BASE_CONFIG.merge(Config(connect_timeout=3, read_timeout=60)),
+}
+
+
+@lru_cache(maxsize=None)
+def get_client(service_name: ServiceName, operation_class: str = "default") -> Any:
+    """
+    Get the shared boto3 client for a service and class of operation.
+    Clients are created once per container and reused, so their connections are too.
+
+    Args:
+        service_name (str): The AWS service, e.g. "dynamodb" or "s3".
+        operation_class (str): A key of CLIENT_CONFIGS.
+
+    Returns:
+        The boto3 client.
+    """
+    return boto3.client(service_name, config=CLIENT_CONFIGS[operation_class])
+
+
+@lru_cache(maxsize=None)
+def get_resource(service_name: Literal["dynamodb", "s3"], operation_class: str = "default") -> Any:
+    """
+    Get the shared boto3 resource for a service and class of operation.
+
+    Args:
+        service_name (str): The AWS service, e.g. "dynamodb".
+        operation_class (str): A key of CLIENT_CONFIGS.
+
+    Returns:
+        The boto3 resource.
+    """
+    return boto3.resource(service_name, config=CLIENT_CONFIGS[operation_class])
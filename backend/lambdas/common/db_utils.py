@@ -1,18 +1,107 @@
 import os
-from typing import List, Optional, Dict, Any
+import random
+from typing import List, Optional, Dict, Any, Tuple, TypedDict, cast
+from functools import lru_cache
 import time
-import boto3
+from datetime import datetime
 from botocore.exceptions import ClientError
 from boto3.dynamodb.conditions import Key
-from lambdas.common.validation_utils import convert_decimal, validate_game_schema, validate_pagination_key
+from boto3.dynamodb.types import Binary
+from lambdas.common.validation_utils import (
+    apply_game_defaults,
+    compile_game_defaults,
+    convert_decimal,
+    validate_pagination_key,
+)
+from lambdas.common.item_deserializer import deserialize_item
+from lambdas.common.aws_clients import get_client, get_resource
+from lambdas.common.item_cache import ItemCache
+from lambdas.common.dictionary_index import build_base_word_map
+from lambdas.common.word_list_codec import decode_solutions, decode_words, encode_solutions, encode_words
 
 # Initialize the DynamoDB resource
-dynamodb = boto3.resource("dynamodb")
+dynamodb = get_resource("dynamodb")
+# Low-level client for hot reads, deserialized without Decimals (see item_deserializer)
+dynamodb_client = get_client("dynamodb", "read")
+# Low-level client for writes, with the default timeouts, so a slow write isn't cut off and resent
+dynamodb_write_client = get_client("dynamodb")
+
+# Table handles by name, with the resource they were created from
+_table_cache: Dict[str, Tuple[Any, Any]] = {}
+
+
+def get_table(table_name: str) -> Any:
+    """
+    Get a cached Table handle, creating it on first use.
+
+    Args:
+        table_name (str): The DynamoDB table name.
+
+    Returns:
+        boto3.Table: The DynamoDB Table object.
+    """
+    cached = _table_cache.get(table_name)
+    # A replaced resource (e.g. a mocked one in tests) gets fresh handles
+    if cached is None or cached[0] is not dynamodb:
+        cached = (dynamodb, dynamodb.Table(table_name))
+        _table_cache[table_name] = cached
+    return cached[1]
 
 
 # ====================== Games Table Functions ======================
 
-def add_game_to_db(game_data: Dict[str, Any]) -> bool:
+MAX_TRANSACTION_ITEMS = 100  # DynamoDB's limit on actions in one transaction
+# Game attributes that change as the game is played and rated
+GAME_COUNTER_ATTRIBUTES = (
+    "totalCompletions",
+    "totalWordsUsed",
+    "totalLettersUsed",
+    "totalRatings",
+    "totalStars",
+)
+# Solution lists are stored as compressed binary (see word_list_codec), and decoded on read.
+# Games written before they were compressed still hold plain lists, which are read as they are.
+COMPRESSED_GAME_ATTRIBUTES = {
+    "oneWordSolutions": (encode_words, decode_words),
+    "twoWordSolutions": (encode_solutions, decode_solutions),
+    "threeWordSolutions": (encode_solutions, decode_solutions),
+}
+
+
+def compress_game_item(game_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Get a copy of a game item with its solution lists encoded for storage.
+
+    Args:
+        game_data (Dict[str, Any]): The game data. Not modified.
+
+    Returns:
+        Dict[str, Any]: The item to write.
+    """
+    item = dict(game_data)
+    for attribute, (encode, _) in COMPRESSED_GAME_ATTRIBUTES.items():
+        if isinstance(item.get(attribute), (list, tuple)):
+            item[attribute] = encode(item[attribute])
+    return item
+
+
+def decompress_game_item(item: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Decode the stored solution lists of a game item in place.
+
+    Args:
+        item (Dict[str, Any]): The item as read.
+
+    Returns:
+        Dict[str, Any]: The same item, with plain solution lists.
+    """
+    for attribute, (_, decode) in COMPRESSED_GAME_ATTRIBUTES.items():
+        if isinstance(item.get(attribute), (bytes, Binary)):
+            item[attribute] = decode(bytes(item[attribute]))
+    return item
+
+
+def add_game_to_db(game_data: Dict[str, Any], only_if_new: bool = False) -> bool:
     """
     Adds a game entry to the DynamoDB table.
     Also adds the valid words for that game into the Valid Words table, so
@@ -20,9 +109,12 @@ def add_game_to_db(game_data: Dict[str, Any]) -> bool:
 
     Args:
         game_data (dict): A dictionary containing all game details.
+        only_if_new (bool): Only write the game if no game with its gameId exists, so an
+            existing game (and its ratings and completions) is never replaced.
 
     Returns:
-        bool: True if operation was successful, False otherwise.
+        bool: True if operation was successful, False otherwise (including when only_if_new
+        is set and the game already exists).
     """
     try:
         # First add the valid words to the ValidWords Table
@@ -34,13 +126,55 @@ def add_game_to_db(game_data: Dict[str, Any]) -> bool:
         
         # Then add the rest of the data to the Games DB
         table = get_games_table()
-        table.put_item(Item=game_data)
+        if only_if_new:
+            table.put_item(
+                Item=compress_game_item(game_data),
+                ConditionExpression="attribute_not_exists(gameId)",
+            )
+        else:
+            table.put_item(Item=compress_game_item(game_data))
         return True
     except ClientError as e:
+        if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+            print(f"Game {game_data['gameId']} already exists. Not replacing it.")
+            return False
         print(f"Error adding game to DB: {e}")
         return False
 
 
+def batch_add_games_to_db(games: List[Dict[str, Any]]) -> bool:
+    """
+    Adds many game entries (and their valid words) using batched writes.
+    Like add_game_to_db, the valid words are stored in the Valid Words table
+    and left out of the games table entries.
+
+    Args:
+        games (List[Dict[str, Any]]): The game data for each game. Not modified.
+
+    Returns:
+        bool: True if operation was successful, False otherwise.
+    """
+    try:
+        valid_words_table = get_valid_words_table()
+        with valid_words_table.batch_writer() as batch:
+            for game_data in games:
+                batch.put_item(Item=get_valid_words_item(
+                    game_data["gameId"], game_data["validWords"], game_data["baseValidWords"]
+                ))
+
+        games_table = get_games_table()
+        with games_table.batch_writer() as batch:
+            for game_data in games:
+                batch.put_item(Item=compress_game_item({
+                    key: value for key, value in game_data.items()
+                    if key not in ("validWords", "baseValidWords")
+                }))
+        return True
+    except ClientError as e:
+        print(f"Error batch adding games to DB: {e}")
+        return False
+
+
 def update_game_in_db(game_data: Dict[str, Any]) -> bool:
     """
     Updates a game entry in the DynamoDB table.
@@ -61,7 +195,7 @@ def update_game_in_db(game_data: Dict[str, Any]) -> bool:
         # Build the update expression and attribute values
         update_expression = []
         expression_attribute_values = {}
-        for key, value in game_data.items():
+        for key, value in compress_game_item(game_data).items():
             if key != "gameId":  # Skip primary key
                 update_expression.append(f"{key} = :{key}")
                 expression_attribute_values[f":{key}"] = value
@@ -88,6 +222,70 @@ def update_game_in_db(game_data: Dict[str, Any]) -> bool:
         return False
 
 
+def add_to_game_counters(deltas_by_game: Dict[str, Dict[str, int]], request_token: str) -> List[str]:
+    """
+    Adds to the counters of several games in a single transaction of ADD updates.
+    DynamoDB applies a transaction at most once per request token (for 10 minutes),
+    so a retry with the same token and deltas can't count anything twice.
+
+    Args:
+        deltas_by_game (Dict[str, Dict[str, int]]): The amount to add to each counter, by gameId.
+            At most MAX_TRANSACTION_ITEMS games.
+        request_token (str): The idempotency token for these deltas.
+
+    Returns:
+        List[str]: The games that don't exist. If there are any, nothing was applied.
+
+    Raises:
+        ClientError: If the transaction fails for any other reason.
+    """
+    transact_items = []
+    for game_id, deltas in deltas_by_game.items():
+        names = {f"#c{i}": counter for i, counter in enumerate(deltas)}
+        transact_items.append({
+            "Update": {
+                "TableName": get_games_table_name(),
+                "Key": {"gameId": {"S": game_id}},
+                "UpdateExpression": "ADD " + ", ".join(f"{name} :c{i}" for i, name in enumerate(names)),
+                "ConditionExpression": "attribute_exists(gameId)",
+                "ExpressionAttributeNames": names,
+                "ExpressionAttributeValues": {
+                    f":c{i}": {"N": str(amount)} for i, amount in enumerate(deltas.values())
+                },
+            }
+        })
+    try:
+        dynamodb_write_client.transact_write_items(TransactItems=transact_items, ClientRequestToken=request_token)
+    except ClientError as e:
+        if e.response["Error"]["Code"] == "TransactionCanceledException":
+            reasons = e.response.get("CancellationReasons", [])
+            missing_games = [
+                game_id for game_id, reason in zip(deltas_by_game, reasons)
+                if reason.get("Code") == "ConditionalCheckFailed"
+            ]
+            if missing_games:
+                return missing_games
+        raise
+    return []
+
+
+def fetch_game_counters(game_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Fetches a game's play and rating counters. Unlike most fetches, a failed read is
+    raised, so callers can tell a missing game from an error.
+
+    Args:
+        game_id (str): The unique identifier for the game.
+
+    Returns:
+        dict or None: The counters if found, else None.
+
+    Raises:
+        ClientError: If the read fails.
+    """
+    return _get_game_attributes(game_id, GAME_COUNTER_ATTRIBUTES)
+
+
 def fetch_game_by_id(game_id: str) -> Optional[Dict[str, Any]]:
     """
     Fetches a game entry by its gameId.
@@ -99,16 +297,145 @@ def fetch_game_by_id(game_id: str) -> Optional[Dict[str, Any]]:
         dict or None: The game item if found, else None.
     """
     try:
-        table = get_games_table()
-        response = table.get_item(Key={"gameId": game_id})
+        response = dynamodb_client.get_item(TableName=get_games_table_name(), Key={"gameId": {"S": game_id}})
         item = response.get("Item")
-        
-        validated_item = validate_game_schema(item)
-        return validated_item
+        if item is None:
+            return None
+        return apply_game_defaults(decompress_game_item(deserialize_item(item)))
     except ClientError as e:
         print(f"Error fetching game by gameId: {e}")
         return None
-    
+
+
+class GameLayoutView(TypedDict):
+    """The attributes needed to play a game."""
+    gameId: str
+    gameLayout: List[str]
+    boardSize: str
+    language: str
+    par: str
+    clue: str
+
+
+class GameRatingView(TypedDict):
+    """A game's rating counters."""
+    gameId: str
+    totalRatings: int
+    totalStars: int
+
+
+GAME_LAYOUT_ATTRIBUTES = tuple(GameLayoutView.__annotations__)
+GAME_RATING_ATTRIBUTES = tuple(GameRatingView.__annotations__)
+
+
+@lru_cache(maxsize=None)
+def _build_projection(attributes: Tuple[str, ...]) -> Tuple[str, Dict[str, str], Any]:
+    """
+    Build the ProjectionExpression and ExpressionAttributeNames for a set of attributes,
+    and compile their defaults. Names are always aliased, since many game attributes
+    (language, par, ...) are DynamoDB reserved words.
+    """
+    names = {f"#a{i}": attribute for i, attribute in enumerate(attributes)}
+    return ", ".join(names), names, compile_game_defaults(attributes)
+
+
+def fetch_game_attributes(game_id: str, attributes: Tuple[str, ...]) -> Optional[Dict[str, Any]]:
+    """
+    Fetches only some attributes of a game, so large fields like the solution lists
+    and the NYT dictionary are neither read nor deserialized unless they are needed.
+
+    Args:
+        game_id (str): The unique identifier for the game.
+        attributes (Tuple[str, ...]): The game attributes to read (keys of GAME_DEFAULTS).
+
+    Returns:
+        dict or None: The requested attributes, with defaults for any the item lacks,
+        or None if the game was not found.
+    """
+    try:
+        return _get_game_attributes(game_id, attributes)
+    except ClientError as e:
+        print(f"Error fetching attributes of game {game_id}: {e}")
+        return None
+
+
+def _get_game_attributes(game_id: str, attributes: Tuple[str, ...]) -> Optional[Dict[str, Any]]:
+    projection, names, compiled_defaults = _build_projection(attributes)
+    response = dynamodb_client.get_item(
+        TableName=get_games_table_name(),
+        Key={"gameId": {"S": game_id}},
+        ProjectionExpression=projection,
+        ExpressionAttributeNames=names,
+    )
+    item = response.get("Item")
+    if item is None:
+        return None
+    return apply_game_defaults(decompress_game_item(deserialize_item(item)), compiled_defaults)
+
+
+def fetch_game_layout(game_id: str) -> Optional[GameLayoutView]:
+    """
+    Fetches the attributes needed to play a game.
+
+    Args:
+        game_id (str): The unique identifier for the game.
+
+    Returns:
+        GameLayoutView or None: The game's layout view if found, else None.
+    """
+    return cast(Optional[GameLayoutView], fetch_game_attributes(game_id, GAME_LAYOUT_ATTRIBUTES))
+
+
+def fetch_game_rating(game_id: str) -> Optional[GameRatingView]:
+    """
+    Fetches a game's rating counters.
+
+    Args:
+        game_id (str): The unique identifier for the game.
+
+    Returns:
+        GameRatingView or None: The game's rating view if found, else None.
+    """
+    return cast(Optional[GameRatingView], fetch_game_attributes(game_id, GAME_RATING_ATTRIBUTES))
+
+
+def game_exists(game_id: str) -> bool:
+    """
+    Checks whether a game is in the DB, reading only its key.
+
+    Args:
+        game_id (str): The unique identifier for the game.
+
+    Returns:
+        bool: True if the game exists.
+    """
+    return fetch_game_attributes(game_id, ("gameId",)) is not None
+
+
+# Game attributes that browsing reads. The browse indexes (LanguageBrowseIndex and
+# GameTypeLanguageCreatedAtIndex) only need to project these, not the solutions or dictionary.
+BROWSE_GAME_ATTRIBUTES = (
+    "gameId",
+    "gameLayout",
+    "gameType",
+    "language",
+    "boardSize",
+    "createdAt",
+    "createdBy",
+    "clue",
+    "validWordCount",
+    "oneWordSolutionCount",
+    "twoWordSolutionCount",
+    "totalRatings",
+    "totalStars",
+    "totalCompletions",
+    "totalWordsUsed",
+)
+# Game attributes in archive listings: the browse listing, plus par
+ARCHIVE_GAME_ATTRIBUTES = BROWSE_GAME_ATTRIBUTES + ("par",)
+BROWSE_QUERY_MIN_LIMIT = 10  # Fewest items read per browse query round
+MAX_BROWSE_QUERY_ROUNDS = 10  # Query rounds per page, however many casual games are skipped
+
 
 def fetch_games_by_language(
     language: str,
@@ -119,6 +446,10 @@ def fetch_games_by_language(
 ) -> Dict[str, Any]:
     """
     Queries games by language and optionally by game type, and paginates results.
+    Only BROWSE_GAME_ATTRIBUTES are read, so each page transfers a small summary per game.
+
+    Casual games are left out, and the query continues until `limit` games are found, so
+    a page is only short when there are no more games (or after MAX_BROWSE_QUERY_ROUNDS).
 
     Args:
         language (str): The language to filter games by.
@@ -128,10 +459,12 @@ def fetch_games_by_language(
         index_name (Optional[str]): DynamoDB GSI to use for the query (optional, auto-selected based on game_type).
 
     Returns:
-        dict: Dictionary containing "games" (list of games) and "lastEvaluatedKey" for pagination.
+        dict: Dictionary containing "games" (list of games) and "lastEvaluatedKey" for pagination
+        (None once there are no more games).
     """
     try:
         table = get_games_table()
+        projection, names, compiled_defaults = _build_projection(BROWSE_GAME_ATTRIBUTES)
         
         # Determine which GSI to use and build the appropriate query
         if game_type:
@@ -142,7 +475,8 @@ def fetch_games_by_language(
             query_kwargs = {
                 "IndexName": actual_index_name,
                 "KeyConditionExpression": Key("gameTypeLanguage").eq(game_type_language),
-                "Limit": limit,
+                "ProjectionExpression": projection,
+                "ExpressionAttributeNames": names,
                 "ScanIndexForward": False  # Descending order
             }
             
@@ -152,13 +486,14 @@ def fetch_games_by_language(
                 validate_pagination_key(last_key, game_type)
                 query_kwargs["ExclusiveStartKey"] = last_key
         else:
-            # Use LanguageCreatedAtIndex for unfiltered queries
-            actual_index_name = index_name or "LanguageCreatedAtIndex"
+            # Use the language browse index for unfiltered queries
+            actual_index_name = index_name or get_language_browse_index_name()
             
             query_kwargs = {
                 "IndexName": actual_index_name,
                 "KeyConditionExpression": Key("language").eq(language),
-                "Limit": limit,
+                "ProjectionExpression": projection,
+                "ExpressionAttributeNames": names,
                 "ScanIndexForward": False  # Descending order
             }
             
@@ -170,55 +505,38 @@ def fetch_games_by_language(
         
         print("query_kwargs:", query_kwargs)
         
-        # Execute the query
-        response = table.query(**query_kwargs)
-        print("DB response LastEvaluatedKey:", response.get("LastEvaluatedKey"))
-        
-        games = []
-        for raw_item in response.get("Items", []):
-            item = validate_game_schema(raw_item)
-            
-            # Exclude casual games
-            if item["gameType"] == "casual":
-                continue
-            
-            # Calculate derived values
-            total_ratings = item.get("totalRatings", 0)
-            total_stars = item.get("totalStars", 0)
-            total_completions = item.get("totalCompletions", 0)
-            total_words_used = item.get("totalWordsUsed", 0)
-            valid_word_count = item.get("validWordCount", 0)
-            two_word_solution_count = item.get("twoWordSolutionCount", 0)
-            one_word_solution_count = item.get("oneWordSolutionCount", 0)
-
-            average_rating = total_stars / total_ratings if total_ratings > 0 else 0.0
-            average_words_needed = (
-                total_words_used / total_completions if total_completions > 0 else 0.0
-            )
-            
-            # Append validated game to the results
-            games.append({
-                "gameId": item["gameId"],
-                "gameLayout": item["gameLayout"],
-                "gameType": item["gameType"],
-                "language": item["language"],
-                "boardSize": item["boardSize"],
-                "createdAt": item["createdAt"],
-                "createdBy": item["createdBy"],
-                "hint": item["clue"],
-                "validWordCount": valid_word_count,
-                "oneWordSolutionCount": one_word_solution_count,
-                "twoWordSolutionCount": two_word_solution_count,
-                "totalRatings": total_ratings,
-                "averageRating": average_rating,
-                "totalCompletions": total_completions,
-                "averageWordsNeeded": average_words_needed,
-            })
+        games: List[Dict[str, Any]] = []
+        next_key = None
+        for _ in range(MAX_BROWSE_QUERY_ROUNDS):
+            # Read at least BROWSE_QUERY_MIN_LIMIT, so runs of casual games take few rounds
+            query_kwargs["Limit"] = max(limit - len(games), BROWSE_QUERY_MIN_LIMIT)
+            response = table.query(**query_kwargs)
+            next_key = response.get("LastEvaluatedKey")
+            print("DB response LastEvaluatedKey:", next_key)
+
+            items = response.get("Items", [])
+            for position, raw_item in enumerate(items):
+                item = convert_decimal(apply_game_defaults(raw_item, compiled_defaults))
+
+                # Exclude casual games
+                if item["gameType"] == "casual":
+                    continue
+
+                games.append(_to_browse_summary(item))
+                if len(games) == limit:
+                    # Continue after this game next time, unless it was the last one read
+                    if position < len(items) - 1:
+                        next_key = _browse_pagination_key(item, game_type)
+                    break
+
+            if len(games) == limit or not next_key:
+                break
+            query_kwargs["ExclusiveStartKey"] = next_key
         
         # Return results with full lastEvaluatedKey
         return {
             "games": games,
-            "lastEvaluatedKey": response.get("LastEvaluatedKey")  # Include the full key for frontend
+            "lastEvaluatedKey": next_key  # Include the full key for frontend
         }
     
     except Exception as e:
@@ -226,6 +544,90 @@ def fetch_games_by_language(
         return {"games": [], "lastEvaluatedKey": None}
 
 
+def _to_browse_summary(item: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build the browse listing of a game from its BROWSE_GAME_ATTRIBUTES.
+    """
+    # Calculate derived values
+    total_ratings = item.get("totalRatings", 0)
+    total_stars = item.get("totalStars", 0)
+    total_completions = item.get("totalCompletions", 0)
+    total_words_used = item.get("totalWordsUsed", 0)
+
+    average_rating = total_stars / total_ratings if total_ratings > 0 else 0.0
+    average_words_needed = (
+        total_words_used / total_completions if total_completions > 0 else 0.0
+    )
+
+    return {
+        "gameId": item["gameId"],
+        "gameLayout": item["gameLayout"],
+        "gameType": item["gameType"],
+        "language": item["language"],
+        "boardSize": item["boardSize"],
+        "createdAt": item["createdAt"],
+        "createdBy": item["createdBy"],
+        "hint": item["clue"],
+        "validWordCount": item.get("validWordCount", 0),
+        "oneWordSolutionCount": item.get("oneWordSolutionCount", 0),
+        "twoWordSolutionCount": item.get("twoWordSolutionCount", 0),
+        "totalRatings": total_ratings,
+        "averageRating": average_rating,
+        "totalCompletions": total_completions,
+        "averageWordsNeeded": average_words_needed,
+    }
+
+
+def _browse_pagination_key(item: Dict[str, Any], game_type: Optional[str]) -> Dict[str, str]:
+    """
+    Build the pagination key that continues a browse query after the given game.
+    """
+    if game_type:
+        return {
+            "gameTypeLanguage": f"{item['gameType']}#{item['language']}",
+            "createdAt": item["createdAt"],
+            "gameId": item["gameId"],
+        }
+    return {"language": item["language"], "createdAt": item["createdAt"], "gameId": item["gameId"]}
+
+
+def fetch_game_summaries(game_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetches the browse listing (plus par) of many games with BatchGetItem, reading only
+    ARCHIVE_GAME_ATTRIBUTES.
+
+    Args:
+        game_ids (List[str]): The games. Any number; they are read MAX_BATCH_GET_KEYS at a time.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Each summary by gameId. Games that don't exist, or couldn't
+        be read, are left out.
+    """
+    projection, names, compiled_defaults = _build_projection(ARCHIVE_GAME_ATTRIBUTES)
+    table_name = get_games_table_name()
+    unique_ids = list(dict.fromkeys(game_ids))
+    summaries: Dict[str, Dict[str, Any]] = {}
+    for start in range(0, len(unique_ids), MAX_BATCH_GET_KEYS):
+        request_items = {
+            table_name: {
+                "Keys": [{"gameId": {"S": game_id}} for game_id in unique_ids[start:start + MAX_BATCH_GET_KEYS]],
+                "ProjectionExpression": projection,
+                "ExpressionAttributeNames": names,
+            }
+        }
+        try:
+            found, complete = batch_get_all(request_items)
+        except ClientError as e:
+            print(f"Error reading game summaries: {e}")
+            continue
+        if not complete:
+            print("Unprocessed keys left reading game summaries; some are left out.")
+        for raw_item in found.get(table_name, []):
+            item = apply_game_defaults(deserialize_item(raw_item), compiled_defaults)
+            summaries[item["gameId"]] = {**_to_browse_summary(item), "par": item["par"]}
+    return summaries
+
+
 def fetch_solutions_by_standardized_hash(standardized_hash: str) -> Optional[Dict[str, Any]]:
     """
     Fetches the first item with both `twoWordSolutions` and `threeWordSolutions`
@@ -249,7 +651,7 @@ def fetch_solutions_by_standardized_hash(standardized_hash: str) -> Optional[Dic
         # Iterate over items to find the first with both solution fields
         for item in items:
             if "twoWordSolutions" in item and "threeWordSolutions" in item:
-                return item
+                return decompress_game_item(item)
         
         # Return None if no item with both solutions is found
         return None
@@ -266,12 +668,65 @@ def get_games_table() -> Any:
     Returns:
         boto3.Table: The DynamoDB Table object.
     """
-    table_name = os.environ.get("GAMES_TABLE", "LetterBoxedGames")
-    return dynamodb.Table(table_name)
+    return get_table(get_games_table_name())
+
+
+def get_games_table_name() -> str:
+    """
+    Get the name of the games table from the environment variable.
+    """
+    return os.environ.get("GAMES_TABLE", "LetterBoxedGames")
+
+
+def get_language_browse_index_name() -> str:
+    """
+    Get the name of the games table GSI that browsing by language queries, from the environment
+    variable. Tables without the slim LanguageBrowseIndex yet use LanguageCreatedAtIndex.
+    """
+    return os.environ.get("LANGUAGE_BROWSE_INDEX", "LanguageCreatedAtIndex")
 
 
 # ====================== Valid Words Table Functions ======================
 
+def get_valid_words_item(game_id: str, valid_words: List[str], base_valid_words: List[str]) -> Dict[str, Any]:
+    """
+    Build the valid words item for a game. Both lists are sorted by valid word (keeping
+    each base word with its word) and stored as compressed binary (see word_list_codec).
+
+    Args:
+        game_id (str): The unique identifier for the game.
+        valid_words (list): List of valid words for the game.
+        base_valid_words: List of valid words, with accents removed, in the same order.
+
+    Returns:
+        Dict[str, Any]: The item to write.
+    """
+    pairs = sorted(zip(valid_words, base_valid_words))
+    return {
+        "gameId": game_id,
+        "validWordCount": len(valid_words),
+        "validWords": encode_words([word for word, _ in pairs]),
+        "baseValidWords": encode_words([base_word for _, base_word in pairs]),
+    }
+
+
+def decompress_valid_words_item(item: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Decode the stored word lists of a valid words item in place. Items written before
+    the lists were compressed are returned as they are.
+
+    Args:
+        item (Dict[str, Any]): The item as read.
+
+    Returns:
+        Dict[str, Any]: The same item, with plain word lists.
+    """
+    for attribute in ("validWords", "baseValidWords"):
+        if isinstance(item.get(attribute), (bytes, Binary)):
+            item[attribute] = decode_words(bytes(item[attribute]))
+    return item
+
+
 def add_valid_words_to_db(game_id: str, valid_words: List[str], base_valid_words: List[str]) -> bool:
     """
     Stores all valid words for a game in a single item in the valid words table.
@@ -286,13 +741,7 @@ def add_valid_words_to_db(game_id: str, valid_words: List[str], base_valid_words
     """
     try:
         table = get_valid_words_table()
-        valid_words_entry = {
-            "gameId": game_id,
-            "validWordCount": len(valid_words),
-            "validWords": valid_words,
-            "baseValidWords": base_valid_words
-        }
-        table.put_item(Item=valid_words_entry)
+        table.put_item(Item=get_valid_words_item(game_id, valid_words, base_valid_words))
         return True
     except ClientError as e:
         print(f"Error adding valid words to DB: {e}")
@@ -307,13 +756,16 @@ def fetch_valid_words_by_game_id(game_id: str) -> Optional[List[str]]:
         game_id (str): The unique identifier for the game.
 
     Returns:
-        list or None: The list of valid words if found, else None.
+        list or None: The list of valid words (sorted) if found, else None.
     """
     try:
         table = get_valid_words_table()
         response = table.get_item(Key={"gameId": game_id})
-        item: Optional[Dict[str, List[str]]] = response.get("Item")
-        return item.get("validWords", []) if item else None
+        item: Optional[Dict[str, Any]] = response.get("Item")
+        if not item:
+            return None
+        valid_words: List[str] = decompress_valid_words_item(item).get("validWords", [])
+        return valid_words
     except ClientError as e:
         print(f"Error fetching valid words by gameId: {e}")
         return None
@@ -326,8 +778,14 @@ def get_valid_words_table() -> Any:
     Returns:
         boto3.Table: The DynamoDB Table object.
     """
-    table_name = os.environ.get("VALID_WORDS_TABLE", "LetterBoxedValidWords1")
-    return dynamodb.Table(table_name)
+    return get_table(get_valid_words_table_name())
+
+
+def get_valid_words_table_name() -> str:
+    """
+    Get the name of the valid words table from the environment variable.
+    """
+    return os.environ.get("VALID_WORDS_TABLE", "LetterBoxedValidWords1")
 
 
 # ====================== User Game States Table Functions ======================
@@ -345,39 +803,21 @@ def get_user_game_state(session_id: str, game_id: str) -> Optional[Dict[str, Any
         Optional[dict]: The user's game state, or None if an error occurred.
     """
     try:
-        table = get_session_states_table()
-        
         # Composite key for querying the table
         key = {
-            "sessionId": session_id,
-            "gameId": game_id
+            "sessionId": {"S": session_id},
+            "gameId": {"S": game_id}
         }
 
         # Retrieve the game state from the database
-        response = table.get_item(Key=key)
-        user_game_data: Optional[Dict[str, Any]] = response.get("Item")
+        response = dynamodb_client.get_item(TableName=get_session_states_table_name(), Key=key)
+        item = response.get("Item")
+        user_game_data: Optional[Dict[str, Any]] = deserialize_item(item) if item is not None else None
 
         # If no game state exists, initialize it
         if user_game_data is None:
-            print(f"No existing game state for session '{session_id}' and game '{game_id}'. Initializing...")
-            user_game_data = {
-                "sessionId": session_id,
-                "gameId": game_id,
-                "wordsUsed": [],
-                "originalWordsUsed": [],
-                "gameCompleted": False,
-                "lastUpdated": int(time.time()),
-                "TTL": int(time.time()) + 30 * 24 * 60 * 60,  # 30 days from now
-            }
-
-            # Save the initialized state
-            if not save_user_session_state(user_game_data):
-                print(f"Failed to save initialized game state for session '{session_id}', game '{game_id}'.")
-                return None
-            print(f"Initialized and saved new game state: {user_game_data}")
+            return initialize_user_game_state(session_id, game_id)
 
-        # Convert any Decimal values to JSON-compatible types
-        user_game_data = convert_decimal(user_game_data)
         return user_game_data
 
     except ClientError as e:
@@ -385,6 +825,36 @@ def get_user_game_state(session_id: str, game_id: str) -> Optional[Dict[str, Any
         return None
 
 
+def initialize_user_game_state(session_id: str, game_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Creates and saves a new game state for a user session.
+
+    Args:
+        session_id (str): The unique session identifier for the user.
+        game_id (str): The unique identifier for the game.
+
+    Returns:
+        Optional[dict]: The new game state, or None if it could not be saved.
+    """
+    print(f"No existing game state for session '{session_id}' and game '{game_id}'. Initializing...")
+    user_game_data = {
+        "sessionId": session_id,
+        "gameId": game_id,
+        "wordsUsed": [],
+        "originalWordsUsed": [],
+        "gameCompleted": False,
+        "lastUpdated": int(time.time()),
+        "TTL": int(time.time()) + 30 * 24 * 60 * 60,  # 30 days from now
+    }
+
+    # Save the initialized state
+    if not save_user_session_state(user_game_data):
+        print(f"Failed to save initialized game state for session '{session_id}', game '{game_id}'.")
+        return None
+    print(f"Initialized and saved new game state: {user_game_data}")
+    return user_game_data
+
+
 def save_user_session_state(session_data: Dict[str, Any]) -> bool:
     """
     Saves the user's game state to the DynamoDB session states table.
@@ -411,19 +881,178 @@ def get_session_states_table() -> Any:
     Returns:
         boto3.Table: The DynamoDB Table object.
     """
-    table_name = os.environ.get("SESSION_STATES_TABLE", "LetterBoxedSessionStates")
-    return dynamodb.Table(table_name)
+    return get_table(get_session_states_table_name())
+
+
+def get_session_states_table_name() -> str:
+    """
+    Get the name of the session states table from the environment variable.
+    """
+    return os.environ.get("SESSION_STATES_TABLE", "LetterBoxedSessionStates")
+
+
+# ====================== Batch Reads ======================
+
+MAX_BATCH_GET_ATTEMPTS = 4  # Rounds of retrying unprocessed keys before giving up
+BATCH_GET_BACKOFF_SECONDS = 0.025  # Doubled after each round
+MAX_BATCH_GET_KEYS = 100  # DynamoDB's limit on keys in one BatchGetItem
+
+
+def batch_get_all(request_items: Dict[str, Any]) -> Tuple[Dict[str, List[Dict[str, Any]]], bool]:
+    """
+    Runs a BatchGetItem, retrying unprocessed keys with backoff.
+
+    Args:
+        request_items (Dict[str, Any]): The RequestItems of the BatchGetItem (at most MAX_BATCH_GET_KEYS keys).
+
+    Returns:
+        Tuple[Dict[str, List[Dict[str, Any]]], bool]: The items found (in DynamoDB JSON) by table,
+        and whether every key was read.
+
+    Raises:
+        ClientError: If a read fails.
+    """
+    items: Dict[str, List[Dict[str, Any]]] = {}
+    for attempt in range(MAX_BATCH_GET_ATTEMPTS):
+        response = dynamodb_client.batch_get_item(RequestItems=request_items)
+        for table_name, table_items in response.get("Responses", {}).items():
+            items.setdefault(table_name, []).extend(table_items)
+        request_items = response.get("UnprocessedKeys") or {}
+        if not request_items:
+            return items, True
+        if attempt < MAX_BATCH_GET_ATTEMPTS - 1:
+            time.sleep(BATCH_GET_BACKOFF_SECONDS * 2 ** attempt)
+    return items, False
+
+
+# ====================== Word Validation Reads ======================
+
+# Game attributes that validating a word uses. None of them change once the game is written.
+WORD_VALIDATION_GAME_ATTRIBUTES = (
+    "gameId",
+    "gameLayout",
+    "oneWordSolutions",
+    "twoWordSolutions",
+    "nytSolution",
+    "randomSeedWord",
+    "randomSeedWords",
+)
+STATIC_GAME_CACHE_MAX_BYTES = int(os.getenv("STATIC_GAME_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+
+# Validation attributes and valid words of recently played games, by gameId
+_static_game_cache = ItemCache(STATIC_GAME_CACHE_MAX_BYTES)
+
+
+def fetch_word_validation_data(game_id: str, session_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Reads everything needed to validate a word with a single BatchGetItem: the game,
+    its valid words and the user's game state, from their three tables. The valid words
+    come back as a map from base form to original word (see build_base_word_map).
+
+    The game's validation attributes and valid words never change, so they are cached
+    for the life of the container, and later guesses on the same game only read the
+    user's game state. Counters are not included (see stats_aggregator).
+
+    Args:
+        game_id (str): The unique identifier for the game.
+        session_id (str): The unique session identifier for the user.
+
+    Returns:
+        Optional[dict]: {"game", "validWordsByBase", "sessionState"}, each None if its item
+        doesn't exist, or None if the read failed.
+    """
+    games_table = get_games_table_name()
+    valid_words_table = get_valid_words_table_name()
+    session_states_table = get_session_states_table_name()
+    projection, names, compiled_defaults = _build_projection(WORD_VALIDATION_GAME_ATTRIBUTES)
+    request_items: Dict[str, Any] = {
+        session_states_table: {
+            "Keys": [{"sessionId": {"S": session_id}, "gameId": {"S": game_id}}],
+        },
+    }
+    static_data = _static_game_cache.get(game_id)
+    if static_data is None:
+        request_items[games_table] = {
+            "Keys": [{"gameId": {"S": game_id}}],
+            "ProjectionExpression": projection,
+            "ExpressionAttributeNames": names,
+        }
+        request_items[valid_words_table] = {
+            "Keys": [{"gameId": {"S": game_id}}],
+            "ProjectionExpression": "validWords, baseValidWords",
+        }
+
+    try:
+        found, complete = batch_get_all(request_items)
+    except ClientError as e:
+        print(f"Error reading word validation data for game '{game_id}', session '{session_id}': {e}")
+        return None
+    if not complete:
+        print(f"Unprocessed keys left reading game '{game_id}' for session '{session_id}'.")
+        return None
+    # One key per table
+    items = {table_name: table_items[0] for table_name, table_items in found.items() if table_items}
+
+    session_state = items.get(session_states_table)
+    if static_data is None:
+        game = items.get(games_table)
+        valid_words = (
+            decompress_valid_words_item(deserialize_item(items[valid_words_table]))
+            if valid_words_table in items else None
+        )
+        static_data = {
+            "game": (
+                apply_game_defaults(decompress_game_item(deserialize_item(game)), compiled_defaults)
+                if game is not None else None
+            ),
+            "validWordsByBase": build_base_word_map(
+                valid_words.get("validWords") or [], valid_words.get("baseValidWords")
+            ) if valid_words is not None else None,
+        }
+        # Only complete games are cached, in case the missing part is still being written
+        if static_data["game"] and static_data["validWordsByBase"]:
+            _static_game_cache.put(game_id, static_data)
+    return {
+        **static_data,
+        "sessionState": deserialize_item(session_state) if session_state is not None else None,
+    }
+
+
+def get_static_game_cache_stats() -> Dict[str, Any]:
+    """
+    Get the hit rate and size of this container's static game cache.
+
+    Returns:
+        Dict[str, Any]: {"hits", "misses", "hitRate", "entries", "sizeBytes"}.
+    """
+    return _static_game_cache.stats()
 
 
 # ====================== Random Game Table Functions ======================
 
-def add_game_id_to_random_games_db(game_id: str, language: str = "en") -> int:
+# Game attributes copied into random pool entries, so a random game can be served from its entry
+RANDOM_POOL_SUMMARY_ATTRIBUTES = ("gameLayout", "boardSize", "language", "clue")
+
+
+def get_random_pool_summary(game_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Get the attributes of a game that its random pool entry carries.
+    """
+    return {attr: game_data[attr] for attr in RANDOM_POOL_SUMMARY_ATTRIBUTES if attr in game_data}
+
+
+def add_game_id_to_random_games_db(
+    game_id: str,
+    language: str = "en",
+    summary: Optional[Dict[str, Any]] = None,
+) -> int:
     """
     Insert the game ID and atomic number into the language-specific Random Games table.
 
     Args:
         game_id (str): The unique game ID.
         language (str): The language code for the table (e.g., 'en', 'es').
+        summary (Dict[str, Any], optional): The game's summary (see get_random_pool_summary).
 
     Returns:
         int: The atomic number assigned to this game.
@@ -431,12 +1060,73 @@ def add_game_id_to_random_games_db(game_id: str, language: str = "en") -> int:
     atomic_number = increment_random_game_count(language)
     table = get_random_games_table(language)
     table.put_item(Item={
+        **(summary or {}),
         "atomicNumber": atomic_number,
         "gameId": game_id
     })
     return atomic_number
 
 
+def batch_add_game_ids_to_random_games_db(
+    game_ids: List[str],
+    first_atomic_number: int,
+    language: str = "en",
+    summaries: Optional[List[Dict[str, Any]]] = None,
+) -> List[int]:
+    """
+    Insert many game IDs into the language-specific Random Games table using batched
+    writes, numbered consecutively from a block reserved with reserve_random_game_numbers.
+
+    Args:
+        game_ids (List[str]): The game IDs, in the order they should be numbered.
+        first_atomic_number (int): The first atomic number of the reserved block.
+        language (str): The language code for the table (e.g., 'en', 'es').
+        summaries (List[Dict[str, Any]], optional): Each game's summary (see get_random_pool_summary).
+
+    Returns:
+        List[int]: The atomic number assigned to each game.
+    """
+    atomic_numbers = list(range(first_atomic_number, first_atomic_number + len(game_ids)))
+    table = get_random_games_table(language)
+    with table.batch_writer() as batch:
+        for i, (atomic_number, game_id) in enumerate(zip(atomic_numbers, game_ids)):
+            batch.put_item(Item={
+                **(summaries[i] if summaries else {}),
+                "atomicNumber": atomic_number,
+                "gameId": game_id
+            })
+    return atomic_numbers
+
+
+def fetch_random_pool_entries(atomic_numbers: List[int], language: str = "en") -> Optional[List[Dict[str, Any]]]:
+    """
+    Fetch random pool entries (gameId and, for games added since entries carry one, the
+    game's summary) with a single BatchGetItem.
+
+    Args:
+        atomic_numbers (List[int]): At most MAX_BATCH_GET_KEYS atomic numbers.
+        language (str): Language code.
+
+    Returns:
+        Optional[List[Dict[str, Any]]]: The entries found, in no particular order, or None if the read failed.
+    """
+    if not atomic_numbers:
+        return []
+    table_name = get_random_games_table_name(language)
+    request_items = {
+        table_name: {"Keys": [{"atomicNumber": {"N": str(atomic_number)}} for atomic_number in atomic_numbers]}
+    }
+    try:
+        found, complete = batch_get_all(request_items)
+    except ClientError as e:
+        print(f"Error reading random pool entries for '{language}': {e}")
+        return None
+    if not complete:
+        # Entries that were read are still a random sample
+        print(f"Unprocessed keys left reading random pool entries for '{language}'.")
+    return [deserialize_item(item) for item in found.get(table_name, [])]
+
+
 def fetch_game_id_from_random_games_db(atomic_number: int, language: str) -> str:
     """
     Fetch the game ID for the given atomic number from the Random Games table.
@@ -467,15 +1157,195 @@ def get_random_games_table(language: str = "en") -> Any:
         boto3.Table: The DynamoDB Table object.
     """
 
-    table_name = os.environ.get(f"RANDOM_GAMES_TABLE_{language.upper()}", f"LetterBoxedRandomGames_{language}")
-    return dynamodb.Table(table_name)
+    return get_table(get_random_games_table_name(language))
+
+
+def get_random_games_table_name(language: str = "en") -> str:
+    """
+    Get the name of the Random Games table for the specified language from the environment variable.
+    """
+    return os.environ.get(f"RANDOM_GAMES_TABLE_{language.upper()}", f"LetterBoxedRandomGames_{language}")
+
+
+# ====================== Random Game Inventory Functions ======================
+
+INVENTORY_INDEX_NAME = "InventoryPoolIndex"  # Sparse GSI: only unclaimed inventory games have inventoryPool
+INVENTORY_CLAIM_CANDIDATES = 5  # Inventory games read per claim, in case others claim some first
+
+
+def get_inventory_pool_key(language: str, board_size: str) -> str:
+    """
+    Get the inventory pool a game belongs to, e.g. 'en#3x3'.
+    """
+    return f"{language}#{board_size}"
+
+
+def add_games_to_inventory(games: List[Dict[str, Any]], language: str, board_size: str) -> bool:
+    """
+    Adds pre-generated games (and their valid words) to the random game inventory.
+    Inventory games have no createdAt until they are claimed, so they stay out of the
+    browse index until then.
+
+    Args:
+        games (List[Dict[str, Any]]): The game data for each game. Not modified.
+        language (str): The language code of the games.
+        board_size (str): The board size of the games.
+
+    Returns:
+        bool: True if operation was successful, False otherwise.
+    """
+    pool_key = get_inventory_pool_key(language, board_size)
+    inventory_games = []
+    for game_data in games:
+        inventory_game = {key: value for key, value in game_data.items() if key != "createdAt"}
+        inventory_game["inventoryPool"] = pool_key
+        inventory_game["inventoryAddedAt"] = game_data["createdAt"]
+        inventory_games.append(inventory_game)
+    return batch_add_games_to_db(inventory_games)
+
+
+def count_inventory_games(language: str, board_size: str) -> Optional[int]:
+    """
+    Count the unclaimed games in an inventory pool.
+
+    Args:
+        language (str): The language code.
+        board_size (str): The board size.
+
+    Returns:
+        Optional[int]: The number of unclaimed games, or None if the count failed
+        (e.g. the inventory index doesn't exist yet).
+    """
+    table = get_games_table()
+    query_kwargs: Dict[str, Any] = {
+        "IndexName": INVENTORY_INDEX_NAME,
+        "KeyConditionExpression": Key("inventoryPool").eq(get_inventory_pool_key(language, board_size)),
+        "Select": "COUNT",
+    }
+    count = 0
+    try:
+        while True:
+            response = table.query(**query_kwargs)
+            count += int(response.get("Count", 0))
+            if "LastEvaluatedKey" not in response:
+                return count
+            query_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+    except ClientError as e:
+        print(f"Error counting inventory games for {language} {board_size}: {e}")
+        return None
+
+
+def claim_inventory_game(language: str, board_size: str, updates: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Claim the oldest unclaimed game in an inventory pool with a single conditional write.
+    The claim removes the game from the pool, stamps its createdAt, and applies the updates.
+    If another request claims a game first, the next candidate is tried.
+
+    Args:
+        language (str): The language code.
+        board_size (str): The board size.
+        updates (Dict[str, Any]): Attributes to set on the claimed game (e.g. gameType, createdBy).
+
+    Returns:
+        Optional[Dict[str, Any]]: The claimed game, or None if the pool is empty or unavailable.
+    """
+    try:
+        table = get_games_table()
+        response = table.query(
+            IndexName=INVENTORY_INDEX_NAME,
+            KeyConditionExpression=Key("inventoryPool").eq(get_inventory_pool_key(language, board_size)),
+            Limit=INVENTORY_CLAIM_CANDIDATES,
+        )
+    except ClientError as e:
+        print(f"Error reading random game inventory: {e}")
+        return None
+
+    attribute_names = {"#createdAt": "createdAt"}
+    attribute_values: Dict[str, Any] = {":createdAt": datetime.now().isoformat()}
+    set_expressions = ["#createdAt = :createdAt"]
+    for i, (key, value) in enumerate(updates.items()):
+        attribute_names[f"#u{i}"] = key
+        attribute_values[f":u{i}"] = value
+        set_expressions.append(f"#u{i} = :u{i}")
+    update_expression = "SET " + ", ".join(set_expressions) + " REMOVE inventoryPool, inventoryAddedAt"
+
+    for candidate in response.get("Items", []):
+        try:
+            claimed = table.update_item(
+                Key={"gameId": candidate["gameId"]},
+                UpdateExpression=update_expression,
+                ConditionExpression="attribute_exists(inventoryPool)",
+                ExpressionAttributeNames=attribute_names,
+                ExpressionAttributeValues=attribute_values,
+                ReturnValues="ALL_NEW",
+            )
+            claimed_game: Dict[str, Any] = decompress_game_item(convert_decimal(claimed["Attributes"]))
+            return claimed_game
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                continue
+            print(f"Error claiming inventory game {candidate['gameId']}: {e}")
+            return None
+    return None
 
 
 # ====================== Metadata Table Functions ======================
 
+# The random game count is split across shards, so adding games doesn't contend on one item.
+# Shard s numbers its games s * RANDOM_GAME_SHARD_SPAN + 1, + 2, ... Shard 0 is the original,
+# unsharded count, so games numbered before sharding keep their numbers. Shards can be added
+# by raising RANDOM_GAME_COUNTER_SHARDS, but never removed.
+RANDOM_GAME_COUNTER_SHARDS = int(os.getenv("RANDOM_GAME_COUNTER_SHARDS", "8"))
+RANDOM_GAME_SHARD_SPAN = 10 ** 9
+RANDOM_GAME_COUNT_TTL_SECONDS = 10  # How long summed shard counts are reused
+MAX_RESERVATION_ATTEMPTS = 5  # Tries to reserve a block by id before giving up on a busy count
+_random_game_counts: Dict[str, Tuple[List[int], float]] = {}  # language -> (count per shard, when read)
+
+
+def get_random_game_count_key(language: str, shard: int) -> str:
+    """
+    Get the metadata key of one shard of a language's random game count.
+    """
+    if shard == 0:
+        return f"randomGameCount_{language}"
+    return f"randomGameCount_{language}#{shard}"
+
+
+def fetch_random_game_shard_counts(language: str = "en") -> List[int]:
+    """
+    Fetch how many random games each shard of a language's count has numbered, with one
+    eventually consistent batch read. Counts are reused for RANDOM_GAME_COUNT_TTL_SECONDS,
+    except after this container adds games.
+
+    Args:
+        language (str): The language code for the count (e.g., 'en', 'es').
+
+    Returns:
+        List[int]: The count of each shard, by shard number.
+    """
+    cached = _random_game_counts.get(language)
+    if cached and time.monotonic() - cached[1] < RANDOM_GAME_COUNT_TTL_SECONDS:
+        return cached[0]
+
+    table_name = os.environ.get("METADATA_TABLE", "LetterBoxedMetadata")
+    keys = [get_random_game_count_key(language, shard) for shard in range(RANDOM_GAME_COUNTER_SHARDS)]
+    request_items: Dict[str, Any] = {
+        table_name: {"Keys": [{"metadataType": {"S": key}} for key in keys]}
+    }
+    found, complete = batch_get_all(request_items)
+    if not complete:
+        # Games in unread shards just can't be picked until the next read
+        print(f"Unprocessed keys left reading the random game count for '{language}'.")
+    values = {item["metadataType"]["S"]: int(item["value"]["N"]) for item in found.get(table_name, [])}
+
+    counts = [values.get(key, 0) for key in keys]
+    _random_game_counts[language] = (counts, time.monotonic())
+    return counts
+
+
 def fetch_random_game_count(language: str = "en") -> int:
     """
-    Fetch the current random game count for the specified language from the metadata table.
+    Fetch the current random game count for the specified language, summed over its shards.
 
     Args:
         language (str): The language code for the count (e.g., 'en', 'es').
@@ -483,33 +1353,224 @@ def fetch_random_game_count(language: str = "en") -> int:
     Returns:
         int: The current count of random games for the language.
     """
-    table = get_metadata_table()
-    metadata_key = f"randomGameCount_{language}"
-    response = table.get_item(Key={"metadataType": metadata_key})
-    game_count = response.get("Item", {}).get("value", 0) if response else 0
-    return int(game_count)
+    return sum(fetch_random_game_shard_counts(language))
+
+
+def pick_random_atomic_numbers(count: int, language: str = "en") -> List[int]:
+    """
+    Pick the atomic numbers of distinct random games, uniformly over all numbered games.
+    Each game is a position across the shards, which maps to its shard and its offset in it.
+
+    Args:
+        count (int): How many games to pick. Fewer are picked if there aren't enough.
+        language (str): The language code (e.g., 'en', 'es').
+
+    Returns:
+        List[int]: The atomic numbers, in random order. Empty if the language has no random games.
+    """
+    counts = fetch_random_game_shard_counts(language)
+    total = sum(counts)
+    atomic_numbers = []
+    for position in random.sample(range(total), min(count, total)):
+        for shard, shard_count in enumerate(counts):
+            if position < shard_count:
+                atomic_numbers.append(shard * RANDOM_GAME_SHARD_SPAN + position + 1)
+                break
+            position -= shard_count
+    return atomic_numbers
 
 
 def increment_random_game_count(language: str = "en") -> int:
     """
-    Increment the random game count for the specified language in the metadata table.
+    Increment the random game count for the specified language and number a new game.
 
     Args:
         language (str): The language code for the count (e.g., 'en', 'es').
 
     Returns:
-        int: The new count of random games for the language.
+        int: The atomic number of the new game.
     """
+    return reserve_random_game_numbers(1, language)
+
+
+def reserve_random_game_numbers(count: int, language: str = "en", reservation_id: Optional[str] = None) -> int:
+    """
+    Reserve a block of consecutive atomic numbers for random games with a single
+    update of one randomly chosen shard of the count.
+
+    With a reservation_id, the block is recorded under that id in the same transaction
+    as the count update, and reserving again with the id returns the same block. A
+    caller that saves the id before reserving can then never lose a block it reserved.
+
+    Args:
+        count (int): How many numbers to reserve.
+        language (str): The language code for the count (e.g., 'en', 'es').
+        reservation_id (str, optional): A unique id for this reservation.
+
+    Returns:
+        int: The first number of the reserved block.
+    """
+    if count < 1:
+        raise ValueError("Must reserve at least one random game number.")
+    if reservation_id is not None:
+        return _reserve_random_game_numbers_once(count, language, reservation_id)
+    shard = random.randrange(RANDOM_GAME_COUNTER_SHARDS)
     table = get_metadata_table()
-    metadata_key = f"randomGameCount_{language}"
     response = table.update_item(
-        Key={"metadataType": metadata_key},
+        Key={"metadataType": get_random_game_count_key(language, shard)},
         UpdateExpression="SET #val = if_not_exists(#val, :start) + :inc",
         ExpressionAttributeNames={"#val": "value"},
-        ExpressionAttributeValues={":start": 0, ":inc": 1},
+        ExpressionAttributeValues={":start": 0, ":inc": count},
         ReturnValues="UPDATED_NEW"
     )
-    return int(response["Attributes"]["value"])
+    # Our own games should be pickable right away
+    _random_game_counts.pop(language, None)
+    return shard * RANDOM_GAME_SHARD_SPAN + int(response["Attributes"]["value"]) - count + 1
+
+
+def _reserve_random_game_numbers_once(count: int, language: str, reservation_id: str) -> int:
+    table_name = os.environ.get("METADATA_TABLE", "LetterBoxedMetadata")
+    reservation_key = get_random_game_reservation_key(reservation_id)
+    for _ in range(MAX_RESERVATION_ATTEMPTS):
+        reserved = fetch_random_game_reservation(reservation_id)
+        if reserved is not None:
+            return reserved
+
+        # The new count is set outright, so it's conditional on the count that was read
+        shard = random.randrange(RANDOM_GAME_COUNTER_SHARDS)
+        count_key = get_random_game_count_key(language, shard)
+        item = get_metadata_table().get_item(Key={"metadataType": count_key}, ConsistentRead=True).get("Item")
+        current = int(item["value"]) if item and "value" in item else 0
+        first_number = shard * RANDOM_GAME_SHARD_SPAN + current + 1
+        try:
+            dynamodb_write_client.transact_write_items(TransactItems=[
+                {
+                    "Update": {
+                        "TableName": table_name,
+                        "Key": {"metadataType": {"S": count_key}},
+                        "UpdateExpression": "SET #val = :new",
+                        "ConditionExpression": "attribute_not_exists(#val) OR #val = :current",
+                        "ExpressionAttributeNames": {"#val": "value"},
+                        "ExpressionAttributeValues": {
+                            ":new": {"N": str(current + count)},
+                            ":current": {"N": str(current)},
+                        },
+                    }
+                },
+                {
+                    "Put": {
+                        "TableName": table_name,
+                        "Item": {
+                            "metadataType": {"S": reservation_key},
+                            "value": {"N": str(first_number)},
+                        },
+                        "ConditionExpression": "attribute_not_exists(metadataType)",
+                    }
+                },
+            ])
+        except ClientError as e:
+            if e.response["Error"]["Code"] != "TransactionCanceledException":
+                raise
+            # Another reservation moved the count first (or this one landed); read again
+            print(f"Reservation {reservation_id} of random game numbers conflicted, retrying.")
+            continue
+        # Our own games should be pickable right away
+        _random_game_counts.pop(language, None)
+        return first_number
+    raise RuntimeError(f"Could not reserve random game numbers for reservation {reservation_id}.")
+
+
+def get_random_game_reservation_key(reservation_id: str) -> str:
+    """
+    Get the metadata key a block of random game numbers is recorded under.
+
+    Args:
+        reservation_id (str): The id the block was reserved with.
+
+    Returns:
+        str: The metadataType of the reservation.
+    """
+    return f"randomGameReservation_{reservation_id}"
+
+
+def fetch_random_game_reservation(reservation_id: str) -> Optional[int]:
+    """
+    Fetch the block of random game numbers reserved with an id.
+
+    Args:
+        reservation_id (str): The id the block was reserved with.
+
+    Returns:
+        Optional[int]: The first number of the block, or None if nothing was reserved with the id.
+    """
+    response = get_metadata_table().get_item(
+        Key={"metadataType": get_random_game_reservation_key(reservation_id)}, ConsistentRead=True
+    )
+    item = response.get("Item")
+    return int(item["value"]) if item else None
+
+
+def delete_random_game_reservation(reservation_id: str) -> bool:
+    """
+    Delete the record of a reservation once its games are in the random game pool.
+
+    Args:
+        reservation_id (str): The id the block was reserved with.
+
+    Returns:
+        bool: True if the record was deleted (or didn't exist), False otherwise.
+    """
+    try:
+        get_metadata_table().delete_item(Key={"metadataType": get_random_game_reservation_key(reservation_id)})
+        return True
+    except ClientError as e:
+        print(f"Error deleting random game reservation {reservation_id}: {e}")
+        return False
+
+
+def fetch_seed_usage(language: str = "en") -> Optional[Dict[str, Any]]:
+    """
+    Fetch the stored seed word usage counts for the specified language.
+
+    Args:
+        language (str): The language code (e.g., 'en', 'es').
+
+    Returns:
+        Optional[Dict[str, Any]]: {"counts": encoded counts (bytes), "revision": int},
+        or None if no usage has been stored yet.
+    """
+    table = get_metadata_table()
+    response = table.get_item(Key={"metadataType": f"seedUsage_{language}"})
+    item = response.get("Item") if response else None
+    if not item or "counts" not in item:
+        return None
+    return {"counts": bytes(item["counts"]), "revision": int(item.get("revision", 0))}
+
+
+def save_seed_usage(language: str, counts: bytes, revision: int) -> bool:
+    """
+    Store seed word usage counts, if nobody else has stored new counts since they were read.
+
+    Args:
+        language (str): The language code (e.g., 'en', 'es').
+        counts (bytes): The encoded counts.
+        revision (int): The revision the counts were read at (0 if none were stored).
+
+    Returns:
+        bool: True if the counts were stored, False if the stored revision has moved on.
+    """
+    table = get_metadata_table()
+    try:
+        table.put_item(
+            Item={"metadataType": f"seedUsage_{language}", "counts": counts, "revision": revision + 1},
+            ConditionExpression="attribute_not_exists(metadataType) OR revision = :revision",
+            ExpressionAttributeValues={":revision": revision},
+        )
+        return True
+    except ClientError as e:
+        if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+            return False
+        raise
 
 
 def update_metadata(metadata_type: str, new_value: int) -> None:
@@ -539,7 +1600,7 @@ def get_metadata_table() -> Any:
         boto3.Table: The DynamoDB Table object.
     """
     table_name = os.environ.get("METADATA_TABLE", "LetterBoxedMetadata")
-    return dynamodb.Table(table_name)
+    return get_table(table_name)
 
 
 # ====================== Archive Table Functions ======================
@@ -616,4 +1677,4 @@ def get_archive_table() -> Any:
         boto3.Table: The DynamoDB Table object.
     """
     table_name = os.environ.get("ARCHIVE_TABLE", "LetterBoxedNYTArchives")
-    return dynamodb.Table(table_name)
+    return get_table(table_name)
@@ -0,0 +1,472 @@
+import os
+import sys
+import json
+import hashlib
+import unicodedata
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from lambdas.common.sampling_utils import WeightedSampler
+
+# Bump when the on-disk layout of a compiled dictionary changes
+INDEX_FORMAT_VERSION = 2
+MANIFEST_FILE = "manifest.json"
+
+# Commonness ranks (lower is more common), from membership in the basic word list
+# and in the NYT dictionaries collected by the daily update
+RANK_BASIC_AND_NYT = 0
+RANK_BASIC = 1
+RANK_NYT = 2
+RANK_OTHER = 3
+# Relative sampling weight of a word at each rank
+COMMONNESS_WEIGHTS: Tuple[float, ...] = (16.0, 8.0, 4.0, 1.0)
+
+
+def normalize_to_base(word: str) -> str:
+    """
+    Normalize a word to its base form by removing accents and diacritical marks.
+    (Lives here rather than in game_utils, which imports this module.)
+    """
+    return ''.join(
+        char for char in unicodedata.normalize('NFD', word)
+        if unicodedata.category(char) != 'Mn'
+    )
+
+
+def build_base_word_map(words: Sequence[str], base_words: Optional[Sequence[str]] = None) -> Dict[str, str]:
+    """
+    Map the base form of each word (accents removed) to the first word with that base form,
+    so a submitted word can be matched with a single lookup.
+
+    Args:
+        words (Sequence[str]): The words in their original form.
+        base_words (Sequence[str], optional): Their stored base forms, in the same order.
+            Base forms that are missing, or that still have non-ASCII letters, are
+            recomputed from the word.
+
+    Returns:
+        Dict[str, str]: Base form -> original word.
+    """
+    if base_words is None or len(base_words) != len(words):
+        base_words = [""] * len(words)
+    words_by_base: Dict[str, str] = {}
+    for word, base_word in zip(words, base_words):
+        if not base_word or not base_word.isascii():
+            base_word = normalize_to_base(word)
+        words_by_base.setdefault(base_word, word)
+    return words_by_base
+
+
+class DictionaryIndex:
+    """
+    A compiled, read-only view of one language's dictionary.
+
+    Words are stored in dictionary order, and every other structure refers to a
+    word by its position in that order:
+        - base_words: the word with accents removed
+        - masks: a bitmask of the base letters in the word (bit i = alphabet[i])
+        - first_letter_buckets: word positions grouped by first base letter
+        - basic_bitmap: one bit per word, set if the word is in the basic dictionary
+        - ranks: the commonness rank of each word (see RANK_*)
+    """
+
+    def __init__(
+        self,
+        language: str,
+        words: List[str],
+        base_words: List[str],
+        masks: "array[int]",
+        alphabet: str,
+        first_letter_buckets: Dict[str, "array[int]"],
+        basic_bitmap: bytearray,
+        extra_basic_words: List[str],
+        ranks: "array[int]",
+        version: str,
+        sources: Optional[Dict[str, str]] = None,
+        has_basic_words: bool = True,
+    ) -> None:
+        self.language = language
+        self.words = words
+        self.base_words = base_words
+        self.masks = masks
+        self.alphabet = alphabet
+        self.letter_bits = {letter: 1 << i for i, letter in enumerate(alphabet)}
+        self.first_letter_buckets = first_letter_buckets
+        self.basic_bitmap = basic_bitmap
+        self.extra_basic_words = extra_basic_words
+        self.ranks = ranks
+        self.version = version
+        self.sources = sources or {}
+        # False if the language has no basic word list (as opposed to an empty one)
+        self.has_basic_words = has_basic_words
+        self._basic_words: Optional[List[str]] = None
+        self._positions: Optional[Dict[str, int]] = None
+        self._prefix_buckets: Optional[Dict[str, "array[int]"]] = None
+        self._samplers: Dict[Tuple[str, Tuple[float, ...]], WeightedSampler[str]] = {}
+
+    # ====================== Building ======================
+
+    @classmethod
+    def build(
+        cls,
+        language: str,
+        words: Iterable[str],
+        basic_words: Optional[Iterable[str]] = None,
+        sources: Optional[Dict[str, str]] = None,
+        nyt_words: Optional[Iterable[str]] = None,
+    ) -> "DictionaryIndex":
+        """
+        Compile a dictionary and (optionally) its basic word list.
+
+        Args:
+            language (str): The language code.
+            words (Iterable[str]): The full dictionary, in the order it should be stored.
+            basic_words (Iterable[str], optional): The basic dictionary. None if the
+                language has none, so get_words('basic') raises instead of returning [].
+            nyt_words (Iterable[str], optional): Words seen in NYT dictionaries, used
+                with the basic dictionary to rank words by commonness.
+            sources (Dict[str, str], optional): Source file name to ETag, used to
+                detect stale compiled dictionaries.
+
+        Returns:
+            DictionaryIndex: The compiled dictionary.
+        """
+        word_list = [word for word in words if word]
+        base_words = [normalize_to_base(word) for word in word_list]
+        alphabet = "".join(sorted({letter for base_word in base_words for letter in base_word}))
+        letter_bits = {letter: 1 << i for i, letter in enumerate(alphabet)}
+        if len(alphabet) > 64:
+            raise ValueError(f"Alphabet for '{language}' has {len(alphabet)} letters; at most 64 are supported.")
+
+        masks = array("Q")
+        first_letter_buckets: Dict[str, "array[int]"] = {}
+        for position, base_word in enumerate(base_words):
+            mask = 0
+            for letter in base_word:
+                mask |= letter_bits[letter]
+            masks.append(mask)
+            first_letter_buckets.setdefault(base_word[0], array("I")).append(position)
+
+        positions = {word: position for position, word in enumerate(word_list)}
+        basic_bitmap = bytearray((len(word_list) + 7) // 8)
+        extra_basic_words: List[str] = []
+        for word in basic_words or []:
+            if not word:
+                continue
+            basic_position = positions.get(word)
+            if basic_position is None:
+                extra_basic_words.append(word)
+            else:
+                basic_bitmap[basic_position >> 3] |= 1 << (basic_position & 7)
+
+        nyt_set = set(nyt_words or [])
+        ranks = array("B")
+        for position, word in enumerate(word_list):
+            is_basic = bool(basic_bitmap[position >> 3] & (1 << (position & 7)))
+            if word in nyt_set:
+                ranks.append(RANK_BASIC_AND_NYT if is_basic else RANK_NYT)
+            else:
+                ranks.append(RANK_BASIC if is_basic else RANK_OTHER)
+
+        digest = hashlib.sha256()
+        digest.update("\n".join(word_list).encode("utf-8"))
+        digest.update(bytes(basic_bitmap))
+        digest.update("\n".join(extra_basic_words).encode("utf-8"))
+        digest.update(ranks.tobytes())
+
+        return cls(
+            language=language,
+            words=word_list,
+            base_words=base_words,
+            masks=masks,
+            alphabet=alphabet,
+            first_letter_buckets=first_letter_buckets,
+            basic_bitmap=basic_bitmap,
+            extra_basic_words=extra_basic_words,
+            ranks=ranks,
+            version=digest.hexdigest()[:16],
+            sources=sources,
+            has_basic_words=basic_words is not None,
+        )
+
+    # ====================== Persistence ======================
+
+    def save(self, directory: str) -> None:
+        """
+        Write the compiled dictionary to a directory as binary artifacts plus a manifest.
+
+        Args:
+            directory (str): The output directory (created if missing).
+        """
+        os.makedirs(directory, exist_ok=True)
+
+        bucket_offsets: Dict[str, List[int]] = {}
+        bucket_positions = array("I")
+        for letter in sorted(self.first_letter_buckets):
+            bucket = self.first_letter_buckets[letter]
+            bucket_offsets[letter] = [len(bucket_positions), len(bucket)]
+            bucket_positions.extend(bucket)
+
+        with open(os.path.join(directory, "words.bin"), "wb") as f:
+            f.write("\n".join(self.words).encode("utf-8"))
+        with open(os.path.join(directory, "base_words.bin"), "wb") as f:
+            f.write("\n".join(self.base_words).encode("utf-8"))
+        with open(os.path.join(directory, "masks.bin"), "wb") as f:
+            self.masks.tofile(f)
+        with open(os.path.join(directory, "first_letter.bin"), "wb") as f:
+            bucket_positions.tofile(f)
+        with open(os.path.join(directory, "basic.bin"), "wb") as f:
+            f.write(bytes(self.basic_bitmap))
+        with open(os.path.join(directory, "ranks.bin"), "wb") as f:
+            self.ranks.tofile(f)
+
+        manifest = {
+            "formatVersion": INDEX_FORMAT_VERSION,
+            "language": self.language,
+            "version": self.version,
+            "sources": self.sources,
+            "wordCount": len(self.words),
+            "alphabet": self.alphabet,
+            "byteOrder": sys.byteorder,
+            "firstLetterBuckets": bucket_offsets,
+            "extraBasicWords": self.extra_basic_words,
+            "hasBasicWords": self.has_basic_words,
+        }
+        with open(os.path.join(directory, MANIFEST_FILE), "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+    @staticmethod
+    def read_manifest(directory: str) -> Optional[Dict[str, Any]]:
+        """
+        Read the manifest of a compiled dictionary without loading its artifacts.
+
+        Args:
+            directory (str): The compiled dictionary directory.
+
+        Returns:
+            Optional[Dict[str, Any]]: The manifest, or None if it is missing or
+            was written by an incompatible format version.
+        """
+        manifest_path = os.path.join(directory, MANIFEST_FILE)
+        if not os.path.exists(manifest_path):
+            return None
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest: Dict[str, Any] = json.load(f)
+        if manifest.get("formatVersion") != INDEX_FORMAT_VERSION:
+            return None
+        return manifest
+
+    @classmethod
+    def load(cls, directory: str) -> Optional["DictionaryIndex"]:
+        """
+        Load a compiled dictionary written by save().
+
+        Args:
+            directory (str): The compiled dictionary directory.
+
+        Returns:
+            Optional[DictionaryIndex]: The compiled dictionary, or None if the
+            directory does not contain a compatible one.
+        """
+        manifest = cls.read_manifest(directory)
+        if manifest is None:
+            return None
+        swap_bytes = manifest.get("byteOrder", sys.byteorder) != sys.byteorder
+
+        def read_array(file_name: str, typecode: str) -> "array[int]":
+            values = array(typecode)
+            with open(os.path.join(directory, file_name), "rb") as f:
+                values.frombytes(f.read())
+            if swap_bytes:
+                values.byteswap()
+            return values
+
+        def read_words(file_name: str) -> List[str]:
+            with open(os.path.join(directory, file_name), "rb") as f:
+                content = f.read().decode("utf-8")
+            return content.split("\n") if content else []
+
+        words = read_words("words.bin")
+        base_words = read_words("base_words.bin")
+        masks = read_array("masks.bin", "Q")
+        bucket_positions = read_array("first_letter.bin", "I")
+        with open(os.path.join(directory, "basic.bin"), "rb") as f:
+            basic_bitmap = bytearray(f.read())
+        ranks = read_array("ranks.bin", "B")
+
+        first_letter_buckets = {
+            letter: bucket_positions[start:start + count]
+            for letter, (start, count) in manifest["firstLetterBuckets"].items()
+        }
+
+        return cls(
+            language=manifest["language"],
+            words=words,
+            base_words=base_words,
+            masks=masks,
+            alphabet=manifest["alphabet"],
+            first_letter_buckets=first_letter_buckets,
+            basic_bitmap=basic_bitmap,
+            extra_basic_words=manifest.get("extraBasicWords", []),
+            ranks=ranks,
+            version=manifest["version"],
+            sources=manifest.get("sources", {}),
+            has_basic_words=manifest.get("hasBasicWords", True),
+        )
+
+    # ====================== Queries ======================
+
+    def letter_mask(self, letters: Iterable[str]) -> int:
+        """
+        Build the bitmask for a set of base letters. Letters outside the
+        dictionary's alphabet are ignored.
+
+        Args:
+            letters (Iterable[str]): The letters.
+
+        Returns:
+            int: The bitmask.
+        """
+        mask = 0
+        for letter in letters:
+            mask |= self.letter_bits.get(letter, 0)
+        return mask
+
+    def is_basic(self, position: int) -> bool:
+        """
+        Check whether the word at a position is in the basic dictionary.
+
+        Args:
+            position (int): The word position.
+
+        Returns:
+            bool: True if the word is a basic word.
+        """
+        return bool(self.basic_bitmap[position >> 3] & (1 << (position & 7)))
+
+    def get_words(self, dictionary_type: str = "dictionary") -> List[str]:
+        """
+        Return a copy of the full or basic word list.
+
+        Args:
+            dictionary_type (str): 'dictionary' for the full list or 'basic' for the basic list.
+
+        Returns:
+            List[str]: The words, which the caller may modify.
+
+        Raises:
+            ValueError: If the list wasn't compiled (e.g. the language has no basic list).
+        """
+        if dictionary_type == "dictionary":
+            return list(self.words)
+        if dictionary_type == "basic" and not self.has_basic_words:
+            raise ValueError(f"Dictionary 'basic' for language '{self.language}' is not compiled.")
+        if dictionary_type == "basic":
+            if self._basic_words is None:
+                self._basic_words = [
+                    word for position, word in enumerate(self.words) if self.is_basic(position)
+                ] + self.extra_basic_words
+            return list(self._basic_words)
+        raise ValueError(f"Dictionary type '{dictionary_type}' is not compiled.")
+
+    def get_prefix_bucket(self, prefix: str) -> "array[int]":
+        """
+        Get the positions of the words whose base form starts with a two-letter prefix.
+        The buckets are built on first use.
+
+        Args:
+            prefix (str): Two base letters.
+
+        Returns:
+            array[int]: The word positions, in dictionary order.
+        """
+        if self._prefix_buckets is None:
+            self._prefix_buckets = {}
+            for position, base_word in enumerate(self.base_words):
+                if len(base_word) >= 2:
+                    self._prefix_buckets.setdefault(base_word[:2], array("I")).append(position)
+        return self._prefix_buckets.get(prefix, array("I"))
+
+    def get_rank(self, word: str) -> Optional[int]:
+        """
+        Look up the commonness rank of a word.
+
+        Args:
+            word (str): The word, as stored in the dictionary.
+
+        Returns:
+            Optional[int]: The rank (see RANK_*), or None if the word is not in the dictionary.
+        """
+        if self._positions is None:
+            self._positions = {word: position for position, word in enumerate(self.words)}
+        position = self._positions.get(word)
+        if position is None:
+            return None
+        return int(self.ranks[position])
+
+    def get_base_word(self, word: str) -> str:
+        """
+        Get a word without accents, as its letters appear on a board.
+
+        Args:
+            word (str): The word.
+
+        Returns:
+            str: The base form (from the index if the word is in it).
+        """
+        if self._positions is None:
+            self._positions = {word: position for position, word in enumerate(self.words)}
+        position = self._positions.get(word)
+        if position is None:
+            return normalize_to_base(word)
+        return self.base_words[position]
+
+    def get_commonness_weights(
+        self,
+        words: Iterable[str],
+        weights: Sequence[float] = COMMONNESS_WEIGHTS,
+    ) -> List[float]:
+        """
+        Look up the sampling weight of each word from its commonness rank.
+        Words that are not in the dictionary get the weight of the least common rank.
+
+        Args:
+            words (Iterable[str]): The words.
+            weights (Sequence[float]): The weight of each rank.
+
+        Returns:
+            List[float]: One weight per word.
+        """
+        default_weight = weights[RANK_OTHER]
+        result = []
+        for word in words:
+            rank = self.get_rank(word)
+            result.append(default_weight if rank is None else weights[rank])
+        return result
+
+    def get_sampler(
+        self,
+        dictionary_type: str = "dictionary",
+        weights: Sequence[float] = COMMONNESS_WEIGHTS,
+    ) -> WeightedSampler[str]:
+        """
+        Get a sampler that draws words from the full or basic word list in O(1),
+        favoring common words. Built once per dictionary type and weighting.
+
+        Args:
+            dictionary_type (str): 'dictionary' for the full list or 'basic' for the basic list.
+            weights (Sequence[float]): The weight of each rank.
+
+        Returns:
+            WeightedSampler[str]: The sampler.
+        """
+        cache_key = (dictionary_type, tuple(weights))
+        sampler = self._samplers.get(cache_key)
+        if sampler is None:
+            if dictionary_type == "dictionary":
+                word_weights = [weights[rank] for rank in self.ranks]
+                sampler = WeightedSampler(self.words, word_weights)
+            else:
+                basic_words = self.get_words(dictionary_type)
+                sampler = WeightedSampler(basic_words, self.get_commonness_weights(basic_words, weights))
+            self._samplers[cache_key] = sampler
+        return sampler
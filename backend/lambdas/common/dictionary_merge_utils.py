@@ -0,0 +1,122 @@
+import os
+from typing import Iterable, List, Optional, Tuple
+
+MIN_WORD_LENGTH = 3
+
+
+def clean_word(word: str) -> str:
+    """
+    Normalize a raw dictionary line or word to the stored form.
+
+    Args:
+        word (str): The raw word.
+
+    Returns:
+        str: The word stripped of whitespace and converted to uppercase.
+    """
+    return word.strip().upper()
+
+
+def is_dictionary_word(word: str) -> bool:
+    """
+    Check whether a cleaned word is allowed in a dictionary file.
+
+    Args:
+        word (str): A word that has already been passed through clean_word.
+
+    Returns:
+        bool: True if the word is long enough and purely alphabetic.
+    """
+    return len(word) >= MIN_WORD_LENGTH and word.isalpha()
+
+
+def prepare_new_words(words: Iterable[str]) -> List[str]:
+    """
+    Clean, filter, sort and deduplicate a small batch of words so it can be
+    streamed into a sorted dictionary.
+
+    Args:
+        words (Iterable[str]): The raw words to merge (e.g. today's NYT dictionary).
+
+    Returns:
+        List[str]: The sorted, unique, cleaned words.
+    """
+    cleaned = {clean_word(word) for word in words}
+    return sorted(word for word in cleaned if is_dictionary_word(word))
+
+
+def merge_sorted_dictionary(
+    dictionary_path: str,
+    new_words: Iterable[str],
+    output_path: Optional[str] = None,
+) -> Tuple[List[str], int]:
+    """
+    Merge a small batch of words into an already sorted dictionary file in a
+    single streaming pass. Only one line of the dictionary is held in memory
+    at a time, so memory use does not grow with the dictionary size.
+
+    The output is written to a temporary file next to the output path and then
+    moved into place, so the dictionary can be merged into itself. If no words
+    were added, the output file is left untouched.
+
+    Args:
+        dictionary_path (str): Path to the sorted dictionary (one word per line).
+        new_words (Iterable[str]): The words to merge. They do not need to be
+            cleaned or sorted.
+        output_path (str, optional): Where to write the merged dictionary.
+            Defaults to overwriting dictionary_path.
+
+    Returns:
+        Tuple[List[str], int]: The words that were not already in the dictionary
+        (in sorted order), and the total word count after merging.
+
+    Raises:
+        ValueError: If the dictionary file is not sorted.
+    """
+    output_path = output_path or dictionary_path
+    pending = prepare_new_words(new_words)
+    added_words: List[str] = []
+    word_count = 0
+    pending_index = 0
+    last_word = ""
+    temp_path = output_path + ".tmp"
+
+    with open(dictionary_path, "r") as infile, open(temp_path, "w") as outfile:
+        for line in infile:
+            word = clean_word(line)
+            if not is_dictionary_word(word) or word == last_word:
+                continue
+            if word < last_word:
+                outfile.close()
+                os.remove(temp_path)
+                raise ValueError(
+                    f"Dictionary '{dictionary_path}' is not sorted: '{word}' follows '{last_word}'."
+                )
+
+            # Emit every new word that sorts before the current dictionary word
+            while pending_index < len(pending) and pending[pending_index] < word:
+                outfile.write(pending[pending_index] + "\n")
+                added_words.append(pending[pending_index])
+                word_count += 1
+                pending_index += 1
+
+            # Skip a new word that is already in the dictionary
+            if pending_index < len(pending) and pending[pending_index] == word:
+                pending_index += 1
+
+            outfile.write(word + "\n")
+            word_count += 1
+            last_word = word
+
+        # Any remaining new words sort after the last dictionary word
+        for word in pending[pending_index:]:
+            outfile.write(word + "\n")
+            added_words.append(word)
+            word_count += 1
+
+    if added_words or output_path != dictionary_path:
+        os.replace(temp_path, output_path)
+    else:
+        os.remove(temp_path)
+
+    return added_words, word_count
@@ -1,7 +1,11 @@
 import os
-import boto3
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from dotenv import load_dotenv
 from botocore.exceptions import ClientError
+from lambdas.common.aws_clients import get_client
+from lambdas.common.dictionary_index import DictionaryIndex
+from lambdas.common.sampling_utils import WeightedSampler
+from lambdas.common.seed_usage import SeedUsage, load_seed_usage
 
 load_dotenv()
 
@@ -12,9 +16,22 @@ DICTIONARY_BASE_S3_PATH = os.getenv("DICTIONARY_BASE_S3_PATH", "")
 DEFAULT_LANGUAGE = os.getenv("DEFAULT_LANGUAGE", "en")
 LOCAL_DICTIONARY_PATH = os.getenv("LOCAL_DICTIONARY_PATH", "./dictionaries/{language}/dictionary.txt")
 LOCAL_BASIC_DICTIONARY_PATH = os.getenv("LOCAL_BASIC_DICTIONARY_PATH", "./dictionaries/{language}/basic.txt")
+# Compiled dictionaries shipped in the dictionary Lambda layer (mounted under /opt)
+DICTIONARY_LAYER_PATH = os.getenv("DICTIONARY_LAYER_PATH", "/opt/dictionaries")
+CHECK_LAYER_FRESHNESS = os.getenv("DICTIONARY_LAYER_FRESHNESS_CHECK", "true").lower() == "true"
 
 # Initialize S3 client if needed
-s3 = boto3.client("s3") if DICTIONARY_SOURCE == "s3" else None
+s3 = get_client("s3", "transfer") if DICTIONARY_SOURCE == "s3" else None
+
+# Compiled dictionaries loaded by this container, by language
+_dictionary_index_cache: Dict[str, DictionaryIndex] = {}
+# Layer dictionaries checked by this container, by language (None if missing or stale)
+_layer_index_cache: Dict[str, Optional[DictionaryIndex]] = {}
+# Seed word usage counts loaded by this container, by language
+_seed_usage_cache: Dict[str, SeedUsage] = {}
+# Usage-balanced seed word samplers (with each word's position and commonness weight),
+# by language and dictionary type
+_balanced_sampler_cache: Dict[Tuple[str, str], Tuple[WeightedSampler[str], Dict[str, int], List[float]]] = {}
 
 
 def get_dictionary(language: str = DEFAULT_LANGUAGE) -> list[str]:
@@ -45,6 +62,207 @@ def get_basic_dictionary(language: str = DEFAULT_LANGUAGE) -> list[str]:
     return _load_dictionary(language, "basic")
 
 
+def get_dictionary_index(language: str = DEFAULT_LANGUAGE) -> DictionaryIndex:
+    """
+    Get the compiled dictionary for the specified language, cached for the life of the container.
+    Uses the dictionary layer when it is present and up to date, otherwise compiles
+    the dictionary from its source (local or S3).
+
+    Args:
+        language (str): The language code (e.g., 'en', 'es').
+
+    Returns:
+        DictionaryIndex: The compiled dictionary.
+    """
+    index = _dictionary_index_cache.get(language)
+    if index is not None:
+        return index
+
+    index = _load_layer_index(language) if DICTIONARY_SOURCE == "s3" else None
+    if index is None:
+        print(f"Compiling dictionary for {language}")
+        dictionary = _load_source_dictionary(language, "dictionary")
+        basic_dictionary: Optional[List[str]]
+        try:
+            basic_dictionary = _load_source_dictionary(language, "basic")
+        except ValueError:
+            # Compiled as missing, so get_basic_dictionary still raises
+            basic_dictionary = None
+        try:
+            nyt_words = _load_source_dictionary(language, "nyt")
+        except ValueError:
+            nyt_words = []
+        index = DictionaryIndex.build(language, dictionary, basic_dictionary, nyt_words=nyt_words)
+
+    _dictionary_index_cache[language] = index
+    return index
+
+
+def get_commonness_weights(words: Iterable[str], language: str = DEFAULT_LANGUAGE) -> Optional[List[float]]:
+    """
+    Get the sampling weight of each word from its commonness rank in the compiled dictionary.
+
+    Args:
+        words (Iterable[str]): The words.
+        language (str): The language code (e.g., 'en', 'es').
+
+    Returns:
+        Optional[List[float]]: One weight per word, or None if the dictionary could not be loaded.
+    """
+    try:
+        index = get_dictionary_index(language)
+    except (ValueError, RuntimeError) as e:
+        print(f"Commonness ranks unavailable for '{language}': {e}")
+        return None
+    return index.get_commonness_weights(words)
+
+
+def get_seed_usage(language: str = DEFAULT_LANGUAGE) -> SeedUsage:
+    """
+    Get the seed word usage counts for the specified language. They are loaded once and
+    cached with the dictionary for the life of the container, so balancing seed words
+    adds no reads per request. Games generated by this container are recorded in the
+    cached counts as they are made.
+
+    Args:
+        language (str): The language code (e.g., 'en', 'es').
+
+    Returns:
+        SeedUsage: The usage counts (empty if none are stored).
+    """
+    usage = _seed_usage_cache.get(language)
+    if usage is None:
+        usage = load_seed_usage(language)
+        _seed_usage_cache[language] = usage
+    return usage
+
+
+def get_balanced_sampler(language: str = DEFAULT_LANGUAGE, dictionary_type: str = "dictionary") -> WeightedSampler[str]:
+    """
+    Get a sampler that draws seed words weighted by their commonness rank, and weighted
+    down by how often they (and their letters) have been used. Built once per container
+    from the cached dictionary and usage counts, then kept up to date by record_seed_usage.
+
+    Args:
+        language (str): The language code (e.g., 'en', 'es').
+        dictionary_type (str): 'basic' or 'dictionary'.
+
+    Returns:
+        WeightedSampler[str]: The sampler.
+    """
+    cache_key = (language, dictionary_type)
+    cached = _balanced_sampler_cache.get(cache_key)
+    if cached is not None:
+        return cached[0]
+
+    index = get_dictionary_index(language)
+    usage = get_seed_usage(language)
+    words = index.get_words(dictionary_type)
+    commonness_weights = index.get_commonness_weights(words)
+    weights = [
+        weight * usage.weight_factor(word, index.get_base_word(word))
+        for word, weight in zip(words, commonness_weights)
+    ]
+    sampler = WeightedSampler(words, weights)
+    positions = {word: position for position, word in enumerate(words)}
+    _balanced_sampler_cache[cache_key] = (sampler, positions, commonness_weights)
+    return sampler
+
+
+def record_seed_usage(language: str, seed_words: List[str], game_layout: List[str]) -> None:
+    """
+    Record a generated game in this container's usage counts, and weigh its seed words
+    down in the balanced samplers already built. Nothing is read from or written to the
+    database: if this container has not loaded the usage counts, there is nothing to update.
+
+    Args:
+        language (str): The language code (e.g., 'en', 'es').
+        seed_words (List[str]): The game's seed word(s).
+        game_layout (List[str]): The game's sides.
+    """
+    usage = _seed_usage_cache.get(language)
+    if usage is None:
+        return
+    usage.record(seed_words, game_layout)
+    index = _dictionary_index_cache.get(language)
+    for (sampler_language, _), (sampler, positions, commonness_weights) in _balanced_sampler_cache.items():
+        if sampler_language != language:
+            continue
+        for word in seed_words:
+            position = positions.get(word)
+            if position is not None:
+                base_word = index.get_base_word(word) if index else None
+                sampler.update(position, commonness_weights[position] * usage.weight_factor(word, base_word))
+
+
+def clear_dictionary_cache() -> None:
+    """
+    Forget every dictionary (and seed word usage count) loaded by this container.
+    """
+    _dictionary_index_cache.clear()
+    _layer_index_cache.clear()
+    _seed_usage_cache.clear()
+    _balanced_sampler_cache.clear()
+
+
+def _load_layer_index(language: str) -> Optional[DictionaryIndex]:
+    """
+    Load the compiled dictionary for a language from the dictionary layer.
+    The result (including a miss) is remembered for the life of the container.
+
+    Args:
+        language (str): The language code.
+
+    Returns:
+        Optional[DictionaryIndex]: The compiled dictionary, or None if the layer has no
+        compatible dictionary for the language or it is older than the S3 source.
+    """
+    if language in _layer_index_cache:
+        return _layer_index_cache[language]
+
+    index = None
+    layer_directory = os.path.join(DICTIONARY_LAYER_PATH, language)
+    manifest = DictionaryIndex.read_manifest(layer_directory)
+    if manifest is None:
+        print(f"No compiled dictionary for '{language}' in layer at '{layer_directory}'.")
+    elif CHECK_LAYER_FRESHNESS and _is_layer_manifest_stale(language, manifest):
+        print(f"Compiled dictionary for '{language}' (version {manifest['version']}) is stale.")
+    else:
+        index = DictionaryIndex.load(layer_directory)
+
+    _layer_index_cache[language] = index
+    return index
+
+
+def _is_layer_manifest_stale(language: str, manifest: Dict[str, Any]) -> bool:
+    """
+    Compare the source ETags recorded when the layer was built with the current S3 objects.
+    Only object metadata is requested, so the check is a few small requests at most.
+
+    Args:
+        language (str): The language code.
+        manifest (Dict[str, Any]): The compiled dictionary manifest.
+
+    Returns:
+        bool: True if any source dictionary in S3 has changed since the layer was built.
+    """
+    s3_bucket_name = os.getenv("S3_BUCKET_NAME")
+    s3_base_path = os.getenv("DICTIONARY_BASE_S3_PATH", "")
+    if not s3_bucket_name or not s3:
+        return False
+
+    for dictionary_type, layer_etag in manifest.get("sources", {}).items():
+        s3_key = f"{s3_base_path}{language}/{dictionary_type}.txt"
+        try:
+            response = s3.head_object(Bucket=s3_bucket_name, Key=s3_key)
+        except ClientError as e:
+            print(f"Could not check freshness of {s3_key}: {e}")
+            continue
+        if response["ETag"].strip('"') != layer_etag:
+            return True
+    return False
+
+
 def _load_dictionary(language: str, dictionary_type: str) -> list[str]:
     """
     Generic function to load a dictionary of a specified type.
@@ -53,17 +271,33 @@ def _load_dictionary(language: str, dictionary_type: str) -> list[str]:
         language (str): The language code (e.g., 'en', 'es').
         dictionary_type (str): The type of dictionary to load ('dictionary', 'basic', etc.).
 
+    Returns:
+        list[str]: A list of words from the specified dictionary.
+    """
+    if DICTIONARY_SOURCE == "s3":
+        # From the layer, or compiled from S3 once when the layer is missing or stale, so
+        # each S3 dictionary is downloaded at most once per container
+        print(f"Loading compiled dictionary: {language}:{dictionary_type}")
+        return get_dictionary_index(language).get_words(dictionary_type)
+    return _load_source_dictionary(language, dictionary_type)
+
+
+def _load_source_dictionary(language: str, dictionary_type: str) -> list[str]:
+    """
+    Load a dictionary of a specified type from its source file (S3 or local), uncompiled.
+
+    Args:
+        language (str): The language code (e.g., 'en', 'es').
+        dictionary_type (str): The type of dictionary to load ('dictionary', 'basic', 'nyt').
+
     Returns:
         list[str]: A list of words from the specified dictionary.
     """
     if DICTIONARY_SOURCE == "s3":
         print(f"Fetching dictionary from S3: {language}:{dictionary_type}")
-        dictionary = _fetch_dictionary_from_s3(language, dictionary_type)
-    else:
-        print(f"Loading local dictionary for {language}:{dictionary_type}")
-        dictionary = _load_local_dictionary(language, dictionary_type)
-     
-    return dictionary
+        return _fetch_dictionary_from_s3(language, dictionary_type)
+    print(f"Loading local dictionary for {language}:{dictionary_type}")
+    return _load_local_dictionary(language, dictionary_type)
 
 
 def _fetch_dictionary_from_s3(language: str, dictionary_type: str) -> list[str]:
@@ -1,6 +1,7 @@
 from typing import Dict, Any, Optional, List, Tuple
 import time
 import uuid
+import random
 import hashlib
 from datetime import datetime
 from lambdas.common.game_utils import (
@@ -10,8 +11,9 @@ from lambdas.common.game_utils import (
     calculate_three_word_solutions,
     generate_valid_words,
     standardize_board,
-    normalize_to_base,
 )
+from lambdas.common.dictionary_index import normalize_to_base
+from lambdas.common.dictionary_utils import get_commonness_weights
 from lambdas.common.validation_utils import (
     validate_board_matches_layout,
     validate_board_size,
@@ -49,6 +51,9 @@ def create_game_schema(
     created_at: Optional[str] = None,
     created_by: str = "",
     clue: str = "",
+    generation_seed: Optional[int] = None,
+    difficulty: Optional[str] = None,
+    rng: Optional[random.Random] = None,
 ) -> Dict[str, Any]:
     """
     Create a game schema with validation and default values.
@@ -82,6 +87,9 @@ def create_game_schema(
         created_at: ISO timestamp for when the game was created.
         created_by: Identifier for the user who created the game, if applicable.
         clue: Clue for the two-word solution to this puzzle.
+        generation_seed: Seed a random game was generated from, so it can be reproduced.
+        difficulty: Difficulty band a random game was generated for, if any.
+        rng: Random generator used to order the solution search (seeded from generation_seed).
 
     Returns:
         A dictionary representing the game schema.
@@ -131,7 +139,13 @@ def create_game_schema(
         )
     two_word_solutions = (
         two_word_solutions 
-        or calculate_two_word_solutions(game_layout, valid_words, language)
+        or calculate_two_word_solutions(
+            game_layout,
+            valid_words,
+            language,
+            word_weights=get_commonness_weights(valid_words, language),
+            rng=rng,
+        )
         or []
     )
     three_word_solutions = (
@@ -180,6 +194,8 @@ def create_game_schema(
         "createdAt": created_time,
         "createdBy": created_by,
         "clue": clue,
+        "generationSeed": generation_seed,
+        "difficulty": difficulty,
     }
 
 
@@ -245,4 +261,19 @@ def generate_game_id() -> str:
     Returns:
         str: A unique identifier string.
     """
-    return str(uuid.uuid4())[-12:]
\ No newline at end of file
+    return str(uuid.uuid4())[-12:]
+
+
+def generate_content_game_id(*parts: str) -> str:
+    """
+    Generate a game id from the inputs a game was generated from, so identical
+    requests map to the same game.
+
+    Args:
+        *parts (str): The generation inputs.
+
+    Returns:
+        str: An identifier string, the same length as generate_game_id's.
+    """
+    content = "|".join(parts)
+    return hashlib.sha256(content.encode()).hexdigest()[:12]
@@ -2,10 +2,11 @@ from typing import List, Set, Optional, Dict, Tuple
 import time
 import random
 import logging
-import unicodedata
 from uuid import uuid4
 from collections import defaultdict, Counter
 from lambdas.common.dictionary_utils import get_dictionary
+from lambdas.common.dictionary_index import DictionaryIndex, normalize_to_base
+from lambdas.common.sampling_utils import weighted_shuffle
 
 logging.basicConfig(level=logging.INFO)
 _logger = logging.getLogger(__name__)
@@ -130,7 +131,9 @@ def calculate_two_word_solutions(
     valid_words: List[str],
     language: str = "en",
     starting_letter_to_words: Optional[Dict[str, List[str]]] = None,
-    time_limit: Optional[float] = 25.0
+    time_limit: Optional[float] = 25.0,
+    word_weights: Optional[List[float]] = None,
+    rng: Optional[random.Random] = None,
 ) -> List[Tuple[str, str]]:
     """
     Calculate the two-word solutions to the given puzzle input.
@@ -140,6 +143,10 @@ def calculate_two_word_solutions(
         language (str, optional): Language of the word dictionary.
         valid_words (List[str], optional): Pre-calculated list of valid words.
         starting_letter_to_words (Dict[str, List[str]], optional): Mapping of starting letters to words.
+        word_weights (List[float], optional): A weight for each valid word. Heavier (more common)
+            words are tried first, so solutions found before the cap favor common words.
+        rng (random.Random, optional): The random generator that orders the words, so the
+            same generator state finds the same solutions.
 
     Returns:
         List[Tuple[str, str]]: Pairs of words representing solutions to the puzzle.
@@ -168,8 +175,11 @@ def calculate_two_word_solutions(
     letter_usage: Counter[str] = Counter()
 
     # Iterate through all valid words
-    shuffled_valid_words = valid_words[:]
-    random.shuffle(shuffled_valid_words)
+    if word_weights and len(word_weights) == len(valid_words):
+        shuffled_valid_words = weighted_shuffle(valid_words, word_weights, rng)
+    else:
+        shuffled_valid_words = valid_words[:]
+        (rng or random).shuffle(shuffled_valid_words)
     for word1 in shuffled_valid_words:
         base_word1 = normalize_to_base(word1)
         # Update letter usage with word1
@@ -236,14 +246,8 @@ def calculate_three_word_solutions(
     Returns:
         List[Tuple[str, str, str]]: List of trios of words representing solutions to the puzzle.
     """
-    try:
-        dictionary = get_dictionary(language)
-    except ValueError as e:
-        # Log error if dictionary cannot be loaded
-        print(f"Error loading dictionary for language '{language}': {e}")
-        return []
-
     # Placeholder implementation: Return an empty list
+    # (the dictionary isn't loaded until this is implemented, since nothing would use it)
     return []
 
 
@@ -316,6 +320,33 @@ def generate_valid_words(game_layout: List[str], language: str = "en") -> List[s
     return valid_words
 
 
+def generate_valid_words_from_index(game_layout: List[str], index: DictionaryIndex) -> List[str]:
+    """
+    Generate valid words for the Letter Boxed puzzle from a compiled dictionary.
+    Words using a letter that is not on the board are skipped with a single bitmask
+    check, so only the few candidates that could fit are checked letter by letter.
+
+    Args:
+        game_layout (List[str]): Each side of the puzzle as a list.
+        index (DictionaryIndex): The compiled dictionary.
+
+    Returns:
+        List[str]: Words valid for the puzzle, in dictionary order.
+    """
+    letter_to_side = create_letter_to_side_mapping(game_layout)
+    all_letters = set(letter_to_side.keys())
+    board_mask = index.letter_mask(all_letters)
+
+    valid_words = []
+    for position, mask in enumerate(index.masks):
+        if mask & ~board_mask:
+            continue
+        base_word = index.base_words[position]
+        if is_valid_word(base_word, letter_to_side, all_letters):
+            valid_words.append(index.words[position])
+    return valid_words
+
+
 def sides_list_to_sides_set(game_layout: List[str]) -> List[Set[str]]:
     """
     Converts a list of string sides to a list of sets of characters.
@@ -390,14 +421,3 @@ def update_letter_usage(letter_usage: Counter[str], word: str, increment: bool =
         letter_usage[letter] += change
         if letter_usage[letter] == 0 and not increment:
             del letter_usage[letter]
-
-
-def normalize_to_base(word: str) -> str:
-    """
-    Normalize a word to its base form by removing accents and diacritical marks.
-    """
-    return ''.join(
-        char for char in unicodedata.normalize('NFD', word)
-        if unicodedata.category(char) != 'Mn'
-    )
-    
\ No newline at end of file
@@ -0,0 +1,112 @@
+import sys
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+# Rough per-object overhead added by estimate_size on top of string contents
+OBJECT_OVERHEAD_BYTES = 56
+
+
+class ItemCache:
+    """
+    A least-recently-used cache bounded by the estimated size of its values, for items
+    that never change once written. Kept for the life of a warm Lambda container.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        """
+        Args:
+            max_bytes (int): The most the cached values may take up, by estimate_size.
+        """
+        self.max_bytes = max_bytes
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a cached value, marking it as recently used.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Optional[Any]: The value, or None if it isn't cached.
+        """
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value: Any, size: Optional[int] = None) -> None:
+        """
+        Cache a value, evicting the least recently used ones to make room.
+        Values bigger than the whole cache are not cached.
+
+        Args:
+            key (str): The cache key.
+            value (Any): The value (not None).
+            size (int, optional): The value's size, if already known. Defaults to estimate_size.
+        """
+        if size is None:
+            size = estimate_size(value)
+        if key in self._entries:
+            self.size_bytes -= self._sizes.pop(key)
+            del self._entries[key]
+        if size > self.max_bytes:
+            return
+        while self._entries and self.size_bytes + size > self.max_bytes:
+            evicted, _ = self._entries.popitem(last=False)
+            self.size_bytes -= self._sizes.pop(evicted)
+        self._entries[key] = value
+        self._sizes[key] = size
+        self.size_bytes += size
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._sizes.clear()
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the cache's hit rate and size.
+
+        Returns:
+            Dict[str, Any]: {"hits", "misses", "hitRate", "entries", "sizeBytes"}.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hitRate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "entries": len(self._entries),
+            "sizeBytes": self.size_bytes,
+        }
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Estimate how much memory a value of strings, numbers, lists and dicts takes up.
+    Strings count their own size; containers add a fixed overhead per element.
+
+    Args:
+        value (Any): The value.
+
+    Returns:
+        int: The estimated size in bytes.
+    """
+    if isinstance(value, str):
+        return sys.getsizeof(value)
+    if isinstance(value, dict):
+        return OBJECT_OVERHEAD_BYTES + sum(
+            estimate_size(key) + estimate_size(item) for key, item in value.items()
+        )
+    if isinstance(value, (list, tuple, set)):
+        return OBJECT_OVERHEAD_BYTES + sum(estimate_size(item) for item in value)
+    return OBJECT_OVERHEAD_BYTES
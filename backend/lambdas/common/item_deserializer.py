@@ -0,0 +1,74 @@
+from typing import Any, Callable, Dict
+
+
+def deserialize_item(item: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Convert an item in the low-level DynamoDB format ({"S": "..."}, {"N": "..."}, ...)
+    straight to JSON-compatible Python values in one pass.
+
+    Numbers become int (or float if they have a fractional part) without going through
+    Decimal, so items don't need a convert_decimal pass afterwards.
+
+    Args:
+        item (Dict[str, Dict[str, Any]]): The item, as returned by the low-level client.
+
+    Returns:
+        Dict[str, Any]: The item as plain Python values.
+    """
+    return {name: deserialize_value(value) for name, value in item.items()}
+
+
+def deserialize_value(value: Dict[str, Any]) -> Any:
+    """
+    Convert one attribute value in the low-level DynamoDB format.
+
+    Args:
+        value (Dict[str, Any]): A single-key dict of type tag to value, e.g. {"N": "3"}.
+
+    Returns:
+        Any: The Python value.
+
+    Raises:
+        ValueError: If the type tag is unknown.
+    """
+    for tag, raw in value.items():
+        convert = _CONVERTERS.get(tag)
+        if convert is None:
+            raise ValueError(f"Unknown DynamoDB attribute type '{tag}'.")
+        return convert(raw)
+    raise ValueError("Empty DynamoDB attribute value.")
+
+
+def _number(raw: str) -> Any:
+    try:
+        return int(raw)
+    except ValueError:
+        number = float(raw)
+        return int(number) if number.is_integer() else number
+
+
+def _list(raw: Any) -> Any:
+    result = []
+    for element in raw:
+        # Lists of strings (words, layouts, solutions) are by far the most common, so skip the lookup
+        string = element.get("S")
+        result.append(string if string is not None else deserialize_value(element))
+    return result
+
+
+def _map(raw: Any) -> Any:
+    return {name: deserialize_value(value) for name, value in raw.items()}
+
+
+_CONVERTERS: Dict[str, Callable[[Any], Any]] = {
+    "S": lambda raw: raw,
+    "N": _number,
+    "BOOL": lambda raw: raw,
+    "NULL": lambda raw: None,
+    "L": _list,
+    "M": _map,
+    "SS": set,
+    "NS": lambda raw: {_number(number) for number in raw},
+    "B": bytes,
+    "BS": lambda raw: {bytes(binary) for binary in raw},
+}
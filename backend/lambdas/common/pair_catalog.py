@@ -0,0 +1,340 @@
+import os
+import sys
+import json
+import random
+import bisect
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from lambdas.common.dictionary_index import DictionaryIndex, normalize_to_base
+from lambdas.common.dictionary_utils import DICTIONARY_LAYER_PATH, DICTIONARY_SOURCE, get_dictionary_index
+
+# Bump when the on-disk layout of a pair catalog changes
+CATALOG_FORMAT_VERSION = 1
+# Catalogs built inside a Lambda container are kept here for the life of the container
+PAIR_CATALOG_CACHE_PATH = os.getenv("PAIR_CATALOG_CACHE_PATH", "/tmp/pair_catalogs")
+MIN_WORD_LENGTH = 3
+# Pairs kept per bucket. Buckets with more pairs keep a uniform sample, but are still
+# drawn from in proportion to their true size.
+MAX_PAIRS_PER_BUCKET = 2000
+# Fixed so offline and in-container builds of the same dictionary are identical
+BUILD_SEED = 0
+
+# Catalogs loaded by this container, by (language, dictionary type, board size)
+_pair_catalog_cache: Dict[Tuple[str, str, str], "PairCatalog"] = {}
+
+# (shared letters, shorter word length, longer word length)
+BucketKey = Tuple[int, int, int]
+
+
+def _required_letters(board_size: str) -> int:
+    try:
+        rows, cols = map(int, board_size.lower().split('x'))
+    except ValueError:
+        raise ValueError(f"Invalid board size format: '{board_size}'. Expected 'm x n'.")
+    return (2 * rows) + (2 * cols)
+
+
+class PairCatalog:
+    """
+    Every compatible seed word pair for one dictionary and board size, bucketed so
+    filtered samples are drawn without scanning the dictionary.
+
+    A pair (word1, word2) is compatible when word1's last base letter is word2's first
+    base letter and together they use exactly as many unique letters as the board has.
+    Pairs are grouped into buckets by (shared letters, shorter length, longer length);
+    a query only touches the buckets, never the pairs, to pick where to draw from.
+    """
+
+    def __init__(
+        self,
+        words: List[str],
+        pairs: "array[int]",
+        buckets: List[List[int]],
+        board_size: str,
+        dictionary_type: str,
+        dictionary_version: str,
+    ) -> None:
+        """
+        Args:
+            words (List[str]): The word list the pair positions refer to.
+            pairs (array[int]): Word positions, two per pair (first word, second word).
+            buckets (List[List[int]]): [shared, min length, max length, offset, stored, total]
+                for each bucket. offset and stored count pairs in `pairs`; total counts
+                every compatible pair in the bucket.
+            board_size (str): The board size the pairs fill.
+            dictionary_type (str): 'basic' or 'dictionary'.
+            dictionary_version (str): Version of the compiled dictionary the catalog was built from.
+        """
+        self.words = words
+        self.pairs = pairs
+        self.buckets = buckets
+        self.board_size = board_size
+        self.dictionary_type = dictionary_type
+        self.dictionary_version = dictionary_version
+
+    @property
+    def total_pairs(self) -> int:
+        return sum(bucket[5] for bucket in self.buckets)
+
+    # ====================== Building ======================
+
+    @classmethod
+    def build(
+        cls,
+        index: DictionaryIndex,
+        dictionary_type: str,
+        board_size: str,
+        max_pairs_per_bucket: int = MAX_PAIRS_PER_BUCKET,
+    ) -> "PairCatalog":
+        """
+        Enumerate the compatible pairs of a compiled dictionary.
+
+        Words are grouped by their set of base letters, so each distinct pair of letter
+        sets is checked once, and candidate second words with too few unique letters to
+        complete the board are skipped without being checked.
+
+        Args:
+            index (DictionaryIndex): The compiled dictionary.
+            dictionary_type (str): 'basic' or 'dictionary'.
+            board_size (str): The board size, e.g. '3x3'.
+            max_pairs_per_bucket (int): Pairs kept per bucket.
+
+        Returns:
+            PairCatalog: The catalog.
+        """
+        required = _required_letters(board_size)
+        words = index.get_words(dictionary_type)
+
+        # mask -> positions, grouped by first base letter (and unique letter count) and by last base letter
+        starts: Dict[str, Dict[int, Dict[int, List[int]]]] = {}
+        ends: Dict[str, Dict[int, List[int]]] = {}
+        for position, word in enumerate(words):
+            base_word = normalize_to_base(word)
+            if len(word) < MIN_WORD_LENGTH or any(letter not in index.letter_bits for letter in base_word):
+                continue
+            mask = index.letter_mask(base_word)
+            unique_letters = mask.bit_count()
+            if unique_letters > required:
+                continue
+            by_count = starts.setdefault(base_word[0], {})
+            by_count.setdefault(unique_letters, {}).setdefault(mask, []).append(position)
+            ends.setdefault(base_word[-1], {}).setdefault(mask, []).append(position)
+
+        rng = random.Random(BUILD_SEED)
+        reservoirs: Dict[BucketKey, List[Tuple[int, int]]] = {}
+        totals: Dict[BucketKey, int] = {}
+
+        def add_pair(first: int, second: int, shared: int) -> None:
+            length1, length2 = len(words[first]), len(words[second])
+            key = (shared, min(length1, length2), max(length1, length2))
+            total = totals.get(key, 0) + 1
+            totals[key] = total
+            reservoir = reservoirs.setdefault(key, [])
+            if len(reservoir) < max_pairs_per_bucket:
+                reservoir.append((first, second))
+            else:
+                slot = rng.randrange(total)
+                if slot < max_pairs_per_bucket:
+                    reservoir[slot] = (first, second)
+
+        for letter in sorted(ends):
+            second_groups = starts.get(letter)
+            if not second_groups:
+                continue
+            for mask1, first_positions in ends[letter].items():
+                # The second word shares at least the linking letter with the first
+                needed = required - mask1.bit_count() + 1
+                for unique_letters, second_masks in second_groups.items():
+                    if unique_letters < needed:
+                        continue
+                    for mask2, second_positions in second_masks.items():
+                        if (mask1 | mask2).bit_count() != required:
+                            continue
+                        shared = (mask1 & mask2).bit_count()
+                        for first in first_positions:
+                            for second in second_positions:
+                                if first != second:
+                                    add_pair(first, second, shared)
+
+        pairs = array("I")
+        buckets = []
+        for key in sorted(reservoirs):
+            reservoir = reservoirs[key]
+            buckets.append([key[0], key[1], key[2], len(pairs) // 2, len(reservoir), totals[key]])
+            for first, second in reservoir:
+                pairs.append(first)
+                pairs.append(second)
+
+        return cls(words, pairs, buckets, board_size, dictionary_type, index.version)
+
+    # ====================== Persistence ======================
+
+    @staticmethod
+    def directory_name(dictionary_type: str, board_size: str) -> str:
+        return f"{dictionary_type}-{board_size}"
+
+    def save(self, directory: str) -> None:
+        """
+        Write the catalog to a directory.
+
+        Args:
+            directory (str): The output directory (created if missing).
+        """
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, "pairs.bin"), "wb") as f:
+            self.pairs.tofile(f)
+        manifest = {
+            "formatVersion": CATALOG_FORMAT_VERSION,
+            "boardSize": self.board_size,
+            "dictionaryType": self.dictionary_type,
+            "dictionaryVersion": self.dictionary_version,
+            "byteOrder": sys.byteorder,
+            "buckets": self.buckets,
+        }
+        with open(os.path.join(directory, "manifest.json"), "w", encoding="utf-8") as f:
+            json.dump(manifest, f)
+
+    @classmethod
+    def load(cls, directory: str, index: DictionaryIndex, dictionary_type: str) -> Optional["PairCatalog"]:
+        """
+        Load a catalog written by save().
+
+        Args:
+            directory (str): The catalog directory.
+            index (DictionaryIndex): The compiled dictionary the catalog must have been built from.
+            dictionary_type (str): 'basic' or 'dictionary'.
+
+        Returns:
+            Optional[PairCatalog]: The catalog, or None if it is missing, incompatible,
+            or was built from a different version of the dictionary.
+        """
+        manifest_path = os.path.join(directory, "manifest.json")
+        if not os.path.exists(manifest_path):
+            return None
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest: Dict[str, Any] = json.load(f)
+        if (
+            manifest.get("formatVersion") != CATALOG_FORMAT_VERSION
+            or manifest.get("dictionaryVersion") != index.version
+            or manifest.get("dictionaryType") != dictionary_type
+        ):
+            return None
+
+        pairs = array("I")
+        with open(os.path.join(directory, "pairs.bin"), "rb") as f:
+            pairs.frombytes(f.read())
+        if manifest.get("byteOrder", sys.byteorder) != sys.byteorder:
+            pairs.byteswap()
+
+        return cls(
+            index.get_words(dictionary_type),
+            pairs,
+            manifest["buckets"],
+            manifest["boardSize"],
+            dictionary_type,
+            index.version,
+        )
+
+    # ====================== Queries ======================
+
+    def sample(
+        self,
+        count: int,
+        min_word_length: int = MIN_WORD_LENGTH,
+        max_word_length: int = 99,
+        max_shared_letters: int = 99,
+        exclude: Iterable[str] = (),
+        rng: Optional[random.Random] = None,
+        max_attempts: Optional[int] = None,
+    ) -> List[Tuple[str, str]]:
+        """
+        Draw distinct pairs uniformly from the pairs that match the filters.
+
+        Args:
+            count (int): The number of pairs to return.
+            min_word_length (int): Minimum length of each word.
+            max_word_length (int): Maximum length of each word.
+            max_shared_letters (int): Maximum letters the two words may share.
+            exclude (Iterable[str]): Words that may not appear in a pair.
+            rng (random.Random, optional): The random generator to use.
+            max_attempts (int, optional): Draws to try before giving up. Defaults to 20 per pair.
+
+        Returns:
+            List[Tuple[str, str]]: Up to `count` pairs (fewer if not enough pairs match).
+        """
+        rng = rng or random.Random()
+        excluded = set(exclude)
+
+        matching = [
+            bucket for bucket in self.buckets
+            if bucket[0] <= max_shared_letters
+            and bucket[1] >= min_word_length
+            and bucket[2] <= max_word_length
+            and bucket[4] > 0
+        ]
+        if not matching:
+            return []
+        cumulative_totals = []
+        running_total = 0
+        for bucket in matching:
+            running_total += bucket[5]
+            cumulative_totals.append(running_total)
+
+        results: List[Tuple[str, str]] = []
+        seen = set()
+        for _ in range(max_attempts or count * 20):
+            if len(results) >= count:
+                break
+            bucket = matching[bisect.bisect_right(cumulative_totals, rng.randrange(running_total))]
+            pair_offset = (bucket[3] + rng.randrange(bucket[4])) * 2
+            first, second = self.pairs[pair_offset], self.pairs[pair_offset + 1]
+            if (first, second) in seen:
+                continue
+            word1, word2 = self.words[first], self.words[second]
+            if word1 in excluded or word2 in excluded:
+                continue
+            seen.add((first, second))
+            results.append((word1, word2))
+        return results
+
+
+def get_pair_catalog(language: str, dictionary_type: str, board_size: str) -> PairCatalog:
+    """
+    Get the seed pair catalog for a language, dictionary and board size, cached for the
+    life of the container. Uses the catalog from the dictionary layer when it matches the
+    compiled dictionary, then one built earlier in this container, and otherwise builds
+    one and saves it under PAIR_CATALOG_CACHE_PATH.
+
+    Args:
+        language (str): The language code.
+        dictionary_type (str): 'basic' or 'dictionary'.
+        board_size (str): The board size, e.g. '3x3'.
+
+    Returns:
+        PairCatalog: The catalog.
+    """
+    cache_key = (language, dictionary_type, board_size)
+    catalog = _pair_catalog_cache.get(cache_key)
+    if catalog is not None:
+        return catalog
+
+    index = get_dictionary_index(language)
+    directory_name = PairCatalog.directory_name(dictionary_type, board_size)
+    layer_directory = os.path.join(DICTIONARY_LAYER_PATH, language, "pairs", directory_name)
+    cache_directory = os.path.join(PAIR_CATALOG_CACHE_PATH, language, directory_name)
+
+    if DICTIONARY_SOURCE == "s3":
+        catalog = PairCatalog.load(layer_directory, index, dictionary_type)
+    if catalog is None:
+        catalog = PairCatalog.load(cache_directory, index, dictionary_type)
+    if catalog is None:
+        print(f"Building {dictionary_type} pair catalog for {language} {board_size}")
+        catalog = PairCatalog.build(index, dictionary_type, board_size)
+        try:
+            catalog.save(cache_directory)
+        except OSError as e:
+            print(f"Could not cache pair catalog at {cache_directory}: {e}")
+        print(f"Pair catalog has {catalog.total_pairs} pairs in {len(catalog.buckets)} buckets")
+
+    _pair_catalog_cache[cache_key] = catalog
+    return catalog
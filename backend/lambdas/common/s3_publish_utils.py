@@ -0,0 +1,251 @@
+import os
+import json
+import glob
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+from boto3.s3.transfer import TransferConfig
+from botocore.exceptions import ClientError
+from lambdas.common.aws_clients import get_client
+
+# Uploads above the threshold are split into parts of this size. The ETag calculation
+# below must use the same values, or multipart ETags will never match.
+MULTIPART_THRESHOLD = 8 * 1024 * 1024
+MULTIPART_CHUNKSIZE = 8 * 1024 * 1024
+MAX_PUBLISH_WORKERS = 8
+
+DEFAULT_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=MULTIPART_THRESHOLD,
+    multipart_chunksize=MULTIPART_CHUNKSIZE,
+)
+
+# (local file path, bucket name, S3 key)
+Upload = Tuple[str, str, str]
+
+
+def calculate_s3_etag(
+    file_path: str,
+    multipart_threshold: int = MULTIPART_THRESHOLD,
+    multipart_chunksize: int = MULTIPART_CHUNKSIZE,
+) -> str:
+    """
+    Calculate the ETag S3 will report for a file uploaded with the given transfer settings.
+
+    Files smaller than the threshold are uploaded in a single request and their ETag
+    is the plain MD5. Larger files are uploaded in parts, and S3 reports the MD5 of
+    the concatenated part digests followed by "-<part count>".
+
+    Args:
+        file_path (str): Path to the local file.
+        multipart_threshold (int): Size at which uploads switch to multipart.
+        multipart_chunksize (int): Size of each multipart part.
+
+    Returns:
+        str: The expected ETag, without surrounding quotes.
+    """
+    file_size = os.path.getsize(file_path)
+    with open(file_path, "rb") as f:
+        if file_size < multipart_threshold:
+            hash_md5 = hashlib.md5()
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                hash_md5.update(chunk)
+            return hash_md5.hexdigest()
+
+        part_digests = []
+        for part in iter(lambda: f.read(multipart_chunksize), b""):
+            part_digests.append(hashlib.md5(part).digest())
+
+    combined = hashlib.md5(b"".join(part_digests)).hexdigest()
+    return f"{combined}-{len(part_digests)}"
+
+
+def load_publish_manifest(manifest_path: Optional[str]) -> Dict[str, Any]:
+    """
+    Load the local publishing manifest, or return an empty one.
+
+    The manifest has two sections:
+        "files": {path: {"size", "mtime", "etag"}} caches local content hashes.
+        "published": {"bucket/key": etag} records what was last uploaded.
+
+    Args:
+        manifest_path (Optional[str]): Path to the manifest JSON file.
+
+    Returns:
+        Dict[str, Any]: The manifest.
+    """
+    manifest: Dict[str, Any] = {"files": {}, "published": {}}
+    if manifest_path and os.path.exists(manifest_path):
+        with open(manifest_path, "r") as f:
+            manifest.update(json.load(f))
+    return manifest
+
+
+def save_publish_manifest(manifest_path: Optional[str], manifest: Dict[str, Any]) -> None:
+    """
+    Save the publishing manifest atomically.
+
+    Args:
+        manifest_path (Optional[str]): Path to the manifest JSON file. Nothing is saved if None.
+        manifest (Dict[str, Any]): The manifest to save.
+    """
+    if not manifest_path:
+        return
+    os.makedirs(os.path.dirname(os.path.abspath(manifest_path)), exist_ok=True)
+    temp_path = manifest_path + ".tmp"
+    with open(temp_path, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(temp_path, manifest_path)
+
+
+def get_local_etag(
+    file_path: str,
+    cached_entry: Optional[Dict[str, Any]],
+    transfer_config: TransferConfig = DEFAULT_TRANSFER_CONFIG,
+) -> Dict[str, Any]:
+    """
+    Return the manifest entry for a local file, re-hashing only if its size or
+    modification time changed since the cached entry was recorded.
+
+    Args:
+        file_path (str): Path to the local file.
+        cached_entry (Optional[Dict[str, Any]]): The entry from a previous run, if any.
+        transfer_config (TransferConfig): The transfer settings used for uploads.
+
+    Returns:
+        Dict[str, Any]: {"size": int, "mtime": int, "etag": str}
+    """
+    stat = os.stat(file_path)
+    if (
+        cached_entry
+        and cached_entry.get("size") == stat.st_size
+        and cached_entry.get("mtime") == stat.st_mtime_ns
+    ):
+        return cached_entry
+
+    etag = calculate_s3_etag(
+        file_path,
+        transfer_config.multipart_threshold,
+        transfer_config.multipart_chunksize,
+    )
+    return {"size": stat.st_size, "mtime": stat.st_mtime_ns, "etag": etag}
+
+
+def get_remote_etag(s3_client: Any, bucket_name: str, s3_key: str) -> Optional[str]:
+    """
+    Fetch the ETag of an S3 object.
+
+    Args:
+        s3_client: The boto3 S3 client.
+        bucket_name (str): The bucket name.
+        s3_key (str): The object key.
+
+    Returns:
+        Optional[str]: The ETag without quotes, or None if the object does not exist.
+    """
+    try:
+        response = s3_client.head_object(Bucket=bucket_name, Key=s3_key)
+        etag: str = response["ETag"].strip('"')
+        return etag
+    except ClientError:
+        return None
+
+
+def collect_dictionary_uploads(dictionaries_dir: str, targets: List[Dict[str, str]]) -> List[Upload]:
+    """
+    Build the list of uploads for every file under the dictionaries directory.
+
+    Args:
+        dictionaries_dir (str): The local dictionaries directory.
+        targets (List[Dict[str, str]]): Targets with "bucket_name" and "prefix" keys.
+
+    Returns:
+        List[Upload]: (file path, bucket, key) for every file and target.
+    """
+    uploads: List[Upload] = []
+    for file_path in sorted(glob.glob(f"{dictionaries_dir}/**/*", recursive=True)):
+        if not os.path.isfile(file_path):
+            continue
+        relative_path = os.path.relpath(file_path, dictionaries_dir).replace(os.sep, "/")
+        for target in targets:
+            uploads.append((file_path, target["bucket_name"], f"{target['prefix']}{relative_path}"))
+    return uploads
+
+
+def publish_files(
+    uploads: List[Upload],
+    manifest_path: Optional[str] = None,
+    s3_client: Optional[Any] = None,
+    max_workers: int = MAX_PUBLISH_WORKERS,
+    verify_remote: bool = False,
+    transfer_config: TransferConfig = DEFAULT_TRANSFER_CONFIG,
+) -> Dict[str, List[str]]:
+    """
+    Upload only the files whose content differs from what is already published,
+    concurrently across files and target buckets.
+
+    Each distinct local file is hashed once (re-using the manifest's cached hash when
+    the file is unchanged). An upload is skipped when the manifest says the same
+    content was already published to that bucket/key. Otherwise, or when
+    verify_remote is set, the object's ETag is compared with a HEAD request first.
+
+    Args:
+        uploads (List[Upload]): (file path, bucket, key) tuples to publish.
+        manifest_path (Optional[str]): Path to the local manifest. If None, every
+            upload is checked against S3.
+        s3_client: The boto3 S3 client to use. Defaults to the shared transfer client.
+        max_workers (int): Maximum number of concurrent hashes/uploads.
+        verify_remote (bool): Always compare against S3, even if the manifest matches.
+        transfer_config (TransferConfig): Transfer settings for uploads and ETags.
+
+    Returns:
+        Dict[str, List[str]]: "uploaded", "skipped" and "failed" lists of s3:// URIs.
+    """
+    s3_client = s3_client or get_client("s3", "transfer")
+    manifest = load_publish_manifest(manifest_path)
+    result: Dict[str, List[str]] = {"uploaded": [], "skipped": [], "failed": []}
+    if not uploads:
+        return result
+
+    # Phase 1: hash every distinct local file once
+    file_paths = sorted({file_path for file_path, _, _ in uploads})
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        entries = executor.map(
+            lambda path: get_local_etag(path, manifest["files"].get(path), transfer_config),
+            file_paths,
+        )
+        for file_path, entry in zip(file_paths, entries):
+            manifest["files"][file_path] = entry
+
+    def publish_one(upload: Upload) -> Tuple[str, str]:
+        file_path, bucket_name, s3_key = upload
+        target = f"{bucket_name}/{s3_key}"
+        local_etag = manifest["files"][file_path]["etag"]
+
+        if not verify_remote and manifest["published"].get(target) == local_etag:
+            return "skipped", local_etag
+        if get_remote_etag(s3_client, bucket_name, s3_key) == local_etag:
+            return "skipped", local_etag
+
+        print(f"Uploading {file_path} to s3://{target}")
+        s3_client.upload_file(file_path, bucket_name, s3_key, Config=transfer_config)
+        return "uploaded", local_etag
+
+    # Phase 2: compare and upload every (file, target) pair concurrently
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(publish_one, upload): upload for upload in uploads}
+        for future, (file_path, bucket_name, s3_key) in futures.items():
+            target = f"{bucket_name}/{s3_key}"
+            try:
+                status, etag = future.result()
+                manifest["published"][target] = etag
+                result[status].append(f"s3://{target}")
+            except Exception as e:
+                print(f"Error publishing {file_path} to s3://{target}: {e}")
+                result["failed"].append(f"s3://{target}")
+
+    save_publish_manifest(manifest_path, manifest)
+    print(
+        f"Published {len(result['uploaded'])} objects, skipped {len(result['skipped'])} "
+        f"unchanged, {len(result['failed'])} failed."
+    )
+    return result
@@ -0,0 +1,189 @@
+import math
+import random
+from array import array
+from typing import Generic, List, Optional, Sequence, TypeVar
+
+T = TypeVar("T")
+
+
+class AliasTable:
+    """
+    Walker/Vose alias table for drawing indices from a fixed discrete distribution.
+
+    Building the table is O(n); every draw afterwards is O(1): pick a column
+    uniformly, then keep it or take its alias with one biased coin flip.
+    """
+
+    def __init__(self, weights: Sequence[float]) -> None:
+        """
+        Build the table.
+
+        Args:
+            weights (Sequence[float]): Non-negative relative weights, one per index.
+
+        Raises:
+            ValueError: If there are no weights, any weight is negative, or they sum to zero.
+        """
+        count = len(weights)
+        if count == 0:
+            raise ValueError("Cannot build an alias table without weights.")
+        if any(weight < 0 for weight in weights):
+            raise ValueError("Weights must not be negative.")
+        total = math.fsum(weights)
+        if total <= 0:
+            raise ValueError("At least one weight must be positive.")
+
+        self.size = count
+        self.probabilities = array("d", [0.0] * count)
+        self.aliases = array("I", range(count))
+
+        scaled = [weight * count / total for weight in weights]
+        small = [i for i, value in enumerate(scaled) if value < 1.0]
+        large = [i for i, value in enumerate(scaled) if value >= 1.0]
+
+        while small and large:
+            less, more = small.pop(), large.pop()
+            self.probabilities[less] = scaled[less]
+            self.aliases[less] = more
+            scaled[more] = (scaled[more] + scaled[less]) - 1.0
+            if scaled[more] < 1.0:
+                small.append(more)
+            else:
+                large.append(more)
+
+        # Whatever is left is 1.0 up to rounding error
+        for i in large + small:
+            self.probabilities[i] = 1.0
+
+    def sample(self, rng: Optional[random.Random] = None) -> int:
+        """
+        Draw one index.
+
+        Args:
+            rng (random.Random, optional): The random generator to use. Defaults to the
+                module-level generator.
+
+        Returns:
+            int: An index, drawn with probability proportional to its weight.
+        """
+        draw = rng.random if rng else random.random
+        column = int(draw() * self.size)
+        if draw() < self.probabilities[column]:
+            return column
+        return int(self.aliases[column])
+
+
+class WeightedSampler(Generic[T]):
+    """
+    Draws items from a list in O(1), with probability proportional to their weights.
+
+    Items are split into blocks, each with its own alias table, and a top-level alias
+    table picks the block. Changing a weight only rebuilds that item's block and the
+    top-level table (O(sqrt n) with the default block size), so weights can be kept up
+    to date between draws.
+    """
+
+    def __init__(self, items: Sequence[T], weights: Sequence[float], block_size: Optional[int] = None) -> None:
+        """
+        Args:
+            items (Sequence[T]): The items to draw from.
+            weights (Sequence[float]): The relative weight of each item.
+            block_size (int, optional): Items per block. Defaults to the square root of the item count.
+
+        Raises:
+            ValueError: If the lengths differ or the weights are invalid.
+        """
+        if len(items) != len(weights):
+            raise ValueError("Each item must have exactly one weight.")
+        if any(weight < 0 for weight in weights):
+            raise ValueError("Weights must not be negative.")
+        self.items = items
+        self.weights = array("d", weights)
+        self.block_size = block_size or max(1, math.isqrt(len(items)))
+        block_count = max(1, -(-len(items) // self.block_size))
+        self.blocks: List[Optional[AliasTable]] = [None] * block_count
+        self.block_totals = array("d", [0.0] * block_count)
+        self._dirty_blocks = set(range(block_count))
+        self.table = self._rebuild()
+
+    def update(self, position: int, weight: float) -> None:
+        """
+        Change the weight of one item. Its block is rebuilt before the next draw.
+
+        Args:
+            position (int): The item's position in the list.
+            weight (float): The new relative weight.
+
+        Raises:
+            ValueError: If the weight is negative.
+        """
+        if weight < 0:
+            raise ValueError("Weights must not be negative.")
+        self.weights[position] = weight
+        self._dirty_blocks.add(position // self.block_size)
+
+    def sample(self, rng: Optional[random.Random] = None) -> T:
+        """
+        Draw one item.
+
+        Args:
+            rng (random.Random, optional): The random generator to use.
+
+        Returns:
+            T: The drawn item.
+        """
+        if self._dirty_blocks:
+            self.table = self._rebuild()
+        block = self.table.sample(rng)
+        block_table = self.blocks[block]
+        assert block_table is not None  # Blocks without weight are never drawn
+        return self.items[block * self.block_size + block_table.sample(rng)]
+
+    def _rebuild(self) -> AliasTable:
+        """
+        Rebuild the blocks whose weights changed, then the top-level table.
+
+        Raises:
+            ValueError: If every weight is zero.
+        """
+        for block in self._dirty_blocks:
+            start = block * self.block_size
+            weights = self.weights[start:start + self.block_size]
+            total = math.fsum(weights)
+            self.block_totals[block] = total
+            self.blocks[block] = AliasTable(weights) if total > 0 else None
+        self._dirty_blocks.clear()
+        return AliasTable(self.block_totals)
+
+
+def weighted_shuffle(
+    items: Sequence[T],
+    weights: Sequence[float],
+    rng: Optional[random.Random] = None,
+) -> List[T]:
+    """
+    Return the items in a random order where heavier items tend to come first
+    (weighted sampling without replacement, Efraimidis-Spirakis).
+
+    Args:
+        items (Sequence[T]): The items to order.
+        weights (Sequence[float]): The relative weight of each item. Items with a
+            weight of zero are placed last.
+        rng (random.Random, optional): The random generator to use.
+
+    Returns:
+        List[T]: A new, reordered list.
+    """
+    if len(items) != len(weights):
+        raise ValueError("Each item must have exactly one weight.")
+    draw = rng.random if rng else random.random
+
+    def key(weight: float) -> float:
+        if weight <= 0:
+            return math.inf
+        # Sorting by -log(u) / w ascending is the same as sorting by u ** (1 / w) descending
+        return -math.log(1.0 - draw()) / weight
+
+    keys = [key(weight) for weight in weights]
+    order = sorted(range(len(items)), key=keys.__getitem__)
+    return [items[i] for i in order]
@@ -0,0 +1,206 @@
+import zlib
+from typing import Any, Dict, Iterable, List, Optional
+from lambdas.common.db_utils import fetch_seed_usage, save_seed_usage
+
+WORD_USAGE_EXPONENT = 1.0  # How strongly a seed word's own usage weighs it down
+LETTER_USAGE_EXPONENT = 1.0  # How strongly overused layout letters weigh a word down
+MIN_LETTER_FACTOR = 0.25  # Letter balancing never changes a word's weight by more than 4x
+MAX_LETTER_FACTOR = 4.0
+MAX_WORD_COUNT = 1000  # Counts are halved once a word reaches this, so recent usage counts most
+MAX_SAVE_ATTEMPTS = 5  # Conflicting writers retried before the usage update is dropped
+
+
+class SeedUsage:
+    """
+    How often each seed word, and each letter on a generated layout, has been used
+    for one language. Used to weigh future seed word draws down for overused words.
+    """
+
+    def __init__(
+        self,
+        word_counts: Optional[Dict[str, int]] = None,
+        letter_counts: Optional[Dict[str, int]] = None,
+        revision: int = 0,
+    ) -> None:
+        """
+        Args:
+            word_counts (Dict[str, int], optional): Uses of each seed word.
+            letter_counts (Dict[str, int], optional): Uses of each layout letter.
+            revision (int): The stored revision the counts were loaded from (0 if new).
+        """
+        self.word_counts: Dict[str, int] = dict(word_counts or {})
+        self.letter_counts: Dict[str, int] = dict(letter_counts or {})
+        self.revision = revision
+        self._letter_factors: Optional[Dict[str, float]] = None
+
+    def record(self, seed_words: Iterable[str], game_layout: Iterable[str]) -> None:
+        """
+        Count one generated game.
+
+        Args:
+            seed_words (Iterable[str]): The game's seed word(s).
+            game_layout (Iterable[str]): The game's sides.
+        """
+        for word in seed_words:
+            if word:
+                self.word_counts[word] = self.word_counts.get(word, 0) + 1
+        for side in game_layout:
+            for letter in side:
+                self.letter_counts[letter] = self.letter_counts.get(letter, 0) + 1
+
+    def merge(self, other: "SeedUsage") -> None:
+        """
+        Add another set of counts to these, then halve them all if any word count
+        has grown past MAX_WORD_COUNT.
+
+        Args:
+            other (SeedUsage): The counts to add.
+        """
+        for word, count in other.word_counts.items():
+            self.word_counts[word] = self.word_counts.get(word, 0) + count
+        for letter, count in other.letter_counts.items():
+            self.letter_counts[letter] = self.letter_counts.get(letter, 0) + count
+        if self.word_counts and max(self.word_counts.values()) >= MAX_WORD_COUNT:
+            self.word_counts = {word: count // 2 for word, count in self.word_counts.items() if count > 1}
+            self.letter_counts = {letter: count // 2 for letter, count in self.letter_counts.items() if count > 1}
+        self._letter_factors = None
+
+    def is_empty(self) -> bool:
+        return not self.word_counts and not self.letter_counts
+
+    def weight_factor(self, word: str, base_word: Optional[str] = None) -> float:
+        """
+        Get the factor a seed word's sampling weight is multiplied by.
+
+        The word's own count weighs it down, and so do letters that show up on layouts
+        more often than average (and vice versa). Letter factors are computed once from
+        the counts as loaded, so recording new games only changes word factors.
+
+        Args:
+            word (str): The seed word.
+            base_word (str, optional): The word without accents, as letters appear on layouts.
+
+        Returns:
+            float: The factor (1.0 for an unused word with average letters).
+        """
+        factor = float((1 + self.word_counts.get(word, 0)) ** -WORD_USAGE_EXPONENT)
+        letter_factors = self._get_letter_factors()
+        letters = set(base_word or word)
+        if letter_factors and letters:
+            letter_factor = 1.0
+            for letter in letters:
+                letter_factor *= letter_factors.get(letter, MAX_LETTER_FACTOR)
+            # Geometric mean, so long words aren't punished for having more letters
+            letter_factor **= 1 / len(letters)
+            factor *= min(MAX_LETTER_FACTOR, max(MIN_LETTER_FACTOR, letter_factor))
+        return factor
+
+    def encode(self) -> bytes:
+        """
+        Encode the counts compactly: one "word<TAB>count" line per word (sorted, so shared
+        prefixes compress well), a blank line, then the letter counts, zlib-compressed.
+        """
+        lines: List[str] = [f"{word}\t{count}" for word, count in sorted(self.word_counts.items())]
+        lines.append("")
+        lines.extend(f"{letter}\t{count}" for letter, count in sorted(self.letter_counts.items()))
+        return zlib.compress("\n".join(lines).encode("utf-8"), 9)
+
+    @classmethod
+    def decode(cls, data: bytes, revision: int = 0) -> "SeedUsage":
+        """
+        Decode counts written by encode.
+
+        Args:
+            data (bytes): The encoded counts.
+            revision (int): The stored revision the counts were loaded from.
+
+        Returns:
+            SeedUsage: The counts.
+        """
+        word_counts: Dict[str, int] = {}
+        letter_counts: Dict[str, int] = {}
+        counts = word_counts
+        for line in zlib.decompress(data).decode("utf-8").split("\n"):
+            if not line:
+                counts = letter_counts
+                continue
+            key, count = line.rsplit("\t", 1)
+            counts[key] = int(count)
+        return cls(word_counts, letter_counts, revision)
+
+    def _get_letter_factors(self) -> Dict[str, float]:
+        if self._letter_factors is None:
+            self._letter_factors = {}
+            if self.letter_counts:
+                mean = sum(self.letter_counts.values()) / len(self.letter_counts)
+                self._letter_factors = {
+                    letter: (mean / count) ** LETTER_USAGE_EXPONENT
+                    for letter, count in self.letter_counts.items()
+                }
+        return self._letter_factors
+
+
+def load_seed_usage(language: str) -> SeedUsage:
+    """
+    Load the stored usage counts for a language.
+
+    Args:
+        language (str): The language code.
+
+    Returns:
+        SeedUsage: The counts (empty if none are stored or they could not be loaded).
+    """
+    try:
+        stored = fetch_seed_usage(language)
+    except Exception as e:
+        print(f"[WARN] Seed word usage unavailable for '{language}': {e}")
+        return SeedUsage()
+    if stored is None:
+        return SeedUsage()
+    return SeedUsage.decode(stored["counts"], stored["revision"])
+
+
+def save_seed_usage_counts(language: str, new_usage: SeedUsage) -> bool:
+    """
+    Add newly recorded usage to the stored counts. Writers that race each other are
+    detected by the stored revision, and the loser merges again with the latest counts.
+    Failures are logged rather than raised, since the games themselves are already saved.
+
+    Args:
+        language (str): The language code.
+        new_usage (SeedUsage): Usage recorded since the last save.
+
+    Returns:
+        bool: True if the counts were saved.
+    """
+    if new_usage.is_empty():
+        return True
+    for _ in range(MAX_SAVE_ATTEMPTS):
+        stored = load_seed_usage(language)
+        stored.merge(new_usage)
+        try:
+            if save_seed_usage(language, stored.encode(), stored.revision):
+                return True
+        except Exception as e:
+            print(f"[ERROR] Could not save seed word usage for '{language}': {e}")
+            return False
+        print(f"[INFO] Seed word usage for '{language}' changed while saving, retrying")
+    print(f"[ERROR] Could not save seed word usage for '{language}'")
+    return False
+
+
+def count_seed_usage(games: Iterable[Dict[str, Any]]) -> SeedUsage:
+    """
+    Count the seed words and layout letters of generated games.
+
+    Args:
+        games (Iterable[Dict[str, Any]]): Game data, as created by create_game_schema.
+
+    Returns:
+        SeedUsage: The counts.
+    """
+    usage = SeedUsage()
+    for game in games:
+        seed_words = game.get("randomSeedWords") or [game.get("randomSeedWord")]
+        usage.record([word for word in seed_words if word], game.get("gameLayout") or [])
+    return usage
@@ -0,0 +1,228 @@
+import os
+import time
+import uuid
+from typing import Callable, Dict, List, Optional, Tuple
+from botocore.exceptions import BotoCoreError, ClientError
+from lambdas.common.db_utils import (
+    GAME_COUNTER_ATTRIBUTES,
+    MAX_TRANSACTION_ITEMS,
+    add_to_game_counters,
+    fetch_game_counters,
+)
+
+# Buffered deltas are flushed once the oldest is this old, or once this many updates are buffered
+FLUSH_INTERVAL_SECONDS = float(os.getenv("STATS_FLUSH_INTERVAL_SECONDS", "30"))
+MAX_PENDING_UPDATES = int(os.getenv("STATS_FLUSH_MAX_UPDATES", "100"))
+MAX_FLUSH_ATTEMPTS = 3  # Tries per transaction (with the same token) before it waits for the next flush
+FLUSH_BACKOFF_SECONDS = 0.05  # Doubled after each failed try
+# DynamoDB honours a ClientRequestToken for 10 minutes; unconfirmed transactions are dropped before then
+TOKEN_LIFETIME_SECONDS = 9 * 60
+TOTALS_TTL_SECONDS = 60  # How long totals read from the DB are reused (with the deltas recorded since)
+MAX_KNOWN_GAMES = 1000  # Games whose totals are kept; the oldest are forgotten first
+
+
+class GameStatsAggregator:
+    """
+    Write-behind buffer for game counters (completions, words and letters used, ratings).
+
+    Deltas are summed per game and written as one ADD update per game, in a single
+    transaction, once the oldest is flush_interval seconds old or max_pending_updates are
+    buffered. A popular game's counters then take one write per flush rather than one per
+    update. The flush is checked when an update is recorded, so a container that is
+    recycled before its next update loses what it buffered: at most max_pending_updates
+    updates, none older than its last update plus flush_interval.
+
+    Each transaction has an idempotency token, so retrying it never counts anything twice.
+    A transaction that still fails is kept with its token, and the next flush retries it
+    unchanged before writing anything new, since it may have been applied even though the
+    call failed. Once its token may have expired (TOKEN_LIFETIME_SECONDS), a retry could
+    count it twice, so it is dropped instead.
+    """
+
+    def __init__(
+        self,
+        flush_interval: float = FLUSH_INTERVAL_SECONDS,
+        max_pending_updates: int = MAX_PENDING_UPDATES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Args:
+            flush_interval (float): Seconds after which buffered deltas are flushed (0 writes every update).
+            max_pending_updates (int): Buffered updates that trigger a flush.
+            clock (Callable[[], float]): Source of the current time, in seconds.
+        """
+        self.flush_interval = flush_interval
+        self.max_pending_updates = max_pending_updates
+        self.clock = clock
+        self.pending: Dict[str, Dict[str, int]] = {}
+        self.pending_updates = 0
+        self.oldest_pending: Optional[float] = None
+        # Transactions that failed, with their tokens and when they were first sent, to retry as they are
+        self.unconfirmed: List[Tuple[Dict[str, Dict[str, int]], str, float]] = []
+        # Called after every flush
+        self.flush_listeners: List[Callable[[], None]] = []
+        # gameId -> (totals as read, when they were read)
+        self._known_totals: Dict[str, Tuple[Dict[str, int], float]] = {}
+        # gameId -> deltas recorded since its totals were read (flushed or not)
+        self._unseen: Dict[str, Dict[str, int]] = {}
+
+    def record(self, game_id: str, deltas: Dict[str, int]) -> None:
+        """
+        Buffer deltas for a game's counters, flushing if the buffer is due.
+
+        Args:
+            game_id (str): The game.
+            deltas (Dict[str, int]): The amount to add to each counter.
+        """
+        self._add(self.pending, game_id, deltas)
+        if game_id in self._known_totals:
+            self._add(self._unseen, game_id, deltas)
+        self.pending_updates += 1
+        if self.oldest_pending is None:
+            self.oldest_pending = self.clock()
+        self.flush_if_due()
+
+    def get_totals(self, game_id: str) -> Optional[Dict[str, int]]:
+        """
+        Get a game's counters, including deltas recorded in this container but not yet
+        written. Totals are read from the DB at most once every TOTALS_TTL_SECONDS per game,
+        so they may miss other containers' recent updates.
+
+        Args:
+            game_id (str): The game.
+
+        Returns:
+            Optional[Dict[str, int]]: Each counter's total, or None if the game wasn't found.
+
+        Raises:
+            ClientError: If the totals had to be read and the read failed.
+        """
+        known = self._known_totals.get(game_id)
+        if known is None or self.clock() - known[1] > TOTALS_TTL_SECONDS:
+            totals = fetch_game_counters(game_id)
+            if totals is None:
+                return None
+            self._known_totals.pop(game_id, None)
+            if len(self._known_totals) >= MAX_KNOWN_GAMES:
+                forgotten = next(iter(self._known_totals))
+                del self._known_totals[forgotten]
+                self._unseen.pop(forgotten, None)
+            known = (totals, self.clock())
+            self._known_totals[game_id] = known
+            # Buffered deltas aren't in the DB yet (unconfirmed ones may be, but usually aren't)
+            buffered: Dict[str, Dict[str, int]] = {game_id: {}}
+            for deltas_by_game, _, _ in self.unconfirmed:
+                if game_id in deltas_by_game:
+                    self._add(buffered, game_id, deltas_by_game[game_id])
+            if game_id in self.pending:
+                self._add(buffered, game_id, self.pending[game_id])
+            self._unseen[game_id] = buffered[game_id]
+        unseen = self._unseen.get(game_id, {})
+        return {counter: known[0].get(counter, 0) + unseen.get(counter, 0) for counter in GAME_COUNTER_ATTRIBUTES}
+
+    def flush_if_due(self) -> bool:
+        """
+        Flush if the oldest buffered delta is old enough, or enough are buffered.
+
+        Returns:
+            bool: False if a flush was due and failed.
+        """
+        if self.oldest_pending is None:
+            return True
+        if (
+            self.pending_updates >= self.max_pending_updates
+            or self.clock() - self.oldest_pending >= self.flush_interval
+        ):
+            return self.flush()
+        return True
+
+    def flush(self) -> bool:
+        """
+        Retry unconfirmed transactions whose tokens are still honoured, then write all
+        buffered deltas, up to MAX_TRANSACTION_ITEMS games per transaction.
+
+        Returns:
+            bool: True if every delta was written (or belonged to a game that no longer exists).
+        """
+        now = self.clock()
+        transactions = []
+        for deltas_by_game, token, first_sent in self.unconfirmed:
+            if now - first_sent >= TOKEN_LIFETIME_SECONDS:
+                # It may have been applied, and a retry can no longer tell
+                print(f"[WARN] Dropping game stats whose write can't be confirmed: {deltas_by_game}")
+            else:
+                transactions.append((deltas_by_game, token, first_sent))
+        self.unconfirmed = []
+        pending = self.pending
+        self.pending = {}
+        self.pending_updates = 0
+        self.oldest_pending = None
+
+        game_ids = list(pending)
+        for start in range(0, len(game_ids), MAX_TRANSACTION_ITEMS):
+            chunk = {game_id: pending[game_id] for game_id in game_ids[start:start + MAX_TRANSACTION_ITEMS]}
+            transactions.append((chunk, uuid.uuid4().hex, now))
+
+        for deltas_by_game, token, first_sent in transactions:
+            unconfirmed = self._flush_chunk(deltas_by_game, token)
+            if unconfirmed is not None:
+                self.unconfirmed.append((*unconfirmed, first_sent))
+        for listener in self.flush_listeners:
+            listener()
+        return not self.unconfirmed
+
+    def _flush_chunk(
+        self, deltas_by_game: Dict[str, Dict[str, int]], token: str
+    ) -> Optional[Tuple[Dict[str, Dict[str, int]], str]]:
+        # Returns the transaction (and its token) if it still isn't confirmed
+        for attempt in range(MAX_FLUSH_ATTEMPTS):
+            try:
+                missing_games = add_to_game_counters(deltas_by_game, token)
+            except (BotoCoreError, ClientError) as e:
+                # The transaction may or may not have been applied; the same token makes retrying safe
+                print(f"[WARN] Failed to write game stats (attempt {attempt + 1}): {e}")
+                if attempt < MAX_FLUSH_ATTEMPTS - 1:
+                    time.sleep(FLUSH_BACKOFF_SECONDS * 2 ** attempt)
+                continue
+            if not missing_games:
+                return None
+            print(f"[WARN] Dropping stats for games that no longer exist: {missing_games}")
+            deltas_by_game = {
+                game_id: deltas for game_id, deltas in deltas_by_game.items() if game_id not in missing_games
+            }
+            if not deltas_by_game:
+                return None
+            # The cancelled transaction wrote nothing, and different deltas need a new token
+            token = uuid.uuid4().hex
+        return deltas_by_game, token
+
+    @staticmethod
+    def _add(target: Dict[str, Dict[str, int]], game_id: str, deltas: Dict[str, int]) -> None:
+        counters = target.setdefault(game_id, {})
+        for counter, amount in deltas.items():
+            counters[counter] = counters.get(counter, 0) + amount
+
+
+# This container's aggregator
+_aggregator = GameStatsAggregator()
+
+
+def record_game_stats(game_id: str, deltas: Dict[str, int]) -> None:
+    """
+    Buffer deltas for a game's counters (see GameStatsAggregator.record).
+    """
+    _aggregator.record(game_id, deltas)
+
+
+def get_game_totals(game_id: str) -> Optional[Dict[str, int]]:
+    """
+    Get a game's counters, including buffered deltas (see GameStatsAggregator.get_totals).
+    """
+    return _aggregator.get_totals(game_id)
+
+
+def add_game_stats_flush_listener(listener: Callable[[], None]) -> None:
+    """
+    Call a function after every flush of this container's game stats, e.g. to log.
+    """
+    _aggregator.flush_listeners.append(listener)
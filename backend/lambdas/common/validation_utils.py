@@ -1,4 +1,4 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Optional, Tuple
 import decimal
 
 # Constants for validation
@@ -10,6 +10,57 @@ VALID_LANGUAGES = ["de", "en", "es", "fr", "it", "pl", "ru"]
 LANGUAGE_PAGINATION_KEYS = ["language", "createdAt", "gameId"]
 GAME_TYPE_PAGINATION_KEYS = ["gameTypeLanguage", "createdAt", "gameId"]
 
+# Default value of each game field, for items that don't have it
+GAME_DEFAULTS: Dict[str, Any] = {
+    "gameId": "",
+    "gameLayout": [],
+    "gameType": "",
+    "officialGame": False,
+    "standardizedHash": "",
+    "validWords": [],
+    "validWordCount": 0,
+    "baseValidWords": [],
+    "oneWordSolutions": [],
+    "twoWordSolutions": [],
+    "threeWordSolutions": [],
+    "oneWordSolutionCount": 0,
+    "twoWordSolutionCount": 0,
+    "threeWordSolutionCount": 0,
+    "nytSolution": [],
+    "randomSeedWord": "",
+    "randomSeedWords": [],
+    "dictionary": [],
+    "par": "",
+    "boardSize": "3x3",
+    "language": "en",
+    "totalRatings": 0,
+    "totalStars": 0,
+    "totalCompletions": 0,
+    "totalWordsUsed": 0,
+    "totalLettersUsed": 0,
+    "createdAt": "",
+    "createdBy": "Anonymous",
+    "clue": "",
+    "generationSeed": None,
+    "difficulty": None,
+}
+
+
+def compile_game_defaults(fields: Iterable[str]) -> Tuple[Tuple[str, Any, bool], ...]:
+    """
+    Compile the defaults of some game fields for apply_game_defaults.
+
+    Args:
+        fields (Iterable[str]): Keys of GAME_DEFAULTS.
+
+    Returns:
+        Tuple[Tuple[str, Any, bool], ...]: (field, default, whether each item needs its own empty list).
+    """
+    return tuple((field, GAME_DEFAULTS[field], isinstance(GAME_DEFAULTS[field], list)) for field in fields)
+
+
+_COMPILED_GAME_DEFAULTS = compile_game_defaults(GAME_DEFAULTS)
+
 
 def validate_game_schema(game_item: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -17,48 +68,35 @@ def validate_game_schema(game_item: Dict[str, Any]) -> Dict[str, Any]:
     """
     if game_item is None:
         return None
-    
-    defaults = {
-        "gameId": "",
-        "gameLayout": [],
-        "gameType": "",
-        "officialGame": False,
-        "standardizedHash": "",
-        "validWords": [],
-        "validWordCount": 0,
-        "baseValidWords": [],
-        "oneWordSolutions": [],
-        "twoWordSolutions": [],
-        "threeWordSolutions": [],
-        "oneWordSolutionCount": 0,
-        "twoWordSolutionCount": 0,
-        "threeWordSolutionCount": 0,
-        "nytSolution": [],
-        "randomSeedWord": "",
-        "randomSeedWords": [],
-        "dictionary": [],
-        "par": "",
-        "boardSize": "3x3",
-        "language": "en",
-        "totalRatings": 0,
-        "totalStars": 0,
-        "totalCompletions": 0,
-        "totalWordsUsed": 0,
-        "totalLettersUsed": 0,
-        "createdAt": "",
-        "createdBy": "Anonymous",
-        "clue": "",
-    }
-    
-    # Populate missing fields with their defaults
-    for field, default in defaults.items():
-        if field not in game_item or game_item[field] is None:
-            game_item[field] = default
-    
+
+    apply_game_defaults(game_item)
     converted_game_item: Dict[str, Any] = convert_decimal(game_item)
     return converted_game_item
 
 
+def apply_game_defaults(
+    game_item: Dict[str, Any],
+    compiled_defaults: Optional[Tuple[Tuple[str, Any, bool], ...]] = None,
+) -> Dict[str, Any]:
+    """
+    Populate missing (or null) fields of a game item with their defaults, in place.
+    Unlike validate_game_schema, values are not converted, so this suits items that
+    were read without Decimals.
+
+    Args:
+        game_item (Dict[str, Any]): The game item.
+        compiled_defaults (optional): Only fill these fields, from compile_game_defaults.
+            Defaults to every game field.
+
+    Returns:
+        Dict[str, Any]: The same item.
+    """
+    for field, default, is_list in compiled_defaults or _COMPILED_GAME_DEFAULTS:
+        if game_item.get(field) is None:
+            game_item[field] = [] if is_list else default
+    return game_item
+
+
 def convert_decimal(obj: Any) -> Any:
     """
     Recursively converts DynamoDB Decimal types to JSON-compatible types.
@@ -0,0 +1,137 @@
+import zlib
+from typing import List, Sequence, Tuple
+
+FORMAT_VERSION = 1  # First byte of every encoded value, so the format can change later
+
+
+def encode_words(words: Sequence[str]) -> bytes:
+    """
+    Encode a word list compactly: each word is front-coded (the number of characters it
+    shares with the word before it, then the rest), and the result is zlib-compressed.
+    Sorted lists share the longest prefixes, but any order is kept as it is.
+
+    Args:
+        words (Sequence[str]): The words.
+
+    Returns:
+        bytes: The encoded words.
+    """
+    payload = bytearray()
+    _write_words(payload, words)
+    return bytes([FORMAT_VERSION]) + zlib.compress(bytes(payload), 9)
+
+
+def decode_words(data: bytes) -> List[str]:
+    """
+    Decode words written by encode_words.
+
+    Args:
+        data (bytes): The encoded words.
+
+    Returns:
+        List[str]: The words, in the order they were encoded.
+    """
+    words, _ = _read_words(_decompress(data), 0)
+    return words
+
+
+def encode_solutions(solutions: Sequence[Sequence[str]]) -> bytes:
+    """
+    Encode solutions (tuples of words) compactly: the distinct words they use, sorted and
+    front-coded, then each solution as indices into those words, zlib-compressed.
+
+    Args:
+        solutions (Sequence[Sequence[str]]): The solutions, e.g. [("ABC", "CDE"), ...].
+
+    Returns:
+        bytes: The encoded solutions.
+    """
+    words = sorted({word for solution in solutions for word in solution})
+    index_of = {word: index for index, word in enumerate(words)}
+    payload = bytearray()
+    _write_words(payload, words)
+    _write_varint(payload, len(solutions))
+    for solution in solutions:
+        _write_varint(payload, len(solution))
+        for word in solution:
+            _write_varint(payload, index_of[word])
+    return bytes([FORMAT_VERSION]) + zlib.compress(bytes(payload), 9)
+
+
+def decode_solutions(data: bytes) -> List[List[str]]:
+    """
+    Decode solutions written by encode_solutions.
+
+    Args:
+        data (bytes): The encoded solutions.
+
+    Returns:
+        List[List[str]]: The solutions, in the order they were encoded.
+    """
+    payload = _decompress(data)
+    words, position = _read_words(payload, 0)
+    count, position = _read_varint(payload, position)
+    solutions: List[List[str]] = []
+    for _ in range(count):
+        length, position = _read_varint(payload, position)
+        solution = []
+        for _ in range(length):
+            index, position = _read_varint(payload, position)
+            solution.append(words[index])
+        solutions.append(solution)
+    return solutions
+
+
+def _decompress(data: bytes) -> bytes:
+    data = bytes(data)
+    if not data or data[0] != FORMAT_VERSION:
+        raise ValueError(f"Unknown word list format {data[:1]!r}.")
+    return zlib.decompress(data[1:])
+
+
+def _write_words(payload: bytearray, words: Sequence[str]) -> None:
+    _write_varint(payload, len(words))
+    previous = ""
+    for word in words:
+        shared = 0
+        limit = min(len(word), len(previous))
+        while shared < limit and word[shared] == previous[shared]:
+            shared += 1
+        suffix = word[shared:].encode("utf-8")
+        _write_varint(payload, shared)
+        _write_varint(payload, len(suffix))
+        payload += suffix
+        previous = word
+
+
+def _read_words(payload: bytes, position: int) -> Tuple[List[str], int]:
+    count, position = _read_varint(payload, position)
+    words: List[str] = []
+    previous = ""
+    for _ in range(count):
+        shared, position = _read_varint(payload, position)
+        length, position = _read_varint(payload, position)
+        previous = previous[:shared] + payload[position:position + length].decode("utf-8")
+        position += length
+        words.append(previous)
+    return words, position
+
+
+def _write_varint(payload: bytearray, value: int) -> None:
+    # 7 bits per byte, high bit set on every byte but the last
+    while value >= 0x80:
+        payload.append((value & 0x7F) | 0x80)
+        value >>= 7
+    payload.append(value)
+
+
+def _read_varint(payload: bytes, position: int) -> Tuple[int, int]:
+    value = 0
+    shift = 0
+    while True:
+        byte = payload[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, position
+        shift += 7
@@ -0,0 +1,356 @@
+import os
+import json
+import time
+import uuid
+import random
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Any, Dict, List, Optional, Set
+from lambdas.common.dictionary_utils import get_dictionary_index, record_seed_usage
+from lambdas.common.seed_usage import count_seed_usage, save_seed_usage_counts
+from lambdas.common.game_utils import generate_valid_words_from_index
+from lambdas.common.game_schema import create_game_schema
+from lambdas.common.pair_catalog import get_pair_catalog
+from lambdas.common.db_utils import (
+    batch_add_games_to_db,
+    batch_add_game_ids_to_random_games_db,
+    delete_random_game_reservation,
+    get_random_pool_summary,
+    reserve_random_game_numbers,
+)
+from lambdas.create_random.random_game_service import (
+    LARGER_BOARDS,
+    MAX_GENERATION_SEED,
+    USE_BASIC_DICTIONARY,
+    generate_layout,
+    generate_layout_from_single_word,
+    get_seed_word_sampler,
+    new_generation_seed,
+    select_board_for_difficulty,
+    select_one_word,
+    select_two_words,
+)
+
+SMALL_BOARDS = ["2x2"]  # Boards generated from a single seed word
+WRITE_CHUNK_SIZE = 25  # Games written (and numbers reserved) per batch
+MAX_GENERATION_ATTEMPTS = 5  # Seed word draws per game before giving up on it
+
+# Dictionary and sampler loaded once per worker process
+_worker_state: Dict[str, Any] = {}
+
+
+def init_worker(
+    language: str,
+    board_size: str,
+    difficulty: Optional[str] = None,
+    balanced: bool = False,
+) -> None:
+    """
+    Load the dictionary for a worker once, before it generates any games.
+
+    Args:
+        language (str): The language code for the dictionary.
+        board_size (str): The size of the boards to generate.
+        difficulty (str, optional): A key of DIFFICULTY_BANDS that every board must fall in.
+        balanced (bool): Balance seed words by usage. Games are then not reproducible from
+            their seeds, so no generationSeed is recorded.
+    """
+    if difficulty and board_size in SMALL_BOARDS:
+        raise ValueError("A difficulty can only be targeted for boards with two seed words.")
+    index = get_dictionary_index(language)
+    seed_dictionary_type = "basic" if USE_BASIC_DICTIONARY and board_size not in LARGER_BOARDS else "dictionary"
+    try:
+        seed_dictionary = index.get_words(seed_dictionary_type)
+    except ValueError as e:
+        print(f"[WARN] {e}")
+        seed_dictionary = []
+    if not seed_dictionary:
+        print(f"[WARN] No {seed_dictionary_type} seed words for '{language}'; using the full dictionary.")
+        seed_dictionary_type = "dictionary"
+        seed_dictionary = index.get_words(seed_dictionary_type)
+
+    _worker_state.update({
+        "language": language,
+        "board_size": board_size,
+        "difficulty": difficulty,
+        "balanced": balanced,
+        "index": index,
+        "seed_dictionary": seed_dictionary,
+        "sampler": get_seed_word_sampler(language, seed_dictionary_type, balanced=balanced),
+        "catalog": get_pair_catalog(language, seed_dictionary_type, board_size) if difficulty else None,
+    })
+
+
+def generate_random_game_data(seed: Optional[int] = None) -> Optional[Dict[str, Any]]:
+    """
+    Generate and solve one random game with the worker's preloaded dictionary.
+
+    Args:
+        seed (int, optional): Seed for every random choice, recorded as the game's
+            generationSeed. A new seed is drawn if not provided.
+
+    Returns:
+        Optional[Dict[str, Any]]: The game data (including valid words), or None if
+        no game could be generated.
+    """
+    language = _worker_state["language"]
+    board_size = _worker_state["board_size"]
+    index = _worker_state["index"]
+    seed_dictionary = _worker_state["seed_dictionary"]
+    sampler = _worker_state["sampler"]
+    difficulty = _worker_state.get("difficulty")
+    balanced = _worker_state.get("balanced", False)
+    if seed is None:
+        seed = new_generation_seed()
+    rng = random.Random(seed)
+
+    for _ in range(MAX_GENERATION_ATTEMPTS):
+        if board_size in SMALL_BOARDS:
+            seed_word = select_one_word(seed_dictionary, board_size, sampler=sampler, rng=rng)
+            game_layout = generate_layout_from_single_word(seed_word, board_size, rng=rng) if seed_word else None
+            seed_kwargs: Dict[str, Any] = {"random_seed_word": seed_word}
+        elif difficulty:
+            board = select_board_for_difficulty(_worker_state["catalog"], board_size, index, difficulty, rng=rng)
+            if not board:
+                # The search already tried many seed words, so give up on this game
+                return None
+            game_layout = board[1]
+            seed_kwargs = {"random_seed_words": list(board[0]), "difficulty": difficulty}
+        else:
+            seed_words = select_two_words(seed_dictionary, board_size, sampler=sampler, rng=rng)
+            game_layout = generate_layout(seed_words[0], seed_words[1], board_size, rng=rng) if seed_words else None
+            seed_kwargs = {"random_seed_words": list(seed_words) if seed_words else []}
+        if not game_layout:
+            continue
+
+        game_data = create_game_schema(
+            game_layout=game_layout,
+            game_type="random",
+            language=language,
+            board_size=board_size,
+            valid_words=generate_valid_words_from_index(game_layout, index),
+            generation_seed=None if balanced else seed,
+            rng=rng,
+            **seed_kwargs,
+        )
+        # Weigh these seed words down for the rest of this worker's games
+        record_seed_usage(language, game_data["randomSeedWords"] or [game_data["randomSeedWord"]], game_layout)
+        return game_data
+    return None
+
+
+def load_checkpoint(checkpoint_path: Optional[str], language: str, board_size: str, count: int) -> Dict[str, Any]:
+    """
+    Load the progress of an interrupted run, or start a new one.
+
+    Args:
+        checkpoint_path (Optional[str]): The checkpoint file, if the run is resumable.
+        language (str): The language code.
+        board_size (str): The board size.
+        count (int): The number of games the run should add.
+
+    Returns:
+        Dict[str, Any]: {"language", "boardSize", "count", "written", "pending"}. "pending"
+        holds games already in the games table whose random pool entries are not written yet.
+    """
+    new_state = {"language": language, "boardSize": board_size, "count": count, "written": 0, "pending": None}
+    if not checkpoint_path or not os.path.exists(checkpoint_path):
+        return new_state
+    with open(checkpoint_path, "r") as f:
+        state: Dict[str, Any] = json.load(f)
+    if (state.get("language"), state.get("boardSize"), state.get("count")) != (language, board_size, count):
+        raise ValueError(
+            f"Checkpoint {checkpoint_path} belongs to a different run "
+            f"({state.get('language')}, {state.get('boardSize')}, {state.get('count')} games)."
+        )
+    print(f"[INFO] Resuming from checkpoint: {state['written']}/{count} games already written")
+    return state
+
+
+def save_checkpoint(checkpoint_path: Optional[str], state: Dict[str, Any]) -> None:
+    """
+    Save the progress of a run atomically.
+
+    Args:
+        checkpoint_path (Optional[str]): The checkpoint file. Nothing is saved if None.
+        state (Dict[str, Any]): The run state.
+    """
+    if not checkpoint_path:
+        return
+    temp_path = checkpoint_path + ".tmp"
+    with open(temp_path, "w") as f:
+        json.dump(state, f)
+    os.replace(temp_path, checkpoint_path)
+
+
+def _publish_pending(state: Dict[str, Any], checkpoint_path: Optional[str]) -> None:
+    """
+    Add the pending games to the random game pool. The reservation id is saved before
+    the block is reserved, so a run resumed after a crash at any point gets the same
+    block back instead of leaving a gap in the pool.
+    """
+    pending = state["pending"]
+    language = state["language"]
+    if pending["firstAtomicNumber"] is None:
+        if not pending.get("reservationId"):
+            # Checkpoints from before reservation ids have none
+            pending["reservationId"] = uuid.uuid4().hex
+            save_checkpoint(checkpoint_path, state)
+        pending["firstAtomicNumber"] = reserve_random_game_numbers(
+            len(pending["gameIds"]), language, pending["reservationId"]
+        )
+        save_checkpoint(checkpoint_path, state)
+
+    # Checkpoints from before pool entries carried summaries have none
+    batch_add_game_ids_to_random_games_db(
+        pending["gameIds"], pending["firstAtomicNumber"], language, pending.get("summaries")
+    )
+    if pending.get("reservationId"):
+        delete_random_game_reservation(pending["reservationId"])
+    state["written"] += len(pending["gameIds"])
+    state["pending"] = None
+    save_checkpoint(checkpoint_path, state)
+
+
+def _write_games(games: List[Dict[str, Any]], state: Dict[str, Any], checkpoint_path: Optional[str]) -> None:
+    """
+    Write a chunk of games, then add them to the random game pool and the seed word usage counts.
+    """
+    if not batch_add_games_to_db(games):
+        raise RuntimeError("Failed to write a batch of games to the database.")
+    state["pending"] = {
+        "gameIds": [game["gameId"] for game in games],
+        "summaries": [get_random_pool_summary(game) for game in games],
+        "reservationId": uuid.uuid4().hex,
+        "firstAtomicNumber": None,
+    }
+    save_checkpoint(checkpoint_path, state)
+    _publish_pending(state, checkpoint_path)
+    save_seed_usage_counts(state["language"], count_seed_usage(games))
+
+
+def generate_random_games(
+    language: str,
+    board_size: str,
+    count: int,
+    max_workers: Optional[int] = None,
+    checkpoint_path: Optional[str] = None,
+    chunk_size: int = WRITE_CHUNK_SIZE,
+    seed: Optional[int] = None,
+    difficulty: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Generate random games in bulk and add them to the random game pool.
+
+    The dictionary is loaded once per worker process, boards are generated and solved
+    in parallel, and games, valid words and pool entries are written in batches. Each
+    batch reserves its atomic numbers with a single counter update. Progress is saved
+    to the checkpoint after every batch, so an interrupted run picks up where it left
+    off when started again with the same arguments.
+
+    Args:
+        language (str): The language code for the dictionary.
+        board_size (str): The size of the boards to generate.
+        count (int): The number of games to add.
+        max_workers (int, optional): Worker processes. Defaults to the CPU count; 1 generates
+            games in this process.
+        checkpoint_path (str, optional): File used to save progress and resume the run.
+        chunk_size (int): Games written per batch.
+        seed (int, optional): Seed the games' own seeds are drawn from, so a run generates
+            the same games again (a resumed run continues with new seeds). Without a seed,
+            seed words are balanced by usage instead.
+        difficulty (str, optional): A key of DIFFICULTY_BANDS that every board must fall in.
+
+    Returns:
+        Dict[str, Any]: The throughput report.
+    """
+    if count < 1:
+        raise ValueError("Count must be at least 1.")
+
+    start_time = time.time()
+    state = load_checkpoint(checkpoint_path, language, board_size, count)
+    if state["pending"]:
+        print(f"[INFO] Publishing {len(state['pending']['gameIds'])} games left pending by the last run")
+        _publish_pending(state, checkpoint_path)
+    save_checkpoint(checkpoint_path, state)
+
+    remaining = count - state["written"]
+    resumed_from = state["written"]
+    report = {"generated": 0, "failed": 0, "writeSeconds": 0.0}
+    buffer: List[Dict[str, Any]] = []
+    seed_rng = random.Random(seed) if seed is not None and resumed_from == 0 else None
+
+    def next_seed() -> int:
+        return seed_rng.randrange(MAX_GENERATION_SEED) if seed_rng else new_generation_seed()
+
+    def on_game(game_data: Optional[Dict[str, Any]]) -> None:
+        if game_data is None:
+            report["failed"] += 1
+            return
+        report["generated"] += 1
+        buffer.append(game_data)
+        if len(buffer) >= chunk_size or state["written"] + len(buffer) >= count:
+            flush()
+
+    def flush() -> None:
+        if not buffer:
+            return
+        write_start = time.time()
+        _write_games(list(buffer), state, checkpoint_path)
+        buffer.clear()
+        report["writeSeconds"] += time.time() - write_start
+        elapsed = time.time() - start_time
+        new_games = state["written"] - resumed_from
+        print(
+            f"[INFO] {state['written']}/{count} games written "
+            f"({new_games / elapsed:.2f} games/s, {report['failed']} failed attempts)"
+        )
+
+    balanced = seed is None
+    # Allow a few failed games per game requested before giving up
+    max_failures = max(10, remaining * MAX_GENERATION_ATTEMPTS)
+    workers = max_workers or os.cpu_count() or 1
+
+    if remaining > 0 and workers <= 1:
+        init_worker(language, board_size, difficulty, balanced)
+        while report["generated"] < remaining and report["failed"] < max_failures:
+            on_game(generate_random_game_data(next_seed()))
+    elif remaining > 0:
+        if difficulty:
+            # Build the pair catalog once here, where workers find it cached, instead of in each worker
+            init_worker(language, board_size, difficulty, balanced)
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=init_worker, initargs=(language, board_size, difficulty, balanced)
+        ) as executor:
+            in_flight: Set[Future[Optional[Dict[str, Any]]]] = set()
+            while report["generated"] < remaining and report["failed"] < max_failures:
+                while len(in_flight) < workers * 2 and report["generated"] + len(in_flight) < remaining:
+                    in_flight.add(executor.submit(generate_random_game_data, next_seed()))
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if report["generated"] < remaining:
+                        on_game(future.result())
+            for future in in_flight:
+                future.cancel()
+    flush()
+
+    elapsed = time.time() - start_time
+    new_games = state["written"] - resumed_from
+    summary = {
+        "language": language,
+        "boardSize": board_size,
+        "requested": count,
+        "written": state["written"],
+        "generated": report["generated"],
+        "failed": report["failed"],
+        "workers": workers,
+        "elapsedSeconds": round(elapsed, 2),
+        "writeSeconds": round(report["writeSeconds"], 2),
+        "gamesPerSecond": round(new_games / elapsed, 2) if elapsed > 0 else 0.0,
+    }
+    print("\n=== Batch Generation Results ===")
+    for key, value in summary.items():
+        print(f"{key}: {value}")
+
+    if state["written"] >= count and checkpoint_path and os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    return summary
@@ -0,0 +1,149 @@
+from typing import Any, Dict, List, Optional
+from lambdas.common.dictionary_index import DictionaryIndex
+from lambdas.common.game_utils import create_letter_to_side_mapping, is_valid_word
+
+# Difficulty bands, by how many two-word solutions and valid words a board has.
+# Every band requires a two-word solution (par 2 or better).
+DIFFICULTY_BANDS: Dict[str, Dict[str, int]] = {
+    "easy": {"minTwoWordSolutions": 30, "maxTwoWordSolutions": 10 ** 9, "minValidWords": 80},
+    "medium": {"minTwoWordSolutions": 8, "maxTwoWordSolutions": 29, "minValidWords": 40},
+    "hard": {"minTwoWordSolutions": 1, "maxTwoWordSolutions": 7, "minValidWords": 20},
+}
+MAX_ESTIMATED_PAR = 4  # Boards that need more than three words are all estimated at this par
+
+
+def estimate_board_quality(game_layout: List[str], index: DictionaryIndex) -> Dict[str, Any]:
+    """
+    Estimate how hard a board is without solving it.
+
+    Only words whose first two letters are on different sides of the board are checked,
+    using the dictionary's prefix buckets and letter masks. Valid words are then grouped
+    by their first and last letters and their letter masks, so two-word solutions are
+    counted mask against mask, and a pair is only looked for when the words starting
+    with the linking letter cover the rest of the board between them.
+
+    Args:
+        game_layout (List[str]): Each side of the puzzle as a list.
+        index (DictionaryIndex): The compiled dictionary.
+
+    Returns:
+        Dict[str, Any]: {"validWordCount", "twoWordSolutionCount", "par"}. The solution count
+        is approximate (it can include a word paired with itself), and a par of
+        MAX_ESTIMATED_PAR means four or more words.
+    """
+    letter_to_side = create_letter_to_side_mapping(game_layout)
+    all_letters = set(letter_to_side.keys())
+    board_mask = index.letter_mask(all_letters)
+
+    valid_word_count = 0
+    one_word_solvable = False
+    # first letter -> last letter -> mask -> number of words
+    words_by_ends: Dict[str, Dict[str, Dict[int, int]]] = {}
+    for first in all_letters:
+        for second in all_letters:
+            if letter_to_side[first] == letter_to_side[second]:
+                continue
+            for position in index.get_prefix_bucket(first + second):
+                mask = index.masks[position]
+                if mask & ~board_mask:
+                    continue
+                base_word = index.base_words[position]
+                if not is_valid_word(base_word, letter_to_side, all_letters):
+                    continue
+                valid_word_count += 1
+                one_word_solvable = one_word_solvable or mask == board_mask
+                masks = words_by_ends.setdefault(first, {}).setdefault(base_word[-1], {})
+                masks[mask] = masks.get(mask, 0) + 1
+
+    # Union of the letters of every word starting with each letter, and its words' masks
+    coverage: Dict[str, int] = {}
+    starting_masks: Dict[str, Dict[int, int]] = {}
+    for first, by_last in words_by_ends.items():
+        for masks in by_last.values():
+            for mask, count in masks.items():
+                coverage[first] = coverage.get(first, 0) | mask
+                starting_masks.setdefault(first, {})
+                starting_masks[first][mask] = starting_masks[first].get(mask, 0) + count
+
+    two_word_solution_count = 0
+    three_word_solvable = False
+    for by_last in words_by_ends.values():
+        for link, masks in by_last.items():
+            for mask1, count1 in masks.items():
+                if mask1 | coverage.get(link, 0) != board_mask:
+                    # No second word can finish the board, but a second and third word might
+                    if not three_word_solvable:
+                        three_word_solvable = _has_third_word(mask1, link, words_by_ends, coverage, board_mask)
+                    continue
+                three_word_solvable = True
+                for mask2, count2 in starting_masks.get(link, {}).items():
+                    if mask1 | mask2 == board_mask:
+                        two_word_solution_count += count1 * count2
+
+    if one_word_solvable:
+        par = 1
+    elif two_word_solution_count:
+        par = 2
+    elif three_word_solvable:
+        par = 3
+    else:
+        par = MAX_ESTIMATED_PAR
+
+    return {
+        "validWordCount": valid_word_count,
+        "twoWordSolutionCount": two_word_solution_count,
+        "par": par,
+    }
+
+
+def _has_third_word(
+    mask1: int,
+    link: str,
+    words_by_ends: Dict[str, Dict[str, Dict[int, int]]],
+    coverage: Dict[str, int],
+    board_mask: int,
+) -> bool:
+    """
+    Check whether a second word from `link` and the words starting with its last letter
+    could cover the rest of the board (a necessary condition for a three-word solution).
+    """
+    for last, masks in words_by_ends.get(link, {}).items():
+        for mask2 in masks:
+            if mask1 | mask2 | coverage.get(last, 0) == board_mask:
+                return True
+    return False
+
+
+def is_in_difficulty_band(quality: Dict[str, Any], difficulty: str) -> bool:
+    """
+    Check whether an estimated board quality falls in a difficulty band.
+
+    Args:
+        quality (Dict[str, Any]): The estimate from estimate_board_quality.
+        difficulty (str): A key of DIFFICULTY_BANDS.
+
+    Returns:
+        bool: True if the board is in the band.
+    """
+    band = DIFFICULTY_BANDS[difficulty]
+    return bool(
+        quality["par"] <= 2
+        and band["minTwoWordSolutions"] <= quality["twoWordSolutionCount"] <= band["maxTwoWordSolutions"]
+        and quality["validWordCount"] >= band["minValidWords"]
+    )
+
+
+def classify_difficulty(quality: Dict[str, Any]) -> Optional[str]:
+    """
+    Find the difficulty band an estimated board quality falls in.
+
+    Args:
+        quality (Dict[str, Any]): The estimate from estimate_board_quality.
+
+    Returns:
+        Optional[str]: The difficulty, or None if the board fits no band.
+    """
+    for difficulty in DIFFICULTY_BANDS:
+        if is_in_difficulty_band(quality, difficulty):
+            return difficulty
+    return None
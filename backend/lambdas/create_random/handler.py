@@ -1,7 +1,13 @@
 import json
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from lambdas.common.validation_utils import validate_board_size, validate_language
-from lambdas.create_random.random_game_service import create_random_game, create_random_small_board_game
+from lambdas.create_random.random_game_service import (
+    MAX_GENERATION_SEED,
+    create_random_game,
+    create_random_small_board_game,
+)
+from lambdas.create_random.inventory_service import claim_random_game
+from lambdas.create_random.board_quality import DIFFICULTY_BANDS
 from lambdas.common.response_utils import error_response, HEADERS
 
 
@@ -51,29 +57,56 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         small_boards = ["1x1", "2x2"]
         if board_size not in small_boards and isinstance(seed_words, str):
             return error_response("Only small boards can have a single seed word", 400)
+
+        # Use a generation seed if provided, to reproduce a game
+        seed = body.get("seed", None)
+        if seed is not None and (
+            not isinstance(seed, int) or isinstance(seed, bool) or not 0 <= seed < MAX_GENERATION_SEED
+        ):
+            return error_response(f"Seed must be an integer from 0 to {MAX_GENERATION_SEED - 1}.", 400)
+
+        # Use a difficulty if provided, to generate boards until one falls in that band
+        difficulty = body.get("difficulty", None)
+        if difficulty is not None and difficulty not in DIFFICULTY_BANDS:
+            return error_response(f"Difficulty must be one of: {', '.join(DIFFICULTY_BANDS)}.", 400)
+        if difficulty and (seed_words or single_word):
+            return error_response("A difficulty can only be requested for randomly chosen seed words.", 400)
         
-        # Special handling for small boards
-        if board_size in small_boards and single_word:
-            random_game_data = create_random_small_board_game(
-                language, 
-                board_size, 
-                seed_words, 
-                clue, 
-                created_by, 
-                from_lambda_console,
-                is_casual,
-            )
-        else:
-            # Use existing service for all other boards
-            random_game_data = create_random_game(
-                language, 
-                board_size, 
-                seed_words, 
-                clue, 
-                created_by, 
-                from_lambda_console,
-                is_casual,
-            )
+        # Hand out a ready-made game from the inventory when any random game will do
+        random_game_data: Optional[Dict[str, Any]] = None
+        uses_inventory = (
+            not seed_words and seed is None and difficulty is None
+            and not from_lambda_console and not is_casual and not single_word
+        )
+        if uses_inventory:
+            random_game_data = claim_random_game(language, board_size, created_by)
+
+        if random_game_data is None:
+            # Special handling for small boards
+            if board_size in small_boards and single_word:
+                random_game_data = create_random_small_board_game(
+                    language, 
+                    board_size, 
+                    seed_words, 
+                    clue, 
+                    created_by, 
+                    from_lambda_console,
+                    is_casual,
+                    seed,
+                )
+            else:
+                # Use existing service for all other boards
+                random_game_data = create_random_game_with_retries(
+                    language, 
+                    board_size, 
+                    seed_words, 
+                    clue, 
+                    created_by, 
+                    from_lambda_console,
+                    is_casual,
+                    seed,
+                    difficulty,
+                )
 
         # Return the game details
         return {
@@ -85,7 +118,9 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 "gameId": random_game_data["gameId"],
                 "gameLayout": random_game_data["gameLayout"],
                 "createdBy": random_game_data["createdBy"],
-                "clue": random_game_data["clue"]
+                "clue": random_game_data["clue"],
+                "generationSeed": random_game_data.get("generationSeed"),
+                "difficulty": random_game_data.get("difficulty")
             })
         }
     except json.JSONDecodeError as e:
@@ -96,4 +131,45 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     except Exception as e:
         print(f"Handler failed: {e}")
         return error_response(f"There was a problem creating the game: {e}", 500)
-    
\ No newline at end of file
+    
+
+
+def create_random_game_with_retries(
+    language: str,
+    board_size: str,
+    seed_words: Optional[tuple[str, str]],
+    clue: Optional[str],
+    created_by: Optional[str],
+    from_lambda_console: bool,
+    is_casual: bool,
+    seed: Optional[int] = None,
+    difficulty: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Create a random game, retrying with new seed words (up to MAX_RETRIES times)
+    when randomly chosen seed words fail to make a game. Games from given seed
+    words or a given seed are not retried, since they would fail the same way again,
+    and neither are difficulty requests, which already try many seed words.
+
+    Raises:
+        ValueError if the game could not be created.
+    """
+    attempt = 1
+    while True:
+        try:
+            return create_random_game(
+                language,
+                board_size,
+                seed_words,
+                clue,
+                created_by,
+                from_lambda_console,
+                is_casual,
+                seed,
+                difficulty,
+            )
+        except ValueError as e:
+            if seed_words or seed is not None or difficulty or attempt >= MAX_RETRIES:
+                raise
+            print(f"Attempt {attempt} failed ({e}). Retrying with new seed words.")
+            attempt += 1
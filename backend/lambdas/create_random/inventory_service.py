@@ -0,0 +1,95 @@
+import time
+from typing import Any, Callable, Dict, List, Optional
+from lambdas.common.db_utils import add_games_to_inventory, claim_inventory_game, count_inventory_games
+from lambdas.common.seed_usage import count_seed_usage, save_seed_usage_counts
+from lambdas.create_random.batch_generation_service import generate_random_game_data, init_worker
+
+# Unclaimed games kept ready for each (language, board size)
+INVENTORY_TARGETS: Dict[str, Dict[str, int]] = {
+    "en": {"3x3": 50, "4x4": 20},
+}
+INVENTORY_WRITE_CHUNK_SIZE = 10  # Games written to the inventory per batch
+MAX_FAILED_GAMES = 10  # Failed generations per pool before the top-up moves on
+
+
+def claim_random_game(language: str, board_size: str, created_by: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    Claim a ready-made random game for a web UI request, if the inventory has one.
+
+    Args:
+        language (str): The language code.
+        board_size (str): The board size.
+        created_by (str, optional): The author to record on the game.
+
+    Returns:
+        Optional[Dict[str, Any]]: The claimed game, or None if the game must be generated now.
+    """
+    if board_size not in INVENTORY_TARGETS.get(language, {}):
+        return None
+    start_time = time.time()
+    game_data = claim_inventory_game(language, board_size, {
+        "gameType": "custom",  # Same type as games generated on request from the web UI
+        "createdBy": created_by or "",
+        "clue": "",
+    })
+    if game_data:
+        print(f"[INFO] Claimed inventory game {game_data['gameId']} in {time.time() - start_time:.2f} seconds")
+    else:
+        print(f"[INFO] No inventory game available for {language} {board_size}")
+    return game_data
+
+
+def replenish_inventory(
+    language: str,
+    board_size: str,
+    target: int,
+    has_time: Callable[[], bool] = lambda: True,
+) -> int:
+    """
+    Top up an inventory pool to its target with newly generated games.
+
+    Args:
+        language (str): The language code.
+        board_size (str): The board size.
+        target (int): The number of unclaimed games to keep.
+        has_time (Callable[[], bool]): Returns False when generation should stop early
+            (e.g. the Lambda is about to time out). Games generated so far are kept.
+
+    Returns:
+        int: The number of games added.
+    """
+    available = count_inventory_games(language, board_size)
+    if available is None:
+        # Without a count, topping up could overfill the pool
+        print(f"[ERROR] Could not count the {language} {board_size} inventory; skipping it")
+        return 0
+    missing = target - available
+    if missing <= 0:
+        print(f"[INFO] Inventory for {language} {board_size} is full")
+        return 0
+
+    print(f"[INFO] Adding {missing} games to the {language} {board_size} inventory")
+    init_worker(language, board_size, balanced=True)
+    added = 0
+    failed = 0
+    buffer: List[Dict[str, Any]] = []
+    while added + len(buffer) < missing and failed < MAX_FAILED_GAMES and has_time():
+        game_data = generate_random_game_data()
+        if game_data is None:
+            failed += 1
+            continue
+        buffer.append(game_data)
+        if len(buffer) >= INVENTORY_WRITE_CHUNK_SIZE:
+            added += _write_inventory(buffer, language, board_size)
+            buffer = []
+    if buffer:
+        added += _write_inventory(buffer, language, board_size)
+    return added
+
+
+def _write_inventory(games: List[Dict[str, Any]], language: str, board_size: str) -> int:
+    if not add_games_to_inventory(games, language, board_size):
+        print(f"[ERROR] Failed to add {len(games)} games to the {language} {board_size} inventory")
+        return 0
+    save_seed_usage_counts(language, count_seed_usage(games))
+    return len(games)
@@ -0,0 +1,294 @@
+import random
+from functools import lru_cache
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+NUM_SIDES = 4
+ALL_SIDES = (1 << NUM_SIDES) - 1
+
+# A layout in canonical form: each side's letters sorted, and the sides sorted
+CanonicalLayout = Tuple[str, ...]
+
+
+def parse_side_length(board_size: str) -> int:
+    """
+    Get the number of letters on each side for a board size.
+
+    Args:
+        board_size (str): The board size, e.g. '3x3'.
+
+    Returns:
+        int: Letters per side.
+
+    Raises:
+        ValueError: If the board size is malformed.
+    """
+    try:
+        rows, cols = map(int, board_size.lower().split('x'))
+    except ValueError:
+        raise ValueError(f"Invalid board size format: '{board_size}'. Expected 'm x n'.")
+    return rows
+
+
+def build_letter_graph(letter_sequence: str) -> Optional[Tuple[str, List[int]]]:
+    """
+    Build the constraint graph for a sequence of letters that must be playable in order.
+    Each distinct letter is a vertex, and consecutive letters are joined by an edge
+    (they must be on different sides).
+
+    Args:
+        letter_sequence (str): The base letters of the seed word(s), in play order.
+
+    Returns:
+        Optional[Tuple[str, List[int]]]: The distinct letters and, for each letter, a
+        bitmask of its neighbours; or None if a letter follows itself, which no layout allows.
+    """
+    letters = "".join(dict.fromkeys(letter_sequence))
+    position = {letter: i for i, letter in enumerate(letters)}
+    neighbours = [0] * len(letters)
+    for previous, current in zip(letter_sequence, letter_sequence[1:]):
+        if previous == current:
+            return None
+        a, b = position[previous], position[current]
+        neighbours[a] |= 1 << b
+        neighbours[b] |= 1 << a
+    return letters, neighbours
+
+
+def _search(
+    letters: str,
+    neighbours: List[int],
+    side_length: int,
+    shuffle: Optional[Callable[[List[int]], None]] = None,
+) -> Iterator[List[int]]:
+    """
+    Assign every letter to one of four sides, yielding each distinct assignment once.
+
+    The search is a graph colouring with equal colour class sizes:
+        - Forward checking: placing a letter removes its side from its neighbours'
+          domains, and a full side is removed from every unplaced letter's domain.
+        - Capacity propagation: every side must still be fillable by the unplaced
+          letters that can go there.
+        - Most-constrained-letter-first ordering.
+        - Symmetry breaking: sides are interchangeable, so a letter is only ever put
+          on the sides already in use or on the first unused side. Each distinct
+          layout is therefore found exactly once.
+
+    Args:
+        letters (str): The distinct letters.
+        neighbours (List[int]): Neighbour bitmask for each letter.
+        side_length (int): Letters per side.
+        shuffle (Callable, optional): If given, used to shuffle the order sides are
+            tried in, so the first assignment found is a random one.
+
+    Yields:
+        List[int]: The side of each letter.
+    """
+    count = len(letters)
+    if count != NUM_SIDES * side_length:
+        return
+
+    assignment = [-1] * count
+
+    def solve(domains: List[int], side_counts: List[int], sides_used: int, remaining: int) -> Iterator[List[int]]:
+        if remaining == 0:
+            yield list(assignment)
+            return
+
+        # Choose the unplaced letter with the fewest possible sides (then the most unplaced neighbours)
+        best = -1
+        best_key = (NUM_SIDES + 1, 0)
+        for i in range(count):
+            if assignment[i] != -1:
+                continue
+            unplaced_neighbours = sum(1 for j in range(count) if neighbours[i] >> j & 1 and assignment[j] == -1)
+            key = (domains[i].bit_count(), -unplaced_neighbours)
+            if key < best_key:
+                best, best_key = i, key
+
+        candidates = [side for side in range(sides_used) if domains[best] >> side & 1]
+        if sides_used < NUM_SIDES:
+            candidates.append(sides_used)
+        if shuffle is not None:
+            shuffle(candidates)
+
+        for side in candidates:
+            bit = 1 << side
+            new_domains = list(domains)
+            new_counts = list(side_counts)
+            assignment[best] = side
+            new_counts[side] += 1
+            feasible = True
+            for j in range(count):
+                if assignment[j] != -1:
+                    continue
+                if neighbours[best] >> j & 1 or new_counts[side] == side_length:
+                    new_domains[j] &= ~bit
+                    if not new_domains[j]:
+                        feasible = False
+                        break
+            if feasible:
+                feasible = _sides_fillable(
+                    new_domains, new_counts, assignment, side_length, max(sides_used, side + 1)
+                )
+            if feasible:
+                yield from solve(new_domains, new_counts, max(sides_used, side + 1), remaining - 1)
+            assignment[best] = -1
+
+    yield from solve([ALL_SIDES] * count, [0] * NUM_SIDES, 0, count)
+
+
+def _sides_fillable(
+    domains: List[int],
+    side_counts: List[int],
+    assignment: List[int],
+    side_length: int,
+    sides_used: int,
+) -> bool:
+    """
+    Check that each side in use can still be filled by unplaced letters that may go there.
+    (Unused sides can take any letter, so the total count already guarantees them.)
+    """
+    for side in range(sides_used):
+        missing = side_length - side_counts[side]
+        if missing == 0:
+            continue
+        supporters = sum(
+            1 for i, domain in enumerate(domains) if assignment[i] == -1 and domain >> side & 1
+        )
+        if supporters < missing:
+            return False
+    return True
+
+
+def _to_layout(letters: str, assignment: List[int]) -> List[str]:
+    sides = [""] * NUM_SIDES
+    for letter, side in zip(letters, assignment):
+        sides[side] += letter
+    return sides
+
+
+def canonicalize(layout: List[str]) -> CanonicalLayout:
+    """
+    Put a layout in canonical form (letters sorted within each side, then sides sorted),
+    so layouts that differ only by ordering compare equal.
+
+    Args:
+        layout (List[str]): The layout.
+
+    Returns:
+        CanonicalLayout: The canonical layout.
+    """
+    return tuple(sorted("".join(sorted(side)) for side in layout))
+
+
+@lru_cache(maxsize=4096)
+def is_feasible(letter_sequence: str, side_length: int) -> bool:
+    """
+    Check whether any layout lets the letter sequence be played in order.
+    Results are cached, so repeated checks of the same seed words are free.
+
+    Args:
+        letter_sequence (str): The base letters of the seed word(s), in play order.
+        side_length (int): Letters per side.
+
+    Returns:
+        bool: True if at least one layout exists.
+    """
+    graph = build_letter_graph(letter_sequence)
+    if graph is None:
+        return False
+    letters, neighbours = graph
+    return next(_search(letters, neighbours, side_length), None) is not None
+
+
+@lru_cache(maxsize=256)
+def _enumerate_layouts(letter_sequence: str, side_length: int, limit: Optional[int]) -> Tuple[CanonicalLayout, ...]:
+    graph = build_letter_graph(letter_sequence)
+    if graph is None:
+        return ()
+    letters, neighbours = graph
+    layouts: Dict[CanonicalLayout, None] = {}
+    for assignment in _search(letters, neighbours, side_length):
+        layouts[canonicalize(_to_layout(letters, assignment))] = None
+        if limit is not None and len(layouts) >= limit:
+            break
+    return tuple(layouts)
+
+
+def enumerate_layouts(
+    letter_sequence: str,
+    side_length: int,
+    limit: Optional[int] = None,
+) -> List[CanonicalLayout]:
+    """
+    List the distinct layouts that let the letter sequence be played in order.
+    Results are cached per sequence, side length and limit.
+
+    Args:
+        letter_sequence (str): The base letters of the seed word(s), in play order.
+        side_length (int): Letters per side.
+        limit (int, optional): Stop after this many layouts.
+
+    Returns:
+        List[CanonicalLayout]: The layouts, in canonical form.
+    """
+    return list(_enumerate_layouts(letter_sequence, side_length, limit))
+
+
+def find_layout(
+    letter_sequence: str,
+    side_length: int,
+    rng: Optional[random.Random] = None,
+) -> Optional[List[str]]:
+    """
+    Find one random layout that lets the letter sequence be played in order.
+    Infeasible sequences are rejected from the feasibility cache without searching again.
+
+    Args:
+        letter_sequence (str): The base letters of the seed word(s), in play order.
+        side_length (int): Letters per side.
+        rng (random.Random, optional): The random generator to use.
+
+    Returns:
+        Optional[List[str]]: The four sides, or None if no layout exists.
+    """
+    if not is_feasible(letter_sequence, side_length):
+        return None
+    graph = build_letter_graph(letter_sequence)
+    if graph is None:
+        return None
+    letters, neighbours = graph
+    assignment = next(_search(letters, neighbours, side_length, (rng or random).shuffle), None)
+    if assignment is None:
+        return None
+    return _to_layout(letters, assignment)
+
+
+def choose_layout(
+    letter_sequence: str,
+    side_length: int,
+    score: Callable[[CanonicalLayout], float],
+    limit: Optional[int] = None,
+    rng: Optional[random.Random] = None,
+) -> Optional[List[str]]:
+    """
+    Enumerate the layouts for a letter sequence and return the best-scoring one
+    (ties are broken at random).
+
+    Args:
+        letter_sequence (str): The base letters of the seed word(s), in play order.
+        side_length (int): Letters per side.
+        score (Callable[[CanonicalLayout], float]): Scores a layout; higher is better.
+        limit (int, optional): Consider at most this many layouts.
+        rng (random.Random, optional): The random generator to use for ties.
+
+    Returns:
+        Optional[List[str]]: The four sides, or None if no layout exists.
+    """
+    layouts = enumerate_layouts(letter_sequence, side_length, limit)
+    if not layouts:
+        return None
+    scores = [score(layout) for layout in layouts]
+    best_score = max(scores)
+    best_layouts = [layout for layout, layout_score in zip(layouts, scores) if layout_score == best_score]
+    return list((rng or random).choice(best_layouts))
@@ -1,17 +1,40 @@
 import time
 import random
-import unicodedata
-from typing import List, Optional, Tuple, Dict, Any
-from lambdas.common.game_utils import normalize_to_base
-from lambdas.common.dictionary_utils import get_dictionary, get_basic_dictionary
+from typing import Callable, List, Optional, Tuple, Dict, Any
+from lambdas.common.dictionary_utils import (
+    get_balanced_sampler,
+    get_basic_dictionary,
+    get_dictionary,
+    get_dictionary_index,
+    record_seed_usage,
+)
+from lambdas.common.dictionary_index import DictionaryIndex, normalize_to_base
+from lambdas.common.pair_catalog import PairCatalog, get_pair_catalog
+from lambdas.common.sampling_utils import WeightedSampler
 from lambdas.common.db_utils import (
     add_game_to_db,
     add_game_id_to_random_games_db,
+    get_random_pool_summary,
+    fetch_game_by_id,
 )
-from lambdas.common.game_schema import create_game_schema
+from lambdas.common.game_schema import create_game_schema, generate_content_game_id
+from lambdas.create_random.layout_engine import CanonicalLayout, choose_layout, find_layout, parse_side_length
+from lambdas.create_random.board_quality import DIFFICULTY_BANDS, estimate_board_quality, is_in_difficulty_band
 
 DEFAULT_LANGUAGE = "en"
 USE_BASIC_DICTIONARY = True # Determine which dictionary to use for seed words
+LARGER_BOARDS = ["4x4", "5x5"] # Boards that always use the full dictionary for seed words
+MAX_LAYOUT_CANDIDATES = 2000 # Layouts considered when a layout scorer is used
+USE_COMMONNESS_WEIGHTING = True # Favor common words (by compiled commonness rank) when selecting seed words
+USE_USAGE_BALANCING = True # Weigh seed words down by how often they (and their letters) have been used
+MAX_GENERATION_SEED = 2 ** 53 # Generation seeds stay below this, so they are exact as JSON numbers in the browser
+MAX_DIFFICULTY_ATTEMPTS = 200 # Seed word pairs tried when looking for a board of a given difficulty
+LAYOUTS_PER_SEED_PAIR = 3 # Layouts tried for each seed word pair when looking for a board of a given difficulty
+# Block certain words that work a little "too" well for puzzles, so they show up a lot
+# (usage balancing weighs overused words down, so this is only for words that should never come up)
+BANNED_WORD_LIST = [
+    "DAINTILY",
+]
 
 def create_random_game(
     language: str = "en", 
@@ -21,6 +44,8 @@ def create_random_game(
     created_by: Optional[str] = None,
     from_lambda_console: bool = False,
     is_casual: bool = False,
+    seed: Optional[int] = None,
+    difficulty: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Create a random game by selecting two words from the dictionary and generating a layout.
@@ -34,6 +59,12 @@ def create_random_game(
         created_by (str): The author of the puzzle, if provided.
         from_lambda_console (bool): True if the game creation request came from Lambda, or false it came from the web UI.
         is_casual: If true, seed words do not have to be in the dictionary.
+        seed (int, optional): Seed for every random choice, so the same request makes the same game.
+            If provided, a game already generated from the same inputs is returned instead.
+            If not provided, a new seed is drawn and seed words are balanced by usage, so the
+            game can't be reproduced and no generationSeed is recorded.
+        difficulty (str, optional): A key of DIFFICULTY_BANDS. Boards are generated until one
+            falls in that band. Only used when the seed words are chosen at random.
 
     Returns:
         Dict[str, Optional[List[str]]]: A dictionary containing the selected words and the game layout.
@@ -44,14 +75,34 @@ def create_random_game(
     start_time = time.time()
     print(f"\n[INFO] Starting random game creation for language '{language}' and board size '{board_size}'")
 
+    if difficulty and seed_words:
+        raise ValueError("A difficulty can only be targeted when the seed words are chosen at random.")
+    if difficulty and difficulty not in DIFFICULTY_BANDS:
+        raise ValueError(f"Unknown difficulty '{difficulty}'.")
+
+    game_type = get_game_type(from_lambda_console, is_casual)
+    game_id = None
+    if seed is not None:
+        game_id = get_seeded_game_id(
+            language, board_size, seed, list(seed_words or []), clue or "", game_type, difficulty
+        )
+        cached_game = fetch_cached_game(game_id)
+        if cached_game:
+            return cached_game
+    balanced = seed is None
+    if seed is None:
+        seed = new_generation_seed()
+    rng = random.Random(seed)
+
     # Fetch the dictionary for the specified language
     dict_start = time.time()
     dictionary = get_dictionary(language)
     basic_dictionary = get_basic_dictionary(language) if USE_BASIC_DICTIONARY else dictionary
+    seed_dictionary_type = "basic" if USE_BASIC_DICTIONARY else "dictionary"
     # Use the full dictionary for larger boards
-    larger_boards = ["4x4", "5x5"]
-    if board_size in larger_boards:
+    if board_size in LARGER_BOARDS:
         basic_dictionary = dictionary
+        seed_dictionary_type = "dictionary"
     
     dict_time = time.time() - dict_start
     print(f"[INFO] Dictionary fetch completed in {dict_time:.2f} seconds")
@@ -63,9 +114,24 @@ def create_random_game(
 
     # Select two words that can be potentially linked for the random puzzle, if not provided
     select_words_start = time.time()
+    game_layout = None
+    random_seed_words = not seed_words
     if not seed_words:
         print(f"Seed words not passed. Selecting two words from {len(basic_dictionary)}-word dictionary.")
-        seed_words = select_two_words(basic_dictionary, board_size)
+        if difficulty:
+            board = select_board_for_difficulty(
+                get_pair_catalog(language, seed_dictionary_type, board_size),
+                board_size,
+                get_dictionary_index(language),
+                difficulty,
+                rng=rng,
+            )
+            if not board:
+                raise ValueError(f"[ERROR] Failed to find a board with {difficulty} difficulty.")
+            seed_words, game_layout = board
+        else:
+            sampler = get_seed_word_sampler(language, seed_dictionary_type, balanced=balanced)
+            seed_words = select_two_words(basic_dictionary, board_size, sampler=sampler, rng=rng)
         if not seed_words:
             raise ValueError("[ERROR] Failed to find a valid pair of words for the game.")
     select_words_time = time.time() - select_words_start
@@ -81,19 +147,15 @@ def create_random_game(
 
     # Generate the game layout
     layout_start = time.time()
-    game_layout = generate_layout(word1, word2, board_size)
+    if game_layout is None:
+        game_layout = generate_layout(word1, word2, board_size, rng=rng)
     layout_time = time.time() - layout_start
     if not game_layout:
         raise ValueError("[ERROR] Failed to generate a valid layout for the game.")
     print(f"[INFO] Layout generation completed in {layout_time:.2f} seconds")
 
-    game_type = "custom"
-    if is_casual:
-        game_type = "casual"
-    elif from_lambda_console:
-        game_type = "random"
-
     game_data = create_game_schema(
+        game_id=game_id,
         game_layout=game_layout,
         game_type=game_type,
         language=language,
@@ -101,8 +163,14 @@ def create_random_game(
         random_seed_words=[word1, word2],
         created_by=created_by or "",
         clue=clue or "",
+        generation_seed=None if balanced and random_seed_words else seed,
+        difficulty=difficulty,
+        rng=rng,
     )
 
+    if random_seed_words:
+        record_seed_usage(language, [word1, word2], game_layout)
+
     # Insert the two seed words into the valid words list for this game (for casual games)
     if is_casual:
         game_data["validWords"].append(word1)
@@ -113,14 +181,21 @@ def create_random_game(
 
     # Store the game in the games DB
     db_start = time.time()
-    success = add_game_to_db(game_data)
+    # A seeded game may have been written by a concurrent request with the same seed
+    success = add_game_to_db(game_data, only_if_new=game_id is not None)
     db_time = time.time() - db_start
     print(f"[INFO] Database operations completed in {db_time:.2f} seconds")
+    if not success and game_id:
+        cached_game = fetch_cached_game(game_id)
+        if cached_game:
+            return cached_game
 
     if success and from_lambda_console:
     # Add the game to the random games table and track the count (if created via Lambda console)
         atomic_start = time.time()
-        atomic_number = add_game_id_to_random_games_db(game_data["gameId"], language)
+        atomic_number = add_game_id_to_random_games_db(
+            game_data["gameId"], language, get_random_pool_summary(game_data)
+        )
         atomic_time = time.time() - atomic_start
         print(f"[INFO] Atomic number tracking completed in {atomic_time:.2f} seconds")
 
@@ -138,6 +213,7 @@ def create_random_small_board_game(
     created_by: Optional[str] = None,
     from_lambda_console: bool = False,
     is_casual: bool = False,
+    seed: Optional[int] = None,
 ) -> Dict[str, Any]:
     """
     Create a random game by selecting a single word from the dictionary and generating a layout.
@@ -150,6 +226,8 @@ def create_random_small_board_game(
         created_by (str): The author of the puzzle, if provided.
         from_lambda_console (bool): True if the game creation request came from Lambda, or false it came from the web UI.
         is_casual: If true, seed words do not have to be in the dictionary.
+        seed (int, optional): Seed for every random choice, as in create_random_game.
+            If not provided, the seed word is balanced by usage and no generationSeed is recorded.
 
     Returns:
         Dict[str, Optional[List[str]]]: A dictionary containing the selected words and the game layout.
@@ -157,6 +235,18 @@ def create_random_small_board_game(
     crsb_start_time = time.time()
     print(f"\n[INFO] Starting random game creation for language '{language}' and board size '{board_size}'")
 
+    game_type = get_game_type(from_lambda_console, is_casual)
+    game_id = None
+    if seed is not None:
+        game_id = get_seeded_game_id(language, board_size, seed, [seed_word or ""], clue or "", game_type)
+        cached_game = fetch_cached_game(game_id)
+        if cached_game:
+            return cached_game
+    balanced = seed is None
+    if seed is None:
+        seed = new_generation_seed()
+    rng = random.Random(seed)
+
     # Fetch the dictionary for the specified language
     dict_start = time.time()
     dictionary = get_dictionary(language)
@@ -173,9 +263,13 @@ def create_random_small_board_game(
     
     # Select a single word that can be potentially used for the random puzzle, if not provided
     select_word_start = time.time()
+    random_seed_word = not seed_word
     if not seed_word:
         print(f"Seed word not passed. Selecting a word from {len(basic_dictionary)}-word dictionary.")
-        seed_word = select_one_word(basic_dictionary, board_size)
+        sampler = get_seed_word_sampler(
+            language, "basic" if USE_BASIC_DICTIONARY else "dictionary", balanced=balanced
+        )
+        seed_word = select_one_word(basic_dictionary, board_size, sampler=sampler, rng=rng)
         if not seed_word:
             raise ValueError("[ERROR] Failed to find a valid word for the game.")
     select_word_time = time.time() - select_word_start
@@ -186,19 +280,14 @@ def create_random_small_board_game(
     
     # Generate the game layout
     layout_start = time.time()
-    game_layout = generate_layout_from_single_word(seed_word, board_size)
+    game_layout = generate_layout_from_single_word(seed_word, board_size, rng=rng)
     layout_time = time.time() - layout_start
     if not game_layout:
         raise ValueError("[ERROR] Failed to generate a valid layout for the game.")
     print(f"[INFO] Layout generation completed in {layout_time:.2f} seconds")
-    
-    game_type = "custom"
-    if is_casual:
-        game_type = "casual"
-    elif from_lambda_console:
-        game_type = "random"
 
     game_data = create_game_schema(
+        game_id=game_id,
         game_layout=game_layout,
         game_type=game_type,
         language=language,
@@ -206,8 +295,13 @@ def create_random_small_board_game(
         board_size=board_size,
         created_by=created_by or "",
         clue=clue or "",
+        generation_seed=None if balanced and random_seed_word else seed,
+        rng=rng,
     )
 
+    if random_seed_word:
+        record_seed_usage(language, [seed_word], game_layout)
+
     # Insert the seed word into the valid words list for this game (for casual games)
     if is_casual:
         game_data["validWords"].append(seed_word)
@@ -216,14 +310,21 @@ def create_random_small_board_game(
     
     # Store the game in the games DB
     db_start = time.time()
-    success = add_game_to_db(game_data)
+    # A seeded game may have been written by a concurrent request with the same seed
+    success = add_game_to_db(game_data, only_if_new=game_id is not None)
     db_time = time.time() - db_start
     print(f"[INFO] Database operations completed in {db_time:.2f} seconds")
+    if not success and game_id:
+        cached_game = fetch_cached_game(game_id)
+        if cached_game:
+            return cached_game
 
     # Add the game to the random games table and track the count, if game was created from lambda console
     if success and from_lambda_console:
         atomic_start = time.time()
-        atomic_number = add_game_id_to_random_games_db(game_data["gameId"], language)
+        atomic_number = add_game_id_to_random_games_db(
+            game_data["gameId"], language, get_random_pool_summary(game_data)
+        )
         atomic_time = time.time() - atomic_start
         print(f"[INFO] Atomic number tracking completed in {atomic_time:.2f} seconds")
 
@@ -233,7 +334,102 @@ def create_random_small_board_game(
     return game_data
     
 
-def generate_layout(word1: str, word2: str, board_size: str) -> Optional[List[str]]:
+def get_game_type(from_lambda_console: bool, is_casual: bool) -> str:
+    """
+    Get the game type of a generated game from where the request came from.
+    """
+    if is_casual:
+        return "casual"
+    if from_lambda_console:
+        return "random"
+    return "custom"
+
+
+def new_generation_seed() -> int:
+    """
+    Draw a new generation seed (from the OS, so it is independent of any seeded generator).
+    """
+    return random.SystemRandom().randrange(MAX_GENERATION_SEED)
+
+
+def get_seeded_game_id(
+    language: str,
+    board_size: str,
+    seed: int,
+    seed_words: List[str],
+    clue: str,
+    game_type: str,
+    difficulty: Optional[str] = None,
+) -> Optional[str]:
+    """
+    Get the content-addressed game id for a seeded request. Every input that changes the
+    generated game is part of the id, including the compiled dictionary version, so the
+    same request maps to the same game until the dictionary changes.
+
+    Returns:
+        Optional[str]: The game id, or None if the dictionary version is unavailable
+        (the game is then generated without caching).
+    """
+    try:
+        dictionary_version = get_dictionary_index(language).version
+    except (ValueError, RuntimeError) as e:
+        print(f"[WARN] Seeded game cache unavailable: {e}")
+        return None
+    parts = ["random-game", language, board_size, str(seed), dictionary_version, ",".join(seed_words), clue, game_type]
+    if difficulty:
+        parts.append(difficulty)
+    return generate_content_game_id(*parts)
+
+
+def fetch_cached_game(game_id: Optional[str]) -> Optional[Dict[str, Any]]:
+    """
+    Fetch a game generated earlier from the same seeded request, if there is one.
+    """
+    if not game_id:
+        return None
+    cached_game = fetch_game_by_id(game_id)
+    if cached_game:
+        print(f"[INFO] Returning game {game_id}, already generated from the same seed")
+    return cached_game
+
+
+def get_seed_word_sampler(
+    language: str,
+    dictionary_type: str,
+    balanced: bool = False,
+) -> Optional[WeightedSampler[str]]:
+    """
+    Get a sampler that draws seed words weighted by their commonness rank.
+
+    Args:
+        language (str): The language code for the dictionary.
+        dictionary_type (str): 'basic' or 'dictionary', matching the list the seed words are checked against.
+        balanced (bool): Also weigh words down by how often they (and their letters) have been
+            used. Balanced draws depend on the usage counts, so seeded (reproducible) generation
+            must not use them.
+
+    Returns:
+        Optional[WeightedSampler[str]]: The sampler, or None if weighting is disabled or the
+        compiled dictionary is unavailable (seed words are then drawn uniformly).
+    """
+    if not USE_COMMONNESS_WEIGHTING:
+        return None
+    try:
+        if balanced and USE_USAGE_BALANCING:
+            return get_balanced_sampler(language, dictionary_type)
+        return get_dictionary_index(language).get_sampler(dictionary_type)
+    except (ValueError, RuntimeError) as e:
+        print(f"[WARN] Commonness-weighted seed selection unavailable: {e}")
+        return None
+
+
+def generate_layout(
+    word1: str,
+    word2: str,
+    board_size: str,
+    layout_scorer: Optional[Callable[[CanonicalLayout], float]] = None,
+    rng: Optional[random.Random] = None,
+) -> Optional[List[str]]:
     """
     Generate a game layout with letters from two words distributed across 4 sides,
     maintaining adjacency constraints and handling shared and repeated letters.
@@ -242,6 +438,10 @@ def generate_layout(word1: str, word2: str, board_size: str) -> Optional[List[st
         word1 (str): The first word.
         word2 (str): The second word.
         board_size (str): The size of the board to generate.
+        layout_scorer (Callable[[CanonicalLayout], float], optional): If provided, every
+            distinct layout (up to MAX_LAYOUT_CANDIDATES) is scored and the best one is used.
+            Otherwise a random layout is used.
+        rng (random.Random, optional): The random generator to use.
 
     Returns:
         Optional[List[str]]: A list of 4 strings representing the sides of the board,
@@ -249,12 +449,8 @@ def generate_layout(word1: str, word2: str, board_size: str) -> Optional[List[st
     """
     layout_start = time.time()
     print(f"[INFO] Starting layout generation for words '{word1}' and '{word2}' with board size '{board_size}'")
-    try:
-        rows, cols = map(int, board_size.lower().split('x'))
-    except ValueError:
-        raise ValueError(f"Invalid board size format: '{board_size}'. Expected 'm x n'.")
-
-    total_spaces = (2 * rows) + (2 * cols)
+    rows = parse_side_length(board_size)
+    total_spaces = 4 * rows
     base_word1 = normalize_to_base(word1)
     base_word2 = normalize_to_base(word2)
 
@@ -265,48 +461,15 @@ def generate_layout(word1: str, word2: str, board_size: str) -> Optional[List[st
     if len(set(combined_letters)) != total_spaces:
         return None
 
-    sides = [""] * 4
-    letter_to_side: Dict[str, int] = {}
-
-    def backtrack(index: int, current_side: int) -> bool:
-        if index == len(combined_letters):
-            return True
-
-        letter = combined_letters[index]
-        if letter in letter_to_side:
-            next_side = letter_to_side[letter]
-            return next_side != current_side and backtrack(index + 1, next_side)
-
-        # Try placing the letter on a valid side
-        side_indices = list(range(4))  # Four sides
-        random.shuffle(side_indices)  # Shuffle to introduce randomness
-
-        for side_index in side_indices:
-            if side_index == current_side or len(sides[side_index]) >= rows:
-                continue
-
-            sides[side_index] += letter
-            letter_to_side[letter] = side_index
-
-            if backtrack(index + 1, side_index):
-                return True
+    return _layout_letter_sequence(combined_letters, rows, layout_scorer, layout_start, rng)
 
-            sides[side_index] = sides[side_index][:-1]
-            del letter_to_side[letter]
 
-        return False
-
-    if backtrack(0, -1):
-        shuffled_sides = shuffle_final_layout(sides)
-        layout_time = time.time() - layout_start
-        print(f"[INFO] Layout generation {shuffled_sides} completed in {layout_time:.2f} seconds")
-        return shuffled_sides
-    layout_time = time.time() - layout_start
-    print(f"[ERROR] Layout generation failed after {layout_time:.2f} seconds")
-    return None
-
-
-def generate_layout_from_single_word(word: str, board_size: str) -> Optional[List[str]]:
+def generate_layout_from_single_word(
+    word: str,
+    board_size: str,
+    layout_scorer: Optional[Callable[[CanonicalLayout], float]] = None,
+    rng: Optional[random.Random] = None,
+) -> Optional[List[str]]:
     """
     Generate a game layout using letters from a single word distributed across 4 sides,
     maintaining adjacency constraints and handling shared and repeated letters.
@@ -314,6 +477,10 @@ def generate_layout_from_single_word(word: str, board_size: str) -> Optional[Lis
     Args:
         word (str): The seed word to generate the layout.
         board_size (str): The size of the board to generate.
+        layout_scorer (Callable[[CanonicalLayout], float], optional): If provided, every
+            distinct layout (up to MAX_LAYOUT_CANDIDATES) is scored and the best one is used.
+            Otherwise a random layout is used.
+        rng (random.Random, optional): The random generator to use.
 
     Returns:
         Optional[List[str]]: A list of 4 strings representing the sides of the board,
@@ -323,72 +490,48 @@ def generate_layout_from_single_word(word: str, board_size: str) -> Optional[Lis
     print(f"[INFO] Starting layout generation for word '{word}' with board size '{board_size}'")
 
     # Validate the board size
-    try:
-        rows, cols = map(int, board_size.lower().split('x'))
-    except ValueError:
-        raise ValueError(f"Invalid board size format: '{board_size}'. Expected 'm x n'.")
-
-    total_spaces = (2 * rows) + (2 * cols)
+    rows = parse_side_length(board_size)
+    total_spaces = 4 * rows
     base_word = normalize_to_base(word)
 
     if len(set(base_word)) != total_spaces:
         print(f"[ERROR] Word '{word}' does not contain the exact number of unique letters required for the board size.")
         return None
 
-    # Initialize the sides of the board
-    sides = [""] * 4
-    letter_to_side: Dict[str, int] = {}
-
-    def backtrack(index: int, current_side: int) -> bool:
-        if index == len(base_word):
-            return True  # Successfully placed all letters
-
-        letter = base_word[index]
-
-        # Check if the letter has already been assigned to a side
-        if letter in letter_to_side:
-            next_side = letter_to_side[letter]
-            return next_side != current_side and backtrack(index + 1, next_side)
-
-        # Try placing the letter on a valid side
-        side_indices = list(range(4))  # Four sides
-        random.shuffle(side_indices)  # Shuffle to introduce randomness
+    return _layout_letter_sequence(base_word, rows, layout_scorer, layout_start, rng)
 
-        for side_index in side_indices:
-            if side_index == current_side or len(sides[side_index]) >= rows:
-                continue  # Skip the current side or sides that are full
 
-            # Place the letter
-            sides[side_index] += letter
-            letter_to_side[letter] = side_index
-
-            # Recurse to the next letter
-            if backtrack(index + 1, side_index):
-                return True
-
-            # Undo placement if it doesn't lead to a solution
-            sides[side_index] = sides[side_index][:-1]
-            del letter_to_side[letter]
-
-        return False
-
-    # Begin backtracking
-    if backtrack(0, -1):
-        shuffled_sides = shuffle_final_layout(sides)
-        layout_time = time.time() - layout_start
-        print(f"[INFO] Layout generation {shuffled_sides} completed in {layout_time:.2f} seconds")
-        return shuffled_sides
+def _layout_letter_sequence(
+    letter_sequence: str,
+    rows: int,
+    layout_scorer: Optional[Callable[[CanonicalLayout], float]],
+    layout_start: float,
+    rng: Optional[random.Random] = None,
+) -> Optional[List[str]]:
+    """
+    Place the letters of the seed word(s) with the layout engine, then shuffle the result.
+    """
+    if layout_scorer:
+        sides = choose_layout(letter_sequence, rows, layout_scorer, limit=MAX_LAYOUT_CANDIDATES, rng=rng)
+    else:
+        sides = find_layout(letter_sequence, rows, rng)
 
-    # If no valid layout is found
     layout_time = time.time() - layout_start
-    print(f"[ERROR] Layout generation failed after {layout_time:.2f} seconds")
-    return None
+    if sides is None:
+        print(f"[ERROR] Layout generation failed after {layout_time:.2f} seconds")
+        return None
+
+    shuffled_sides = shuffle_final_layout(sides, rng)
+    print(f"[INFO] Layout generation {shuffled_sides} completed in {layout_time:.2f} seconds")
+    return shuffled_sides
 
 
 def select_one_word(
     dictionary: List[str], 
     board_size: str, 
     max_attempts: int = 10000,
+    sampler: Optional[WeightedSampler[str]] = None,
+    rng: Optional[random.Random] = None,
 ) -> Optional[str]:
     """
     Select one word that contains enough unique letters to fill the board.
@@ -397,6 +540,9 @@ def select_one_word(
         dictionary (List[str]): List of words from the dictionary.
         board_size (str): The size of the board that the word must fit on.
         max_attempts (int): Maximum number of attempts to find a valid word.
+        sampler (WeightedSampler[str], optional): Draws candidate words weighted by commonness.
+            If not provided, candidates are drawn uniformly from the dictionary.
+        rng (random.Random, optional): The random generator to use.
 
     Returns:
         Optional[str]: A single word that fits the board or None if no word is found.
@@ -412,7 +558,7 @@ def select_one_word(
     print(f"[INFO] Searching for a word with {num_unique_letters_required} unique letters.")
     
     for attempt in range(max_attempts):
-        word = random.choice(dictionary)
+        word = sampler.sample(rng) if sampler else (rng or random).choice(dictionary)
         base_word = normalize_to_base(word)
         
         # Check if the word has exactly the required number of unique letters
@@ -444,7 +590,9 @@ def select_two_words(
     max_attempts: int = 10000,
     min_word_length: int = 3,
     max_word_length: int = 99,
-    max_shared_letters: int = 3
+    max_shared_letters: int = 3,
+    sampler: Optional[WeightedSampler[str]] = None,
+    rng: Optional[random.Random] = None,
 ) -> Optional[Tuple[str, str]]:
     """
     Select two words that together contain enough unique letters to fill the board, and where
@@ -459,6 +607,9 @@ def select_two_words(
             contribute more equally to the puzzle.
         max_shared_letters (int): Maximum shared letters between the two words, to 
             allow each word to contribute more equally to the puzzle
+        sampler (WeightedSampler[str], optional): Draws the first word weighted by commonness.
+            If not provided, the first word is drawn uniformly from the dictionary.
+        rng (random.Random, optional): The random generator to use.
 
     Returns:
         Optional[Tuple[str, str]]: A tuple of two words or None if no pair is found.
@@ -471,13 +622,8 @@ def select_two_words(
     num_unique_letters_required = (2 * rows) + (2 * cols)
     print(f"Searching for two words with {num_unique_letters_required} unique letters.")
 
-    # Block certain words that work a little "too" well for puzzles, so they show up a lot
-    BANNED_WORD_LIST = [
-        "DAINTILY",
-    ]
-    
     for attempt in range(max_attempts):
-        word1 = random.choice(dictionary)
+        word1 = sampler.sample(rng) if sampler else (rng or random).choice(dictionary)
         if (
             word1 in BANNED_WORD_LIST 
             or len(word1) < min_word_length 
@@ -508,16 +654,66 @@ def select_two_words(
     return None
 
 
-def shuffle_final_layout(layout: List[str]) -> List[str]:
+def select_board_for_difficulty(
+    catalog: PairCatalog,
+    board_size: str,
+    index: DictionaryIndex,
+    difficulty: str,
+    rng: Optional[random.Random] = None,
+    max_attempts: int = MAX_DIFFICULTY_ATTEMPTS,
+) -> Optional[Tuple[Tuple[str, str], List[str]]]:
+    """
+    Generate candidate boards until one falls in a difficulty band. Each candidate is
+    checked with the board quality estimate, so boards outside the band are rejected
+    before the full solve in create_game_schema.
+
+    Candidate seed word pairs are drawn from the pair catalog in one pass, so a rejected
+    pair costs its layouts and estimates, not a search of the dictionary. Pairs are drawn
+    uniformly, without commonness weighting.
+
+    Args:
+        catalog (PairCatalog): The seed word pairs for the board size.
+        board_size (str): The size of the board to generate.
+        index (DictionaryIndex): The compiled dictionary the board is estimated against.
+        difficulty (str): A key of DIFFICULTY_BANDS.
+        rng (random.Random, optional): The random generator to use.
+        max_attempts (int): Seed word pairs to try before giving up.
+
+    Returns:
+        Optional[Tuple[Tuple[str, str], List[str]]]: The seed words and the layout, or None
+        if no board in the band was found.
+    """
+    start_time = time.time()
+    # The same limit on shared letters select_two_words applies by default
+    candidates = catalog.sample(max_attempts, max_shared_letters=3, exclude=BANNED_WORD_LIST, rng=rng)
+    for attempt, seed_words in enumerate(candidates):
+        for _ in range(LAYOUTS_PER_SEED_PAIR):
+            game_layout = generate_layout(seed_words[0], seed_words[1], board_size, rng=rng)
+            if not game_layout:
+                break
+            quality = estimate_board_quality(game_layout, index)
+            if is_in_difficulty_band(quality, difficulty):
+                print(
+                    f"[INFO] Found a {difficulty} board after {attempt + 1} seed word pairs "
+                    f"in {time.time() - start_time:.2f} seconds: {quality}"
+                )
+                return seed_words, game_layout
+    print(f"[ERROR] No {difficulty} board found after {len(candidates)} seed word pairs")
+    return None
+
+
+def shuffle_final_layout(layout: List[str], rng: Optional[random.Random] = None) -> List[str]:
     """
     Shuffle the letters within each side and shuffle the sides themselves.
 
     Args:
         layout (List[str]): The generated layout with letters placed.
+        rng (random.Random, optional): The random generator to use.
 
     Returns:
         List[str]: The shuffled layout.
     """
-    shuffled_sides = [''.join(random.sample(side, len(side))) for side in layout]
-    random.shuffle(shuffled_sides)
+    generator = rng or random
+    shuffled_sides = [''.join(generator.sample(side, len(side))) for side in layout]
+    generator.shuffle(shuffled_sides)
     return shuffled_sides
@@ -1,11 +1,15 @@
 import json
 import os
-import boto3
 import requests
+from typing import Dict, List
+from botocore.exceptions import ClientError
 from lambdas.prefetch_todays_game.prefetch_service import fetch_todays_game
+from lambdas.common.dictionary_merge_utils import merge_sorted_dictionary
+from lambdas.common.s3_publish_utils import publish_files
+from lambdas.common.aws_clients import get_client
 
-s3 = boto3.client("s3")
-sns = boto3.client("sns")
+s3 = get_client("s3", "transfer")
+sns = get_client("sns")
 
 S3_SOURCE_BUCKET = "chazwinter.com"
 S3_DICT_KEY = "LetterBoxed/Dictionaries/en/dictionary.txt"
@@ -13,39 +17,56 @@ S3_UPLOAD_TARGETS = [
     {"bucket": "chazwinter.com", "key": "LetterBoxed/Dictionaries/en/dictionary.txt"},
     {"bucket": "test-dictionary-bucket", "key": "Dictionaries/en/dictionary.txt"},
 ]
+# Every word seen in an NYT dictionary, used to rank words by commonness
+S3_NYT_WORDS_KEY = "LetterBoxed/Dictionaries/en/nyt.txt"
+S3_NYT_UPLOAD_TARGETS = [
+    {"bucket": "chazwinter.com", "key": "LetterBoxed/Dictionaries/en/nyt.txt"},
+    {"bucket": "test-dictionary-bucket", "key": "Dictionaries/en/nyt.txt"},
+]
 
 PREFETCH_API_URL = "https://9q2qk2fao1.execute-api.us-east-1.amazonaws.com/prod/prefetch"
 SNS_TOPIC_ARN = os.environ.get("SNS_TOPIC_ARN", "")
 TEMP_DICT_PATH = "/tmp/dictionary.txt"
-
-
-def _clean_word(word):
-    return word.strip().upper()
+TEMP_NYT_WORDS_PATH = "/tmp/nyt.txt"
 
 
 def _merge_nyt_words_into_dictionary(nyt_words):
     """
-    Reads the downloaded dictionary from TEMP_DICT_PATH, merges in the NYT words,
-    and writes the result back to the same path.
-    Returns the total word count after merging.
+    Streams the downloaded (sorted) dictionary at TEMP_DICT_PATH together with the
+    NYT words and writes the merged result back to the same path.
+    Returns the list of words that were added and the total word count after merging.
+    """
+    return merge_sorted_dictionary(TEMP_DICT_PATH, nyt_words)
+
+
+def _collect_nyt_words(nyt_words: List[str]) -> List[str]:
     """
-    unique_words = set()
-    with open(TEMP_DICT_PATH, "r") as f:
-        for line in f:
-            word = _clean_word(line)
-            if len(word) >= 3 and word.isalpha():
-                unique_words.add(word)
+    Streams today's NYT words into the (sorted) list of every word seen in an NYT
+    dictionary, starting a new list if none has been published yet.
+    Returns the list of words that were added.
 
-    for word in nyt_words:
-        word = _clean_word(word)
-        if len(word) >= 3 and word.isalpha():
-            unique_words.add(word)
+    Any other S3 error is raised, since publishing a new list would replace the real one.
+    """
+    try:
+        s3.download_file(S3_SOURCE_BUCKET, S3_NYT_WORDS_KEY, TEMP_NYT_WORDS_PATH)
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") not in ("404", "NoSuchKey"):
+            raise
+        print(f"No NYT word list at s3://{S3_SOURCE_BUCKET}/{S3_NYT_WORDS_KEY} ({e}). Starting a new one.")
+        open(TEMP_NYT_WORDS_PATH, "w").close()
+    added_words, _ = merge_sorted_dictionary(TEMP_NYT_WORDS_PATH, nyt_words)
+    return added_words
 
-    with open(TEMP_DICT_PATH, "w") as f:
-        for word in sorted(unique_words):
-            f.write(word + "\n")
 
-    return len(unique_words)
+def _publish(local_path: str, targets: List[Dict[str, str]]) -> List[str]:
+    """
+    Uploads a local file to every target bucket/key. Returns the uploaded URIs.
+    """
+    uploads = [(local_path, target["bucket"], target["key"]) for target in targets]
+    publish_result = publish_files(uploads, s3_client=s3)
+    if publish_result["failed"]:
+        raise RuntimeError(f"Failed to upload {local_path} to: {', '.join(publish_result['failed'])}")
+    return publish_result["uploaded"]
 
 
 def _notify(subject, body):
@@ -72,13 +93,23 @@ def handler(event, context):
         messages.append(f"Downloaded s3://{S3_SOURCE_BUCKET}/{S3_DICT_KEY}")
 
         # Step 3: Merge NYT words into the dictionary
-        word_count = _merge_nyt_words_into_dictionary(nyt_dictionary)
+        added_words, word_count = _merge_nyt_words_into_dictionary(nyt_dictionary)
         messages.append(f"Merged dictionary has {word_count} unique words")
 
-        # Step 4: Upload merged dictionary to all target buckets
-        for target in S3_UPLOAD_TARGETS:
-            s3.upload_file(TEMP_DICT_PATH, target["bucket"], target["key"])
-            messages.append(f"Uploaded to s3://{target['bucket']}/{target['key']}")
+        # Step 4: Upload merged dictionary to all target buckets (only if it changed)
+        if added_words:
+            messages.append(f"Added {len(added_words)} new words: {', '.join(added_words)}")
+            for uri in _publish(TEMP_DICT_PATH, S3_UPLOAD_TARGETS):
+                messages.append(f"Uploaded to {uri}")
+        else:
+            messages.append("No new words added. Skipping dictionary upload.")
+
+        # Step 4b: Record today's NYT words for the commonness ranks (only upload if it changed)
+        added_nyt_words = _collect_nyt_words(nyt_dictionary)
+        if added_nyt_words:
+            messages.append(f"Added {len(added_nyt_words)} words to the NYT word list")
+            for uri in _publish(TEMP_NYT_WORDS_PATH, S3_NYT_UPLOAD_TARGETS):
+                messages.append(f"Uploaded to {uri}")
 
         # Step 5: Trigger the prefetch endpoint to load today's game into DynamoDB
         prefetch_response = requests.get(PREFETCH_API_URL, timeout=30)
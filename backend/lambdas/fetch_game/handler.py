@@ -1,7 +1,7 @@
 import json
 import logging
 from typing import Dict, Any
-from lambdas.common.db_utils import fetch_game_by_id
+from lambdas.common.db_utils import fetch_game_layout
 from lambdas.common.response_utils import error_response, HEADERS
 
 logger = logging.getLogger()
@@ -18,7 +18,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     
     # Fetch the game from the database
     try:
-        game_data = fetch_game_by_id(game_id)
+        game_data = fetch_game_layout(game_id)
         if not game_data:
             logger.warning(f"Game ID {game_id} not found")
             return error_response("Game ID not found.", 404)
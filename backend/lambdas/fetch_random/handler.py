@@ -1,11 +1,6 @@
 import json
-import random
 from typing import Dict, Any
-from lambdas.common.db_utils import (
-    fetch_random_game_count,
-    fetch_game_id_from_random_games_db,
-    fetch_game_by_id
-)
+from lambdas.fetch_random.random_pool_service import pick_random_game
 from lambdas.common.response_utils import error_response, HEADERS
 
 
@@ -27,34 +22,21 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     
     language = query_params.get("language", "en") # Default to English
 
-    # Fetch metadata for the random game count
-    max_atomic_number = fetch_random_game_count(language)
-    
-    if not isinstance(max_atomic_number, int) or max_atomic_number < 1:
-        return error_response("No random games available for the specified language.", 404)
-    
     try:
-        # Select a random atomic number
-        random_atomic_number = random.randint(1, max_atomic_number)
-        print(f"Selected random atomic number: {random_atomic_number}")
-
-        # Fetch game ID using the atomic number
-        game_id = fetch_game_id_from_random_games_db(random_atomic_number, language)
-        if not game_id:
-            return error_response("Game ID not found when fetching raandom game", 500)
+        # Pick a game from this container's sample of the random pool, whose entries carry
+        # the game details needed to play it
+        game_data = pick_random_game(language)
+        if game_data is None:
+            return error_response("No random games available for the specified language.", 404)
+        print(f"Selected random game: {game_data['gameId']}")
 
-        # Fetch the full game details using the game ID
-        game_data = fetch_game_by_id(game_id)
-        if not game_data:
-            return error_response("Game data not found for the fetched game ID.", 500)
-        
         # Return the game details
         return {
             "statusCode": 200,
             "headers": HEADERS,
             "body": json.dumps({
                 "message": "Random game fetched successfully.",
-                "gameId": game_id,
+                "gameId": game_data["gameId"],
                 "gameLayout": game_data["gameLayout"],
                 "language": game_data["language"],
                 "boardSize": game_data["boardSize"],
@@ -0,0 +1,81 @@
+import random
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from lambdas.common.db_utils import (
+    MAX_BATCH_GET_KEYS,
+    RANDOM_POOL_SUMMARY_ATTRIBUTES,
+    fetch_game_layout,
+    fetch_random_pool_entries,
+    pick_random_atomic_numbers,
+)
+
+RANDOM_POOL_SAMPLE_SIZE = MAX_BATCH_GET_KEYS  # Pool entries read per sample, in one BatchGetItem
+RANDOM_POOL_SAMPLE_TTL_SECONDS = 300  # How long a sample is served before a new one is read
+
+# language -> (sampled pool entries, when they were read)
+_samples: Dict[str, Tuple[List[Dict[str, Any]], float]] = {}
+
+
+def get_random_pool_sample(language: str) -> List[Dict[str, Any]]:
+    """
+    Get this container's random sample of a language's random pool, reading a new one
+    when it is missing or older than RANDOM_POOL_SAMPLE_TTL_SECONDS.
+
+    Args:
+        language (str): The language code.
+
+    Returns:
+        List[Dict[str, Any]]: The sampled pool entries. Empty if the pool is empty.
+
+    Raises:
+        RuntimeError: If the pool entries can't be read.
+    """
+    cached = _samples.get(language)
+    if cached and time.monotonic() - cached[1] < RANDOM_POOL_SAMPLE_TTL_SECONDS:
+        return cached[0]
+
+    atomic_numbers = pick_random_atomic_numbers(RANDOM_POOL_SAMPLE_SIZE, language)
+    entries = fetch_random_pool_entries(atomic_numbers, language)
+    if entries is None:
+        # Not an empty pool: the client should see an error it can retry
+        raise RuntimeError(f"Failed to read the random pool for '{language}'.")
+    if not entries:
+        return []
+    _samples[language] = (entries, time.monotonic())
+    return entries
+
+
+def pick_random_game(language: str) -> Optional[Dict[str, Any]]:
+    """
+    Pick a random game from the warm sample of the random pool. Entries carry the game's
+    layout, board size and clue, so this usually reads nothing. Entries written before they
+    carried them have their layout read once and kept in the sample.
+
+    Args:
+        language (str): The language code.
+
+    Returns:
+        Optional[Dict[str, Any]]: {"gameId", "gameLayout", "boardSize", "language", "clue"},
+        or None if the language has no random games.
+
+    Raises:
+        ValueError: If the picked game no longer exists.
+        RuntimeError: If the random pool can't be read.
+    """
+    sample = get_random_pool_sample(language)
+    if not sample:
+        return None
+    entry = random.choice(sample)
+    if "gameLayout" not in entry:
+        game_layout = fetch_game_layout(entry["gameId"])
+        if not game_layout:
+            raise ValueError(f"Game {entry['gameId']} in the random pool was not found.")
+        layout = dict(game_layout)
+        entry.update({attr: layout.get(attr) for attr in RANDOM_POOL_SUMMARY_ATTRIBUTES})
+    return {
+        "gameId": entry["gameId"],
+        "gameLayout": entry["gameLayout"],
+        "boardSize": entry.get("boardSize"),
+        "language": entry.get("language", language),
+        "clue": entry.get("clue", ""),
+    }
@@ -0,0 +1,43 @@
+import json
+import time
+from typing import Any, Dict, Optional
+from lambdas.common.db_utils import fetch_archived_games, fetch_game_summaries
+from lambdas.common.item_cache import ItemCache
+
+ARCHIVE_PAGE_TTL_SECONDS = 300  # How long a page is served from the cache (ratings and today's game change)
+ARCHIVE_PAGE_CACHE_MAX_BYTES = 4 * 1024 * 1024
+
+# "<limit>|<lastKey>" -> (page, when it was read)
+_archive_page_cache = ItemCache(ARCHIVE_PAGE_CACHE_MAX_BYTES)
+
+
+def fetch_archive_page(limit: int, last_key: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Fetch a page of the NYT game archive, with each game's summary (layout, par, ratings...)
+    embedded, in one archive query and one batch read. Pages are cached in the container
+    for ARCHIVE_PAGE_TTL_SECONDS.
+
+    Args:
+        limit (int): The maximum number of games on the page.
+        last_key (Optional[Dict[str, Any]]): The key to start after (for pagination).
+
+    Returns:
+        Dict[str, Any]: {"items": archive rows, each with a "summary" (None if the game
+        couldn't be read), "lastKey": the key of the next page}.
+    """
+    cache_key = f"{limit}|{json.dumps(last_key, sort_keys=True) if last_key else ''}"
+    cached = _archive_page_cache.get(cache_key)
+    if cached and time.monotonic() - cached[1] < ARCHIVE_PAGE_TTL_SECONDS:
+        cached_page: Dict[str, Any] = cached[0]
+        return cached_page
+
+    result = fetch_archived_games(limit=limit, last_key=last_key)
+    summaries = fetch_game_summaries([item["gameId"] for item in result["items"]])
+    page = {
+        "items": [{**item, "summary": summaries.get(item["gameId"])} for item in result["items"]],
+        "lastKey": result["lastKey"],
+    }
+    # Pages missing games (e.g. after a failed read) are not cached
+    if page["items"] and len(summaries) == len(page["items"]):
+        _archive_page_cache.put(cache_key, (page, time.monotonic()))
+    return page
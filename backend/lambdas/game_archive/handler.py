@@ -2,7 +2,7 @@ import os
 import json
 from typing import Any, Dict
 import boto3
-from lambdas.common.db_utils import fetch_archived_games
+from lambdas.game_archive.archive_service import fetch_archive_page
 from lambdas.common.response_utils import error_response, HEADERS
 
 
@@ -27,8 +27,8 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         if last_key:
             last_key = json.loads(last_key)
         
-        # Fetch paginated archived games
-        result = fetch_archived_games(limit=limit, last_key=last_key)
+        # Fetch paginated archived games, with each game's summary
+        result = fetch_archive_page(limit=limit, last_key=last_key)
         items = result["items"]
         last_evaluated_key = result["lastKey"]
         
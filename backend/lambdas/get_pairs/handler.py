@@ -1,10 +1,10 @@
 import json
 from typing import Dict, Any, Optional
 import time
-import random
 from lambdas.common.response_utils import error_response, HEADERS
-from lambdas.create_random.random_game_service import select_two_words, select_one_word
+from lambdas.create_random.random_game_service import select_one_word, BANNED_WORD_LIST
 from lambdas.common.dictionary_utils import get_dictionary, get_basic_dictionary
+from lambdas.common.pair_catalog import get_pair_catalog
 from lambdas.common.validation_utils import validate_language, validate_board_size
 
 
@@ -27,6 +27,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         min_word_length = body.get("minWordLength", 3)
         max_word_length = body.get("maxWordLength", 99)
         max_shared_letters = body.get("maxSharedLetters", 4)
+        exclude_words = body.get("excludeWords", [])
         
         # Validate parameters
         if not validate_language(language):
@@ -42,39 +43,28 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 return error_response(
                     f"Maximum shared letters ({max_shared_letters}) must be between 1 and 7.", 400
                 )
+        if not isinstance(exclude_words, list) or not all(isinstance(word, str) for word in exclude_words):
+            return error_response("excludeWords must be a list of words.", 400)
         
-        dictionary = get_basic_dictionary(language) if basic_dictionary else get_dictionary(language)
-        random.shuffle(dictionary)
         word_pairs = []
         words = []
         
-        for _ in range(num_tries):
-            if single_word:
+        if single_word:
+            dictionary = get_basic_dictionary(language) if basic_dictionary else get_dictionary(language)
+            for _ in range(num_tries):
                 seed_word = select_one_word(dictionary, "2x2")
                 if seed_word:
                     words.append(seed_word)
-            elif board_size == "3x3":
-                seed_words = select_two_words(
-                    dictionary, 
-                    "3x3", 
-                    10000, 
-                    min_word_length, 
-                    max_word_length, 
-                    max_shared_letters
-                )
-                if seed_words:
-                    word_pairs.append(seed_words)
-            elif board_size == "4x4":
-                seed_words = select_two_words(
-                    dictionary, 
-                    "4x4", 
-                    10000, 
-                    min_word_length, 
-                    max_word_length, 
-                    max_shared_letters
-                )
-                if seed_words:
-                    word_pairs.append(seed_words)
+        elif board_size in ["3x3", "4x4"]:
+            # Draw from the pre-built catalog of compatible pairs instead of searching the dictionary
+            catalog = get_pair_catalog(language, "basic" if basic_dictionary else "dictionary", board_size)
+            word_pairs = catalog.sample(
+                num_tries,
+                min_word_length=min_word_length,
+                max_word_length=max_word_length,
+                max_shared_letters=max_shared_letters,
+                exclude=BANNED_WORD_LIST + [word.upper() for word in exclude_words],
+            )
         
         return {
             "statusCode": 200,
@@ -1,7 +1,7 @@
 import json
 from typing import Dict, Any
 from datetime import date, timedelta
-from lambdas.common.db_utils import fetch_game_by_id
+from lambdas.common.db_utils import fetch_game_layout
 from lambdas.common.response_utils import error_response, HEADERS
 
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
@@ -15,11 +15,11 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         yesterday = (date.today() - timedelta(days=1)).isoformat()
 
         # Fetch the game from the database
-        todays_game = fetch_game_by_id(today)
+        todays_game = fetch_game_layout(today)
 
         if not todays_game:
             # Fall back to yesterday's game if today's game is not available
-            todays_game = fetch_game_by_id(yesterday)
+            todays_game = fetch_game_layout(yesterday)
 
             if not todays_game:
                 return error_response(
@@ -5,7 +5,7 @@ from lambdas.prefetch_todays_game.prefetch_service import (
 )
 from lambdas.common.db_utils import (
     add_game_to_db, 
-    fetch_game_by_id, 
+    game_exists, 
     add_game_to_archive
 )
 from lambdas.common.game_schema import create_game_schema
@@ -24,7 +24,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         print(f"Today's game fetched from NYT website: {game_id}")
 
         # Check if the game is already in the database
-        if fetch_game_by_id(game_id):
+        if game_exists(game_id):
             return {
                 "statusCode": 200,
                 "headers": HEADERS,
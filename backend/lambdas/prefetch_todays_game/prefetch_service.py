@@ -2,7 +2,7 @@ import json
 import requests
 from typing import Any, Dict
 from bs4 import BeautifulSoup
-from lambdas.common.db_utils import fetch_game_by_id
+from lambdas.common.db_utils import game_exists
 
 def fetch_todays_game() -> Dict[str, Any]:
     """
@@ -55,4 +55,4 @@ def game_exists_in_db(game_id: str) -> bool:
     Returns:
         bool: True if the game exists, False otherwise.
     """
-    return fetch_game_by_id(game_id) is not None
+    return game_exists(game_id)
@@ -1,43 +1,27 @@
-from typing import Dict, Any
-from lambdas.common.db_utils import update_game_in_db
-from lambdas.common.game_schema import update_game_schema
+from typing import Dict, Optional
+from lambdas.common.stats_aggregator import get_game_totals, record_game_stats
 
 
-def rate_game(game: Dict[str, Any], stars: int) -> bool:
+def rate_game(game_id: str, stars: int) -> Optional[Dict[str, int]]:
     """
-    Rates a game by incrementing the total stars and total ratings.
+    Rates a game by adding to its total stars and total ratings. The update is buffered
+    (see stats_aggregator) and written when the handler flushes, before it returns.
 
     Args:
-        game (Dict[str, Any]): The game object to rate.
+        game_id (str): The ID of the game to rate.
         stars (int): The number of stars to add.
 
     Returns:
-        bool: True if the operation was successful, False otherwise.
+        Optional[Dict[str, int]]: The game's counters including this rating, or None if the game doesn't exist.
+
+    Raises:
+        ClientError: If the game's counters couldn't be read.
     """
-    try:
-        # Calculate the new totals for totalStars and totalRatings
-        total_ratings = game.get("totalRatings", 0) + 1
-        total_stars = game.get("totalStars", 0) + stars
-        
-        # Update the game schema with the rating fields
-        print(f"Updating game: {game.get('gameId')}, totalRatings: {total_ratings}, totalStars: {total_stars}")
-        updated_game = update_game_schema(
-            game,
-            updates={
-                "totalRatings": total_ratings,
-                "totalStars": total_stars    
-            },
-        )
-        
-        # Pass only updated fields to the DB update utility (must also include gameId)
-        update_data = {
-            "gameId": updated_game["gameId"],
-            "totalRatings": updated_game["totalRatings"],
-            "totalStars": updated_game["totalStars"],
-        }
-        print(f"Updating game in DB with data: {update_data}")
-        return update_game_in_db(update_data)
-    except Exception as e:
-        print(f"Error attempting to rate game: {str(e)}")
-        return False
-    
\ No newline at end of file
+    print(f"Rating game: {game_id} with {stars} stars")
+    totals = get_game_totals(game_id)
+    if totals is None:
+        return None
+    record_game_stats(game_id, {"totalRatings": 1, "totalStars": stars})
+    totals["totalRatings"] += 1
+    totals["totalStars"] += stars
+    return totals
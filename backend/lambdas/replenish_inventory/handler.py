@@ -0,0 +1,39 @@
+import json
+from typing import Dict, Any
+from lambdas.create_random.inventory_service import INVENTORY_TARGETS, replenish_inventory
+from lambdas.common.response_utils import error_response, HEADERS
+
+# Stop generating with this much time left, so the last batch can still be written
+TIME_MARGIN_MS = 20000
+
+
+def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    """
+    AWS Lambda handler, run on a schedule, that tops up the random game inventory
+    so create_random can hand out ready-made games.
+    """
+    try:
+        def has_time() -> bool:
+            if context is None:
+                return True
+            return bool(context.get_remaining_time_in_millis() > TIME_MARGIN_MS)
+
+        added: Dict[str, int] = {}
+        for language, targets in INVENTORY_TARGETS.items():
+            for board_size, target in targets.items():
+                if not has_time():
+                    break
+                added[f"{language}#{board_size}"] = replenish_inventory(language, board_size, target, has_time)
+
+        print(f"Inventory top-up results: {added}")
+        return {
+            "statusCode": 200,
+            "headers": HEADERS,
+            "body": json.dumps({
+                "message": "Random game inventory replenished.",
+                "added": added
+            })
+        }
+    except Exception as e:
+        print(f"Error replenishing random game inventory: {e}")
+        return error_response(f"Error: {str(e)}", 500)
@@ -1,18 +1,22 @@
 import json
 import random
 from typing import Any, Dict
-from lambdas.common.game_utils import normalize_to_base, check_game_completion
+from lambdas.common.game_utils import check_game_completion
+from lambdas.common.dictionary_index import normalize_to_base
 from lambdas.common.db_utils import (
-    fetch_game_by_id,
-    fetch_valid_words_by_game_id,
-    get_user_game_state,
-    save_user_session_state,
+    fetch_word_validation_data,
+    get_static_game_cache_stats,
+    initialize_user_game_state,
 )
+from lambdas.common.stats_aggregator import add_game_stats_flush_listener
 from lambdas.validate_word.word_validator_service import (
     find_valid_word_from_normalized,
     handle_post_game_logic,
 )
 
+# Log the cache's hit rate whenever this container writes its game stats, not on every guess
+add_game_stats_flush_listener(lambda: print(f"Static game cache: {get_static_game_cache_stats()}"))
+
 
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
@@ -44,28 +48,34 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 "Missing required parameters: gameId, word, or sessionId.", 400
             )
 
-        # Fetch game details and valid words
-        game_data = fetch_game_by_id(game_id)
+        # Fetch the game, its valid words and the user game state together
+        validation_data = fetch_word_validation_data(game_id, session_id)
+        if validation_data is None:
+            return _error_response(
+                "An error occurred while fetching the game", 500
+            )
+
+        game_data = validation_data["game"]
         if not game_data:
             return _error_response(
                 "Game with specified game ID not found", 404
             )
 
-        valid_words = fetch_valid_words_by_game_id(game_id)
-        if not valid_words:
+        valid_words_by_base = validation_data["validWordsByBase"]
+        if not valid_words_by_base:
             return _error_response(
                 "Valid words list for specified game ID not found", 404
             )
 
         # Check if the submitted word is valid
-        matching_word = find_valid_word_from_normalized(submitted_word, valid_words)
+        matching_word = find_valid_word_from_normalized(submitted_word, valid_words_by_base)
         if not matching_word:
             return _error_response(
                 "Word is not valid for this puzzle.", 200
             )
 
-        # Fetch the user game state
-        user_game_state = get_user_game_state(session_id, game_id)
+        # Start a new game state if the user doesn't have one yet
+        user_game_state = validation_data["sessionState"] or initialize_user_game_state(session_id, game_id)
         if not user_game_state:
             return _error_response(
                 "An error occurred while fetching the game state", 500
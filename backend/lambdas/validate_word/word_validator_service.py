@@ -1,27 +1,22 @@
 from typing import List, Optional, Dict, Any, Tuple
 import random
-from lambdas.common.db_utils import update_game_in_db
-from lambdas.common.game_utils import normalize_to_base
+from botocore.exceptions import BotoCoreError, ClientError
+from lambdas.common.stats_aggregator import get_game_totals, record_game_stats
 
-def find_valid_word_from_normalized(submitted_word: str, valid_words: List[str]) -> Optional[str]:
+def find_valid_word_from_normalized(submitted_word: str, valid_words_by_base: Dict[str, str]) -> Optional[str]:
     """
     Find the original word in the dictionary that matches a normalized word.
 
     Args:
         submitted_word (str): The normalized word to check against the dictionary.
-        valid_words (List[str]): The list of valid words in their original form,
-            which may include accents or special characters.
+        valid_words_by_base (Dict[str, str]): The valid words, by their base form
+            (see build_base_word_map). The originals may include accents or special characters.
 
     Returns:
         str: The original word from the dictionary that matches the normalized 
         word, or None if no match is found.
     """
-    for original_word in valid_words:
-        base_original_word = normalize_to_base(original_word)
-        if submitted_word == base_original_word:
-            return original_word  # Return the original word that matches
-    
-    return None  # Return None if no match is found
+    return valid_words_by_base.get(submitted_word)
 
 
 def handle_post_game_logic(game_data: Dict[str, Any], words_used: List[str]) -> Dict[str, Any]:
@@ -30,7 +25,8 @@ def handle_post_game_logic(game_data: Dict[str, Any], words_used: List[str]) ->
     sampling solutions, and any additional post-game tasks.
 
     Args:
-        game_data (Dict[str, Any]): The game data fetched from the database.
+        game_data (Dict[str, Any]): The game data fetched from the database. Its counters
+            aren't used; the updated ones come back from the counter update.
         words_used: List[str]: The words used to complete the puzzle.
 
     Returns:
@@ -66,28 +62,29 @@ def handle_post_game_logic(game_data: Dict[str, Any], words_used: List[str]) ->
             min(len(game_data["twoWordSolutions"]), NUM_SAMPLE_SOLUTIONS)
         )
 
-    # Provide game statistics
-    total_completions = game_data["totalCompletions"] + 1  # We just finished the game
-    total_words_used = game_data["totalWordsUsed"] + len(words_used)
-    total_letters_used = game_data["totalLettersUsed"] + sum(len(word) for word in words_used)
-    total_ratings = game_data["totalRatings"]
-    total_stars = game_data["totalStars"]
-
-    print("Game data:", game_data)
-
-    # Update game data in the database
-    updated_game_data = {
-        "gameId": game_data["gameId"],
-        "totalCompletions": total_completions,
-        "totalWordsUsed": total_words_used,
-        "totalLettersUsed": total_letters_used,
-    }
-    if not update_game_in_db(updated_game_data):
-        print(f"[WARN] Failed to update game stats for gameId {game_data['gameId']}")
-
-    average_rating = total_stars / total_ratings if total_ratings > 0 else 0.0
-    average_words_used = total_words_used / total_completions
-    average_word_length = total_letters_used / total_words_used
+    # Add this completion to the game statistics. The update is buffered and written with
+    # others, so the totals include other containers' completions only as of their last flush.
+    record_game_stats(game_data["gameId"], {
+        "totalCompletions": 1,  # We just finished the game
+        "totalWordsUsed": len(words_used),
+        "totalLettersUsed": sum(len(word) for word in words_used),
+    })
+    try:
+        totals = get_game_totals(game_data["gameId"])
+    except (BotoCoreError, ClientError) as e:
+        # The completion is recorded either way; only the averages shown are missing
+        print(f"[WARN] Failed to read game stats for gameId {game_data['gameId']}: {e}")
+        totals = {}
+    if totals is None:
+        print(f"[WARN] Failed to get game stats for gameId {game_data['gameId']}")
+        totals = {}
+
+    total_completions = totals.get("totalCompletions", 0)
+    total_words_used = totals.get("totalWordsUsed", 0)
+    total_ratings = totals.get("totalRatings", 0)
+    average_rating = totals.get("totalStars", 0) / total_ratings if total_ratings > 0 else 0.0
+    average_words_used = total_words_used / total_completions if total_completions > 0 else 0.0
+    average_word_length = totals.get("totalLettersUsed", 0) / total_words_used if total_words_used > 0 else 0.0
 
     # Return the processed post-game data
     return {
@@ -1,5 +1,4 @@
 import os
-import glob
 import shutil
 import smtplib
 from email.mime.text import MIMEText
@@ -11,6 +10,9 @@ from typing import Any, Dict
 from bs4 import BeautifulSoup
 from datetime import date
 import boto3
+from botocore.exceptions import ClientError
+from lambdas.common.dictionary_merge_utils import merge_sorted_dictionary
+from lambdas.common.s3_publish_utils import collect_dictionary_uploads, publish_files
 
 # Load environment variables from .env file
 load_dotenv(override=True)
@@ -24,9 +26,11 @@ temp_dictionary_path = os.path.join(script_dir, "utility", "temp_dictionary.txt"
 final_dictionary_path = os.path.join(script_dir, "utility", "dictionary.txt")
 dictionaries_dir = os.path.join(script_dir, "dictionaries")
 target_directory = os.path.join(script_dir, "dictionaries", "en")
+publish_manifest_path = os.path.join(script_dir, "utility", "dictionary_publish_manifest.json")
 
 # S3 configuration
 S3_SOURCE_BUCKET = {"bucket_name": "chazwinter.com", "prefix": "LetterBoxed/Dictionaries/en/dictionary.txt"}
+S3_NYT_WORDS_SOURCE = {"bucket_name": "chazwinter.com", "prefix": "LetterBoxed/Dictionaries/en/nyt.txt"}
 S3_BUCKETS = [
     {"bucket_name": "chazwinter.com", "prefix": "LetterBoxed/Dictionaries/"},
     {"bucket_name": "test-dictionary-bucket", "prefix": "Dictionaries/"}
@@ -35,47 +39,6 @@ S3_BUCKETS = [
 # Global variable to hold the response message for notification
 response_message = ""
 
-def clean_word(word):
-    """Normalize and clean a word."""
-    return word.strip().upper()
-
-
-def merge_word_lists(output_file, *word_lists):
-    """
-    Merge multiple word lists into a single cleaned and deduplicated list.
-    
-    Args:
-        output_file (str): Path to the output file.
-        *word_lists (list): Lists of words to merge.
-    """
-    unique_words = set()
-    word_count = 0
-
-    for word_list in word_lists:
-        if isinstance(word_list, str) and os.path.isfile(word_list):
-            # If word_list is a file path, load it
-            with open(word_list, 'r') as infile:
-                for line in infile:
-                    word_count += 1
-                    word = clean_word(line)
-                    if len(word) >= 3 and word.isalpha():
-                        unique_words.add(word)
-        elif isinstance(word_list, list):
-            # If word_list is a Python list, process it directly
-            for word in word_list:
-                word_count += 1
-                word = clean_word(word)
-                if len(word) >= 3 and word.isalpha():
-                    unique_words.add(word)
-        print(f"Processed {word_count} words from current word list.")
-        word_count = 0
-
-    # Write sorted unique words to output file
-    with open(output_file, 'w') as outfile:
-        for word in sorted(unique_words):
-            outfile.write(word + '\n')
-
-
 def copy_file(source_file, target_file):
     """
     Copy a file to another location.
@@ -99,13 +62,9 @@ def download_s3_file(bucket_name: str, key: str, local_path: str):
     
 
 def upload_dictionaries_to_s3():
-    """Upload dictionaries to S3."""
-    for bucket in S3_BUCKETS:
-        for file_path in glob.glob(f"{dictionaries_dir}/**/*", recursive=True):
-            if os.path.isfile(file_path):
-                s3_key = f"{bucket['prefix']}{file_path.replace(dictionaries_dir, '').lstrip('/')}"
-                print(f"Uploading {file_path} to s3://{bucket['bucket_name']}/{s3_key}")
-                s3.upload_file(file_path, bucket["bucket_name"], s3_key)
+    """Upload changed dictionaries to all S3 buckets concurrently."""
+    uploads = collect_dictionary_uploads(dictionaries_dir, S3_BUCKETS)
+    publish_files(uploads, manifest_path=publish_manifest_path, s3_client=s3)
 
 
 def fetch_todays_game() -> Dict[str, Any]:
@@ -174,58 +133,70 @@ def prefetch_nyt_game_for_app():
         raise
     
 
-def merge_s3_and_nyt_dictionaries(nyt_dictionary: list):
-    """Merge the S3 dictionary and the NYT dictionary."""
+def merge_s3_and_nyt_dictionaries(nyt_dictionary: list) -> list:
+    """
+    Merge the S3 dictionary and the NYT dictionary.
+
+    Returns:
+        list: The words that were added to the dictionary.
+    """
     # Step 1: Download the S3 dictionary from the source bucket
     download_s3_file(S3_SOURCE_BUCKET["bucket_name"], S3_SOURCE_BUCKET["prefix"], temp_dictionary_path)
 
-    # Step 2: Merge dictionaries
-    merged_temp_path = temp_dictionary_path + ".merged"
-    merge_word_lists(
-        merged_temp_path,  # New temp file as output
+    # Step 2: Stream the (sorted) S3 dictionary and the NYT words into the final utility dictionary
+    added_words, word_count = merge_sorted_dictionary(
         temp_dictionary_path,  # S3 dictionary
-        nyt_dictionary  # NYT dictionary
+        nyt_dictionary,  # NYT dictionary
+        final_dictionary_path  # Output
     )
+    print(f"Merged dictionary saved to {final_dictionary_path} ({word_count} words, {len(added_words)} added)")
 
-    # Step 3: Replace the final utility dictionary with the merged result
-    shutil.move(merged_temp_path, final_dictionary_path)
-    print(f"Merged dictionary saved to {final_dictionary_path}")
-
-    # Step 4: Copy the merged dictionary to the language-specific target directory
+    # Step 3: Copy the merged dictionary to the language-specific target directory
     en_target_path = os.path.join(target_directory, "dictionary.txt")
     shutil.copy(final_dictionary_path, en_target_path)
     print(f"Copied merged dictionary to {en_target_path}")
+    return added_words
 
 
-def merge_nyt_dictionary_to_final(nyt_dictionary, temp_dictionary_path, final_dictionary_path):
+def merge_nyt_words_list(nyt_dictionary: list) -> list:
     """
-    Merge the NYT dictionary with the latest dictionary, updating the final dictionary.
+    Merge today's NYT words into the list of every word seen in an NYT dictionary
+    (dictionaries/en/nyt.txt), which is used to rank words by commonness.
 
-    Args:
-        nyt_dictionary (list): List of words from the NYT game.
-        temp_dictionary_path (str): Path to the temporary dictionary file.
-        final_dictionary_path (str): Path to the final dictionary file.
+    Returns:
+        list: The words that were added to the NYT word list.
     """
-    # Step 1: Copy the final dictionary to the temp dictionary
-    copy_file(final_dictionary_path, temp_dictionary_path)
+    nyt_words_path = os.path.join(target_directory, "nyt.txt")
+    try:
+        download_s3_file(S3_NYT_WORDS_SOURCE["bucket_name"], S3_NYT_WORDS_SOURCE["prefix"], nyt_words_path)
+    except ClientError as e:
+        # Only a missing list starts a new one. Anything else would replace the real list on upload.
+        if e.response.get("Error", {}).get("Code") not in ("404", "NoSuchKey"):
+            raise
+        if not os.path.exists(nyt_words_path):
+            print(f"Starting a new NYT word list at {nyt_words_path}")
+            open(nyt_words_path, "w").close()
 
-    # Step 2: Create a new temporary output file for the merged result
-    merged_temp_path = temp_dictionary_path + ".merged"
+    added_words, word_count = merge_sorted_dictionary(nyt_words_path, nyt_dictionary)
+    print(f"NYT word list has {word_count} words ({len(added_words)} added)")
+    return added_words
 
-    # Step 3: Merge the NYT dictionary with the temp dictionary
-    merge_word_lists(
-        merged_temp_path,       # New temp file as output
-        temp_dictionary_path,   # Existing dictionary words
-        nyt_dictionary          # NYT dictionary
-    )
 
-    # Step 4: Replace the final dictionary with the merged result
-    print(f"Merge complete! Copying merged dictionary to {final_dictionary_path}")
-    copy_file(merged_temp_path, final_dictionary_path)
+def merge_nyt_dictionary_to_final(nyt_dictionary, final_dictionary_path):
+    """
+    Merge the NYT dictionary with the latest dictionary, updating the final dictionary.
+
+    Args:
+        nyt_dictionary (list): List of words from the NYT game.
+        final_dictionary_path (str): Path to the final dictionary file.
 
-    # Step 5: Clean up temporary merged file
-    os.remove(merged_temp_path)
-    print(f"Cleaned up temporary file: {merged_temp_path}")
+    Returns:
+        list: The words that were added to the final dictionary.
+    """
+    # The final dictionary is already sorted, so merge the NYT words into it in place
+    added_words, word_count = merge_sorted_dictionary(final_dictionary_path, nyt_dictionary)
+    print(f"Merge complete! {final_dictionary_path} has {word_count} words ({len(added_words)} added)")
+    return added_words
 
 def send_completion_notification():
     """
@@ -270,10 +241,14 @@ def main():
     nyt_dictionary = todays_game.get("dictionary", [])
 
     # Merge the S3 dictionary and the NYT dictionary
-    merge_s3_and_nyt_dictionaries(nyt_dictionary)
-
-    # Upload the updated dictionaries to all configured S3 buckets
-    upload_dictionaries_to_s3()
+    added_words = merge_s3_and_nyt_dictionaries(nyt_dictionary)
+    added_nyt_words = merge_nyt_words_list(nyt_dictionary)
+
+    # Upload the updated dictionaries to all configured S3 buckets, if anything changed
+    if added_words or added_nyt_words:
+        upload_dictionaries_to_s3()
+    else:
+        print("No new words added. Skipping dictionary upload.")
 
     # Add the game to the app
     prefetch_nyt_game_for_app()
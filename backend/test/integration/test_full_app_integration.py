@@ -44,6 +44,9 @@ def setup_environment():
     os.environ["RANDOM_GAMES_TABLE_PL"] = "LetterBoxedRandomGames_plTest"
     os.environ["RANDOM_GAMES_TABLE_RU"] = "LetterBoxedRandomGames_ruTest"
 
+    # With one count shard, atomic numbers run 1, 2, 3... and match the count
+    db_utils.RANDOM_GAME_COUNTER_SHARDS = 1
+
     # Define constants for table names
     DYNAMO_DB_TABLE_NAMES = [
         os.environ["GAMES_TABLE"],
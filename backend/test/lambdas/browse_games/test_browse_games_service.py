@@ -1,6 +1,10 @@
 import pytest
 from datetime import datetime
-from lambdas.browse_games.browse_games_service import query_games_by_language
+from lambdas.browse_games.browse_games_service import (
+    decode_pagination_token,
+    encode_pagination_token,
+    query_games_by_language,
+)
 from lambdas.common.db_utils import fetch_games_by_language
 
 
@@ -98,3 +102,24 @@ def test_query_games_unexpected_error(mocker):
 
     with pytest.raises(Exception, match="Unexpected error"):
         query_games_by_language(language="en", last_key=None, limit=10)
+
+
+def test_pagination_token_round_trip():
+    """Test that a continuation token decodes to the key it was made from."""
+    last_key = {"gameTypeLanguage": "nyt#en", "createdAt": "2024-12-24T12:00:00", "gameId": "1234"}
+
+    token = encode_pagination_token(last_key)
+
+    assert isinstance(token, str)
+    assert "{" not in token
+    assert decode_pagination_token(token, "nyt") == last_key
+    assert encode_pagination_token(None) is None
+
+
+def test_decode_pagination_token_invalid():
+    """Test decode_pagination_token with malformed tokens or keys for another game type."""
+    with pytest.raises(ValueError, match="Invalid nextToken"):
+        decode_pagination_token("not-a-token")
+    language_token = encode_pagination_token({"language": "en", "createdAt": "2024-12-24", "gameId": "1"})
+    with pytest.raises(ValueError):
+        decode_pagination_token(language_token, "nyt")
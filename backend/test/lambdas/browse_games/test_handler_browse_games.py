@@ -2,7 +2,7 @@ import json
 import pytest
 from datetime import datetime
 from lambdas.browse_games.handler import handler
-from lambdas.browse_games.browse_games_service import query_games_by_language
+from lambdas.browse_games.browse_games_service import encode_pagination_token, query_games_by_language
 
 
 @pytest.fixture
@@ -112,3 +112,25 @@ def test_handler_unexpected_error(mocker, mock_event):
     result = handler(mock_event, None)
     assert result["statusCode"] == 500
     assert json.loads(result["body"])["message"] == "Internal Server Error"
+
+
+def test_handler_next_token(mocker, mock_event):
+    """Test handler with a continuation token from a previous page."""
+    mock_query = mocker.patch("lambdas.browse_games.handler.query_games_by_language", return_value={"games": []})
+    last_key = {"language": "en", "createdAt": "2024-12-24T15:26:14.634415", "gameId": "1234"}
+    mock_event["queryStringParameters"].pop("lastEvaluatedKey")
+    mock_event["queryStringParameters"]["nextToken"] = encode_pagination_token(last_key)
+
+    result = handler(mock_event, None)
+
+    assert result["statusCode"] == 200
+    mock_query.assert_called_once_with("en", last_key, None, 10)
+
+
+def test_handler_invalid_next_token(mocker, mock_event):
+    """Test handler with a malformed continuation token."""
+    mock_event["queryStringParameters"]["nextToken"] = "not-a-token"
+    result = handler(mock_event, None)
+
+    assert result["statusCode"] == 400
+    assert json.loads(result["body"])["message"] == "Invalid nextToken."
@@ -0,0 +1,25 @@
+from lambdas.common import aws_clients
+
+
+def test_get_client_is_shared_per_service_and_class(mocker):
+    mocker.patch.object(aws_clients.boto3, "client", side_effect=lambda *args, **kwargs: object())
+    aws_clients.get_client.cache_clear()
+    try:
+        read_client = aws_clients.get_client("dynamodb", "read")
+
+        assert aws_clients.get_client("dynamodb", "read") is read_client
+        assert aws_clients.get_client("dynamodb") is not read_client
+        aws_clients.boto3.client.assert_any_call("dynamodb", config=aws_clients.CLIENT_CONFIGS["read"])
+    finally:
+        aws_clients.get_client.cache_clear()
+
+
+def test_client_configs_are_tuned():
+    for config in aws_clients.CLIENT_CONFIGS.values():
+        assert config.max_pool_connections == aws_clients.MAX_POOL_CONNECTIONS
+        assert config.tcp_keepalive is True
+        assert config.retries["mode"] == "adaptive"
+    # Request-path reads fail faster than everything else
+    read, default = aws_clients.CLIENT_CONFIGS["read"], aws_clients.CLIENT_CONFIGS["default"]
+    assert read.read_timeout < default.read_timeout
+    assert aws_clients.CLIENT_CONFIGS["transfer"].read_timeout > default.read_timeout
@@ -1,9 +1,11 @@
 import pytest
+import time
 from unittest import mock
 from unittest.mock import MagicMock, ANY
 from boto3.dynamodb.conditions import Key
 from botocore.exceptions import ClientError
 from lambdas.common import db_utils
+from lambdas.common.word_list_codec import encode_solutions, encode_words
 
 # Helper function to create a mock DynamoDB table
 def create_mock_table():
@@ -19,8 +21,43 @@ def mock_dynamodb_resource(mocker):
     mocker.patch("lambdas.common.db_utils.dynamodb", mock_dynamodb)
     return mock_dynamodb
 
+# Fixture to mock the low-level DynamoDB client in the `db_utils` module
+@pytest.fixture(autouse=True)
+def mock_dynamodb_client(mocker):
+    """Mock the low-level DynamoDB client in the db_utils module."""
+    mock_client = MagicMock()
+    mocker.patch("lambdas.common.db_utils.dynamodb_client", mock_client)
+    return mock_client
+
+# Fixture to mock the low-level DynamoDB write client in the `db_utils` module
+@pytest.fixture(autouse=True)
+def mock_dynamodb_write_client(mocker):
+    """Mock the low-level DynamoDB write client in the db_utils module."""
+    mock_client = MagicMock()
+    mocker.patch("lambdas.common.db_utils.dynamodb_write_client", mock_client)
+    return mock_client
+
+# Games and counts cached by one test must not leak into the next
+@pytest.fixture(autouse=True)
+def clear_caches():
+    db_utils._static_game_cache.clear()
+    db_utils._random_game_counts.clear()
+    yield
+    db_utils._static_game_cache.clear()
+    db_utils._random_game_counts.clear()
+
 # ====================== Games Table Tests ======================
 
+def test_get_table_caches_handles_per_name(mock_dynamodb_resource):
+    # Act
+    first = db_utils.get_table("LetterBoxedGames")
+    second = db_utils.get_table("LetterBoxedGames")
+    db_utils.get_table("LetterBoxedMetadata")
+
+    # Assert
+    assert first is second
+    assert mock_dynamodb_resource.Table.call_count == 2
+
 def test_add_game_to_db_success(mock_dynamodb_resource):
     # Arrange
     mock_table = create_mock_table()
@@ -43,8 +80,8 @@ def test_add_game_to_db_success(mock_dynamodb_resource):
         mock.call.put_item(Item={
             "gameId": "test-game-id",
             "validWordCount": 2,
-            "validWords": ["WORD1", "WORD2"],
-            "baseValidWords": ["WORD1", "WORD2"]
+            "validWords": encode_words(["WORD1", "WORD2"]),
+            "baseValidWords": encode_words(["WORD1", "WORD2"])
         }),
         mock.call.put_item(Item={
             "gameId": "test-game-id",
@@ -80,8 +117,8 @@ def test_add_game_to_db_failure(mock_dynamodb_resource):
     mock_table.put_item.assert_called_once_with(Item={
         "gameId": "test-game-id",
         "validWordCount": 2,
-        "validWords": ["WORD1", "WORD2"],
-        "baseValidWords": ["WORD1", "WORD2"]
+        "validWords": encode_words(["WORD1", "WORD2"]),
+        "baseValidWords": encode_words(["WORD1", "WORD2"])
     })
 
 
@@ -172,48 +209,281 @@ def test_update_game_in_db_partial_update(mock_dynamodb_resource):
     )
 
 
-def test_fetch_game_by_id_success(mock_dynamodb_resource):
+def test_add_to_game_counters_single_transaction(mock_dynamodb_write_client):
+    # Act
+    missing = db_utils.add_to_game_counters(
+        {"game-1": {"totalCompletions": 2, "totalWordsUsed": 7}, "game-2": {"totalRatings": 1}},
+        "token-1",
+    )
+
+    # Assert
+    assert missing == []
+    mock_dynamodb_write_client.transact_write_items.assert_called_once_with(
+        TransactItems=[
+            {"Update": {
+                "TableName": "LetterBoxedGames",
+                "Key": {"gameId": {"S": "game-1"}},
+                "UpdateExpression": "ADD #c0 :c0, #c1 :c1",
+                "ConditionExpression": "attribute_exists(gameId)",
+                "ExpressionAttributeNames": {"#c0": "totalCompletions", "#c1": "totalWordsUsed"},
+                "ExpressionAttributeValues": {":c0": {"N": "2"}, ":c1": {"N": "7"}},
+            }},
+            {"Update": {
+                "TableName": "LetterBoxedGames",
+                "Key": {"gameId": {"S": "game-2"}},
+                "UpdateExpression": "ADD #c0 :c0",
+                "ConditionExpression": "attribute_exists(gameId)",
+                "ExpressionAttributeNames": {"#c0": "totalRatings"},
+                "ExpressionAttributeValues": {":c0": {"N": "1"}},
+            }},
+        ],
+        ClientRequestToken="token-1",
+    )
+
+def test_add_to_game_counters_missing_games(mock_dynamodb_write_client):
+    # Arrange
+    error = ClientError(
+        error_response={"Error": {"Code": "TransactionCanceledException", "Message": "Transaction cancelled"}},
+        operation_name="TransactWriteItems",
+    )
+    error.response["CancellationReasons"] = [{"Code": "None"}, {"Code": "ConditionalCheckFailed"}]
+    mock_dynamodb_write_client.transact_write_items.side_effect = error
+
+    # Act
+    missing = db_utils.add_to_game_counters({"game-1": {"totalRatings": 1}, "game-2": {"totalRatings": 1}}, "token")
+
+    # Assert
+    assert missing == ["game-2"]
+
+def test_add_to_game_counters_error(mock_dynamodb_write_client):
+    # Arrange
+    mock_dynamodb_write_client.transact_write_items.side_effect = ClientError(
+        error_response={"Error": {"Code": "TransactionConflictException", "Message": "Conflict"}},
+        operation_name="TransactWriteItems",
+    )
+
+    # Act / Assert
+    with pytest.raises(ClientError):
+        db_utils.add_to_game_counters({"game-1": {"totalRatings": 1}}, "token")
+
+def test_fetch_game_counters(mock_dynamodb_client):
+    # Arrange
+    mock_dynamodb_client.get_item.return_value = {"Item": {
+        "gameId": {"S": "test-game-id"},
+        "totalCompletions": {"N": "3"},
+        "totalRatings": {"N": "2"},
+    }}
+
+    # Act
+    result = db_utils.fetch_game_counters("test-game-id")
+
+    # Assert
+    assert result["totalCompletions"] == 3
+    assert result["totalRatings"] == 2
+    kwargs = mock_dynamodb_client.get_item.call_args.kwargs
+    assert set(kwargs["ExpressionAttributeNames"].values()) == set(db_utils.GAME_COUNTER_ATTRIBUTES)
+
+def test_fetch_game_counters_error(mock_dynamodb_client):
+    # Arrange
+    mock_dynamodb_client.get_item.side_effect = ClientError(
+        {"Error": {"Code": "InternalServerError", "Message": "Oops"}}, "GetItem"
+    )
+
+    # Act / Assert: a failed read isn't reported as a missing game
+    with pytest.raises(ClientError):
+        db_utils.fetch_game_counters("test-game-id")
+
+def test_fetch_game_by_id_success(mock_dynamodb_client):
+    # Arrange
+    mock_dynamodb_client.get_item.return_value = {"Item": {
+        "gameId": {"S": "test-game-id"},
+        "gameLayout": {"L": [{"S": "ABC"}, {"S": "DEF"}, {"S": "GHI"}, {"S": "JKL"}]},
+        "twoWordSolutions": {"L": [{"L": [{"S": "ACE"}, {"S": "EGL"}]}]},
+        "totalStars": {"N": "12"},
+        "averageRating": {"N": "4.5"},
+        "officialGame": {"BOOL": True},
+        "clue": {"NULL": True},
+    }}
+
+    # Act
+    result = db_utils.fetch_game_by_id("test-game-id")
+
+    # Assert
+    assert result["gameId"] == "test-game-id"
+    assert result["gameLayout"] == ["ABC", "DEF", "GHI", "JKL"]
+    assert result["twoWordSolutions"] == [["ACE", "EGL"]]
+    assert result["totalStars"] == 12 and isinstance(result["totalStars"], int)
+    assert result["averageRating"] == 4.5
+    assert result["officialGame"] is True
+    # Missing and null fields get their defaults
+    assert result["clue"] == ""
+    assert result["validWords"] == []
+    mock_dynamodb_client.get_item.assert_called_once_with(
+        TableName="LetterBoxedGames", Key={"gameId": {"S": "test-game-id"}}
+    )
+
+def test_add_game_to_db_only_if_new_existing_game(mock_dynamodb_resource):
     # Arrange
     mock_table = create_mock_table()
-    expected_item = {"gameId": "test-game-id", "gameLayout": ["ABC", "DEF", "GHI", "JKL"]}
-    mock_table.get_item.return_value = {"Item": expected_item}
+    mock_table.put_item.side_effect = [
+        None,  # Valid words
+        ClientError(
+            error_response={"Error": {"Code": "ConditionalCheckFailedException", "Message": "Exists"}},
+            operation_name="PutItem",
+        ),
+    ]
     mock_dynamodb_resource.Table.return_value = mock_table
+    game_data = {"gameId": "seeded-id", "validWords": ["WORD1"], "baseValidWords": ["WORD1"]}
 
     # Act
-    result = db_utils.fetch_game_by_id("test-game-id")
+    result = db_utils.add_game_to_db(game_data, only_if_new=True)
 
     # Assert
-    assert result == expected_item
-    mock_table.get_item.assert_called_once_with(Key={"gameId": "test-game-id"})
+    assert result is False
+    mock_table.put_item.assert_called_with(
+        Item={"gameId": "seeded-id"}, ConditionExpression="attribute_not_exists(gameId)"
+    )
 
-def test_fetch_game_by_id_not_found(mock_dynamodb_resource):
+def test_add_game_to_db_compresses_solutions(mock_dynamodb_resource):
     # Arrange
     mock_table = create_mock_table()
-    mock_table.get_item.return_value = {}
     mock_dynamodb_resource.Table.return_value = mock_table
+    game_data = {
+        "gameId": "test-game-id",
+        "validWords": ["ACE", "EGL"],
+        "baseValidWords": ["ACE", "EGL"],
+        "oneWordSolutions": [],
+        "twoWordSolutions": [["ACE", "EGL"]],
+    }
+
+    # Act
+    result = db_utils.add_game_to_db(game_data)
+
+    # Assert
+    assert result is True
+    mock_table.put_item.assert_called_with(Item={
+        "gameId": "test-game-id",
+        "oneWordSolutions": encode_words([]),
+        "twoWordSolutions": encode_solutions([["ACE", "EGL"]]),
+    })
+
+def test_fetch_game_by_id_decodes_compressed_solutions(mock_dynamodb_client):
+    # Arrange
+    mock_dynamodb_client.get_item.return_value = {"Item": {
+        "gameId": {"S": "test-game-id"},
+        "oneWordSolutions": {"B": encode_words(["ACEGL"])},
+        "twoWordSolutions": {"B": encode_solutions([["ACE", "EGL"], ["ALE", "EGL"]])},
+    }}
+
+    # Act
+    result = db_utils.fetch_game_by_id("test-game-id")
+
+    # Assert
+    assert result["oneWordSolutions"] == ["ACEGL"]
+    assert result["twoWordSolutions"] == [["ACE", "EGL"], ["ALE", "EGL"]]
+    assert result["threeWordSolutions"] == []
+
+def test_fetch_game_by_id_not_found(mock_dynamodb_client):
+    # Arrange
+    mock_dynamodb_client.get_item.return_value = {}
 
     # Act
     result = db_utils.fetch_game_by_id("non-existent-id")
 
     # Assert
     assert result is None
-    mock_table.get_item.assert_called_once_with(Key={"gameId": "non-existent-id"})
+    mock_dynamodb_client.get_item.assert_called_once_with(
+        TableName="LetterBoxedGames", Key={"gameId": {"S": "non-existent-id"}}
+    )
 
-def test_fetch_game_by_id_error(mock_dynamodb_resource):
+def test_fetch_game_by_id_error(mock_dynamodb_client):
     # Arrange
-    mock_table = create_mock_table()
-    mock_table.get_item.side_effect = ClientError(
+    mock_dynamodb_client.get_item.side_effect = ClientError(
         error_response={"Error": {"Code": "500", "Message": "Internal Server Error"}},
         operation_name="GetItem",
     )
-    mock_dynamodb_resource.Table.return_value = mock_table
 
     # Act
     result = db_utils.fetch_game_by_id("test-game-id")
 
     # Assert
     assert result is None
-    mock_table.get_item.assert_called_once_with(Key={"gameId": "test-game-id"})
+    mock_dynamodb_client.get_item.assert_called_once()
+
+def test_fetch_game_layout_projects_only_layout_attributes(mock_dynamodb_client):
+    # Arrange
+    mock_dynamodb_client.get_item.return_value = {"Item": {
+        "gameId": {"S": "test-game-id"},
+        "gameLayout": {"L": [{"S": "ABC"}, {"S": "DEF"}, {"S": "GHI"}, {"S": "JKL"}]},
+        "language": {"S": "es"},
+        "par": {"S": "2"},
+    }}
+
+    # Act
+    result = db_utils.fetch_game_layout("test-game-id")
+
+    # Assert: only the requested attributes are read, and missing ones get their defaults
+    assert result == {
+        "gameId": "test-game-id",
+        "gameLayout": ["ABC", "DEF", "GHI", "JKL"],
+        "boardSize": "3x3",
+        "language": "es",
+        "par": "2",
+        "clue": "",
+    }
+    mock_dynamodb_client.get_item.assert_called_once_with(
+        TableName="LetterBoxedGames",
+        Key={"gameId": {"S": "test-game-id"}},
+        ProjectionExpression="#a0, #a1, #a2, #a3, #a4, #a5",
+        ExpressionAttributeNames={
+            "#a0": "gameId", "#a1": "gameLayout", "#a2": "boardSize",
+            "#a3": "language", "#a4": "par", "#a5": "clue",
+        },
+    )
+
+def test_fetch_game_rating(mock_dynamodb_client):
+    # Arrange
+    mock_dynamodb_client.get_item.return_value = {"Item": {
+        "gameId": {"S": "test-game-id"},
+        "totalRatings": {"N": "3"},
+    }}
+
+    # Act
+    result = db_utils.fetch_game_rating("test-game-id")
+
+    # Assert
+    assert result == {"gameId": "test-game-id", "totalRatings": 3, "totalStars": 0}
+    kwargs = mock_dynamodb_client.get_item.call_args.kwargs
+    assert kwargs["ProjectionExpression"] == "#a0, #a1, #a2"
+    assert set(kwargs["ExpressionAttributeNames"].values()) == {"gameId", "totalRatings", "totalStars"}
+
+def test_fetch_game_attributes_not_found_or_error(mock_dynamodb_client):
+    # Arrange
+    mock_dynamodb_client.get_item.side_effect = [
+        {},
+        ClientError(
+            error_response={"Error": {"Code": "500", "Message": "Internal Server Error"}},
+            operation_name="GetItem",
+        ),
+    ]
+
+    # Act / Assert
+    assert db_utils.fetch_game_layout("non-existent-id") is None
+    assert db_utils.fetch_game_layout("test-game-id") is None
+
+def test_game_exists_reads_only_the_key(mock_dynamodb_client):
+    # Arrange
+    mock_dynamodb_client.get_item.side_effect = [{"Item": {"gameId": {"S": "test-game-id"}}}, {}]
+
+    # Act / Assert
+    assert db_utils.game_exists("test-game-id") is True
+    assert db_utils.game_exists("non-existent-id") is False
+    mock_dynamodb_client.get_item.assert_called_with(
+        TableName="LetterBoxedGames",
+        Key={"gameId": {"S": "non-existent-id"}},
+        ProjectionExpression="#a0",
+        ExpressionAttributeNames={"#a0": "gameId"},
+    )
     
 def test_fetch_games_success(mock_dynamodb_resource):
     """Test fetch_games_by_language with a successful response."""
@@ -247,7 +517,8 @@ def test_fetch_games_success(mock_dynamodb_resource):
             "gameId": "1234",
         },
     }
-    mock_table.query.return_value = mock_response
+    # The page isn't full, so the query continues until there are no more games
+    mock_table.query.side_effect = [mock_response, {"Items": []}]
 
     # Act
     last_key = {
@@ -259,25 +530,81 @@ def test_fetch_games_success(mock_dynamodb_resource):
 
     # Assert
     assert len(result["games"]) == 1
-    assert result["lastEvaluatedKey"] == {
-        "language": "en",
-        "createdAt": "2024-12-24T12:00:00",
-        "gameId": "1234",
-    }
+    assert result["lastEvaluatedKey"] is None
     assert result["games"][0]["gameId"] == "1234"
+    assert result["games"][0]["averageRating"] == 2.0
+    assert result["games"][0]["averageWordsNeeded"] == 5.0
+    # Only the browse summary is read
+    names = mock_table.query.call_args.kwargs["ExpressionAttributeNames"]
+    assert set(names.values()) == set(db_utils.BROWSE_GAME_ATTRIBUTES)
+    assert "twoWordSolutions" not in names.values()
 
     # Verify query parameters
-    mock_table.query.assert_called_once_with(
-        IndexName="LanguageCreatedAtIndex",
-        KeyConditionExpression=mock.ANY,  # Can't assert Key directly
-        Limit=10,
-        ScanIndexForward=False,
-        ExclusiveStartKey={
-            "language": "en",
-            "createdAt": "2024-12-23T12:00:00",
-            "gameId": "1233",
-        },
-    )
+    assert mock_table.query.call_count == 2
+    first_query = mock_table.query.call_args_list[0].kwargs
+    assert first_query["IndexName"] == "LanguageCreatedAtIndex"
+    assert first_query["Limit"] == 10
+    assert first_query["ScanIndexForward"] is False
+    assert first_query["ExclusiveStartKey"] == {
+        "language": "en",
+        "createdAt": "2024-12-23T12:00:00",
+        "gameId": "1233",
+    }
+    second_query = mock_table.query.call_args_list[1].kwargs
+    assert second_query["Limit"] == 10  # Never fewer than BROWSE_QUERY_MIN_LIMIT
+    assert second_query["ExclusiveStartKey"] == mock_response["LastEvaluatedKey"]
+
+
+def make_browse_item(game_id, created_at, game_type="random"):
+    return {
+        "gameId": game_id,
+        "gameType": game_type,
+        "language": "en",
+        "createdAt": created_at,
+        "gameLayout": ["ABC", "DEF", "GHI", "JKL"],
+    }
+
+
+def test_fetch_games_fills_page_past_casual_games(mock_dynamodb_resource):
+    # Arrange
+    mock_table = create_mock_table()
+    mock_dynamodb_resource.Table.return_value = mock_table
+    first_page = {
+        "Items": [make_browse_item("g1", "2024-12-10"), make_browse_item("c1", "2024-12-09", "casual")],
+        "LastEvaluatedKey": {"language": "en", "createdAt": "2024-12-09", "gameId": "c1"},
+    }
+    second_page = {
+        "Items": [make_browse_item("g2", "2024-12-08"), make_browse_item("g3", "2024-12-07")],
+        "LastEvaluatedKey": {"language": "en", "createdAt": "2024-12-07", "gameId": "g3"},
+    }
+    mock_table.query.side_effect = [first_page, second_page]
+
+    # Act
+    result = db_utils.fetch_games_by_language(language="en", limit=2)
+
+    # Assert
+    assert [game["gameId"] for game in result["games"]] == ["g1", "g2"]
+    # The page filled up before g3, so the next one starts after g2
+    assert result["lastEvaluatedKey"] == {"language": "en", "createdAt": "2024-12-08", "gameId": "g2"}
+    assert mock_table.query.call_args_list[1].kwargs["ExclusiveStartKey"] == first_page["LastEvaluatedKey"]
+
+
+def test_fetch_games_by_type_continues_with_type_key(mock_dynamodb_resource):
+    # Arrange
+    mock_table = create_mock_table()
+    mock_dynamodb_resource.Table.return_value = mock_table
+    mock_table.query.return_value = {
+        "Items": [make_browse_item("g1", "2024-12-10", "nyt"), make_browse_item("g2", "2024-12-09", "nyt")],
+        "LastEvaluatedKey": {"gameTypeLanguage": "nyt#en", "createdAt": "2024-12-09", "gameId": "g2"},
+    }
+
+    # Act
+    result = db_utils.fetch_games_by_language(language="en", limit=1, game_type="nyt")
+
+    # Assert
+    assert [game["gameId"] for game in result["games"]] == ["g1"]
+    assert result["lastEvaluatedKey"] == {"gameTypeLanguage": "nyt#en", "createdAt": "2024-12-10", "gameId": "g1"}
+    mock_table.query.assert_called_once()
 
 
 def test_fetch_games_no_results(mock_dynamodb_resource):
@@ -299,11 +626,26 @@ def test_fetch_games_no_results(mock_dynamodb_resource):
     mock_table.query.assert_called_once_with(
         IndexName="LanguageCreatedAtIndex",
         KeyConditionExpression=mock.ANY,
+        ProjectionExpression=mock.ANY,
+        ExpressionAttributeNames=mock.ANY,
         Limit=10,
         ScanIndexForward=False,
     )
 
 
+def test_fetch_games_uses_configured_browse_index(mock_dynamodb_resource, monkeypatch):
+    # Arrange
+    monkeypatch.setenv("LANGUAGE_BROWSE_INDEX", "LanguageBrowseIndex")
+    mock_table = create_mock_table()
+    mock_dynamodb_resource.Table.return_value = mock_table
+    mock_table.query.return_value = {"Items": []}
+
+    # Act
+    db_utils.fetch_games_by_language(language="en", limit=10)
+
+    # Assert
+    assert mock_table.query.call_args.kwargs["IndexName"] == "LanguageBrowseIndex"
+
 def test_fetch_games_invalid_last_key(mock_dynamodb_resource):
     """Test fetch_games_by_language with an invalid last key."""
     # Arrange
@@ -329,6 +671,8 @@ def test_fetch_games_invalid_last_key(mock_dynamodb_resource):
     mock_table.query.assert_called_once_with(
         IndexName="LanguageCreatedAtIndex",
         KeyConditionExpression=mock.ANY,
+        ProjectionExpression=mock.ANY,
+        ExpressionAttributeNames=mock.ANY,
         Limit=10,
         ScanIndexForward=False,
         ExclusiveStartKey={
@@ -358,6 +702,8 @@ def test_fetch_games_query_error(mock_dynamodb_resource):
     mock_table.query.assert_called_once_with(
         IndexName="LanguageCreatedAtIndex",
         KeyConditionExpression=mock.ANY,
+        ProjectionExpression=mock.ANY,
+        ExpressionAttributeNames=mock.ANY,
         Limit=10,
         ScanIndexForward=False,
     )
@@ -421,6 +767,65 @@ def test_fetch_solutions_by_standardized_hash_error(mock_dynamodb_resource):
         ProjectionExpression="twoWordSolutions, threeWordSolutions"
     )
 
+def test_batch_add_games_to_db_success(mock_dynamodb_resource):
+    # Arrange
+    mock_games_table = create_mock_table()
+    mock_valid_words_table = create_mock_table()
+
+    def side_effect(table_name):
+        if table_name == "LetterBoxedValidWords1":
+            return mock_valid_words_table
+        return mock_games_table
+
+    mock_dynamodb_resource.Table.side_effect = side_effect
+    games = [
+        {
+            "gameId": f"game-{i}",
+            "gameLayout": ["ABC", "DEF", "GHI", "JKL"],
+            "validWords": ["WORD1", "WORD2"],
+            "baseValidWords": ["WORD1", "WORD2"]
+        }
+        for i in range(3)
+    ]
+
+    # Act
+    result = db_utils.batch_add_games_to_db(games)
+
+    # Assert
+    assert result is True
+    valid_words_batch = mock_valid_words_table.batch_writer.return_value.__enter__.return_value
+    games_batch = mock_games_table.batch_writer.return_value.__enter__.return_value
+    assert valid_words_batch.put_item.call_count == 3
+    valid_words_batch.put_item.assert_any_call(Item={
+        "gameId": "game-0",
+        "validWordCount": 2,
+        "validWords": encode_words(["WORD1", "WORD2"]),
+        "baseValidWords": encode_words(["WORD1", "WORD2"])
+    })
+    assert games_batch.put_item.call_count == 3
+    games_batch.put_item.assert_any_call(Item={
+        "gameId": "game-2",
+        "gameLayout": ["ABC", "DEF", "GHI", "JKL"]
+    })
+    # The caller's game data is left intact
+    assert "validWords" in games[0]
+
+def test_batch_add_games_to_db_failure(mock_dynamodb_resource):
+    # Arrange
+    mock_table = create_mock_table()
+    mock_table.batch_writer.return_value.__enter__.return_value.put_item.side_effect = ClientError(
+        error_response={"Error": {"Code": "500", "Message": "Internal Server Error"}},
+        operation_name="BatchWriteItem",
+    )
+    mock_dynamodb_resource.Table.return_value = mock_table
+    games = [{"gameId": "game-0", "validWords": ["WORD1"], "baseValidWords": ["WORD1"]}]
+
+    # Act
+    result = db_utils.batch_add_games_to_db(games)
+
+    # Assert
+    assert result is False
+
 # ====================== Valid Words Table Tests ======================
 
 def test_add_valid_words_to_db_success(mock_dynamodb_resource):
@@ -440,8 +845,8 @@ def test_add_valid_words_to_db_success(mock_dynamodb_resource):
         Item={
             "gameId": game_id, 
             "validWordCount": len(valid_words),
-            "validWords": valid_words, 
-            "baseValidWords": base_valid_words
+            "validWords": encode_words(valid_words),
+            "baseValidWords": encode_words(base_valid_words)
         }
     )
 
@@ -466,8 +871,8 @@ def test_add_valid_words_to_db_failure(mock_dynamodb_resource):
         Item={
             "gameId": game_id, 
             "validWordCount": len(valid_words),
-            "validWords": valid_words, 
-            "baseValidWords": base_valid_words
+            "validWords": encode_words(valid_words),
+            "baseValidWords": encode_words(base_valid_words)
         }
     )
 
@@ -488,6 +893,37 @@ def test_fetch_valid_words_by_game_id_success(mock_dynamodb_resource):
     assert result == expected_valid_words
     mock_table.get_item.assert_called_once_with(Key={"gameId": game_id})
 
+def test_fetch_valid_words_by_game_id_compressed(mock_dynamodb_resource):
+    # Arrange
+    mock_table = create_mock_table()
+    mock_table.get_item.return_value = {
+        "Item": {"gameId": "test-game-id", "validWords": encode_words(["ÉTÉ", "ÉTOILE"])}
+    }
+    mock_dynamodb_resource.Table.return_value = mock_table
+
+    # Act
+    result = db_utils.fetch_valid_words_by_game_id("test-game-id")
+
+    # Assert
+    assert result == ["ÉTÉ", "ÉTOILE"]
+
+def test_add_valid_words_to_db_sorts_words_with_their_base_words(mock_dynamodb_resource):
+    # Arrange
+    mock_table = create_mock_table()
+    mock_dynamodb_resource.Table.return_value = mock_table
+
+    # Act
+    db_utils.add_valid_words_to_db("test-game-id", ["ORANGE", "ÉTÉ", "APPLE"], ["ORANGE", "ETE", "APPLE"])
+
+    # Assert
+    item = mock_table.put_item.call_args.kwargs["Item"]
+    assert db_utils.decompress_valid_words_item(item) == {
+        "gameId": "test-game-id",
+        "validWordCount": 3,
+        "validWords": ["APPLE", "ORANGE", "ÉTÉ"],
+        "baseValidWords": ["APPLE", "ORANGE", "ETE"],
+    }
+
 def test_fetch_valid_words_by_game_id_not_found(mock_dynamodb_resource):
     # Arrange
     mock_table = create_mock_table()
@@ -521,9 +957,8 @@ def test_fetch_valid_words_by_game_id_error(mock_dynamodb_resource):
 
 # ====================== User Game States Table Tests ======================
 
-def test_get_user_game_state_existing_session(mock_dynamodb_resource):
+def test_get_user_game_state_existing_session(mock_dynamodb_client):
     # Arrange
-    mock_table = create_mock_table()
     session_id = "test-session-id"
     game_id = "test-game-id"
     expected_item = {
@@ -535,22 +970,32 @@ def test_get_user_game_state_existing_session(mock_dynamodb_resource):
         "lastUpdated": 1234567890,
         "TTL": 1234567890 + 30 * 24 * 60 * 60,
     }
-    mock_table.get_item.return_value = {"Item": expected_item}
-    mock_dynamodb_resource.Table.return_value = mock_table
+    mock_dynamodb_client.get_item.return_value = {"Item": {
+        "sessionId": {"S": session_id},
+        "gameId": {"S": game_id},
+        "wordsUsed": {"L": [{"S": "WORD1"}]},
+        "originalWordsUsed": {"L": [{"S": "WORD1"}]},
+        "gameCompleted": {"BOOL": False},
+        "lastUpdated": {"N": "1234567890"},
+        "TTL": {"N": str(1234567890 + 30 * 24 * 60 * 60)},
+    }}
 
     # Act
     result = db_utils.get_user_game_state(session_id, game_id)
 
     # Assert
     assert result == expected_item
-    mock_table.get_item.assert_called_once_with(Key={"sessionId": session_id, "gameId": game_id})
+    mock_dynamodb_client.get_item.assert_called_once_with(
+        TableName="LetterBoxedSessionStates",
+        Key={"sessionId": {"S": session_id}, "gameId": {"S": game_id}},
+    )
 
-def test_get_user_game_state_new_session(mocker, mock_dynamodb_resource):
+def test_get_user_game_state_new_session(mocker, mock_dynamodb_resource, mock_dynamodb_client):
     # Arrange
     mock_table = create_mock_table()
     session_id = "new-session-id"
     game_id = "test-game-id"
-    mock_table.get_item.return_value = {}
+    mock_dynamodb_client.get_item.return_value = {}
     mock_dynamodb_resource.Table.return_value = mock_table
 
     # Mock time.time() to return a fixed timestamp
@@ -567,25 +1012,147 @@ def test_get_user_game_state_new_session(mocker, mock_dynamodb_resource):
     assert result["gameCompleted"] is False
     assert result["lastUpdated"] == 1234567890
     assert result["TTL"] == 1234567890 + 30 * 24 * 60 * 60
-    mock_table.get_item.assert_called_once_with(Key={"sessionId": session_id, "gameId": game_id})
+    mock_dynamodb_client.get_item.assert_called_once()
+    mock_table.put_item.assert_called_once()
 
-def test_get_user_game_state_error(mock_dynamodb_resource):
+def test_get_user_game_state_error(mock_dynamodb_client):
     # Arrange
-    mock_table = create_mock_table()
     session_id = "test-session-id"
     game_id = "test-game-id"
-    mock_table.get_item.side_effect = ClientError(
+    mock_dynamodb_client.get_item.side_effect = ClientError(
         error_response={"Error": {"Code": "500", "Message": "Internal Server Error"}},
         operation_name="GetItem",
     )
-    mock_dynamodb_resource.Table.return_value = mock_table
 
     # Act
     result = db_utils.get_user_game_state(session_id, game_id)
 
     # Assert
     assert result is None
-    mock_table.get_item.assert_called_once_with(Key={"sessionId": session_id, "gameId": game_id})
+    mock_dynamodb_client.get_item.assert_called_once()
+
+def test_fetch_word_validation_data_reads_all_tables_in_one_batch(mocker, mock_dynamodb_client):
+    # Arrange: the session state is unprocessed the first time
+    mocker.patch("lambdas.common.db_utils.time.sleep")
+    session_key = {"sessionId": {"S": "test-session"}, "gameId": {"S": "test-game"}}
+    mock_dynamodb_client.batch_get_item.side_effect = [
+        {
+            "Responses": {
+                "LetterBoxedGames": [{
+                    "gameId": {"S": "test-game"},
+                    "gameLayout": {"L": [{"S": "ABC"}, {"S": "DEF"}, {"S": "GHI"}, {"S": "JKL"}]},
+                    "randomSeedWords": {"L": [{"S": "ABIDE"}, {"S": "ELK"}]},
+                }],
+                "LetterBoxedValidWords1": [{
+                    "validWords": {"L": [{"S": "APPLE"}, {"S": "ORANGE"}]},
+                    "baseValidWords": {"L": [{"S": "APPLE"}, {"S": "ORANGE"}]},
+                }],
+            },
+            "UnprocessedKeys": {"LetterBoxedSessionStates": {"Keys": [session_key]}},
+        },
+        {
+            "Responses": {
+                "LetterBoxedSessionStates": [{
+                    "sessionId": {"S": "test-session"},
+                    "gameId": {"S": "test-game"},
+                    "wordsUsed": {"L": [{"S": "APPLE"}]},
+                }],
+            },
+        },
+    ]
+
+    # Act
+    result = db_utils.fetch_word_validation_data("test-game", "test-session")
+
+    # Assert
+    assert result["game"]["gameLayout"] == ["ABC", "DEF", "GHI", "JKL"]
+    assert result["game"]["randomSeedWords"] == ["ABIDE", "ELK"]
+    assert result["game"]["twoWordSolutions"] == []
+    assert "dictionary" not in result["game"]
+    assert result["validWordsByBase"] == {"APPLE": "APPLE", "ORANGE": "ORANGE"}
+    assert result["sessionState"]["wordsUsed"] == ["APPLE"]
+    first_request = mock_dynamodb_client.batch_get_item.call_args_list[0].kwargs["RequestItems"]
+    assert set(first_request) == {"LetterBoxedGames", "LetterBoxedValidWords1", "LetterBoxedSessionStates"}
+    assert first_request["LetterBoxedValidWords1"]["ProjectionExpression"] == "validWords, baseValidWords"
+    mock_dynamodb_client.batch_get_item.assert_called_with(
+        RequestItems={"LetterBoxedSessionStates": {"Keys": [session_key]}}
+    )
+
+def test_fetch_word_validation_data_decodes_compressed_items(mock_dynamodb_client):
+    # Arrange
+    mock_dynamodb_client.batch_get_item.return_value = {
+        "Responses": {
+            "LetterBoxedGames": [{
+                "gameId": {"S": "test-game"},
+                "twoWordSolutions": {"B": encode_solutions([["APPLE", "EAR"]])},
+            }],
+            "LetterBoxedValidWords1": [{
+                "validWords": {"B": encode_words(["APPLE", "EAR", "ÉTÉ"])},
+                "baseValidWords": {"B": encode_words(["APPLE", "EAR", "ETE"])},
+            }],
+        },
+    }
+
+    # Act
+    result = db_utils.fetch_word_validation_data("test-game", "test-session")
+
+    # Assert
+    assert result["game"]["twoWordSolutions"] == [["APPLE", "EAR"]]
+    assert result["validWordsByBase"] == {"APPLE": "APPLE", "EAR": "EAR", "ETE": "ÉTÉ"}
+
+def test_fetch_word_validation_data_caches_static_game_data(mock_dynamodb_client):
+    # Arrange
+    mock_dynamodb_client.batch_get_item.return_value = {
+        "Responses": {
+            "LetterBoxedGames": [{"gameId": {"S": "test-game"}, "gameLayout": {"L": [{"S": "ABC"}]}}],
+            "LetterBoxedValidWords1": [{"validWords": {"L": [{"S": "APPLE"}]}}],
+            "LetterBoxedSessionStates": [{"sessionId": {"S": "session-1"}, "wordsUsed": {"L": []}}],
+        },
+    }
+
+    # Act
+    first = db_utils.fetch_word_validation_data("test-game", "session-1")
+    second = db_utils.fetch_word_validation_data("test-game", "session-2")
+
+    # Assert: the second guess only reads the session state
+    assert second["game"] == first["game"]
+    assert second["validWordsByBase"] == {"APPLE": "APPLE"}
+    second_request = mock_dynamodb_client.batch_get_item.call_args_list[1].kwargs["RequestItems"]
+    assert list(second_request) == ["LetterBoxedSessionStates"]
+    assert second_request["LetterBoxedSessionStates"]["Keys"][0]["sessionId"] == {"S": "session-2"}
+    assert db_utils.get_static_game_cache_stats()["hits"] == 1
+
+def test_fetch_word_validation_data_does_not_cache_missing_games(mock_dynamodb_client):
+    # Arrange
+    mock_dynamodb_client.batch_get_item.return_value = {"Responses": {}}
+
+    # Act
+    db_utils.fetch_word_validation_data("test-game", "test-session")
+    db_utils.fetch_word_validation_data("test-game", "test-session")
+
+    # Assert
+    second_request = mock_dynamodb_client.batch_get_item.call_args_list[1].kwargs["RequestItems"]
+    assert "LetterBoxedGames" in second_request
+
+def test_fetch_word_validation_data_missing_items(mock_dynamodb_client):
+    # Arrange
+    mock_dynamodb_client.batch_get_item.return_value = {"Responses": {}}
+
+    # Act
+    result = db_utils.fetch_word_validation_data("test-game", "test-session")
+
+    # Assert
+    assert result == {"game": None, "validWordsByBase": None, "sessionState": None}
+
+def test_fetch_word_validation_data_error(mock_dynamodb_client):
+    # Arrange
+    mock_dynamodb_client.batch_get_item.side_effect = ClientError(
+        error_response={"Error": {"Code": "500", "Message": "Internal Server Error"}},
+        operation_name="BatchGetItem",
+    )
+
+    # Act / Assert
+    assert db_utils.fetch_word_validation_data("test-game", "test-session") is None
 
 def test_save_user_session_state_success(mock_dynamodb_resource):
     # Arrange
@@ -662,38 +1229,249 @@ def test_add_game_id_to_random_games_db_success(mocker, mock_dynamodb_resource):
         Item={"atomicNumber": 42, "gameId": game_id}
     )
 
-# ====================== Metadata Table Tests ======================
+def test_add_game_id_to_random_games_db_with_summary(mocker, mock_dynamodb_resource):
+    # Arrange
+    mock_table = create_mock_table()
+    mock_dynamodb_resource.Table.return_value = mock_table
+    mocker.patch("lambdas.common.db_utils.increment_random_game_count", return_value=7)
+    game_data = {"gameId": "game-a", "gameLayout": ["ABC", "DEF", "GHI", "JKL"], "boardSize": "3x3",
+                 "language": "en", "clue": "", "validWords": ["WORD"]}
+
+    # Act
+    db_utils.add_game_id_to_random_games_db("game-a", "en", db_utils.get_random_pool_summary(game_data))
 
-def test_fetch_random_game_count_success(mock_dynamodb_resource):
+    # Assert
+    mock_table.put_item.assert_called_once_with(Item={
+        "gameLayout": ["ABC", "DEF", "GHI", "JKL"],
+        "boardSize": "3x3",
+        "language": "en",
+        "clue": "",
+        "atomicNumber": 7,
+        "gameId": "game-a",
+    })
+
+def test_batch_add_game_ids_to_random_games_db(mock_dynamodb_resource):
     # Arrange
     mock_table = create_mock_table()
-    mock_table.get_item.return_value = {
-        "Item": {"metadataType": "randomGameCount_en", "value": 100}
-    }
     mock_dynamodb_resource.Table.return_value = mock_table
 
     # Act
-    result = db_utils.fetch_random_game_count()
+    result = db_utils.batch_add_game_ids_to_random_games_db(["game-a", "game-b"], 41, "en")
+
+    # Assert
+    assert result == [41, 42]
+    mock_dynamodb_resource.Table.assert_called_with("LetterBoxedRandomGames_en")
+    batch = mock_table.batch_writer.return_value.__enter__.return_value
+    assert batch.put_item.call_args_list == [
+        mock.call(Item={"atomicNumber": 41, "gameId": "game-a"}),
+        mock.call(Item={"atomicNumber": 42, "gameId": "game-b"}),
+    ]
+
+def test_fetch_random_pool_entries(mock_dynamodb_client):
+    # Arrange
+    mock_dynamodb_client.batch_get_item.return_value = {"Responses": {"LetterBoxedRandomGames_en": [
+        {"atomicNumber": {"N": "1"}, "gameId": {"S": "game-a"}, "gameLayout": {"L": [{"S": "ABC"}]}},
+    ]}}
+
+    # Act
+    result = db_utils.fetch_random_pool_entries([1, 2], "en")
+
+    # Assert
+    assert result == [{"atomicNumber": 1, "gameId": "game-a", "gameLayout": ["ABC"]}]
+    mock_dynamodb_client.batch_get_item.assert_called_once_with(RequestItems={
+        "LetterBoxedRandomGames_en": {"Keys": [{"atomicNumber": {"N": "1"}}, {"atomicNumber": {"N": "2"}}]},
+    })
+
+def test_fetch_random_pool_entries_error(mock_dynamodb_client):
+    # Arrange
+    mock_dynamodb_client.batch_get_item.side_effect = ClientError(
+        error_response={"Error": {"Code": "500", "Message": "Internal Server Error"}},
+        operation_name="BatchGetItem",
+    )
+
+    # Act / Assert
+    assert db_utils.fetch_random_pool_entries([1], "en") is None
+
+# ====================== Random Game Inventory Tests ======================
+
+def test_add_games_to_inventory(mocker):
+    # Arrange
+    mock_batch_add = mocker.patch("lambdas.common.db_utils.batch_add_games_to_db", return_value=True)
+    games = [{"gameId": "game-1", "createdAt": "2025-01-01T00:00:00", "validWords": ["WORD"], "baseValidWords": ["WORD"]}]
+
+    # Act
+    result = db_utils.add_games_to_inventory(games, "en", "3x3")
+
+    # Assert
+    assert result is True
+    mock_batch_add.assert_called_once_with([{
+        "gameId": "game-1",
+        "validWords": ["WORD"],
+        "baseValidWords": ["WORD"],
+        "inventoryPool": "en#3x3",
+        "inventoryAddedAt": "2025-01-01T00:00:00",
+    }])
+    # Inventory games stay out of the browse index until claimed
+    assert "createdAt" in games[0]
+
+def test_count_inventory_games_paginates(mock_dynamodb_resource):
+    # Arrange
+    mock_table = create_mock_table()
+    mock_table.query.side_effect = [
+        {"Count": 3, "LastEvaluatedKey": {"gameId": "game-3"}},
+        {"Count": 2},
+    ]
+    mock_dynamodb_resource.Table.return_value = mock_table
+
+    # Act
+    result = db_utils.count_inventory_games("en", "3x3")
 
     # Assert
-    assert result == 100
-    mock_table.get_item.assert_called_once_with(Key={"metadataType": "randomGameCount_en"})
+    assert result == 5
+    assert mock_table.query.call_count == 2
+    assert mock_table.query.call_args_list[1].kwargs["ExclusiveStartKey"] == {"gameId": "game-3"}
+
+def test_count_inventory_games_error(mock_dynamodb_resource):
+    # Arrange: e.g. the index hasn't been added to the table yet
+    mock_table = create_mock_table()
+    mock_table.query.side_effect = ClientError(
+        {"Error": {"Code": "ValidationException", "Message": "The table does not have the specified index"}}, "Query"
+    )
+    mock_dynamodb_resource.Table.return_value = mock_table
+
+    # Act
+    result = db_utils.count_inventory_games("en", "3x3")
 
-def test_fetch_random_game_count_no_item(mock_dynamodb_resource):
+    # Assert
+    assert result is None
+
+def test_claim_inventory_game_success(mock_dynamodb_resource):
     # Arrange
     mock_table = create_mock_table()
-    mock_table.get_item.return_value = {}
+    mock_table.query.return_value = {"Items": [{"gameId": "game-1"}]}
+    mock_table.update_item.return_value = {"Attributes": {"gameId": "game-1", "gameType": "custom"}}
+    mock_dynamodb_resource.Table.return_value = mock_table
+
+    # Act
+    result = db_utils.claim_inventory_game("en", "3x3", {"gameType": "custom"})
+
+    # Assert
+    assert result == {"gameId": "game-1", "gameType": "custom"}
+    update_kwargs = mock_table.update_item.call_args.kwargs
+    assert update_kwargs["Key"] == {"gameId": "game-1"}
+    assert update_kwargs["ConditionExpression"] == "attribute_exists(inventoryPool)"
+    assert update_kwargs["UpdateExpression"].endswith("REMOVE inventoryPool, inventoryAddedAt")
+    assert update_kwargs["ExpressionAttributeNames"]["#u0"] == "gameType"
+    assert update_kwargs["ExpressionAttributeValues"][":u0"] == "custom"
+
+def test_claim_inventory_game_skips_games_claimed_by_others(mock_dynamodb_resource):
+    # Arrange
+    mock_table = create_mock_table()
+    mock_table.query.return_value = {"Items": [{"gameId": "game-1"}, {"gameId": "game-2"}]}
+    mock_table.update_item.side_effect = [
+        ClientError(
+            error_response={"Error": {"Code": "ConditionalCheckFailedException", "Message": "Claimed"}},
+            operation_name="UpdateItem",
+        ),
+        {"Attributes": {"gameId": "game-2"}},
+    ]
     mock_dynamodb_resource.Table.return_value = mock_table
 
+    # Act
+    result = db_utils.claim_inventory_game("en", "3x3", {})
+
+    # Assert
+    assert result == {"gameId": "game-2"}
+    assert mock_table.update_item.call_count == 2
+
+def test_claim_inventory_game_empty(mock_dynamodb_resource):
+    # Arrange
+    mock_table = create_mock_table()
+    mock_table.query.return_value = {"Items": []}
+    mock_dynamodb_resource.Table.return_value = mock_table
+
+    # Act
+    result = db_utils.claim_inventory_game("en", "3x3", {})
+
+    # Assert
+    assert result is None
+    mock_table.update_item.assert_not_called()
+
+# ====================== Metadata Table Tests ======================
+
+def test_fetch_random_game_count_sums_shards(mock_dynamodb_client):
+    # Arrange
+    mock_dynamodb_client.batch_get_item.return_value = {"Responses": {"LetterBoxedMetadata": [
+        {"metadataType": {"S": "randomGameCount_en"}, "value": {"N": "100"}},
+        {"metadataType": {"S": "randomGameCount_en#3"}, "value": {"N": "7"}},
+    ]}}
+
+    # Act
+    result = db_utils.fetch_random_game_count()
+
+    # Assert
+    assert result == 107
+    keys = mock_dynamodb_client.batch_get_item.call_args.kwargs["RequestItems"]["LetterBoxedMetadata"]["Keys"]
+    assert keys[:2] == [{"metadataType": {"S": "randomGameCount_en"}}, {"metadataType": {"S": "randomGameCount_en#1"}}]
+    assert len(keys) == db_utils.RANDOM_GAME_COUNTER_SHARDS
+
+def test_fetch_random_game_count_no_items(mock_dynamodb_client):
+    # Arrange
+    mock_dynamodb_client.batch_get_item.return_value = {"Responses": {}}
+
     # Act
     result = db_utils.fetch_random_game_count()
 
     # Assert
     assert result == 0
-    mock_table.get_item.assert_called_once_with(Key={"metadataType": "randomGameCount_en"})
 
-def test_increment_random_game_count_success(mock_dynamodb_resource):
+def test_fetch_random_game_count_is_cached(mock_dynamodb_client):
+    # Arrange
+    mock_dynamodb_client.batch_get_item.return_value = {"Responses": {"LetterBoxedMetadata": [
+        {"metadataType": {"S": "randomGameCount_en"}, "value": {"N": "5"}},
+    ]}}
+
+    # Act
+    db_utils.fetch_random_game_count()
+    result = db_utils.fetch_random_game_count()
+
+    # Assert
+    assert result == 5
+    mock_dynamodb_client.batch_get_item.assert_called_once()
+
+def test_pick_random_atomic_numbers_maps_positions_to_shards(mocker):
+    # Arrange
+    mocker.patch("lambdas.common.db_utils.fetch_random_game_shard_counts", return_value=[3, 0, 2])
+    sample = mocker.patch("lambdas.common.db_utils.random.sample", return_value=[2, 4, 3])
+
+    # Act
+    result = db_utils.pick_random_atomic_numbers(3)
+
+    # Assert
+    span = db_utils.RANDOM_GAME_SHARD_SPAN
+    assert result == [3, 2 * span + 2, 2 * span + 1]  # Third game of shard 0, then shard 2's games
+    sample.assert_called_once_with(range(5), 3)
+
+def test_pick_random_atomic_numbers_limited_to_pool_size(mocker):
     # Arrange
+    mocker.patch("lambdas.common.db_utils.fetch_random_game_shard_counts", return_value=[2, 1])
+
+    # Act
+    result = db_utils.pick_random_atomic_numbers(100)
+
+    # Assert
+    assert sorted(result) == [1, 2, db_utils.RANDOM_GAME_SHARD_SPAN + 1]
+
+def test_pick_random_atomic_numbers_no_games(mocker):
+    # Arrange
+    mocker.patch("lambdas.common.db_utils.fetch_random_game_shard_counts", return_value=[0, 0])
+
+    # Act / Assert
+    assert db_utils.pick_random_atomic_numbers(10) == []
+
+def test_increment_random_game_count_success(mocker, mock_dynamodb_resource):
+    # Arrange
+    mocker.patch("lambdas.common.db_utils.random.randrange", return_value=0)
     mock_table = create_mock_table()
     mock_table.update_item.return_value = {
         "Attributes": {"value": 101}
@@ -713,8 +1491,9 @@ def test_increment_random_game_count_success(mock_dynamodb_resource):
         ReturnValues="UPDATED_NEW",
     )
 
-def test_increment_random_game_count_failure(mock_dynamodb_resource):
+def test_increment_random_game_count_failure(mocker, mock_dynamodb_resource):
     # Arrange
+    mocker.patch("lambdas.common.db_utils.random.randrange", return_value=0)
     mock_table = create_mock_table()
     mock_table.update_item.side_effect = ClientError(
         error_response={"Error": {"Code": "500", "Message": "Internal Server Error"}},
@@ -733,6 +1512,137 @@ def test_increment_random_game_count_failure(mock_dynamodb_resource):
         ReturnValues="UPDATED_NEW",
     )
 
+def test_reserve_random_game_numbers_success(mocker, mock_dynamodb_resource, mock_dynamodb_client):
+    # Arrange
+    mocker.patch("lambdas.common.db_utils.random.randrange", return_value=3)
+    mock_table = create_mock_table()
+    mock_table.update_item.return_value = {
+        "Attributes": {"value": 125}
+    }
+    mock_dynamodb_resource.Table.return_value = mock_table
+    db_utils._random_game_counts["en"] = ([100], time.monotonic())
+
+    # Act
+    result = db_utils.reserve_random_game_numbers(25)
+
+    # Assert
+    assert result == 3 * db_utils.RANDOM_GAME_SHARD_SPAN + 101
+    mock_table.update_item.assert_called_once_with(
+        Key={"metadataType": "randomGameCount_en#3"},
+        UpdateExpression="SET #val = if_not_exists(#val, :start) + :inc",
+        ExpressionAttributeNames={"#val": "value"},
+        ExpressionAttributeValues={":start": 0, ":inc": 25},
+        ReturnValues="UPDATED_NEW",
+    )
+    # The cached count no longer includes this container's games
+    assert "en" not in db_utils._random_game_counts
+
+def test_reserve_random_game_numbers_with_reservation_id(mocker, mock_dynamodb_resource, mock_dynamodb_write_client):
+    # Arrange
+    mocker.patch("lambdas.common.db_utils.random.randrange", return_value=3)
+    mock_table = create_mock_table()
+    mock_table.get_item.side_effect = [{}, {"Item": {"metadataType": "randomGameCount_en#3", "value": 100}}]
+    mock_dynamodb_resource.Table.return_value = mock_table
+
+    # Act
+    result = db_utils.reserve_random_game_numbers(25, reservation_id="run-1")
+
+    # Assert
+    assert result == 3 * db_utils.RANDOM_GAME_SHARD_SPAN + 101
+    transact_items = mock_dynamodb_write_client.transact_write_items.call_args.kwargs["TransactItems"]
+    update, put = transact_items[0]["Update"], transact_items[1]["Put"]
+    assert update["Key"] == {"metadataType": {"S": "randomGameCount_en#3"}}
+    assert update["ExpressionAttributeValues"] == {":new": {"N": "125"}, ":current": {"N": "100"}}
+    assert put["Item"] == {
+        "metadataType": {"S": "randomGameReservation_run-1"},
+        "value": {"N": str(3 * db_utils.RANDOM_GAME_SHARD_SPAN + 101)},
+    }
+
+def test_reserve_random_game_numbers_reuses_reservation(mock_dynamodb_resource, mock_dynamodb_write_client):
+    # Arrange: the block was reserved before the caller could save it
+    mock_table = create_mock_table()
+    mock_table.get_item.return_value = {"Item": {"metadataType": "randomGameReservation_run-1", "value": 42}}
+    mock_dynamodb_resource.Table.return_value = mock_table
+
+    # Act
+    result = db_utils.reserve_random_game_numbers(25, reservation_id="run-1")
+
+    # Assert
+    assert result == 42
+    mock_dynamodb_write_client.transact_write_items.assert_not_called()
+
+def test_reserve_random_game_numbers_retries_conflict(mocker, mock_dynamodb_resource, mock_dynamodb_write_client):
+    # Arrange: another reservation moves the count between the read and the write
+    mocker.patch("lambdas.common.db_utils.random.randrange", return_value=0)
+    mock_table = create_mock_table()
+    mock_table.get_item.side_effect = [
+        {}, {"Item": {"value": 10}},
+        {}, {"Item": {"value": 15}},
+    ]
+    mock_dynamodb_resource.Table.return_value = mock_table
+    mock_dynamodb_write_client.transact_write_items.side_effect = [
+        ClientError({"Error": {"Code": "TransactionCanceledException", "Message": "Conflict"}}, "TransactWriteItems"),
+        {},
+    ]
+
+    # Act
+    result = db_utils.reserve_random_game_numbers(5, reservation_id="run-1")
+
+    # Assert
+    assert result == 16
+    assert mock_dynamodb_write_client.transact_write_items.call_count == 2
+
+def test_reserve_random_game_numbers_invalid_count(mock_dynamodb_resource):
+    # Act & Assert
+    with pytest.raises(ValueError):
+        db_utils.reserve_random_game_numbers(0)
+    mock_dynamodb_resource.Table.assert_not_called()
+
+def test_fetch_seed_usage_success(mock_dynamodb_resource):
+    # Arrange
+    mock_table = create_mock_table()
+    mock_table.get_item.return_value = {"Item": {"metadataType": "seedUsage_en", "counts": b"data", "revision": 4}}
+    mock_dynamodb_resource.Table.return_value = mock_table
+
+    # Act
+    result = db_utils.fetch_seed_usage("en")
+
+    # Assert
+    assert result == {"counts": b"data", "revision": 4}
+    mock_table.get_item.assert_called_once_with(Key={"metadataType": "seedUsage_en"})
+
+def test_fetch_seed_usage_missing(mock_dynamodb_resource):
+    # Arrange
+    mock_table = create_mock_table()
+    mock_table.get_item.return_value = {}
+    mock_dynamodb_resource.Table.return_value = mock_table
+
+    # Act & Assert
+    assert db_utils.fetch_seed_usage("en") is None
+
+def test_save_seed_usage_checks_revision(mock_dynamodb_resource):
+    # Arrange
+    mock_table = create_mock_table()
+    mock_table.put_item.side_effect = [
+        None,
+        ClientError(
+            error_response={"Error": {"Code": "ConditionalCheckFailedException", "Message": "Changed"}},
+            operation_name="PutItem",
+        ),
+    ]
+    mock_dynamodb_resource.Table.return_value = mock_table
+
+    # Act
+    first = db_utils.save_seed_usage("en", b"data", 4)
+    second = db_utils.save_seed_usage("en", b"data", 4)
+
+    # Assert
+    assert first is True
+    assert second is False
+    put_kwargs = mock_table.put_item.call_args_list[0].kwargs
+    assert put_kwargs["Item"] == {"metadataType": "seedUsage_en", "counts": b"data", "revision": 5}
+    assert put_kwargs["ExpressionAttributeValues"] == {":revision": 4}
+
 def test_update_metadata_success(mock_dynamodb_resource):
     # Arrange
     mock_table = create_mock_table()
@@ -806,6 +1716,39 @@ def test_add_game_to_archive_failure(mock_dynamodb_resource):
     mock_table.put_item.assert_called_once_with(Item={"NYTGame": "NYTGame", "gameId": game_id})
 
 
+def test_fetch_game_summaries(mock_dynamodb_client):
+    # Arrange
+    mock_dynamodb_client.batch_get_item.return_value = {"Responses": {"LetterBoxedGames": [{
+        "gameId": {"S": "2024-12-01"},
+        "gameLayout": {"L": [{"S": "ABC"}, {"S": "DEF"}, {"S": "GHI"}, {"S": "JKL"}]},
+        "gameType": {"S": "nyt"},
+        "par": {"S": "4"},
+        "totalRatings": {"N": "2"},
+        "totalStars": {"N": "9"},
+    }]}}
+
+    # Act
+    result = db_utils.fetch_game_summaries(["2024-12-01", "missing"])
+
+    # Assert
+    assert list(result) == ["2024-12-01"]
+    assert result["2024-12-01"]["par"] == "4"
+    assert result["2024-12-01"]["averageRating"] == 4.5
+    assert result["2024-12-01"]["gameLayout"] == ["ABC", "DEF", "GHI", "JKL"]
+    request = mock_dynamodb_client.batch_get_item.call_args.kwargs["RequestItems"]["LetterBoxedGames"]
+    assert request["Keys"] == [{"gameId": {"S": "2024-12-01"}}, {"gameId": {"S": "missing"}}]
+    assert set(request["ExpressionAttributeNames"].values()) == set(db_utils.ARCHIVE_GAME_ATTRIBUTES)
+
+def test_fetch_game_summaries_error(mock_dynamodb_client):
+    # Arrange
+    mock_dynamodb_client.batch_get_item.side_effect = ClientError(
+        error_response={"Error": {"Code": "500", "Message": "Internal Server Error"}},
+        operation_name="BatchGetItem",
+    )
+
+    # Act / Assert
+    assert db_utils.fetch_game_summaries(["2024-12-01"]) == {}
+
 def test_fetch_archived_games_success(mock_dynamodb_resource):
     # Arrange
     mock_table = create_mock_table()
@@ -0,0 +1,131 @@
+import random
+import pytest
+from lambdas.common.dictionary_index import (
+    DictionaryIndex,
+    RANK_BASIC,
+    RANK_BASIC_AND_NYT,
+    RANK_NYT,
+    RANK_OTHER,
+    build_base_word_map,
+)
+
+
+@pytest.fixture
+def index():
+    return DictionaryIndex.build(
+        "es",
+        ["ÁRBOL", "BANANA", "CAFÉ", "CASA"],
+        ["CASA", "ÁRBOL", "HOLA"],
+        sources={"dictionary": "abc123"},
+        nyt_words=["CASA", "CAFÉ"],
+    )
+
+
+def test_build_computes_base_words_and_masks(index):
+    assert index.base_words == ["ARBOL", "BANANA", "CAFE", "CASA"]
+    assert index.alphabet == "ABCEFLNORS"
+    assert index.masks[1] == index.letter_mask("BAN")
+    assert index.masks[3] == index.letter_mask("CAS")
+    assert index.letter_mask("Z") == 0
+
+
+def test_build_groups_words_by_first_base_letter(index):
+    assert list(index.first_letter_buckets["A"]) == [0]
+    assert list(index.first_letter_buckets["C"]) == [2, 3]
+    assert "Á" not in index.first_letter_buckets
+
+
+def test_get_prefix_bucket_groups_words_by_first_two_base_letters(index):
+    assert list(index.get_prefix_bucket("CA")) == [2, 3]
+    assert list(index.get_prefix_bucket("AR")) == [0]
+    assert list(index.get_prefix_bucket("ZZ")) == []
+
+
+def test_build_marks_basic_words(index):
+    assert [index.is_basic(position) for position in range(4)] == [True, False, False, True]
+    assert index.get_words("basic") == ["ÁRBOL", "CASA", "HOLA"]
+    assert index.get_words("dictionary") == ["ÁRBOL", "BANANA", "CAFÉ", "CASA"]
+    with pytest.raises(ValueError):
+        index.get_words("unknown")
+
+
+def test_get_words_raises_without_basic_list(tmp_path):
+    index = DictionaryIndex.build("es", ["ÁRBOL", "CASA"])
+    index.save(str(tmp_path / "es"))
+    loaded = DictionaryIndex.load(str(tmp_path / "es"))
+
+    # A missing basic list isn't the same as an empty one
+    for compiled in (index, loaded):
+        with pytest.raises(ValueError):
+            compiled.get_words("basic")
+    assert DictionaryIndex.build("es", ["ÁRBOL", "CASA"], []).get_words("basic") == []
+
+
+def test_get_words_returns_a_copy(index):
+    words = index.get_words("dictionary")
+    words.append("EXTRA")
+    assert "EXTRA" not in index.words
+
+
+def test_version_changes_with_content(index):
+    same = DictionaryIndex.build(
+        "es", ["ÁRBOL", "BANANA", "CAFÉ", "CASA"], ["CASA", "ÁRBOL", "HOLA"], nyt_words=["CAFÉ", "CASA"]
+    )
+    different = DictionaryIndex.build("es", ["ÁRBOL", "BANANA", "CAFÉ", "CASA"], ["CASA"])
+    assert same.version == index.version
+    assert different.version != index.version
+
+
+def test_save_and_load_round_trip(index, tmp_path):
+    index.save(str(tmp_path / "es"))
+
+    loaded = DictionaryIndex.load(str(tmp_path / "es"))
+
+    assert loaded is not None
+    assert loaded.words == index.words
+    assert loaded.base_words == index.base_words
+    assert list(loaded.masks) == list(index.masks)
+    assert {letter: list(bucket) for letter, bucket in loaded.first_letter_buckets.items()} == {
+        letter: list(bucket) for letter, bucket in index.first_letter_buckets.items()
+    }
+    assert loaded.get_words("basic") == index.get_words("basic")
+    assert list(loaded.ranks) == list(index.ranks)
+    assert loaded.version == index.version
+    assert loaded.sources == {"dictionary": "abc123"}
+
+
+def test_load_missing_directory_returns_none(tmp_path):
+    assert DictionaryIndex.load(str(tmp_path / "missing")) is None
+
+
+def test_build_ranks_words_by_commonness(index):
+    assert list(index.ranks) == [RANK_BASIC, RANK_OTHER, RANK_NYT, RANK_BASIC_AND_NYT]
+    assert index.get_rank("CASA") == RANK_BASIC_AND_NYT
+    assert index.get_rank("HOLA") is None
+
+
+def test_get_commonness_weights_uses_rank_weights(index):
+    weights = (8.0, 4.0, 2.0, 1.0)
+    assert index.get_commonness_weights(["CASA", "BANANA", "MISSING"], weights) == [8.0, 1.0, 1.0]
+
+
+def test_get_sampler_favors_common_words(index):
+    sampler = index.get_sampler("dictionary", weights=(1.0, 0.0, 0.0, 0.0))
+    rng = random.Random(0)
+    assert {sampler.sample(rng) for _ in range(50)} == {"CASA"}
+    assert index.get_sampler("dictionary", weights=(1.0, 0.0, 0.0, 0.0)) is sampler
+    assert index.get_sampler("basic").items == ["ÁRBOL", "CASA", "HOLA"]
+
+
+def test_build_base_word_map_uses_stored_base_forms():
+    words_by_base = build_base_word_map(["ÁRBOL", "CAFÉ", "CASA"], ["ARBOL", "CAFE", "CASA"])
+
+    assert words_by_base == {"ARBOL": "ÁRBOL", "CAFE": "CAFÉ", "CASA": "CASA"}
+
+
+def test_build_base_word_map_recomputes_missing_or_accented_base_forms():
+    # Casual games append seed words to the base list as they are
+    assert build_base_word_map(["CAFÉ", "PIÑA"], ["CAFE", "PIÑA"]) == {"CAFE": "CAFÉ", "PINA": "PIÑA"}
+    assert build_base_word_map(["CAFÉ", "CASA"]) == {"CAFE": "CAFÉ", "CASA": "CASA"}
+    # Mismatched lists are ignored, and the first word with a base form wins
+    assert build_base_word_map(["CAFÉ", "CAFE"], ["CAFE"]) == {"CAFE": "CAFÉ"}
@@ -0,0 +1,66 @@
+import pytest
+from lambdas.common.dictionary_merge_utils import (
+    merge_sorted_dictionary,
+    prepare_new_words,
+)
+
+
+def write_dictionary(path, words):
+    path.write_text("".join(word + "\n" for word in words))
+
+
+def test_prepare_new_words_cleans_filters_and_sorts():
+    words = ["  zebra", "apple", "APPLE", "ox", "it's", "Éclair"]
+    assert prepare_new_words(words) == ["APPLE", "ZEBRA", "ÉCLAIR"]
+
+
+def test_merge_sorted_dictionary_adds_new_words_in_order(tmp_path):
+    dictionary_path = tmp_path / "dictionary.txt"
+    write_dictionary(dictionary_path, ["APPLE", "CHERRY", "MANGO"])
+
+    added_words, word_count = merge_sorted_dictionary(
+        str(dictionary_path), ["zucchini", "banana", "cherry", "aardvark"]
+    )
+
+    assert added_words == ["AARDVARK", "BANANA", "ZUCCHINI"]
+    assert word_count == 6
+    assert dictionary_path.read_text().split() == [
+        "AARDVARK", "APPLE", "BANANA", "CHERRY", "MANGO", "ZUCCHINI"
+    ]
+
+
+def test_merge_sorted_dictionary_no_changes_leaves_file_untouched(tmp_path):
+    dictionary_path = tmp_path / "dictionary.txt"
+    write_dictionary(dictionary_path, ["APPLE", "CHERRY"])
+    mtime_before = dictionary_path.stat().st_mtime_ns
+
+    added_words, word_count = merge_sorted_dictionary(str(dictionary_path), ["cherry", "ox"])
+
+    assert added_words == []
+    assert word_count == 2
+    assert dictionary_path.stat().st_mtime_ns == mtime_before
+    assert not (tmp_path / "dictionary.txt.tmp").exists()
+
+
+def test_merge_sorted_dictionary_writes_separate_output(tmp_path):
+    dictionary_path = tmp_path / "dictionary.txt"
+    output_path = tmp_path / "merged.txt"
+    write_dictionary(dictionary_path, ["APPLE", "APPLE", "CHERRY", "NO"])
+
+    added_words, word_count = merge_sorted_dictionary(str(dictionary_path), [], str(output_path))
+
+    assert added_words == []
+    assert word_count == 2
+    assert output_path.read_text().split() == ["APPLE", "CHERRY"]
+    assert dictionary_path.read_text().split() == ["APPLE", "APPLE", "CHERRY", "NO"]
+
+
+def test_merge_sorted_dictionary_rejects_unsorted_input(tmp_path):
+    dictionary_path = tmp_path / "dictionary.txt"
+    write_dictionary(dictionary_path, ["CHERRY", "APPLE"])
+
+    with pytest.raises(ValueError, match="is not sorted"):
+        merge_sorted_dictionary(str(dictionary_path), ["banana"])
+
+    assert not (tmp_path / "dictionary.txt.tmp").exists()
+    assert dictionary_path.read_text().split() == ["CHERRY", "APPLE"]
@@ -2,9 +2,16 @@ import pytest
 from unittest.mock import MagicMock
 import os
 from botocore.exceptions import ClientError
+from lambdas.common import dictionary_utils
+from lambdas.common.dictionary_index import DictionaryIndex
+from lambdas.common.seed_usage import SeedUsage
 from lambdas.common.dictionary_utils import (
     get_dictionary,
     get_basic_dictionary,
+    get_dictionary_index,
+    get_balanced_sampler,
+    record_seed_usage,
+    clear_dictionary_cache,
     _fetch_dictionary_from_s3,
     _load_local_dictionary,
 )
@@ -87,3 +94,106 @@ def test_get_basic_dictionary_local(mocker):
     words = get_basic_dictionary("en")
     assert words == ["basic1", "basic2"]
     mock_load_local.assert_called_once_with("en", "basic")
+
+
+@pytest.fixture
+def layer_dir(tmp_path, mocker):
+    clear_dictionary_cache()
+    DictionaryIndex.build(
+        "en", ["APPLE", "BANANA", "CHERRY"], ["APPLE"], sources={"dictionary": "etag-1"}
+    ).save(str(tmp_path / "en"))
+    mocker.patch("lambdas.common.dictionary_utils.DICTIONARY_LAYER_PATH", str(tmp_path))
+    mocker.patch("lambdas.common.dictionary_utils.DICTIONARY_SOURCE", "s3")
+    yield tmp_path
+    clear_dictionary_cache()
+
+
+def test_get_dictionary_loads_from_layer_when_fresh(layer_dir, mock_s3_client):
+    mock_s3_client.head_object.return_value = {"ETag": '"etag-1"'}
+
+    assert get_dictionary("en") == ["APPLE", "BANANA", "CHERRY"]
+    assert get_basic_dictionary("en") == ["APPLE"]
+
+    mock_s3_client.get_object.assert_not_called()
+    # The freshness check only runs once per container
+    mock_s3_client.head_object.assert_called_once_with(
+        Bucket="chazwinter.com", Key="LetterBoxed/Dictionaries/en/dictionary.txt"
+    )
+
+
+def test_get_dictionary_falls_back_to_s3_when_layer_is_stale(layer_dir, mock_s3_client):
+    mock_s3_client.head_object.return_value = {"ETag": '"etag-2"'}
+    mock_s3_client.get_object.return_value = {"Body": MagicMock(read=lambda: b"apple\nbanana\ncherry\ndate")}
+
+    assert get_dictionary("en") == ["APPLE", "BANANA", "CHERRY", "DATE"]
+    get_dictionary_index("en")
+
+    # Each source is downloaded once, for the compiled index, and get_dictionary reads from it
+    keys = [call.kwargs["Key"] for call in mock_s3_client.get_object.call_args_list]
+    assert len(keys) == len(set(keys))
+    assert any(key.endswith("dictionary.txt") for key in keys)
+
+
+def test_get_basic_dictionary_raises_when_missing_from_s3(layer_dir, mock_s3_client):
+    # Arrange: the layer is stale, and S3 has no basic.txt for the language
+    mock_s3_client.head_object.return_value = {"ETag": '"etag-2"'}
+
+    def get_object(Bucket, Key):
+        if Key.endswith("/dictionary.txt"):
+            return {"Body": MagicMock(read=lambda: b"apple\nbanana")}
+        raise ClientError({"Error": {"Code": "NoSuchKey", "Message": "Key not found"}}, "GetObject")
+
+    mock_s3_client.get_object.side_effect = get_object
+
+    # Act / Assert: the full dictionary still loads, but the missing basic list isn't served as []
+    assert get_dictionary("en") == ["APPLE", "BANANA"]
+    with pytest.raises(ValueError):
+        get_basic_dictionary("en")
+
+
+def test_get_dictionary_index_is_cached(layer_dir, mock_s3_client):
+    mock_s3_client.head_object.return_value = {"ETag": '"etag-1"'}
+
+    index = get_dictionary_index("en")
+
+    assert index.words == ["APPLE", "BANANA", "CHERRY"]
+    assert get_dictionary_index("en") is index
+
+
+def test_get_dictionary_index_compiles_local_dictionary(mocker):
+    clear_dictionary_cache()
+    mocker.patch(
+        "lambdas.common.dictionary_utils._load_local_dictionary",
+        side_effect=lambda language, dictionary_type: (
+            ["APPLE", "BANANA"] if dictionary_type == "dictionary" else ["BANANA"]
+        ),
+    )
+
+    index = get_dictionary_index("en")
+
+    assert index.words == ["APPLE", "BANANA"]
+    assert index.get_words("basic") == ["BANANA"]
+    clear_dictionary_cache()
+
+
+def test_balanced_sampler_weighs_down_used_words(mocker):
+    index = DictionaryIndex.build("en", ["APPLE", "BANANA", "CHERRY"], ["APPLE", "BANANA", "CHERRY"])
+    mocker.patch.dict(dictionary_utils._dictionary_index_cache, {"en": index})
+    usage = SeedUsage({"APPLE": 99})
+    mocker.patch.object(dictionary_utils, "load_seed_usage", return_value=usage)
+
+    sampler = get_balanced_sampler("en", "basic")
+
+    assert sampler.weights[0] == pytest.approx(sampler.weights[1] / 100)
+    record_seed_usage("en", ["BANANA"], ["ABN", "XYZ", "QRS", "TUV"])
+    assert usage.word_counts["BANANA"] == 1
+    assert sampler.weights[1] == pytest.approx(sampler.weights[2] / 2)
+    clear_dictionary_cache()
+
+
+def test_record_seed_usage_without_loaded_usage_does_nothing(mocker):
+    load_usage = mocker.patch.object(dictionary_utils, "load_seed_usage")
+
+    record_seed_usage("en", ["BANANA"], ["ABN", "XYZ", "QRS", "TUV"])
+
+    load_usage.assert_not_called()
@@ -1,10 +1,12 @@
 from unittest.mock import patch
 import pytest
+from lambdas.common.dictionary_index import DictionaryIndex
 from lambdas.common.game_utils import (
     standardize_board, 
     is_valid_word,
     sides_list_to_sides_set,
     generate_valid_words,
+    generate_valid_words_from_index,
     create_letter_to_side_mapping,
     check_game_completion,
 )
@@ -109,6 +111,15 @@ def test_generate_valid_words():
         assert valid_words == ["PARDONS", "DAPHNIA", "SNAPDRAGON", "PHONIATRISTS"]
 
 
+def test_generate_valid_words_from_index():
+    dictionary = ["PARDONS", "BAD", "DAPHNIA", "DAAPHNIA", "AAAA", "SO", "SNAPDRAGON", "PHONIATRISTS", "SONANTI"]
+    game_layout = ["PRO", "CTI", "DGN", "SAH"]
+    index = DictionaryIndex.build("en", sorted(dictionary), [])
+
+    valid_words = generate_valid_words_from_index(game_layout, index)
+    assert valid_words == ["DAPHNIA", "PARDONS", "PHONIATRISTS", "SNAPDRAGON"]
+
+
 def test_check_game_completion_success():
     # Arrange
     game_layout = ["PRO", "CTI", "DGN", "SAH"]
@@ -0,0 +1,45 @@
+from lambdas.common.item_cache import ItemCache, estimate_size
+
+
+def test_get_counts_hits_and_misses():
+    cache = ItemCache(max_bytes=10_000)
+    cache.put("game-1", {"validWords": ["APPLE"]})
+
+    assert cache.get("game-1") == {"validWords": ["APPLE"]}
+    assert cache.get("game-2") is None
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hitRate"] == 0.5
+    assert stats["entries"] == 1
+
+
+def test_put_evicts_least_recently_used_to_stay_under_size():
+    cache = ItemCache(max_bytes=250)
+    cache.put("a", "A", size=100)
+    cache.put("b", "B", size=100)
+    cache.get("a")  # "b" is now the least recently used
+    cache.put("c", "C", size=100)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "A"
+    assert cache.get("c") == "C"
+    assert cache.size_bytes == 200
+
+
+def test_put_replaces_and_skips_oversized_values():
+    cache = ItemCache(max_bytes=150)
+    cache.put("a", "A", size=100)
+    cache.put("a", "AA", size=120)
+    cache.put("huge", "H", size=1000)
+
+    assert cache.get("a") == "AA"
+    assert cache.get("huge") is None
+    assert cache.size_bytes == 120
+
+
+def test_estimate_size_grows_with_contents():
+    small = estimate_size({"validWords": ["APPLE"]})
+    large = estimate_size({"validWords": ["APPLE"] * 100})
+
+    assert 0 < small < large
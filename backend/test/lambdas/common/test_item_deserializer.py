@@ -0,0 +1,36 @@
+import pytest
+from decimal import Decimal
+from boto3.dynamodb.types import TypeSerializer
+from lambdas.common.item_deserializer import deserialize_item, deserialize_value
+from lambdas.common.validation_utils import convert_decimal
+
+
+def test_deserialize_item_matches_resource_read_with_convert_decimal():
+    item = {
+        "gameId": "game-1",
+        "gameLayout": ["ABC", "DEF", "GHI", "JKL"],
+        "twoWordSolutions": [["ACE", "EGL"], ["ADG", "GEL"]],
+        "totalStars": Decimal("12"),
+        "averageRating": Decimal("4.5"),
+        "wholeFloat": Decimal("3.0"),
+        "officialGame": False,
+        "clue": None,
+        "stats": {"plays": Decimal("3"), "words": ["A", Decimal("1")]},
+        "tags": {"easy", "new"},
+        "numbers": {Decimal("1"), Decimal("2.5")},
+        "blob": b"\x00\x01",
+    }
+    serializer = TypeSerializer()
+    low_level_item = {name: serializer.serialize(value) for name, value in item.items()}
+
+    result = deserialize_item(low_level_item)
+
+    assert result == convert_decimal(item)
+    assert isinstance(result["wholeFloat"], int)
+
+
+def test_deserialize_value_rejects_unknown_type():
+    with pytest.raises(ValueError):
+        deserialize_value({"X": "1"})
+    with pytest.raises(ValueError):
+        deserialize_value({})
@@ -0,0 +1,91 @@
+import random
+import pytest
+from lambdas.common import pair_catalog
+from lambdas.common.dictionary_index import DictionaryIndex
+from lambdas.common.pair_catalog import PairCatalog, get_pair_catalog
+
+WORDS = ["BULWARK", "KVETCH", "KNIGHTS", "THUMP", "BLACK", "KEYNOTE", "AXE", "PLAY", "FROZEN", "NIGHTLY"]
+
+
+@pytest.fixture
+def index():
+    return DictionaryIndex.build("en", WORDS, ["BULWARK", "KVETCH", "BLACK", "KNIGHTS"])
+
+
+def brute_force_pairs(words, required):
+    pairs = set()
+    for word1 in words:
+        for word2 in words:
+            if word1 != word2 and word1[-1] == word2[0] and len(set(word1 + word2)) == required:
+                pairs.add((word1, word2))
+    return pairs
+
+
+def all_pairs(catalog):
+    return {
+        (catalog.words[catalog.pairs[i]], catalog.words[catalog.pairs[i + 1]])
+        for i in range(0, len(catalog.pairs), 2)
+    }
+
+
+def test_build_finds_every_compatible_pair(index):
+    catalog = PairCatalog.build(index, "dictionary", "3x3")
+
+    assert all_pairs(catalog) == brute_force_pairs(WORDS, 12)
+    assert catalog.total_pairs == len(brute_force_pairs(WORDS, 12))
+    assert ("BULWARK", "KVETCH") in all_pairs(catalog)
+
+
+def test_build_basic_catalog_uses_basic_words(index):
+    catalog = PairCatalog.build(index, "basic", "3x3")
+    assert all_pairs(catalog) == brute_force_pairs(["BULWARK", "KVETCH", "BLACK", "KNIGHTS"], 12)
+
+
+def test_build_keeps_a_sample_of_large_buckets(index):
+    catalog = PairCatalog.build(index, "dictionary", "3x3", max_pairs_per_bucket=1)
+    assert all(bucket[4] == 1 for bucket in catalog.buckets)
+    assert catalog.total_pairs == len(brute_force_pairs(WORDS, 12))
+
+
+def test_sample_applies_filters(index):
+    catalog = PairCatalog.build(index, "dictionary", "3x3")
+    rng = random.Random(1)
+
+    pairs = catalog.sample(10, max_word_length=7, rng=rng)
+    assert set(pairs) == {("BULWARK", "KVETCH"), ("BULWARK", "KEYNOTE"), ("FROZEN", "NIGHTLY")}
+    assert catalog.sample(10, max_word_length=6, rng=rng) == []
+
+    pairs = catalog.sample(10, max_shared_letters=1, exclude=["BULWARK"], rng=rng)
+    assert pairs == [("FROZEN", "NIGHTLY")]
+
+    assert catalog.sample(10, min_word_length=20, rng=rng) == []
+
+
+def test_save_and_load_round_trip(index, tmp_path):
+    catalog = PairCatalog.build(index, "dictionary", "3x3")
+    catalog.save(str(tmp_path / "catalog"))
+
+    loaded = PairCatalog.load(str(tmp_path / "catalog"), index, "dictionary")
+
+    assert loaded is not None
+    assert all_pairs(loaded) == all_pairs(catalog)
+    assert loaded.buckets == catalog.buckets
+
+
+def test_load_rejects_catalog_for_other_dictionary_version(index, tmp_path):
+    PairCatalog.build(index, "dictionary", "3x3").save(str(tmp_path / "catalog"))
+    other_index = DictionaryIndex.build("en", WORDS + ["ZEBRA"])
+
+    assert PairCatalog.load(str(tmp_path / "catalog"), other_index, "dictionary") is None
+    assert PairCatalog.load(str(tmp_path / "missing"), index, "dictionary") is None
+
+
+def test_get_pair_catalog_builds_once_and_caches_on_disk(index, tmp_path, monkeypatch):
+    monkeypatch.setattr(pair_catalog, "PAIR_CATALOG_CACHE_PATH", str(tmp_path))
+    monkeypatch.setattr(pair_catalog, "get_dictionary_index", lambda language: index)
+    monkeypatch.setattr(pair_catalog, "_pair_catalog_cache", {})
+
+    catalog = get_pair_catalog("en", "dictionary", "3x3")
+
+    assert get_pair_catalog("en", "dictionary", "3x3") is catalog
+    assert (tmp_path / "en" / "dictionary-3x3" / "manifest.json").exists()
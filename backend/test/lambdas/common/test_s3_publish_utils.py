@@ -0,0 +1,112 @@
+import os
+import hashlib
+import boto3
+import pytest
+from boto3.s3.transfer import TransferConfig
+from moto import mock_aws
+from lambdas.common.s3_publish_utils import (
+    calculate_s3_etag,
+    collect_dictionary_uploads,
+    load_publish_manifest,
+    publish_files,
+)
+
+MB = 1024 * 1024
+
+
+@pytest.fixture
+def s3_client():
+    with mock_aws():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket="bucket-a")
+        client.create_bucket(Bucket="bucket-b")
+        yield client
+
+
+@pytest.fixture
+def dictionaries_dir(tmp_path):
+    for language, words in [("en", "APPLE\nBANANA\n"), ("es", "MANZANA\n")]:
+        language_dir = tmp_path / "dictionaries" / language
+        language_dir.mkdir(parents=True)
+        (language_dir / "dictionary.txt").write_text(words)
+    return tmp_path / "dictionaries"
+
+
+TARGETS = [
+    {"bucket_name": "bucket-a", "prefix": "LetterBoxed/Dictionaries/"},
+    {"bucket_name": "bucket-b", "prefix": "Dictionaries/"},
+]
+
+
+def test_calculate_s3_etag_single_part(tmp_path):
+    file_path = tmp_path / "small.txt"
+    file_path.write_bytes(b"hello world")
+    assert calculate_s3_etag(str(file_path)) == hashlib.md5(b"hello world").hexdigest()
+
+
+def test_calculate_s3_etag_multipart(tmp_path):
+    file_path = tmp_path / "large.bin"
+    data = os.urandom(11)
+    file_path.write_bytes(data * 10)
+    part_digests = hashlib.md5(data * 4).digest() + hashlib.md5(data * 4).digest() + hashlib.md5(data * 2).digest()
+    expected = f"{hashlib.md5(part_digests).hexdigest()}-3"
+    assert calculate_s3_etag(str(file_path), multipart_threshold=40, multipart_chunksize=44) == expected
+
+
+def test_collect_dictionary_uploads(dictionaries_dir):
+    uploads = collect_dictionary_uploads(str(dictionaries_dir), TARGETS)
+    assert [(bucket, key) for _, bucket, key in uploads] == [
+        ("bucket-a", "LetterBoxed/Dictionaries/en/dictionary.txt"),
+        ("bucket-b", "Dictionaries/en/dictionary.txt"),
+        ("bucket-a", "LetterBoxed/Dictionaries/es/dictionary.txt"),
+        ("bucket-b", "Dictionaries/es/dictionary.txt"),
+    ]
+
+
+def test_publish_files_uploads_only_changed_objects(s3_client, dictionaries_dir, tmp_path):
+    manifest_path = str(tmp_path / "manifest.json")
+    uploads = collect_dictionary_uploads(str(dictionaries_dir), TARGETS)
+
+    first = publish_files(uploads, manifest_path=manifest_path, s3_client=s3_client)
+    assert len(first["uploaded"]) == 4
+    assert first["skipped"] == [] and first["failed"] == []
+    body = s3_client.get_object(Bucket="bucket-b", Key="Dictionaries/en/dictionary.txt")["Body"].read()
+    assert body == b"APPLE\nBANANA\n"
+
+    second = publish_files(uploads, manifest_path=manifest_path, s3_client=s3_client)
+    assert second["uploaded"] == []
+    assert len(second["skipped"]) == 4
+
+    (dictionaries_dir / "en" / "dictionary.txt").write_text("APPLE\nBANANA\nCHERRY\n")
+    third = publish_files(uploads, manifest_path=manifest_path, s3_client=s3_client)
+    assert sorted(third["uploaded"]) == [
+        "s3://bucket-a/LetterBoxed/Dictionaries/en/dictionary.txt",
+        "s3://bucket-b/Dictionaries/en/dictionary.txt",
+    ]
+    manifest = load_publish_manifest(manifest_path)
+    assert len(manifest["published"]) == 4
+
+
+def test_publish_files_skips_identical_remote_object_without_manifest(s3_client, dictionaries_dir):
+    uploads = collect_dictionary_uploads(str(dictionaries_dir), TARGETS[:1])
+    publish_files(uploads, s3_client=s3_client)
+
+    result = publish_files(uploads, s3_client=s3_client)
+
+    assert result["uploaded"] == []
+    assert len(result["skipped"]) == 2
+
+
+def test_publish_files_multipart_etag_matches_s3(s3_client, tmp_path):
+    config = TransferConfig(multipart_threshold=5 * MB, multipart_chunksize=5 * MB)
+    file_path = tmp_path / "large.txt"
+    file_path.write_bytes(b"A" * (11 * MB))
+    uploads = [(str(file_path), "bucket-a", "large.txt")]
+
+    first = publish_files(uploads, s3_client=s3_client, transfer_config=config)
+    assert first["uploaded"] == ["s3://bucket-a/large.txt"]
+    remote_etag = s3_client.head_object(Bucket="bucket-a", Key="large.txt")["ETag"].strip('"')
+    assert remote_etag.endswith("-3")
+
+    second = publish_files(uploads, s3_client=s3_client, transfer_config=config, verify_remote=True)
+    assert second["skipped"] == ["s3://bucket-a/large.txt"]
@@ -0,0 +1,66 @@
+import random
+from collections import Counter
+import pytest
+from lambdas.common.sampling_utils import AliasTable, WeightedSampler, weighted_shuffle
+
+
+def test_alias_table_matches_weights():
+    table = AliasTable([1.0, 0.0, 3.0])
+    rng = random.Random(42)
+
+    counts = Counter(table.sample(rng) for _ in range(20000))
+
+    assert counts[1] == 0
+    assert counts[2] / counts[0] == pytest.approx(3.0, rel=0.1)
+
+
+def test_alias_table_rejects_invalid_weights():
+    with pytest.raises(ValueError):
+        AliasTable([])
+    with pytest.raises(ValueError):
+        AliasTable([0.0, 0.0])
+    with pytest.raises(ValueError):
+        AliasTable([1.0, -1.0])
+
+
+def test_weighted_sampler_returns_items():
+    sampler = WeightedSampler(["A", "B"], [0.0, 1.0])
+    assert {sampler.sample() for _ in range(20)} == {"B"}
+    with pytest.raises(ValueError):
+        WeightedSampler(["A"], [1.0, 2.0])
+
+
+def test_weighted_shuffle_keeps_items_and_puts_heavy_items_first():
+    rng = random.Random(7)
+    items = ["COMMON", "RARE1", "RARE2", "NEVER"]
+
+    first_counts = Counter()
+    for _ in range(500):
+        order = weighted_shuffle(items, [100.0, 1.0, 1.0, 0.0], rng)
+        assert sorted(order) == sorted(items)
+        assert order[-1] == "NEVER"
+        first_counts[order[0]] += 1
+
+    assert first_counts["COMMON"] > 450
+
+
+def test_weighted_sampler_matches_weights_across_blocks():
+    items = [f"W{i}" for i in range(10)]
+    sampler = WeightedSampler(items, [1.0] * 9 + [9.0], block_size=3)
+    rng = random.Random(3)
+
+    counts = Counter(sampler.sample(rng) for _ in range(20000))
+
+    assert counts["W9"] / counts["W0"] == pytest.approx(9.0, rel=0.15)
+
+
+def test_weighted_sampler_update_rebuilds_block():
+    sampler = WeightedSampler(["A", "B", "C", "D"], [1.0, 1.0, 1.0, 1.0], block_size=2)
+
+    sampler.update(0, 0.0)
+    sampler.update(1, 0.0)
+    sampler.update(2, 0.0)
+
+    assert {sampler.sample() for _ in range(20)} == {"D"}
+    with pytest.raises(ValueError):
+        sampler.update(3, -1.0)
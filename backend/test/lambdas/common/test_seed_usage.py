@@ -0,0 +1,72 @@
+import pytest
+from unittest.mock import patch
+from lambdas.common import seed_usage
+from lambdas.common.seed_usage import MAX_WORD_COUNT, SeedUsage, count_seed_usage, save_seed_usage_counts
+
+
+def test_record_counts_seed_words_and_layout_letters():
+    usage = SeedUsage()
+
+    usage.record(["BULWARK", "KVETCH"], ["RHV", "WTU", "LBK", "AEC"])
+    usage.record(["BULWARK", ""], ["RHV", "WTU", "LBK", "AEC"])
+
+    assert usage.word_counts == {"BULWARK": 2, "KVETCH": 1}
+    assert usage.letter_counts["R"] == 2
+
+
+def test_encode_and_decode_round_trip():
+    usage = SeedUsage({"ÁRBOL": 3, "CASA": 1}, {"A": 7, "C": 2})
+
+    decoded = SeedUsage.decode(usage.encode(), revision=9)
+
+    assert decoded.word_counts == usage.word_counts
+    assert decoded.letter_counts == usage.letter_counts
+    assert decoded.revision == 9
+
+
+def test_weight_factor_favors_unused_words_and_rare_letters():
+    usage = SeedUsage({"OVERUSED": 9}, {"A": 30, "B": 10, "C": 10, "D": 10})
+
+    assert usage.weight_factor("OVERUSED", "B") == pytest.approx(0.1 * 1.5)
+    assert usage.weight_factor("NEW", "BCD") > usage.weight_factor("NEW", "A")
+    assert SeedUsage().weight_factor("ANY") == 1.0
+
+
+def test_merge_halves_counts_when_they_grow_too_large():
+    usage = SeedUsage({"COMMON": MAX_WORD_COUNT - 1, "RARE": 1}, {"A": 10})
+
+    usage.merge(SeedUsage({"COMMON": 1}))
+
+    assert usage.word_counts == {"COMMON": MAX_WORD_COUNT // 2}
+    assert usage.letter_counts == {"A": 5}
+
+
+def test_count_seed_usage_reads_games():
+    games = [
+        {"randomSeedWords": ["BULWARK", "KVETCH"], "gameLayout": ["RHV", "WTU", "LBK", "AEC"]},
+        {"randomSeedWords": [], "randomSeedWord": "SOAP", "gameLayout": ["SO", "AP"]},
+    ]
+
+    usage = count_seed_usage(games)
+
+    assert usage.word_counts == {"BULWARK": 1, "KVETCH": 1, "SOAP": 1}
+
+
+@patch.object(seed_usage, "save_seed_usage")
+@patch.object(seed_usage, "fetch_seed_usage")
+def test_save_seed_usage_counts_retries_on_conflict(mock_fetch, mock_save):
+    # Arrange: another writer saves between the first read and write
+    mock_fetch.side_effect = [
+        {"counts": SeedUsage({"APPLE": 1}).encode(), "revision": 1},
+        {"counts": SeedUsage({"APPLE": 2}).encode(), "revision": 2},
+    ]
+    mock_save.side_effect = [False, True]
+
+    # Act
+    saved = save_seed_usage_counts("en", SeedUsage({"APPLE": 1}))
+
+    # Assert
+    assert saved is True
+    language, counts, revision = mock_save.call_args.args
+    assert revision == 2
+    assert SeedUsage.decode(counts).word_counts == {"APPLE": 3}
@@ -0,0 +1,209 @@
+import pytest
+from unittest.mock import ANY, patch
+from botocore.exceptions import ClientError
+from lambdas.common import stats_aggregator
+from lambdas.common.stats_aggregator import GameStatsAggregator
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def mock_add_to_game_counters():
+    with patch("lambdas.common.stats_aggregator.add_to_game_counters", return_value=[]) as mock:
+        yield mock
+
+
+@pytest.fixture
+def mock_fetch_game_counters():
+    with patch("lambdas.common.stats_aggregator.fetch_game_counters") as mock:
+        mock.return_value = {"totalCompletions": 10, "totalWordsUsed": 40, "totalRatings": 2, "totalStars": 8}
+        yield mock
+
+
+@pytest.fixture(autouse=True)
+def no_backoff():
+    with patch("lambdas.common.stats_aggregator.time.sleep"):
+        yield
+
+
+def test_record_buffers_until_max_pending_updates(clock, mock_add_to_game_counters):
+    aggregator = GameStatsAggregator(flush_interval=30, max_pending_updates=3, clock=clock)
+
+    aggregator.record("game-1", {"totalCompletions": 1, "totalWordsUsed": 3})
+    aggregator.record("game-1", {"totalCompletions": 1, "totalWordsUsed": 4})
+    mock_add_to_game_counters.assert_not_called()
+
+    aggregator.record("game-2", {"totalRatings": 1, "totalStars": 5})
+
+    mock_add_to_game_counters.assert_called_once()
+    deltas_by_game = mock_add_to_game_counters.call_args.args[0]
+    assert deltas_by_game == {
+        "game-1": {"totalCompletions": 2, "totalWordsUsed": 7},
+        "game-2": {"totalRatings": 1, "totalStars": 5},
+    }
+    assert aggregator.pending == {}
+
+
+def test_flush_if_due_after_interval(clock, mock_add_to_game_counters):
+    aggregator = GameStatsAggregator(flush_interval=30, max_pending_updates=100, clock=clock)
+    aggregator.record("game-1", {"totalCompletions": 1})
+
+    clock.now = 29
+    assert aggregator.flush_if_due() is True
+    mock_add_to_game_counters.assert_not_called()
+
+    clock.now = 30
+    assert aggregator.flush_if_due() is True
+    mock_add_to_game_counters.assert_called_once()
+
+
+def test_flush_retries_with_same_token(clock, mock_add_to_game_counters):
+    aggregator = GameStatsAggregator(flush_interval=30, max_pending_updates=100, clock=clock)
+    mock_add_to_game_counters.side_effect = [
+        ClientError({"Error": {"Code": "ThrottlingException", "Message": "Slow down"}}, "TransactWriteItems"),
+        [],
+    ]
+    aggregator.record("game-1", {"totalCompletions": 1})
+
+    assert aggregator.flush() is True
+
+    tokens = [call.args[1] for call in mock_add_to_game_counters.call_args_list]
+    assert len(tokens) == 2
+    assert tokens[0] == tokens[1]
+
+
+def test_failed_flush_keeps_transaction_and_token(clock, mock_add_to_game_counters):
+    aggregator = GameStatsAggregator(flush_interval=30, max_pending_updates=100, clock=clock)
+    mock_add_to_game_counters.side_effect = ClientError(
+        {"Error": {"Code": "InternalServerError", "Message": "Oops"}}, "TransactWriteItems"
+    )
+    aggregator.record("game-1", {"totalCompletions": 1, "totalWordsUsed": 3})
+
+    assert aggregator.flush() is False
+    assert mock_add_to_game_counters.call_count == stats_aggregator.MAX_FLUSH_ATTEMPTS
+    failed_token = mock_add_to_game_counters.call_args.args[1]
+
+    # The failed transaction may have been applied, so it's retried as it was, apart from newer deltas
+    mock_add_to_game_counters.reset_mock(side_effect=True)
+    mock_add_to_game_counters.return_value = []
+    aggregator.record("game-1", {"totalCompletions": 1, "totalWordsUsed": 2})
+    assert aggregator.flush() is True
+
+    assert [call.args for call in mock_add_to_game_counters.call_args_list] == [
+        ({"game-1": {"totalCompletions": 1, "totalWordsUsed": 3}}, failed_token),
+        ({"game-1": {"totalCompletions": 1, "totalWordsUsed": 2}}, ANY),
+    ]
+    assert mock_add_to_game_counters.call_args.args[1] != failed_token
+    assert aggregator.unconfirmed == []
+
+
+def test_flush_drops_transaction_once_token_may_have_expired(clock, mock_add_to_game_counters):
+    aggregator = GameStatsAggregator(flush_interval=30, max_pending_updates=100, clock=clock)
+    mock_add_to_game_counters.side_effect = ClientError(
+        {"Error": {"Code": "InternalServerError", "Message": "Oops"}}, "TransactWriteItems"
+    )
+    aggregator.record("game-1", {"totalCompletions": 1})
+    assert aggregator.flush() is False
+
+    # DynamoDB may no longer recognise the token, so a retry could count the transaction twice
+    mock_add_to_game_counters.reset_mock(side_effect=True)
+    mock_add_to_game_counters.return_value = []
+    clock.now = stats_aggregator.TOKEN_LIFETIME_SECONDS
+    aggregator.record("game-1", {"totalCompletions": 1, "totalWordsUsed": 2})
+    assert aggregator.flush() is True
+
+    assert [call.args[0] for call in mock_add_to_game_counters.call_args_list] == [
+        {"game-1": {"totalCompletions": 1, "totalWordsUsed": 2}},
+    ]
+    assert aggregator.unconfirmed == []
+
+
+def test_flush_calls_listeners(clock, mock_add_to_game_counters):
+    aggregator = GameStatsAggregator(flush_interval=30, max_pending_updates=2, clock=clock)
+    flushes = []
+    aggregator.flush_listeners.append(lambda: flushes.append(clock.now))
+
+    aggregator.record("game-1", {"totalCompletions": 1})
+    assert flushes == []
+    aggregator.record("game-1", {"totalCompletions": 1})
+
+    assert flushes == [0.0]
+
+
+def test_flush_drops_missing_games(clock, mock_add_to_game_counters):
+    aggregator = GameStatsAggregator(flush_interval=30, max_pending_updates=100, clock=clock)
+    mock_add_to_game_counters.side_effect = [["game-2"], []]
+    aggregator.record("game-1", {"totalCompletions": 1})
+    aggregator.record("game-2", {"totalCompletions": 1})
+
+    assert aggregator.flush() is True
+
+    retry_deltas, retry_token = mock_add_to_game_counters.call_args.args
+    assert retry_deltas == {"game-1": {"totalCompletions": 1}}
+    assert retry_token != mock_add_to_game_counters.call_args_list[0].args[1]
+    assert aggregator.pending == {}
+
+
+def test_flush_splits_into_transactions(clock, mock_add_to_game_counters):
+    aggregator = GameStatsAggregator(flush_interval=30, max_pending_updates=1000, clock=clock)
+    for i in range(stats_aggregator.MAX_TRANSACTION_ITEMS + 1):
+        aggregator.record(f"game-{i}", {"totalCompletions": 1})
+
+    assert aggregator.flush() is True
+
+    sizes = [len(call.args[0]) for call in mock_add_to_game_counters.call_args_list]
+    assert sizes == [stats_aggregator.MAX_TRANSACTION_ITEMS, 1]
+
+
+def test_get_totals_includes_recorded_deltas(clock, mock_add_to_game_counters, mock_fetch_game_counters):
+    aggregator = GameStatsAggregator(flush_interval=30, max_pending_updates=2, clock=clock)
+    aggregator.record("game-1", {"totalCompletions": 1, "totalWordsUsed": 5})
+
+    totals = aggregator.get_totals("game-1")
+    assert totals["totalCompletions"] == 11
+    assert totals["totalWordsUsed"] == 45
+
+    # Still counted once flushed, until the totals are read again
+    aggregator.record("game-1", {"totalRatings": 1, "totalStars": 4})
+    mock_add_to_game_counters.assert_called_once()
+    totals = aggregator.get_totals("game-1")
+    assert totals == {
+        "totalCompletions": 11,
+        "totalWordsUsed": 45,
+        "totalLettersUsed": 0,
+        "totalRatings": 3,
+        "totalStars": 12,
+    }
+    mock_fetch_game_counters.assert_called_once_with("game-1")
+
+
+def test_get_totals_rereads_stale_totals(clock, mock_add_to_game_counters, mock_fetch_game_counters):
+    aggregator = GameStatsAggregator(flush_interval=30, max_pending_updates=100, clock=clock)
+    aggregator.get_totals("game-1")
+    aggregator.record("game-1", {"totalCompletions": 1})
+
+    clock.now = stats_aggregator.TOTALS_TTL_SECONDS + 1
+    mock_fetch_game_counters.return_value = {"totalCompletions": 20}
+    totals = aggregator.get_totals("game-1")
+
+    # The recorded completion hasn't been flushed, so it's added to the new totals
+    assert totals["totalCompletions"] == 21
+    assert mock_fetch_game_counters.call_count == 2
+
+
+def test_get_totals_game_not_found(clock, mock_fetch_game_counters):
+    aggregator = GameStatsAggregator(clock=clock)
+    mock_fetch_game_counters.return_value = None
+
+    assert aggregator.get_totals("missing") is None
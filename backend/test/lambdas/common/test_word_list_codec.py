@@ -0,0 +1,37 @@
+import json
+import pytest
+from lambdas.common.word_list_codec import decode_solutions, decode_words, encode_solutions, encode_words
+
+
+def test_words_round_trip():
+    words = ["ABIDE", "ABIDES", "ABODE", "ÉTÉ", "ÉTOILE", "ЯБЛОКО", "A"]
+
+    assert decode_words(encode_words(words)) == words
+
+
+def test_words_keep_their_order():
+    words = ["ZEBRA", "APPLE", "APPLES"]
+
+    assert decode_words(encode_words(words)) == words
+
+
+def test_empty_lists_round_trip():
+    assert decode_words(encode_words([])) == []
+    assert decode_solutions(encode_solutions([])) == []
+
+
+def test_solutions_round_trip():
+    solutions = [("ABIDE", "ELK"), ("ALIKE", "ELBOW"), ("ABIDE", "EBB")]
+
+    assert decode_solutions(encode_solutions(solutions)) == [list(solution) for solution in solutions]
+
+
+def test_encoded_words_are_much_smaller():
+    words = sorted(f"{first}{second}{third}ING" for first in "ABCDEFGH" for second in "AEIOU" for third in "LMNRST")
+
+    assert len(encode_words(words)) * 4 < len(json.dumps(words))
+
+
+def test_decode_rejects_unknown_format():
+    with pytest.raises(ValueError):
+        decode_words(b"\x00abc")
@@ -0,0 +1,164 @@
+import json
+import pytest
+from unittest.mock import ANY, patch
+from lambdas.create_random import batch_generation_service
+from lambdas.create_random.batch_generation_service import generate_random_games, load_checkpoint
+
+
+def make_games(count):
+    return [
+        {"gameId": f"game-{i}", "validWords": ["WORD"], "baseValidWords": ["WORD"]}
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def mock_db():
+    """Patch the database writes, numbering the random game pool from 1."""
+    counter = {"value": 0}
+    reservations = {}
+
+    def reserve(count, language, reservation_id=None):
+        if reservation_id not in reservations:
+            counter["value"] += count
+            reservations[reservation_id] = counter["value"] - count + 1
+        return reservations[reservation_id]
+
+    with patch.object(batch_generation_service, "batch_add_games_to_db", return_value=True) as add_games, \
+            patch.object(batch_generation_service, "batch_add_game_ids_to_random_games_db") as add_ids, \
+            patch.object(batch_generation_service, "reserve_random_game_numbers", side_effect=reserve) as reserve_numbers, \
+            patch.object(batch_generation_service, "delete_random_game_reservation", return_value=True) as delete, \
+            patch.object(batch_generation_service, "save_seed_usage_counts", return_value=True) as save_usage:
+        yield {
+            "add_games": add_games,
+            "add_ids": add_ids,
+            "reserve": reserve_numbers,
+            "delete_reservation": delete,
+            "save_usage": save_usage,
+        }
+
+
+@patch.object(batch_generation_service, "init_worker")
+@patch.object(batch_generation_service, "generate_random_game_data")
+def test_generate_random_games_writes_in_chunks(mock_generate, mock_init, mock_db, tmp_path):
+    # Arrange
+    mock_generate.side_effect = make_games(7)
+    checkpoint_path = str(tmp_path / "run.checkpoint.json")
+
+    # Act
+    summary = generate_random_games("en", "3x3", 7, max_workers=1, checkpoint_path=checkpoint_path, chunk_size=3)
+
+    # Assert
+    assert summary["written"] == 7
+    assert summary["failed"] == 0
+    mock_init.assert_called_once_with("en", "3x3", None, True)
+    assert mock_db["save_usage"].call_count == 3
+    assert [len(c.args[0]) for c in mock_db["add_games"].call_args_list] == [3, 3, 1]
+    assert [c.args[0] for c in mock_db["reserve"].call_args_list] == [3, 3, 1]
+    # Each chunk is numbered from its own reserved block, with no gaps
+    assert [c.args[1] for c in mock_db["add_ids"].call_args_list] == [1, 4, 7]
+    reservation_ids = [c.args[2] for c in mock_db["reserve"].call_args_list]
+    assert len(set(reservation_ids)) == 3
+    assert [c.args[0] for c in mock_db["delete_reservation"].call_args_list] == reservation_ids
+    # A finished run removes its checkpoint
+    assert not (tmp_path / "run.checkpoint.json").exists()
+
+
+@patch.object(batch_generation_service, "init_worker")
+@patch.object(batch_generation_service, "generate_random_game_data")
+def test_generate_random_games_skips_failed_games(mock_generate, mock_init, mock_db):
+    # Arrange
+    games = make_games(2)
+    mock_generate.side_effect = [games[0], None, games[1]]
+
+    # Act
+    summary = generate_random_games("en", "3x3", 2, max_workers=1)
+
+    # Assert
+    assert summary["written"] == 2
+    assert summary["failed"] == 1
+
+
+@patch.object(batch_generation_service, "init_worker")
+@patch.object(batch_generation_service, "generate_random_game_data")
+def test_generate_random_games_resumes_from_checkpoint(mock_generate, mock_init, mock_db, tmp_path):
+    # Arrange: the last run wrote 3 games and reserved numbers 4-5 for two more before stopping
+    checkpoint_path = tmp_path / "run.checkpoint.json"
+    checkpoint_path.write_text(json.dumps({
+        "language": "en",
+        "boardSize": "3x3",
+        "count": 6,
+        "written": 3,
+        "pending": {"gameIds": ["game-a", "game-b"], "firstAtomicNumber": 4},
+    }))
+    mock_generate.side_effect = make_games(1)
+    mock_db["reserve"].side_effect = lambda count, language, reservation_id: 6
+
+    # Act
+    summary = generate_random_games("en", "3x3", 6, max_workers=1, checkpoint_path=str(checkpoint_path))
+
+    # Assert
+    assert summary["written"] == 6
+    # The pending games reuse their reserved block instead of reserving a new one
+    first_call = mock_db["add_ids"].call_args_list[0]
+    # A checkpoint from before pool entries had summaries is still published, without them
+    assert first_call.args == (["game-a", "game-b"], 4, "en", None)
+    mock_db["reserve"].assert_called_once_with(1, "en", ANY)
+    assert mock_generate.call_count == 1
+
+
+@patch.object(batch_generation_service, "init_worker")
+@patch.object(batch_generation_service, "generate_random_game_data")
+def test_generate_random_games_resumes_an_unsaved_reservation(mock_generate, mock_init, mock_db, tmp_path):
+    # Arrange: the last run reserved a block for its pending games, then stopped before saving it
+    checkpoint_path = tmp_path / "run.checkpoint.json"
+    checkpoint_path.write_text(json.dumps({
+        "language": "en",
+        "boardSize": "3x3",
+        "count": 2,
+        "written": 0,
+        "pending": {"gameIds": ["game-a", "game-b"], "reservationId": "run-1", "firstAtomicNumber": None},
+    }))
+    mock_db["reserve"].side_effect = None
+    mock_db["reserve"].return_value = 41
+
+    # Act
+    summary = generate_random_games("en", "3x3", 2, max_workers=1, checkpoint_path=str(checkpoint_path))
+
+    # Assert: the block is looked up by the saved reservation id, not reserved again
+    assert summary["written"] == 2
+    mock_db["reserve"].assert_called_once_with(2, "en", "run-1")
+    mock_db["add_ids"].assert_called_once_with(["game-a", "game-b"], 41, "en", None)
+    mock_db["delete_reservation"].assert_called_once_with("run-1")
+    mock_generate.assert_not_called()
+
+
+@patch.object(batch_generation_service, "init_worker")
+@patch.object(batch_generation_service, "generate_random_game_data")
+def test_generate_random_games_seed_is_reproducible(mock_generate, mock_init, mock_db):
+    # Arrange
+    mock_generate.side_effect = make_games(6)
+
+    # Act
+    generate_random_games("en", "3x3", 3, max_workers=1, seed=7)
+    generate_random_games("en", "3x3", 3, max_workers=1, seed=7)
+
+    # Assert
+    seeds = [c.args[0] for c in mock_generate.call_args_list]
+    assert seeds[:3] == seeds[3:]
+    assert len(set(seeds[:3])) == 3
+
+
+def test_load_checkpoint_rejects_a_different_run(tmp_path):
+    checkpoint_path = tmp_path / "run.checkpoint.json"
+    checkpoint_path.write_text(json.dumps({
+        "language": "en", "boardSize": "4x4", "count": 10, "written": 0, "pending": None
+    }))
+
+    with pytest.raises(ValueError):
+        load_checkpoint(str(checkpoint_path), "en", "3x3", 10)
+
+
+def test_generate_random_games_invalid_count():
+    with pytest.raises(ValueError):
+        generate_random_games("en", "3x3", 0)
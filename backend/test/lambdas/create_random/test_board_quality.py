@@ -0,0 +1,77 @@
+import random
+import pytest
+from lambdas.common.dictionary_index import DictionaryIndex
+from lambdas.common.game_utils import generate_valid_words_from_index
+from lambdas.create_random.board_quality import (
+    DIFFICULTY_BANDS,
+    MAX_ESTIMATED_PAR,
+    classify_difficulty,
+    estimate_board_quality,
+    is_in_difficulty_band,
+)
+
+GAME_LAYOUT = ["PRO", "CTI", "DGN", "SAH"]
+
+
+@pytest.fixture
+def index():
+    # Random walks over the board (some of them valid words), plus words off the board
+    rng = random.Random(7)
+    letters = "".join(GAME_LAYOUT)
+    dictionary = {"BAD", "AAAA", "SO", "ZEBRA", "PHONIATRISTS", "SDCG"}
+    while len(dictionary) < 400:
+        dictionary.add("".join(rng.choice(letters) for _ in range(rng.randint(3, 9))))
+    return DictionaryIndex.build("en", sorted(dictionary), [])
+
+
+def count_two_word_solutions(valid_words):
+    letters = set("".join(GAME_LAYOUT))
+    return sum(
+        1
+        for first in valid_words
+        for second in valid_words
+        if first[-1] == second[0] and set(first + second) == letters
+    )
+
+
+def test_estimate_matches_full_solve(index):
+    valid_words = generate_valid_words_from_index(GAME_LAYOUT, index)
+
+    quality = estimate_board_quality(GAME_LAYOUT, index)
+
+    assert quality["validWordCount"] == len(valid_words)
+    assert quality["twoWordSolutionCount"] == count_two_word_solutions(valid_words)
+    assert quality["twoWordSolutionCount"] > 0
+    assert quality["par"] == 2
+
+
+def test_estimate_board_without_words(index):
+    quality = estimate_board_quality(["XYZ", "QWV", "JKM", "BEF"], index)
+    assert quality == {"validWordCount": 0, "twoWordSolutionCount": 0, "par": MAX_ESTIMATED_PAR}
+
+
+def test_estimate_one_word_solution():
+    index = DictionaryIndex.build("en", ["PHONIATRISTSDCG"], [])
+    quality = estimate_board_quality(GAME_LAYOUT, index)
+    assert quality == {"validWordCount": 1, "twoWordSolutionCount": 0, "par": 1}
+
+
+def test_estimate_three_word_board():
+    index = DictionaryIndex.build("en", ["PHONIA", "ARTS", "SDCG"], [])
+    quality = estimate_board_quality(GAME_LAYOUT, index)
+    assert quality == {"validWordCount": 3, "twoWordSolutionCount": 0, "par": 3}
+
+
+def test_is_in_difficulty_band():
+    hard = {"validWordCount": 25, "twoWordSolutionCount": 3, "par": 2}
+    assert is_in_difficulty_band(hard, "hard")
+    assert not is_in_difficulty_band(hard, "medium")
+    assert not is_in_difficulty_band({**hard, "par": 3}, "hard")
+    assert not is_in_difficulty_band({**hard, "validWordCount": 5}, "hard")
+
+
+def test_classify_difficulty():
+    assert classify_difficulty({"validWordCount": 200, "twoWordSolutionCount": 500, "par": 2}) == "easy"
+    assert classify_difficulty({"validWordCount": 50, "twoWordSolutionCount": 10, "par": 2}) == "medium"
+    assert classify_difficulty({"validWordCount": 5, "twoWordSolutionCount": 0, "par": 3}) is None
+    assert set(DIFFICULTY_BANDS) == {"easy", "medium", "hard"}
@@ -0,0 +1,120 @@
+import json
+from unittest.mock import patch
+from lambdas.create_random.handler import handler, MAX_RETRIES
+
+
+CLAIMED_GAME = {
+    "gameId": "inventory-game-id",
+    "gameLayout": ["ABC", "DEF", "GHI", "JKL"],
+    "gameType": "custom",
+    "createdBy": "Player",
+    "clue": "",
+}
+
+
+def make_event(body):
+    return {"body": json.dumps(body)}
+
+
+@patch("lambdas.create_random.handler.create_random_game")
+@patch("lambdas.create_random.handler.claim_random_game", return_value=CLAIMED_GAME)
+def test_handler_returns_inventory_game(mock_claim, mock_create):
+    # Act
+    response = handler(make_event({"language": "en", "boardSize": "3x3", "createdBy": "Player"}), None)
+
+    # Assert
+    assert response["statusCode"] == 201
+    assert json.loads(response["body"])["gameId"] == "inventory-game-id"
+    mock_claim.assert_called_once_with("en", "3x3", "Player")
+    mock_create.assert_not_called()
+
+
+@patch("lambdas.create_random.handler.create_random_game", return_value=CLAIMED_GAME)
+@patch("lambdas.create_random.handler.claim_random_game", return_value=None)
+def test_handler_generates_game_when_inventory_is_empty(mock_claim, mock_create):
+    # Act
+    response = handler(make_event({"language": "en", "boardSize": "3x3"}), None)
+
+    # Assert
+    assert response["statusCode"] == 201
+    mock_claim.assert_called_once()
+    mock_create.assert_called_once()
+
+
+@patch("lambdas.create_random.handler.create_random_game", return_value=CLAIMED_GAME)
+@patch("lambdas.create_random.handler.claim_random_game")
+def test_handler_skips_inventory_for_seed_words(mock_claim, mock_create):
+    # Act
+    response = handler(make_event({"language": "en", "boardSize": "3x3", "seedWords": ["BULWARK", "KVETCH"]}), None)
+
+    # Assert
+    assert response["statusCode"] == 201
+    mock_claim.assert_not_called()
+
+
+@patch("lambdas.create_random.handler.create_random_game")
+@patch("lambdas.create_random.handler.claim_random_game", return_value=None)
+def test_handler_retries_random_seed_words(mock_claim, mock_create):
+    # Arrange
+    mock_create.side_effect = [ValueError("No layout"), CLAIMED_GAME]
+
+    # Act
+    response = handler(make_event({"language": "en", "boardSize": "3x3"}), None)
+
+    # Assert
+    assert response["statusCode"] == 201
+    assert mock_create.call_count == 2
+
+
+@patch("lambdas.create_random.handler.create_random_game", side_effect=ValueError("No layout"))
+@patch("lambdas.create_random.handler.claim_random_game", return_value=None)
+def test_handler_gives_up_after_max_retries(mock_claim, mock_create):
+    # Act
+    response = handler(make_event({"language": "en", "boardSize": "3x3"}), None)
+
+    # Assert
+    assert response["statusCode"] == 400
+    assert mock_create.call_count == MAX_RETRIES
+
+
+@patch("lambdas.create_random.handler.create_random_game", return_value=CLAIMED_GAME)
+@patch("lambdas.create_random.handler.claim_random_game")
+def test_handler_generates_seeded_game(mock_claim, mock_create):
+    # Act
+    response = handler(make_event({"language": "en", "boardSize": "3x3", "seed": 42}), None)
+
+    # Assert
+    assert response["statusCode"] == 201
+    mock_claim.assert_not_called()
+    assert mock_create.call_args.args[7] == 42
+
+
+@patch("lambdas.create_random.handler.create_random_game")
+def test_handler_rejects_invalid_seed(mock_create):
+    for seed in ["42", -1, True, 2 ** 60]:
+        response = handler(make_event({"language": "en", "boardSize": "3x3", "seed": seed}), None)
+        assert response["statusCode"] == 400
+    mock_create.assert_not_called()
+
+
+@patch("lambdas.create_random.handler.create_random_game", return_value=CLAIMED_GAME)
+@patch("lambdas.create_random.handler.claim_random_game")
+def test_handler_generates_game_for_difficulty(mock_claim, mock_create):
+    # Act
+    response = handler(make_event({"language": "en", "boardSize": "3x3", "difficulty": "hard"}), None)
+
+    # Assert
+    assert response["statusCode"] == 201
+    mock_claim.assert_not_called()
+    assert mock_create.call_args.args[8] == "hard"
+
+
+@patch("lambdas.create_random.handler.create_random_game")
+def test_handler_rejects_invalid_difficulty(mock_create):
+    for body in [
+        {"language": "en", "boardSize": "3x3", "difficulty": "impossible"},
+        {"language": "en", "boardSize": "3x3", "difficulty": "easy", "seedWords": ["BULWARK", "KVETCH"]},
+    ]:
+        response = handler(make_event(body), None)
+        assert response["statusCode"] == 400
+    mock_create.assert_not_called()
@@ -0,0 +1,79 @@
+from unittest.mock import patch
+from lambdas.create_random import inventory_service
+from lambdas.create_random.inventory_service import claim_random_game, replenish_inventory
+
+
+def make_games(count):
+    return [{"gameId": f"game-{i}", "createdAt": "2025-01-01T00:00:00"} for i in range(count)]
+
+
+@patch.object(inventory_service, "claim_inventory_game")
+def test_claim_random_game(mock_claim):
+    # Arrange
+    mock_claim.return_value = {"gameId": "game-1"}
+
+    # Act
+    result = claim_random_game("en", "3x3", "Player")
+
+    # Assert
+    assert result == {"gameId": "game-1"}
+    mock_claim.assert_called_once_with("en", "3x3", {"gameType": "custom", "createdBy": "Player", "clue": ""})
+
+
+@patch.object(inventory_service, "claim_inventory_game")
+def test_claim_random_game_without_inventory_pool(mock_claim):
+    assert claim_random_game("es", "3x3") is None
+    mock_claim.assert_not_called()
+
+
+@patch.object(inventory_service, "count_inventory_games", return_value=50)
+@patch.object(inventory_service, "init_worker")
+def test_replenish_inventory_when_full(mock_init, mock_count):
+    assert replenish_inventory("en", "3x3", 50) == 0
+    mock_init.assert_not_called()
+
+
+@patch.object(inventory_service, "count_inventory_games", return_value=None)
+@patch.object(inventory_service, "init_worker")
+def test_replenish_inventory_skips_pool_it_cannot_count(mock_init, mock_count):
+    assert replenish_inventory("en", "3x3", 50) == 0
+    mock_init.assert_not_called()
+
+
+@patch.object(inventory_service, "INVENTORY_WRITE_CHUNK_SIZE", 2)
+@patch.object(inventory_service, "save_seed_usage_counts", return_value=True)
+@patch.object(inventory_service, "add_games_to_inventory", return_value=True)
+@patch.object(inventory_service, "generate_random_game_data")
+@patch.object(inventory_service, "count_inventory_games", return_value=47)
+@patch.object(inventory_service, "init_worker")
+def test_replenish_inventory_adds_missing_games(mock_init, mock_count, mock_generate, mock_add, mock_save_usage):
+    # Arrange
+    games = make_games(3)
+    mock_generate.side_effect = [games[0], None, games[1], games[2]]
+
+    # Act
+    added = replenish_inventory("en", "3x3", 50)
+
+    # Assert
+    assert added == 3
+    mock_init.assert_called_once_with("en", "3x3", balanced=True)
+    assert [c.args[0] for c in mock_add.call_args_list] == [games[:2], games[2:]]
+    assert mock_save_usage.call_count == 2
+
+
+@patch.object(inventory_service, "save_seed_usage_counts", return_value=True)
+@patch.object(inventory_service, "add_games_to_inventory", return_value=True)
+@patch.object(inventory_service, "generate_random_game_data")
+@patch.object(inventory_service, "count_inventory_games", return_value=0)
+@patch.object(inventory_service, "init_worker")
+def test_replenish_inventory_stops_when_out_of_time(mock_init, mock_count, mock_generate, mock_add, mock_save_usage):
+    # Arrange
+    mock_generate.side_effect = make_games(2)
+    time_left = iter([True, True, False])
+
+    # Act
+    added = replenish_inventory("en", "3x3", 50, has_time=lambda: next(time_left))
+
+    # Assert
+    assert added == 2
+    mock_add.assert_called_once()
@@ -0,0 +1,85 @@
+import random
+from itertools import combinations
+from lambdas.create_random.layout_engine import (
+    build_letter_graph,
+    canonicalize,
+    choose_layout,
+    enumerate_layouts,
+    find_layout,
+    is_feasible,
+)
+
+
+def brute_force_layouts(letter_sequence, side_length):
+    """Every partition of the letters into 4 sides with no consecutive letters on the same side."""
+    edges = {frozenset(pair) for pair in zip(letter_sequence, letter_sequence[1:])}
+    layouts = set()
+
+    def place(remaining, sides):
+        if not remaining:
+            layouts.add(tuple(sorted(sides)))
+            return
+        first = remaining[0]
+        for others in combinations(remaining[1:], side_length - 1):
+            side = (first,) + others
+            if any(frozenset(pair) in edges for pair in combinations(side, 2)):
+                continue
+            place([letter for letter in remaining if letter not in side], sides + ["".join(sorted(side))])
+
+    place(sorted(set(letter_sequence)), [])
+    return layouts
+
+
+def is_playable(layout, letter_sequence):
+    letter_to_side = {letter: i for i, side in enumerate(layout) for letter in side}
+    return all(letter_to_side[a] != letter_to_side[b] for a, b in zip(letter_sequence, letter_sequence[1:]))
+
+
+def test_build_letter_graph_rejects_doubled_letters():
+    assert build_letter_graph("BOOK") is None
+    letters, neighbours = build_letter_graph("ABCA")
+    assert letters == "ABC"
+    assert neighbours == [0b110, 0b101, 0b011]
+
+
+def test_enumerate_layouts_finds_every_distinct_layout_once():
+    for sequence in ["BULWARKVETCH", "KNIGHTSWORDAK", "ABCADEFGHIJKL"]:
+        layouts = enumerate_layouts(sequence, 3)
+        assert len(layouts) == len(set(layouts))
+        assert set(layouts) == brute_force_layouts(sequence, 3)
+
+
+def test_enumerate_layouts_respects_limit():
+    assert len(enumerate_layouts("ABCDEFGHIJKLMNOP", 4, limit=25)) == 25
+
+
+def test_is_feasible_rejects_impossible_sequences():
+    # A is next to B..J, so K and L must share A's side, but K and L are next to each other
+    assert not is_feasible("ABACADAEAFAGAHAIAJKL", 3)
+    assert not is_feasible("BOOKCASEQUITY", 3)
+    assert not is_feasible("ABCDEFGHIJK", 3)  # wrong number of letters
+    assert is_feasible("BULWARKVETCH", 3)
+
+
+def test_find_layout_returns_playable_layout():
+    rng = random.Random(3)
+    for _ in range(20):
+        layout = find_layout("BULWARKVETCH", 3, rng)
+        assert layout is not None
+        assert sorted(len(side) for side in layout) == [3, 3, 3, 3]
+        assert is_playable(layout, "BULWARKVETCH")
+    assert find_layout("BOOKCASEQUITY", 3) is None
+
+
+def test_find_layout_varies_with_randomness():
+    layouts = {canonicalize(find_layout("BULWARKVETCH", 3, random.Random(seed))) for seed in range(20)}
+    assert len(layouts) > 1
+
+
+def test_choose_layout_picks_best_score():
+    layouts = enumerate_layouts("BULWARKVETCH", 3)
+    target = layouts[-1]
+
+    chosen = choose_layout("BULWARKVETCH", 3, lambda layout: 1.0 if layout == target else 0.0)
+
+    assert canonicalize(chosen) == target
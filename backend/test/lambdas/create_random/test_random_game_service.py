@@ -1,9 +1,18 @@
 import os
 import pytest
 import random
-from unittest.mock import MagicMock, patch
-from lambdas.create_random.random_game_service import create_random_game, select_two_words, generate_layout
+from unittest.mock import ANY, MagicMock, patch
+from lambdas.create_random.random_game_service import (
+    LAYOUTS_PER_SEED_PAIR,
+    create_random_game,
+    select_board_for_difficulty,
+    select_two_words,
+    generate_layout,
+)
+from lambdas.common.dictionary_index import DictionaryIndex
 from lambdas.common.game_utils import standardize_board
+from lambdas.common.pair_catalog import PairCatalog
+from lambdas.common.sampling_utils import WeightedSampler
 
 
 @pytest.fixture
@@ -29,6 +38,7 @@ def mock_game_schema():
     }
 
 
+@patch("lambdas.create_random.random_game_service.get_seed_word_sampler", return_value=None)
 @patch("lambdas.create_random.random_game_service.get_dictionary")
 @patch("lambdas.create_random.random_game_service.get_basic_dictionary")
 @patch("lambdas.create_random.random_game_service.select_two_words")
@@ -44,6 +54,7 @@ def test_create_random_game_success(
     mock_select_two_words,
     mock_get_dictionary,
     mock_get_basic_dictionary,
+    mock_get_seed_word_sampler,
     mock_dictionary,
     mock_game_schema,
 ):
@@ -61,11 +72,108 @@ def test_create_random_game_success(
     # Assert
     assert result == mock_game_schema
     mock_get_dictionary.assert_called_once_with("en")
-    mock_select_two_words.assert_called_once_with(mock_dictionary, "3x3")
-    mock_generate_layout.assert_called_once_with("BULWARK","KVETCH", "3x3")
+    mock_select_two_words.assert_called_once_with(mock_dictionary, "3x3", sampler=None, rng=ANY)
+    mock_generate_layout.assert_called_once_with("BULWARK","KVETCH", "3x3", rng=ANY)
     mock_create_game_schema.assert_called_once()
-    mock_add_game_to_db.assert_called_once_with(mock_game_schema)
-    mock_add_game_id_to_random_games_db.assert_called_once_with("test-game-id", "en")
+    # Unseeded games balance seed words by usage, so they can't be reproduced from a seed
+    mock_get_seed_word_sampler.assert_called_once_with("en", "basic", balanced=True)
+    assert mock_create_game_schema.call_args.kwargs["generation_seed"] is None
+    mock_add_game_to_db.assert_called_once_with(mock_game_schema, only_if_new=False)
+    mock_add_game_id_to_random_games_db.assert_called_once_with(
+        "test-game-id", "en", {"gameLayout": ["RHV", "WTU", "LBK", "AEC"], "boardSize": "3x3", "language": "en"}
+    )
+
+
+@patch("lambdas.create_random.random_game_service.get_seeded_game_id", return_value="seeded-id")
+@patch("lambdas.create_random.random_game_service.fetch_game_by_id")
+@patch("lambdas.create_random.random_game_service.get_dictionary")
+@patch("lambdas.create_random.random_game_service.add_game_to_db")
+def test_create_random_game_returns_game_cached_for_seed(
+    mock_add_game_to_db,
+    mock_get_dictionary,
+    mock_fetch_game_by_id,
+    mock_get_seeded_game_id,
+    mock_game_schema,
+):
+    # Arrange
+    mock_fetch_game_by_id.return_value = mock_game_schema
+
+    # Act
+    result = create_random_game(language="en", board_size="3x3", seed=42)
+
+    # Assert
+    assert result == mock_game_schema
+    mock_get_seeded_game_id.assert_called_once_with("en", "3x3", 42, [], "", "custom", None)
+    mock_fetch_game_by_id.assert_called_once_with("seeded-id")
+    mock_get_dictionary.assert_not_called()
+    mock_add_game_to_db.assert_not_called()
+
+
+@patch("lambdas.create_random.random_game_service.get_seeded_game_id", return_value="seeded-id")
+@patch("lambdas.create_random.random_game_service.fetch_game_by_id", return_value=None)
+@patch("lambdas.create_random.random_game_service.get_seed_word_sampler", return_value=None)
+@patch("lambdas.create_random.random_game_service.get_dictionary")
+@patch("lambdas.create_random.random_game_service.get_basic_dictionary")
+@patch("lambdas.create_random.random_game_service.create_game_schema")
+@patch("lambdas.create_random.random_game_service.add_game_to_db")
+def test_create_random_game_is_reproducible_from_seed(
+    mock_add_game_to_db,
+    mock_create_game_schema,
+    mock_get_basic_dictionary,
+    mock_get_dictionary,
+    mock_get_seed_word_sampler,
+    mock_fetch_game_by_id,
+    mock_get_seeded_game_id,
+    mock_dictionary,
+    mock_game_schema,
+):
+    # Arrange
+    mock_get_dictionary.return_value = mock_dictionary
+    mock_get_basic_dictionary.return_value = mock_dictionary
+    mock_create_game_schema.return_value = mock_game_schema
+
+    # Act
+    create_random_game(language="en", board_size="3x3", seed=42)
+    create_random_game(language="en", board_size="3x3", seed=42)
+
+    # Assert
+    first_call, second_call = mock_create_game_schema.call_args_list
+    assert first_call.kwargs["game_id"] == "seeded-id"
+    assert first_call.kwargs["generation_seed"] == 42
+    assert first_call.kwargs["game_layout"] == second_call.kwargs["game_layout"]
+
+
+@patch("lambdas.create_random.random_game_service.get_seeded_game_id", return_value="seeded-id")
+@patch("lambdas.create_random.random_game_service.fetch_game_by_id")
+@patch("lambdas.create_random.random_game_service.get_seed_word_sampler", return_value=None)
+@patch("lambdas.create_random.random_game_service.get_dictionary")
+@patch("lambdas.create_random.random_game_service.get_basic_dictionary")
+@patch("lambdas.create_random.random_game_service.create_game_schema")
+@patch("lambdas.create_random.random_game_service.add_game_to_db", return_value=False)
+def test_create_random_game_returns_game_written_concurrently_for_seed(
+    mock_add_game_to_db,
+    mock_create_game_schema,
+    mock_get_basic_dictionary,
+    mock_get_dictionary,
+    mock_get_seed_word_sampler,
+    mock_fetch_game_by_id,
+    mock_get_seeded_game_id,
+    mock_dictionary,
+    mock_game_schema,
+):
+    # Arrange: another request with the same seed writes the game first
+    existing_game = {**mock_game_schema, "totalRatings": 3}
+    mock_fetch_game_by_id.side_effect = [None, existing_game]
+    mock_get_dictionary.return_value = mock_dictionary
+    mock_get_basic_dictionary.return_value = mock_dictionary
+    mock_create_game_schema.return_value = dict(mock_game_schema)
+
+    # Act
+    result = create_random_game(language="en", board_size="3x3", seed=42)
+
+    # Assert
+    assert result == existing_game
+    mock_add_game_to_db.assert_called_once_with(ANY, only_if_new=True)
 
 
 @patch("lambdas.create_random.random_game_service.get_dictionary")
@@ -88,23 +196,131 @@ def test_select_two_words_success(mock_select_two_words, mock_dictionary):
     assert len(word_pair) == 2
 
 
-@patch("lambdas.create_random.random_game_service.generate_layout")
-def test_generate_layout_success(mock_generate_layout):
+def test_select_two_words_draws_first_word_from_sampler(mock_dictionary):
     # Arrange
-    random.seed(0) # Start the random number generator at a consistent state
-    mock_generate_layout.return_value = ["RHV", "WTU", "LBK", "AEC"]
-    expected_layout = ["ABL", "CRV", "EHW", "KTU"]  # Standardized
+    sampler = WeightedSampler(mock_dictionary, [1.0 if word == "BULWARK" else 0.0 for word in mock_dictionary])
 
+    # Act
+    word_pair = select_two_words(mock_dictionary, board_size="3x3", sampler=sampler)
+
+    # Assert
+    assert word_pair == ("BULWARK", "KVETCH")
+
+
+def test_select_two_words_is_reproducible_with_rng(mock_dictionary):
+    # Act
+    first = select_two_words(mock_dictionary, board_size="3x3", rng=random.Random(7))
+    second = select_two_words(mock_dictionary, board_size="3x3", rng=random.Random(7))
+
+    # Assert
+    assert first == second
+
+
+def test_generate_layout_is_reproducible_with_rng():
+    # Act
+    first = generate_layout("BULWARK", "KVETCH", "3x3", rng=random.Random(7))
+    second = generate_layout("BULWARK", "KVETCH", "3x3", rng=random.Random(7))
+
+    # Assert
+    assert first is not None
+    assert first == second
+
+
+def test_generate_layout_success():
     # Act
     layout = generate_layout("BULWARK", "KVETCH", "3x3")
 
-    # Standardize the generated layout so a shufled board is still seen as equivalent
-    standardized_actual = standardize_board(layout) if layout else None
+    # Assert
+    assert layout is not None
+    letter_to_side = {letter: i for i, side in enumerate(layout) for letter in side}
+    assert sorted(letter_to_side) == sorted(set("BULWARKVETCH"))
+    assert all(len(side) == 3 for side in layout)
+    # Every consecutive pair of letters in the seed words is on different sides
+    assert all(letter_to_side[a] != letter_to_side[b] for a, b in zip("BULWARKVETCH", "ULWARKVETCH"))
+
+
+def test_generate_layout_uses_best_scoring_layout():
+    # Arrange
+    target = ("ABL", "CRV", "EHW", "KTU")
+
+    # Act
+    layout = generate_layout("BULWARK", "KVETCH", "3x3", layout_scorer=lambda candidate: candidate == target)
 
     # Assert
-    assert standardized_actual == expected_layout, (
-        f"Expected {expected_layout}, but got {standardized_actual}"
-    )
+    assert standardize_board(layout) == list(target)
+
+
+def test_generate_layout_rejects_repeated_letter():
+    # BOOKCASE + EQUITY has 12 unique letters, but O follows itself, so it can't be played on any layout
+    assert generate_layout("BOOKCASE", "EQUITY", "3x3") is None
+
+
+@patch("lambdas.create_random.random_game_service.estimate_board_quality")
+@patch("lambdas.create_random.random_game_service.generate_layout", return_value=["RHV", "WTU", "LBK", "AEC"])
+def test_select_board_for_difficulty_skips_boards_outside_band(mock_generate_layout, mock_estimate):
+    # Arrange: the first two boards are too easy, the third is hard
+    catalog = MagicMock()
+    catalog.sample.return_value = [("BULWARK", "KVETCH")]
+    too_easy = {"validWordCount": 300, "twoWordSolutionCount": 90, "par": 2}
+    hard = {"validWordCount": 30, "twoWordSolutionCount": 4, "par": 2}
+    mock_estimate.side_effect = [too_easy, too_easy, hard]
+
+    # Act
+    board = select_board_for_difficulty(catalog, "3x3", MagicMock(), "hard")
+
+    # Assert
+    assert board == (("BULWARK", "KVETCH"), ["RHV", "WTU", "LBK", "AEC"])
+    assert mock_estimate.call_count == 3
+
+
+@patch("lambdas.create_random.random_game_service.estimate_board_quality")
+@patch("lambdas.create_random.random_game_service.generate_layout", return_value=["RHV", "WTU", "LBK", "AEC"])
+def test_select_board_for_difficulty_gives_up(mock_generate_layout, mock_estimate):
+    catalog = MagicMock()
+    catalog.sample.return_value = [("BULWARK", "KVETCH")] * 4
+    mock_estimate.return_value = {"validWordCount": 5, "twoWordSolutionCount": 0, "par": 3}
+
+    board = select_board_for_difficulty(catalog, "3x3", MagicMock(), "easy", max_attempts=4)
+
+    assert board is None
+    catalog.sample.assert_called_once_with(4, max_shared_letters=3, exclude=ANY, rng=None)
+    assert mock_estimate.call_count == 4 * LAYOUTS_PER_SEED_PAIR
+
+
+class CountingList(list):
+    """A word list that counts how often it is scanned."""
+
+    def __init__(self, words):
+        super().__init__(words)
+        self.scans = 0
+
+    def __iter__(self):
+        self.scans += 1
+        return super().__iter__()
+
+
+@patch("lambdas.create_random.random_game_service.estimate_board_quality")
+def test_select_board_for_difficulty_never_scans_the_dictionary(mock_estimate):
+    # Arrange: a real catalog, and no board ever in the band, so every attempt is used
+    words = ["BULWARK", "KVETCH", "KNIGHTS", "THUMP", "BLACK", "KEYNOTE", "AXE", "PLAY", "FROZEN", "NIGHTLY"]
+    index = DictionaryIndex.build("en", words, words)
+    catalog = PairCatalog.build(index, "dictionary", "3x3")
+    catalog.words = CountingList(catalog.words)
+    mock_estimate.return_value = {"validWordCount": 5, "twoWordSolutionCount": 0, "par": 3}
+
+    with patch("lambdas.create_random.random_game_service.select_two_words") as mock_select_two_words:
+        board = select_board_for_difficulty(catalog, "3x3", index, "easy", rng=random.Random(1), max_attempts=50)
+
+    # Assert: rejected pairs cost a layout and an estimate each, never a pass over the words
+    assert board is None
+    assert catalog.words.scans == 0
+    mock_select_two_words.assert_not_called()
+    assert 0 < mock_estimate.call_count <= 50 * LAYOUTS_PER_SEED_PAIR
+
+
+def test_create_random_game_rejects_difficulty_with_seed_words():
+    with pytest.raises(ValueError):
+        create_random_game("en", "3x3", seed_words=("BULWARK", "KVETCH"), difficulty="easy")
 
 
 @patch("lambdas.create_random.random_game_service.add_game_id_to_random_games_db")
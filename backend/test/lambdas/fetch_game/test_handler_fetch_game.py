@@ -5,11 +5,11 @@ from lambdas.fetch_game.handler import handler
 
 
 @pytest.fixture
-def mock_fetch_game_by_id(mocker):
-    return mocker.patch("lambdas.fetch_game.handler.fetch_game_by_id")
+def mock_fetch_game_layout(mocker):
+    return mocker.patch("lambdas.fetch_game.handler.fetch_game_layout")
 
 
-def test_fetch_game_success(mock_fetch_game_by_id):
+def test_fetch_game_success(mock_fetch_game_layout):
     # Arrange
     game_id = "2024-11-16"
     sample_game = {
@@ -18,7 +18,7 @@ def test_fetch_game_success(mock_fetch_game_by_id):
         "boardSize": "3x3",
         "language": "en"
     }
-    mock_fetch_game_by_id.return_value = sample_game
+    mock_fetch_game_layout.return_value = sample_game
 
     event = {"pathParameters": {"gameId": game_id}}  
     context = {}
@@ -54,11 +54,11 @@ def test_fetch_game_invalid_input():
 
 
 # Test: Valid gameId but game not found in the database
-@patch("lambdas.fetch_game.handler.fetch_game_by_id")
-def test_fetch_game_not_found(mock_fetch_game_by_id):
+@patch("lambdas.fetch_game.handler.fetch_game_layout")
+def test_fetch_game_not_found(mock_fetch_game_layout):
     # Arrange
     game_id = "non-existent-id"
-    mock_fetch_game_by_id.return_value = None  # Simulate game not found
+    mock_fetch_game_layout.return_value = None  # Simulate game not found
     event = {"pathParameters": {"gameId": game_id}}
     context = {}
 
@@ -69,5 +69,5 @@ def test_fetch_game_not_found(mock_fetch_game_by_id):
     assert response["statusCode"] == 404
     body = json.loads(response["body"])
     assert body["message"] == "Game ID not found."
-    mock_fetch_game_by_id.assert_called_once_with(game_id)
+    mock_fetch_game_layout.assert_called_once_with(game_id)
     
\ No newline at end of file
@@ -0,0 +1,68 @@
+import json
+import pytest
+from lambdas.fetch_random.handler import handler
+
+
+@pytest.fixture
+def mock_pick_random_game(mocker):
+    return mocker.patch("lambdas.fetch_random.handler.pick_random_game")
+
+
+def test_fetch_random_success(mock_pick_random_game):
+    # Arrange
+    mock_pick_random_game.return_value = {
+        "gameId": "random-game",
+        "gameLayout": ["ABC", "DEF", "GHI", "JKL"],
+        "boardSize": "3x3",
+        "language": "es",
+        "clue": "",
+    }
+    event = {"queryStringParameters": {"language": "es"}}
+
+    # Act
+    response = handler(event, None)
+
+    # Assert
+    assert response["statusCode"] == 200
+    body = json.loads(response["body"])
+    assert body["gameId"] == "random-game"
+    assert body["gameLayout"] == ["ABC", "DEF", "GHI", "JKL"]
+    assert body["language"] == "es"
+    assert body["hint"] == ""
+    mock_pick_random_game.assert_called_once_with("es")
+
+
+def test_fetch_random_no_games(mock_pick_random_game):
+    # Arrange
+    mock_pick_random_game.return_value = None
+    event = {"queryStringParameters": {}}
+
+    # Act
+    response = handler(event, None)
+
+    # Assert
+    assert response["statusCode"] == 404
+
+
+def test_fetch_random_missing_game(mock_pick_random_game):
+    # Arrange
+    mock_pick_random_game.side_effect = ValueError("Game missing-game in the random pool was not found.")
+    event = {"queryStringParameters": {"language": "en"}}
+
+    # Act
+    response = handler(event, None)
+
+    # Assert
+    assert response["statusCode"] == 500
+
+
+def test_fetch_random_read_error(mock_pick_random_game):
+    # Arrange
+    mock_pick_random_game.side_effect = RuntimeError("Failed to read the random pool for 'en'.")
+    event = {"queryStringParameters": {"language": "en"}}
+
+    # Act
+    response = handler(event, None)
+
+    # Assert: a failed read is a server error the client can retry, not "no games"
+    assert response["statusCode"] == 500
@@ -0,0 +1,77 @@
+import pytest
+from lambdas.fetch_random import random_pool_service
+from lambdas.fetch_random.random_pool_service import pick_random_game
+
+
+@pytest.fixture(autouse=True)
+def clear_samples():
+    random_pool_service._samples.clear()
+    yield
+    random_pool_service._samples.clear()
+
+
+@pytest.fixture
+def mock_db(mocker):
+    return {
+        "pick_random_atomic_numbers": mocker.patch(
+            "lambdas.fetch_random.random_pool_service.pick_random_atomic_numbers", return_value=[1, 2]
+        ),
+        "fetch_random_pool_entries": mocker.patch("lambdas.fetch_random.random_pool_service.fetch_random_pool_entries"),
+        "fetch_game_layout": mocker.patch("lambdas.fetch_random.random_pool_service.fetch_game_layout"),
+    }
+
+
+def test_pick_random_game_serves_warm_sample(mock_db):
+    # Arrange
+    mock_db["fetch_random_pool_entries"].return_value = [
+        {"atomicNumber": 1, "gameId": "game-1", "gameLayout": ["ABC"], "boardSize": "3x3", "language": "en", "clue": ""},
+    ]
+
+    # Act
+    first = pick_random_game("en")
+    second = pick_random_game("en")
+
+    # Assert
+    assert first == second == {
+        "gameId": "game-1", "gameLayout": ["ABC"], "boardSize": "3x3", "language": "en", "clue": "",
+    }
+    mock_db["pick_random_atomic_numbers"].assert_called_once_with(random_pool_service.RANDOM_POOL_SAMPLE_SIZE, "en")
+    mock_db["fetch_random_pool_entries"].assert_called_once_with([1, 2], "en")
+    mock_db["fetch_game_layout"].assert_not_called()
+
+
+def test_pick_random_game_reads_layout_for_entries_without_summary(mock_db):
+    # Arrange
+    mock_db["fetch_random_pool_entries"].return_value = [{"atomicNumber": 1, "gameId": "old-game"}]
+    mock_db["fetch_game_layout"].return_value = {
+        "gameId": "old-game", "gameLayout": ["XYZ"], "boardSize": "2x2", "language": "en", "par": 2, "clue": "hint",
+    }
+
+    # Act
+    pick_random_game("en")
+    result = pick_random_game("en")
+
+    # Assert
+    assert result == {"gameId": "old-game", "gameLayout": ["XYZ"], "boardSize": "2x2", "language": "en", "clue": "hint"}
+    # The layout is kept in the sample
+    mock_db["fetch_game_layout"].assert_called_once_with("old-game")
+
+
+def test_pick_random_game_empty_pool(mock_db):
+    # Arrange
+    mock_db["pick_random_atomic_numbers"].return_value = []
+    mock_db["fetch_random_pool_entries"].return_value = []
+
+    # Act / Assert
+    assert pick_random_game("en") is None
+    assert "en" not in random_pool_service._samples
+
+
+def test_pick_random_game_read_error(mock_db):
+    # Arrange: the pool has games, but reading them fails
+    mock_db["fetch_random_pool_entries"].return_value = None
+
+    # Act / Assert: a failed read isn't reported as an empty pool
+    with pytest.raises(RuntimeError):
+        pick_random_game("en")
+    assert "en" not in random_pool_service._samples
@@ -0,0 +1,55 @@
+import pytest
+from lambdas.game_archive import archive_service
+from lambdas.game_archive.archive_service import fetch_archive_page
+
+
+@pytest.fixture(autouse=True)
+def clear_archive_page_cache():
+    archive_service._archive_page_cache.clear()
+    yield
+    archive_service._archive_page_cache.clear()
+
+
+@pytest.fixture
+def mock_db(mocker):
+    fetch_archived_games = mocker.patch("lambdas.game_archive.archive_service.fetch_archived_games")
+    fetch_archived_games.return_value = {
+        "items": [{"NYTGame": "NYTGame", "gameId": "2024-12-02"}, {"NYTGame": "NYTGame", "gameId": "2024-12-01"}],
+        "lastKey": {"NYTGame": "NYTGame", "gameId": "2024-12-01"},
+    }
+    fetch_game_summaries = mocker.patch("lambdas.game_archive.archive_service.fetch_game_summaries")
+    fetch_game_summaries.return_value = {
+        "2024-12-02": {"gameId": "2024-12-02", "par": "5"},
+        "2024-12-01": {"gameId": "2024-12-01", "par": "4"},
+    }
+    return {"fetch_archived_games": fetch_archived_games, "fetch_game_summaries": fetch_game_summaries}
+
+
+def test_fetch_archive_page_embeds_summaries(mock_db):
+    page = fetch_archive_page(limit=2)
+
+    assert page["items"] == [
+        {"NYTGame": "NYTGame", "gameId": "2024-12-02", "summary": {"gameId": "2024-12-02", "par": "5"}},
+        {"NYTGame": "NYTGame", "gameId": "2024-12-01", "summary": {"gameId": "2024-12-01", "par": "4"}},
+    ]
+    assert page["lastKey"] == {"NYTGame": "NYTGame", "gameId": "2024-12-01"}
+    mock_db["fetch_game_summaries"].assert_called_once_with(["2024-12-02", "2024-12-01"])
+
+
+def test_fetch_archive_page_is_cached(mock_db):
+    fetch_archive_page(limit=2)
+    fetch_archive_page(limit=2)
+    fetch_archive_page(limit=2, last_key={"NYTGame": "NYTGame", "gameId": "2024-12-01"})
+
+    assert mock_db["fetch_archived_games"].call_count == 2
+    assert mock_db["fetch_game_summaries"].call_count == 2
+
+
+def test_fetch_archive_page_with_missing_summary_is_not_cached(mock_db):
+    mock_db["fetch_game_summaries"].return_value = {"2024-12-02": {"gameId": "2024-12-02", "par": "5"}}
+
+    page = fetch_archive_page(limit=2)
+    fetch_archive_page(limit=2)
+
+    assert page["items"][1]["summary"] is None
+    assert mock_db["fetch_archived_games"].call_count == 2
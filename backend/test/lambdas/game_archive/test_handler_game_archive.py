@@ -2,10 +2,10 @@ import json
 from unittest.mock import patch, MagicMock
 from lambdas.game_archive.handler import handler
 
-@patch("lambdas.game_archive.handler.fetch_archived_games")
-def test_handler_no_query_params(mock_fetch_archived_games):
+@patch("lambdas.game_archive.handler.fetch_archive_page")
+def test_handler_no_query_params(mock_fetch_archive_page):
     # Arrange
-    mock_fetch_archived_games.return_value = {
+    mock_fetch_archive_page.return_value = {
         "items": [
             {"gameId": "20210101", "officialGame": True},
             {"gameId": "20210102", "officialGame": True},
@@ -29,16 +29,16 @@ def test_handler_no_query_params(mock_fetch_archived_games):
     assert len(body["nytGames"]) == 4  # All items returned
     assert body["lastKey"] is None
     assert body["message"] == "Fetched official NYT games archive successfully."
-    mock_fetch_archived_games.assert_called_once_with(limit=10, last_key=None)
+    mock_fetch_archive_page.assert_called_once_with(limit=10, last_key=None)
 
 
-@patch("lambdas.game_archive.handler.fetch_archived_games")
-def test_handler_with_pagination(mock_fetch_archived_games):
+@patch("lambdas.game_archive.handler.fetch_archive_page")
+def test_handler_with_pagination(mock_fetch_archive_page):
     # Arrange
-    mock_fetch_archived_games.return_value = {
+    mock_fetch_archive_page.return_value = {
         "items": [
-            {"gameId": "20210103", "officialGame": True},
-            {"gameId": "20210104", "officialGame": True},
+            {"gameId": "20210103", "officialGame": True, "summary": {"gameId": "20210103", "par": "5"}},
+            {"gameId": "20210104", "officialGame": True, "summary": {"gameId": "20210104", "par": "4"}},
         ],
         "lastKey": {"gameId": "20210104"},
     }
@@ -58,17 +58,18 @@ def test_handler_with_pagination(mock_fetch_archived_games):
     assert response["statusCode"] == 200
     assert "nytGames" in body
     assert len(body["nytGames"]) == 2  # Only 2 items
+    assert body["nytGames"][0]["summary"]["par"] == "5"
     assert body["lastKey"] == json.dumps({"gameId": "20210104"})
-    mock_fetch_archived_games.assert_called_once_with(
+    mock_fetch_archive_page.assert_called_once_with(
         limit=2,
         last_key={"gameId": "20210102"}
     )
 
 
-@patch("lambdas.game_archive.handler.fetch_archived_games")
-def test_handler_error(mock_fetch_archived_games):
+@patch("lambdas.game_archive.handler.fetch_archive_page")
+def test_handler_error(mock_fetch_archive_page):
     # Arrange
-    mock_fetch_archived_games.side_effect = Exception("Database error")
+    mock_fetch_archive_page.side_effect = Exception("Database error")
 
     event = {
         "queryStringParameters": None  # No query parameters
@@ -81,4 +82,4 @@ def test_handler_error(mock_fetch_archived_games):
     # Assert
     assert response["statusCode"] == 500
     assert body["message"] == "Error fetching New York Times Archive"
-    mock_fetch_archived_games.assert_called_once_with(limit=10, last_key=None)
+    mock_fetch_archive_page.assert_called_once_with(limit=10, last_key=None)
@@ -0,0 +1,40 @@
+import json
+import pytest
+from unittest.mock import MagicMock
+from lambdas.get_pairs.handler import handler
+
+
+@pytest.fixture
+def mock_get_pair_catalog(mocker):
+    return mocker.patch("lambdas.get_pairs.handler.get_pair_catalog")
+
+
+def test_get_pairs_samples_from_catalog(mock_get_pair_catalog):
+    # Arrange
+    catalog = MagicMock()
+    catalog.sample.return_value = [("BULWARK", "KVETCH")]
+    mock_get_pair_catalog.return_value = catalog
+    event = {"body": json.dumps({"boardSize": "3x3", "numTries": 5, "excludeWords": ["thump"]})}
+
+    # Act
+    response = handler(event, {})
+
+    # Assert
+    assert response["statusCode"] == 200
+    body = json.loads(response["body"])
+    assert body["wordPairs"] == [["BULWARK", "KVETCH"]]
+    assert body["wordPairsCount"] == 1
+    mock_get_pair_catalog.assert_called_once_with("en", "basic", "3x3")
+    _, kwargs = catalog.sample.call_args
+    assert catalog.sample.call_args.args == (5,)
+    assert kwargs["max_shared_letters"] == 4
+    assert "THUMP" in kwargs["exclude"] and "DAINTILY" in kwargs["exclude"]
+
+
+def test_get_pairs_rejects_invalid_exclusions(mock_get_pair_catalog):
+    event = {"body": json.dumps({"excludeWords": "THUMP"})}
+
+    response = handler(event, {})
+
+    assert response["statusCode"] == 400
+    mock_get_pair_catalog.assert_not_called()
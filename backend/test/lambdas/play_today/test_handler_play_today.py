@@ -1,28 +1,47 @@
 import pytest
 from unittest.mock import MagicMock
+from boto3.dynamodb.types import TypeSerializer
 from lambdas.play_today.handler import handler
 from datetime import date, timedelta
 
 
 @pytest.fixture
 def mock_dynamodb_table(mocker):
-    # Mock the DynamoDB table and replace `boto3.resource` globally
-    mock_table = MagicMock()
-    mocker.patch("lambdas.common.db_utils.get_games_table", return_value=mock_table) 
-    return mock_table
+    # Mock the low-level DynamoDB client that games are read with
+    mock_client = MagicMock()
+    mocker.patch("lambdas.common.db_utils.dynamodb_client", mock_client)
+    return mock_client
+
+
+def to_low_level(item):
+    serializer = TypeSerializer()
+    return {name: serializer.serialize(value) for name, value in item.items()}
+
+
+def game_key(game_id):
+    # Only the attributes needed to play the game are read
+    return {
+        "TableName": "LetterBoxedGames",
+        "Key": {"gameId": {"S": game_id}},
+        "ProjectionExpression": "#a0, #a1, #a2, #a3, #a4, #a5",
+        "ExpressionAttributeNames": {
+            "#a0": "gameId", "#a1": "gameLayout", "#a2": "boardSize",
+            "#a3": "language", "#a4": "par", "#a5": "clue",
+        },
+    }
 
 
 def test_play_today_game_exists(mock_dynamodb_table):
     # Arrange: Mock today's game in the DB
     today = date.today().isoformat()
     mock_dynamodb_table.get_item.return_value = {
-        "Item": {
+        "Item": to_low_level({
             "gameId": today,
             "gameLayout": ["ABC", "DEF", "GHI", "XYZ"],
             "boardSize": "3x3",
             "language": "en",
             "par": 4,
-        }
+        })
     }
 
     # Act
@@ -35,7 +54,7 @@ def test_play_today_game_exists(mock_dynamodb_table):
     # Assert
     assert response["statusCode"] == 200
     assert today in response["body"]
-    mock_dynamodb_table.get_item.assert_called_once_with(Key={"gameId": today})
+    mock_dynamodb_table.get_item.assert_called_once_with(**game_key(today))
 
 
 def test_play_today_fallback_to_yesterday(mock_dynamodb_table):
@@ -44,13 +63,13 @@ def test_play_today_fallback_to_yesterday(mock_dynamodb_table):
     yesterday = (date.today() - timedelta(days=1)).isoformat()
     mock_dynamodb_table.get_item.side_effect = [
         {},  # No game found for today
-        {"Item": {
+        {"Item": to_low_level({
             "gameId": yesterday, 
             "gameLayout": ["XYZ", "DEF", "ABC", "LMN"], 
             "boardSize": "3x3", 
             "language": "en",
             "par": 4
-        }}
+        })}
     ]
 
     # Act
@@ -63,8 +82,8 @@ def test_play_today_fallback_to_yesterday(mock_dynamodb_table):
     # Assert
     assert response["statusCode"] == 200
     assert yesterday in response["body"]
-    mock_dynamodb_table.get_item.assert_any_call(Key={"gameId": today})
-    mock_dynamodb_table.get_item.assert_any_call(Key={"gameId": yesterday})
+    mock_dynamodb_table.get_item.assert_any_call(**game_key(today))
+    mock_dynamodb_table.get_item.assert_any_call(**game_key(yesterday))
 
 
 def test_play_today_no_games_available(mock_dynamodb_table):
@@ -90,5 +109,5 @@ def test_play_today_no_games_available(mock_dynamodb_table):
     assert f"{yesterday}'s game isn't either" in response["body"]
 
     # Ensure `get_item` is called for both today and yesterday
-    mock_dynamodb_table.get_item.assert_any_call(Key={"gameId": today})
-    mock_dynamodb_table.get_item.assert_any_call(Key={"gameId": yesterday})
+    mock_dynamodb_table.get_item.assert_any_call(**game_key(today))
+    mock_dynamodb_table.get_item.assert_any_call(**game_key(yesterday))
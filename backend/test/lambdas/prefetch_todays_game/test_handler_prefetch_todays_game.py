@@ -4,11 +4,11 @@ from lambdas.prefetch_todays_game.handler import handler
 
 
 @patch("lambdas.prefetch_todays_game.prefetch_service.fetch_todays_game")
-@patch("lambdas.prefetch_todays_game.handler.fetch_game_by_id")
+@patch("lambdas.prefetch_todays_game.handler.game_exists")
 @patch("lambdas.prefetch_todays_game.handler.add_game_to_db")
 def test_prefetch_todays_game_handler_game_cached(
     mock_add_game_to_db,
-    mock_fetch_game_by_id,
+    mock_game_exists,
     mock_fetch_todays_game
 ):
     # Arrange
@@ -19,7 +19,7 @@ def test_prefetch_todays_game_handler_game_cached(
         "dictionary": ["WORD1", "WORD2", "WORD3"],
         "par": 4
     }
-    mock_fetch_game_by_id.return_value = {"gameId": "2024-11-16"}
+    mock_game_exists.return_value = True
 
     # Act
     response = handler({}, {})
@@ -31,11 +31,11 @@ def test_prefetch_todays_game_handler_game_cached(
 
 
 @patch("lambdas.prefetch_todays_game.prefetch_service.fetch_todays_game")
-@patch("lambdas.prefetch_todays_game.handler.fetch_game_by_id")
+@patch("lambdas.prefetch_todays_game.handler.game_exists")
 @patch("lambdas.prefetch_todays_game.handler.add_game_to_db")
 def test_prefetch_todays_game_handler_game_not_cached(
     mock_add_game_to_db,
-    mock_fetch_game_by_id,
+    mock_game_exists,
     mock_fetch_todays_game
 ):
     # Arrange
@@ -47,7 +47,7 @@ def test_prefetch_todays_game_handler_game_not_cached(
         "par": 4
     }
 
-    mock_fetch_game_by_id.return_value = None
+    mock_game_exists.return_value = False
 
     # Act
     response = handler({}, {})
@@ -1,6 +1,7 @@
 import json
 import pytest
 from unittest.mock import patch, MagicMock
+from botocore.exceptions import ClientError
 from lambdas.rate_game.handler import handler
 
 @pytest.fixture
@@ -49,13 +50,11 @@ def invalid_json_event():
     }
 
 # Mock dependencies
-@patch("lambdas.rate_game.handler.fetch_game_by_id")
 @patch("lambdas.rate_game.handler.rate_game")
-def test_handler_success(mock_rate_game, mock_fetch_game_by_id, valid_event):
+def test_handler_success(mock_rate_game, valid_event):
     """Test successful game rating."""
     # Arrange
-    mock_fetch_game_by_id.return_value = {"gameId": "12345", "totalRatings": 10, "totalStars": 40}
-    mock_rate_game.return_value = True
+    mock_rate_game.return_value = {"totalRatings": 11, "totalStars": 44}
 
     # Act
     response = handler(valid_event, None)
@@ -66,15 +65,14 @@ def test_handler_success(mock_rate_game, mock_fetch_game_by_id, valid_event):
     assert body["message"] == "Game rated successfully."
     assert body["newReviewCount"] == 11
     assert body["newStarCount"] == 44
-    mock_fetch_game_by_id.assert_called_once_with("12345")
-    mock_rate_game.assert_called_once_with({"gameId": "12345", "totalRatings": 10, "totalStars": 40}, 4)
+    mock_rate_game.assert_called_once_with("12345", 4)
 
 
-@patch("lambdas.rate_game.handler.fetch_game_by_id")
-def test_handler_game_not_found(mock_fetch_game_by_id, valid_event):
+@patch("lambdas.rate_game.handler.rate_game")
+def test_handler_game_not_found(mock_rate_game, valid_event):
     """Test handling when the game is not found in the database."""
     # Arrange
-    mock_fetch_game_by_id.return_value = None
+    mock_rate_game.return_value = None
 
     # Act
     response = handler(valid_event, None)
@@ -85,6 +83,21 @@ def test_handler_game_not_found(mock_fetch_game_by_id, valid_event):
     assert body["message"] == "Game not found in DB"
 
 
+@patch("lambdas.rate_game.handler.rate_game")
+def test_handler_read_error(mock_rate_game, valid_event):
+    """Test that a failed read is a server error, not a missing game."""
+    # Arrange
+    mock_rate_game.side_effect = ClientError(
+        {"Error": {"Code": "InternalServerError", "Message": "Oops"}}, "GetItem"
+    )
+
+    # Act
+    response = handler(valid_event, None)
+
+    # Assert
+    assert response["statusCode"] == 500
+
+
 def test_handler_missing_game_id(invalid_event_missing_game_id):
     """Test handling when gameId is missing."""
     # Act
@@ -129,13 +142,11 @@ def test_handler_invalid_json(invalid_json_event):
     assert body["message"] == "Invalid JSON in request body."
 
 
-@patch("lambdas.rate_game.handler.fetch_game_by_id")
 @patch("lambdas.rate_game.handler.rate_game")
-def test_handler_rate_game_failure(mock_rate_game, mock_fetch_game_by_id, valid_event):
+def test_handler_rate_game_failure(mock_rate_game, valid_event):
     """Test handling when rate_game fails."""
     # Arrange
-    mock_fetch_game_by_id.return_value = {"gameId": "12345", "totalRatings": 10, "totalStars": 40}
-    mock_rate_game.return_value = False
+    mock_rate_game.side_effect = Exception("DynamoDB error")
 
     # Act
     response = handler(valid_event, None)
@@ -143,6 +154,5 @@ def test_handler_rate_game_failure(mock_rate_game, mock_fetch_game_by_id, valid_
     # Assert
     assert response["statusCode"] == 500
     body = json.loads(response["body"])
-    assert body["message"] == "Failed to rate the game."
-    mock_fetch_game_by_id.assert_called_once_with("12345")
-    mock_rate_game.assert_called_once_with({"gameId": "12345", "totalRatings": 10, "totalStars": 40}, 4)
+    assert body["message"] == "An unexpected error occurred: DynamoDB error"
+    mock_rate_game.assert_called_once_with("12345", 4)
@@ -1,122 +1,55 @@
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
+from botocore.exceptions import ClientError
 from lambdas.rate_game.rate_game_service import rate_game
 
 # Mock functions
-@patch("lambdas.rate_game.rate_game_service.update_game_schema")
-@patch("lambdas.rate_game.rate_game_service.update_game_in_db")
-def test_rate_game_success(mock_update_game_in_db, mock_update_game_schema):
+@patch("lambdas.rate_game.rate_game_service.record_game_stats")
+@patch("lambdas.rate_game.rate_game_service.get_game_totals")
+def test_rate_game_success(mock_get_game_totals, mock_record_game_stats):
     """
     Test the success case for rate_game.
     """
     # Arrange
-    mock_update_game_in_db.return_value = True
-    mock_update_game_schema.return_value = {
-        "gameId": "123",
-        "totalStars": 15,
-        "totalRatings": 5
-    }
-    
-    game = {
-        "gameId": "123",
-        "totalStars": 10,
-        "totalRatings": 4
-    }
-    stars = 5
+    mock_get_game_totals.return_value = {"totalCompletions": 8, "totalRatings": 4, "totalStars": 10}
 
     # Act
-    result = rate_game(game, stars)
+    result = rate_game("123", 5)
 
     # Assert
-    assert result is True
-    mock_update_game_schema.assert_called_once_with(
-        game,
-        updates={
-            "totalRatings": 5,
-            "totalStars": 15
-        },
-    )
-    mock_update_game_in_db.assert_called_once_with({
-        "gameId": "123",
-        "totalStars": 15,
-        "totalRatings": 5
-    })
+    assert result == {"totalCompletions": 8, "totalRatings": 5, "totalStars": 15}
+    mock_record_game_stats.assert_called_once_with("123", {"totalRatings": 1, "totalStars": 5})
 
 
-@patch("lambdas.rate_game.rate_game_service.update_game_schema")
-@patch("lambdas.rate_game.rate_game_service.update_game_in_db")
-def test_rate_game_failure_update_db(mock_update_game_in_db, mock_update_game_schema):
+@patch("lambdas.rate_game.rate_game_service.record_game_stats")
+@patch("lambdas.rate_game.rate_game_service.get_game_totals")
+def test_rate_game_game_not_found(mock_get_game_totals, mock_record_game_stats):
     """
-    Test the failure case when update_game_in_db fails.
+    Test the case where the game doesn't exist.
     """
     # Arrange
-    mock_update_game_in_db.return_value = False
-    mock_update_game_schema.return_value = {
-        "gameId": "123",
-        "totalStars": 15,
-        "totalRatings": 5
-    }
-    
-    game = {
-        "gameId": "123",
-        "totalStars": 10,
-        "totalRatings": 4
-    }
-    stars = 5
+    mock_get_game_totals.return_value = None
 
     # Act
-    result = rate_game(game, stars)
+    result = rate_game("missing", 5)
 
     # Assert
-    assert result is False
-    mock_update_game_schema.assert_called_once()
-    mock_update_game_in_db.assert_called_once()
+    assert result is None
+    mock_record_game_stats.assert_not_called()
 
 
-@patch("lambdas.rate_game.rate_game_service.update_game_schema")
-@patch("lambdas.rate_game.rate_game_service.update_game_in_db")
-def test_rate_game_missing_game_id(mock_update_game_in_db, mock_update_game_schema):
+@patch("lambdas.rate_game.rate_game_service.record_game_stats")
+@patch("lambdas.rate_game.rate_game_service.get_game_totals")
+def test_rate_game_read_error_propagates(mock_get_game_totals, mock_record_game_stats):
     """
-    Test the case where the game object is missing a gameId.
+    Test that a failed read is raised rather than reported as a missing game.
     """
     # Arrange
-    mock_update_game_in_db.return_value = True
-    mock_update_game_schema.side_effect = ValueError("gameId is required in the game schema.")
-    game = {
-        "totalStars": 10,
-        "totalRatings": 4
-    }
-    stars = 5
-
-    # Act
-    result = rate_game(game, stars)
-
-    # Assert
-    assert result is False
-    mock_update_game_schema.assert_called_once_with(game, updates={"totalRatings": 5, "totalStars": 15})
-    mock_update_game_in_db.assert_not_called()
-
-
-@patch("lambdas.rate_game.rate_game_service.update_game_schema")
-@patch("lambdas.rate_game.rate_game_service.update_game_in_db")
-def test_rate_game_error_handling(mock_update_game_in_db, mock_update_game_schema):
-    """
-    Test error handling when an exception is raised.
-    """
-    # Arrange
-    mock_update_game_schema.side_effect = Exception("Unexpected error")
-
-    game = {
-        "gameId": "123",
-        "totalStars": 10,
-        "totalRatings": 4
-    }
-    stars = 5
-
-    # Act
-    result = rate_game(game, stars)
+    mock_get_game_totals.side_effect = ClientError(
+        {"Error": {"Code": "ProvisionedThroughputExceededException", "Message": "Slow down"}}, "GetItem"
+    )
 
-    # Assert
-    assert result is False
-    mock_update_game_schema.assert_called_once()
-    mock_update_game_in_db.assert_not_called()
+    # Act & Assert
+    with pytest.raises(ClientError):
+        rate_game("123", 5)
+    mock_record_game_stats.assert_not_called()
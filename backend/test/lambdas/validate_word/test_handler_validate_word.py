@@ -10,28 +10,43 @@ def mock_db_utils(mocker):
     """
     Mock the db_utils functions for interacting with DynamoDB.
     """
-    fetch_game_by_id_mock = mocker.patch("lambdas.validate_word.handler.fetch_game_by_id")
-    fetch_valid_words_by_game_id_mock = mocker.patch("lambdas.validate_word.handler.fetch_valid_words_by_game_id")
-    get_user_game_state_mock = mocker.patch("lambdas.validate_word.handler.get_user_game_state")
-    save_user_session_state_mock = mocker.patch("lambdas.validate_word.handler.save_user_session_state")
+    fetch_word_validation_data_mock = mocker.patch("lambdas.validate_word.handler.fetch_word_validation_data")
+    initialize_user_game_state_mock = mocker.patch("lambdas.validate_word.handler.initialize_user_game_state")
+    record_game_stats_mock = mocker.patch("lambdas.validate_word.word_validator_service.record_game_stats")
+    get_game_totals_mock = mocker.patch("lambdas.validate_word.word_validator_service.get_game_totals")
+    get_game_totals_mock.return_value = {
+        "totalCompletions": 11,
+        "totalWordsUsed": 53,
+        "totalLettersUsed": 318,
+        "totalRatings": 5,
+        "totalStars": 25,
+    }
 
     return {
-        "fetch_game_by_id": fetch_game_by_id_mock,
-        "fetch_valid_words_by_game_id": fetch_valid_words_by_game_id_mock,
-        "get_user_game_state": get_user_game_state_mock,
-        "save_user_session_state": save_user_session_state_mock,
+        "fetch_word_validation_data": fetch_word_validation_data_mock,
+        "initialize_user_game_state": initialize_user_game_state_mock,
+        "record_game_stats": record_game_stats_mock,
+        "get_game_totals": get_game_totals_mock,
+    }
+
+
+def set_validation_data(mock_db_utils, valid_words, session_state, game=None):
+    """
+    Set what the single batch read returns.
+    """
+    mock_db_utils["fetch_word_validation_data"].return_value = {
+        "game": game if game is not None else MagicMock(),
+        "validWordsByBase": {word: word for word in valid_words},
+        "sessionState": session_state,
     }
         
 
 def test_validate_word_success(mock_db_utils, mocker):
     # Arrange
-    mocker.patch(
-        "lambdas.validate_word.handler.fetch_valid_words_by_game_id",
-        return_value=["APPLE", "ORANGE", "ELEPHANT"]
-    )
-    mocker.patch(
-        "lambdas.validate_word.handler.get_user_game_state",
-        return_value={"sessionId": "test-session", "gameId": "test-game", "wordsUsed": ["ORANGE"]}
+    set_validation_data(
+        mock_db_utils,
+        ["APPLE", "ORANGE", "ELEPHANT"],
+        {"sessionId": "test-session", "gameId": "test-game", "wordsUsed": ["ORANGE"]},
     )
 
     event = {
@@ -54,8 +69,7 @@ def test_validate_word_success(mock_db_utils, mocker):
 
 def test_validate_word_already_used(mock_db_utils, mocker):
     # Arrange
-    mocker.patch("lambdas.validate_word.handler.fetch_valid_words_by_game_id", return_value=["APPLE", "ORANGE"])
-    mocker.patch("lambdas.validate_word.handler.get_user_game_state", return_value={"sessionId": "test-session", "gameId": "test-game", "wordsUsed": ["APPLE"]})
+    set_validation_data(mock_db_utils, ["APPLE", "ORANGE"], {"sessionId": "test-session", "gameId": "test-game", "wordsUsed": ["APPLE"]})
 
     event = {
         "body": json.dumps({"gameId": "test-game", "word": "APPLE", "sessionId": "test-session"})
@@ -73,8 +87,7 @@ def test_validate_word_already_used(mock_db_utils, mocker):
 
 def test_validate_word_invalid_word(mock_db_utils, mocker):
     # Arrange
-    mocker.patch("lambdas.validate_word.handler.fetch_valid_words_by_game_id", return_value=["APPLE", "ORANGE"])
-    mocker.patch("lambdas.validate_word.handler.get_user_game_state", return_value={"sessionId": "test-session", "gameId": "test-game", "wordsUsed": []})
+    set_validation_data(mock_db_utils, ["APPLE", "ORANGE"], {"sessionId": "test-session", "gameId": "test-game", "wordsUsed": []})
 
     event = {
         "body": json.dumps({"gameId": "test-game", "word": "BANANA", "sessionId": "test-session"})
@@ -92,8 +105,7 @@ def test_validate_word_invalid_word(mock_db_utils, mocker):
 
 def test_validate_word_db_error(mock_db_utils, mocker):
     # Arrange
-    mocker.patch("lambdas.validate_word.handler.fetch_valid_words_by_game_id", side_effect=Exception("DB Error"))
-    mocker.patch("lambdas.validate_word.handler.get_user_game_state", return_value={"sessionId": "test-session", "gameId": "test-game", "wordsUsed": []})
+    mock_db_utils["fetch_word_validation_data"].side_effect = Exception("DB Error")
 
     event = {
         "body": json.dumps({"gameId": "test-game", "word": "APPLE", "sessionId": "test-session"})
@@ -111,19 +123,13 @@ def test_validate_word_db_error(mock_db_utils, mocker):
 def test_game_completion_with_nyt_solution(mock_db_utils, mocker):
     # Arrange
     random.seed(0)
-    mocker.patch(
-        "lambdas.validate_word.handler.fetch_valid_words_by_game_id",
-        return_value=["APPLE", "ORANGE", "ELEPHANT"]
-    )
-    mocker.patch(
-        "lambdas.validate_word.handler.get_user_game_state",
-        return_value={"sessionId": "test-session", "gameId": "test-game", "wordsUsed": ["APPLE", "ORANGE"]}
-    )
+    valid_words = ["APPLE", "ORANGE", "ELEPHANT"]
+    session_state = {"sessionId": "test-session", "gameId": "test-game", "wordsUsed": ["APPLE", "ORANGE"]}
     mocker.patch(
         "lambdas.validate_word.handler.check_game_completion",
         return_value=(True, "Congratulations! Puzzle solved.")
     )
-    mock_db_utils["fetch_game_by_id"].return_value = {
+    game = {
         "gameId": "test-game",
         "gameLayout": ["ABC", "DEF", "GHI", "JKL"],
         "nytSolution": ["APPLE", "ORANGE", "ELEPHANT"],
@@ -131,12 +137,8 @@ def test_game_completion_with_nyt_solution(mock_db_utils, mocker):
         "twoWordSolutions": [("BANANA", "CHERRY"), ("PEACH", "KIWI")],
         "oneWordSolutionCount": 2,
         "twoWordSolutionCount": 2,
-        "totalCompletions": 10,
-        "totalWordsUsed": 50,
-        "totalLettersUsed": 300,
-        "totalRatings": 5,
-        "totalStars": 25,
     }
+    set_validation_data(mock_db_utils, valid_words, session_state, game)
 
     event = {
         "body": json.dumps({"gameId": "test-game", "word": "ELEPHANT", "sessionId": "test-session"})
@@ -152,6 +154,13 @@ def test_game_completion_with_nyt_solution(mock_db_utils, mocker):
     assert body["gameCompleted"] is True
     assert body["message"] == "Congratulations! Puzzle solved."
     assert body["officialSolution"] == ["APPLE", "ORANGE", "ELEPHANT"]
+    assert body["averageRating"] == 5.0
+    assert body["averageWordsUsed"] == 53 / 11
+    mock_db_utils["record_game_stats"].assert_called_once_with("test-game", {
+        "totalCompletions": 1,
+        "totalWordsUsed": 3,
+        "totalLettersUsed": len("APPLE") + len("ORANGE") + len("ELEPHANT"),
+    })
     assert body["someOneWordSolutions"] == ["GRAPE", "PLUM"]
     assert body["someTwoWordSolutions"] == [["BANANA", "CHERRY"], ["PEACH", "KIWI"]]
 
@@ -159,19 +168,13 @@ def test_game_completion_with_nyt_solution(mock_db_utils, mocker):
 def test_game_completion_with_random_seed_word(mock_db_utils, mocker):
     # Arrange
     random.seed(0)
-    mocker.patch(
-        "lambdas.validate_word.handler.fetch_valid_words_by_game_id",
-        return_value=["APPLE", "ORANGE", "ELEPHANT"]
-    )
-    mocker.patch(
-        "lambdas.validate_word.handler.get_user_game_state",
-        return_value={"sessionId": "test-session", "gameId": "test-game", "wordsUsed": ["ORANGE"]}
-    )
+    valid_words = ["APPLE", "ORANGE", "ELEPHANT"]
+    session_state = {"sessionId": "test-session", "gameId": "test-game", "wordsUsed": ["ORANGE"]}
     mocker.patch(
         "lambdas.validate_word.handler.check_game_completion",
         return_value=(True, "Congratulations! Puzzle solved.")
     )
-    mock_db_utils["fetch_game_by_id"].return_value = {
+    game = {
         "gameId": "test-game",
         "gameLayout": ["OMG", "WTF", "BLT", "SEX"],
         "randomSeedWord": "ORANGE",
@@ -179,12 +182,8 @@ def test_game_completion_with_random_seed_word(mock_db_utils, mocker):
         "oneWordSolutionCount": 1,
         "twoWordSolutions": [("PEACH", "KIWI"), ("BANANA", "CHERRY")],
         "twoWordSolutionCount": 2,
-        "totalCompletions": 10,
-        "totalWordsUsed": 50,
-        "totalLettersUsed": 300,
-        "totalRatings": 5,
-        "totalStars": 25,
     }
+    set_validation_data(mock_db_utils, valid_words, session_state, game)
 
     event = {
         "body": json.dumps({"gameId": "test-game", "word": "ELEPHANT", "sessionId": "test-session"})
@@ -205,8 +204,7 @@ def test_game_completion_with_random_seed_word(mock_db_utils, mocker):
 
 def test_validate_word_chaining_rule_failure(mock_db_utils, mocker):
     # Arrange
-    mocker.patch("lambdas.validate_word.handler.fetch_valid_words_by_game_id", return_value=["APPLE", "ORANGE", "BANANA", "ELEPHANT"])
-    mocker.patch("lambdas.validate_word.handler.get_user_game_state", return_value={"wordsUsed": ["APPLE"]})
+    set_validation_data(mock_db_utils, ["APPLE", "ORANGE", "BANANA", "ELEPHANT"], {"wordsUsed": ["APPLE"]})
 
     event = {
         "body": json.dumps({"gameId": "test-game", "word": "BANANA", "sessionId": "test-session"})
@@ -224,8 +222,7 @@ def test_validate_word_chaining_rule_failure(mock_db_utils, mocker):
     
 def test_validate_word_chaining_rule_success(mock_db_utils, mocker):
     # Arrange
-    mocker.patch("lambdas.validate_word.handler.fetch_valid_words_by_game_id", return_value=["APPLE", "ORANGE", "BANANA", "ELEPHANT"])
-    mocker.patch("lambdas.validate_word.handler.get_user_game_state", return_value={"wordsUsed": ["APPLE"]})
+    set_validation_data(mock_db_utils, ["APPLE", "ORANGE", "BANANA", "ELEPHANT"], {"wordsUsed": ["APPLE"]})
 
     event = {
         "body": json.dumps({"gameId": "test-game", "word": "ELEPHANT", "sessionId": "test-session"})
@@ -252,3 +249,25 @@ def test_validate_word_missing_parameters(mock_db_utils, mocker):
     # Assert
     assert response["statusCode"] == 400
     assert body["message"] == "Missing required parameters: gameId, word, or sessionId."
+
+
+def test_validate_word_starts_new_game_state(mock_db_utils, mocker):
+    # Arrange: the batch read found no game state for this session
+    set_validation_data(mock_db_utils, ["APPLE", "ORANGE"], None)
+    mock_db_utils["initialize_user_game_state"].return_value = {
+        "sessionId": "test-session", "gameId": "test-game", "wordsUsed": []
+    }
+
+    event = {
+        "body": json.dumps({"gameId": "test-game", "word": "APPLE", "sessionId": "test-session"})
+    }
+
+    # Act
+    response = handler(event, None)
+    body = json.loads(response["body"])
+
+    # Assert
+    assert response["statusCode"] == 200
+    assert body["valid"] is True
+    mock_db_utils["fetch_word_validation_data"].assert_called_once_with("test-game", "test-session")
+    mock_db_utils["initialize_user_game_state"].assert_called_once_with("test-session", "test-game")
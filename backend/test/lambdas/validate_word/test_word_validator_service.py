@@ -2,6 +2,7 @@ import pytest
 import random
 from unittest.mock import patch
 from typing import List, Dict, Any
+from lambdas.common.dictionary_index import build_base_word_map
 from lambdas.validate_word.word_validator_service import (
     find_valid_word_from_normalized, 
     handle_post_game_logic
@@ -17,12 +18,21 @@ from lambdas.validate_word.word_validator_service import (
 ])
 def test_find_valid_word_from_normalized(submitted_word: str, valid_words: List[str], expected: str):
     # Call the actual implementation without mocking normalize_to_base
-    result = find_valid_word_from_normalized(submitted_word, valid_words)
+    result = find_valid_word_from_normalized(submitted_word, build_base_word_map(valid_words))
     assert result == expected
 
 
-def test_handle_post_game_logic():
+@patch("lambdas.validate_word.word_validator_service.record_game_stats")
+@patch("lambdas.validate_word.word_validator_service.get_game_totals")
+def test_handle_post_game_logic(mock_get_game_totals, mock_record_game_stats):
     random.seed(0) # For consistent random logic
+    mock_get_game_totals.return_value = {
+        "totalCompletions": 11,
+        "totalWordsUsed": 52,
+        "totalLettersUsed": 310,
+        "totalRatings": 5,
+        "totalStars": 25,
+    }
     game_data = {
         "gameId": "test-game-id",
         "nytSolution": ["nyt1", "nyt2"],
@@ -30,11 +40,6 @@ def test_handle_post_game_logic():
         "randomSeedWords": ["seed1", "seed2"],
         "oneWordSolutions": ["one1", "one2", "one3", "one4", "one5", "one6"],
         "twoWordSolutions": [["two1a", "two1b"], ["two2a", "two2b"], ["two3a", "two3b"]],
-        "totalCompletions": 10,
-        "totalWordsUsed": 50,
-        "totalLettersUsed": 300,
-        "totalRatings": 5,
-        "totalStars": 25,
     }
     words_used = ["test1", "test2"]
 
@@ -47,3 +52,22 @@ def test_handle_post_game_logic():
     assert result["averageRating"] == 5.0  # Total stars / total ratings
     assert result["averageWordsUsed"] == (50 + 2) / 11  # Updated totalWordsUsed / updated totalCompletions
     assert result["averageWordLength"] == (300 + len("test1") + len("test2")) / (50 + 2)
+    mock_record_game_stats.assert_called_once_with("test-game-id", {
+        "totalCompletions": 1,
+        "totalWordsUsed": 2,
+        "totalLettersUsed": 10,
+    })
+
+
+@patch("lambdas.validate_word.word_validator_service.record_game_stats")
+@patch("lambdas.validate_word.word_validator_service.get_game_totals")
+def test_handle_post_game_logic_game_stats_missing(mock_get_game_totals, mock_record_game_stats):
+    mock_get_game_totals.return_value = None  # Game not found
+    game_data = {"gameId": "test-game-id", "randomSeedWord": "random_word"}
+
+    result = handle_post_game_logic(game_data, ["random_word"])
+
+    assert result["officialSolution"] == ["random_word"]
+    assert result["averageRating"] == 0.0
+    assert result["averageWordsUsed"] == 0.0
+    assert result["averageWordLength"] == 0.0
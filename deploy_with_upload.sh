@@ -3,6 +3,9 @@
 # Navigate to the backend directory relative to the script location
 cd "$(dirname "$0")/backend"
 
+# Compile the dictionaries into the dictionary Lambda layer
+python3 build_dictionary_layer.py || { echo "Dictionary layer build failed. Aborting deploy."; exit 1; }
+
 # Run CDK deploy
 cdk deploy "$@"
 if [ $? -eq 0 ]; then
@@ -362,7 +362,7 @@ const BrowseGames: React.FC<BrowseGamesProps> = ({ defaultGameType }) => {
     );
     return {
         items: response.games,
-        lastKey: response.lastEvaluatedKey
+        lastKey: response.nextToken
     };
   }, [selectedLanguage]);
 
@@ -52,10 +52,10 @@ export const fetchGameById = async (gameId: string) => {
 // Fetch games by language with pagination
 export const fetchGamesByLanguage = async (
   language: string,
-  lastEvaluatedKey: Record<string, string> | null,
+  nextToken: string | null,
   limit: number,
   gameType?: string
-): Promise<{ games: Game[]; lastEvaluatedKey?: Record<string, string> | null }> => {
+): Promise<{ games: Game[]; nextToken?: string | null }> => {
   const params = new URLSearchParams();
   params.append("language", language);
   params.append("limit", limit.toString());
@@ -65,9 +65,9 @@ export const fetchGamesByLanguage = async (
     params.append("gameType", gameType);
   }
 
-  // Serialize and append lastEvaluatedKey if it exists
-  if (lastEvaluatedKey) {
-    params.append("lastEvaluatedKey", JSON.stringify(lastEvaluatedKey));
+  // Append the continuation token from the previous page, if any
+  if (nextToken) {
+    params.append("nextToken", nextToken);
   }
 
   const response = await fetch(`${API_URL}/browse-games?${params.toString()}`, {